@@ -1,5 +1,14 @@
 from ragas import backends
-from ragas.cache import CacheInterface, DiskCacheBackend, cacher
+from ragas.cache import (
+    CacheInterface,
+    CompactCodec,
+    DiskCacheBackend,
+    EmbeddingCacheBackend,
+    InMemoryCacheBackend,
+    SQLiteCacheBackend,
+    TieredCacheBackend,
+    cacher,
+)
 from ragas.dataset import Dataset, DataTable
 from ragas.dataset_schema import EvaluationDataset, MultiTurnSample, SingleTurnSample
 from ragas.evaluation import aevaluate, evaluate
@@ -30,7 +39,12 @@ __all__ = [
     "Dataset",
     "cacher",
     "CacheInterface",
+    "CompactCodec",
     "DiskCacheBackend",
+    "EmbeddingCacheBackend",
+    "InMemoryCacheBackend",
+    "SQLiteCacheBackend",
+    "TieredCacheBackend",
     "backends",
     "Experiment",
     "experiment",
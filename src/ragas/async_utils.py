@@ -1,8 +1,13 @@
 """Async utils."""
 
 import asyncio
+import atexit
+import inspect
 import logging
+import os
+import threading
 import typing as t
+from collections import deque
 
 logger = logging.getLogger(__name__)
 
@@ -19,10 +24,137 @@ def is_event_loop_running() -> bool:
         return loop.is_running()
 
 
+class BackgroundEventLoop:
+    """
+    Event loop running forever in a daemon thread.
+
+    Sync entry points submit their coroutines to this loop and block until they
+    finish, instead of creating a new event loop (or a new thread with a new
+    loop) on every call. Async clients used across calls, and their connection
+    pools, stay bound to the same loop, and nothing needs to patch the caller's
+    loop when it is already running, e.g. in Jupyter.
+
+    The thread is started on first use and restarted after a fork.
+    """
+
+    def __init__(self, name: str = "ragas-event-loop"):
+        self.name = name
+        self._lock = threading.Lock()
+        self._loop: t.Optional[asyncio.AbstractEventLoop] = None
+        self._thread: t.Optional[threading.Thread] = None
+        self._pid: t.Optional[int] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running background loop, started if needed."""
+        with self._lock:
+            if (
+                self._loop is None
+                or self._pid != os.getpid()
+                or self._thread is None
+                or not self._thread.is_alive()
+            ):
+                self._start()
+            return t.cast(asyncio.AbstractEventLoop, self._loop)
+
+    def _start(self) -> None:
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def _run() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(started.set)
+            try:
+                loop.run_forever()
+            finally:
+                _cancel_all_tasks(loop)
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.close()
+
+        thread = threading.Thread(target=_run, name=self.name, daemon=True)
+        thread.start()
+        started.wait()
+        self._loop, self._thread, self._pid = loop, thread, os.getpid()
+
+    def in_loop_thread(self) -> bool:
+        """Whether the caller runs in the background loop thread."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def run(self, coro: t.Coroutine[t.Any, t.Any, t.Any]) -> t.Any:
+        """
+        Run a coroutine on the background loop and wait for its result.
+
+        If the caller is interrupted, e.g. by KeyboardInterrupt, the coroutine is
+        cancelled. Context variables of the caller are visible to the coroutine.
+        """
+        if self.in_loop_thread():
+            # blocking the loop thread on itself would deadlock
+            return _run_in_new_thread(coro)
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def shutdown(self, timeout: t.Optional[float] = 5.0) -> None:
+        """Cancel the tasks of the loop and stop its thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None or self._pid != os.getpid():
+            return
+        if thread.is_alive():
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+
+
+def _cancel_all_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    tasks = [task for task in asyncio.all_tasks(loop) if not task.done()]
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+
+def _run_in_new_thread(coro: t.Coroutine[t.Any, t.Any, t.Any]) -> t.Any:
+    result: t.Dict[str, t.Any] = {}
+
+    def _target() -> None:
+        try:
+            result["value"] = asyncio.run(coro)
+        except BaseException as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=_target)
+    thread.start()
+    thread.join()
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
+
+
+_background_loop = BackgroundEventLoop()
+atexit.register(_background_loop.shutdown)
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the event loop that sync entry points run their coroutines on.
+
+    Async clients created on this loop (e.g. with
+    ``asyncio.run_coroutine_threadsafe``) can be reused by every sync call.
+    """
+    return _background_loop.loop
+
+
 def apply_nest_asyncio() -> bool:
     """
     Apply nest_asyncio if an event loop is running and compatible.
 
+    Ragas no longer needs this: sync entry points run on a background event loop
+    (see `run`). It is kept for code that relies on nested event loops.
+
     Returns:
         bool: True if nest_asyncio was applied, False if skipped
     """
@@ -56,44 +188,119 @@ def apply_nest_asyncio() -> bool:
 
 
 def as_completed(
-    coroutines: t.Sequence[t.Coroutine],
+    coroutines: t.Iterable[t.Coroutine],
     max_workers: int = -1,
     *,
     cancel_check: t.Optional[t.Callable[[], bool]] = None,
     cancel_pending: bool = True,
-) -> t.Iterator[asyncio.Future]:
+    prefetch_factor: int = 2,
+    semaphore: t.Optional[t.AsyncContextManager[t.Any]] = None,
+) -> t.Iterator[t.Awaitable]:
     """
     Wrap coroutines with a semaphore if max_workers is specified.
 
-    Returns an iterator of futures that completes as tasks finish.
+    Returns an iterator of awaitables that resolve as tasks finish.
+
+    When ``max_workers`` is set, ``coroutines`` is consumed lazily: at most
+    ``max_workers * prefetch_factor`` tasks are alive at any time and the window
+    is refilled as tasks complete, so a generator of coroutines can be arbitrarily
+    large without holding every task in memory. Each yielded awaitable must be
+    awaited before requesting the next one.
+
+    A custom ``semaphore`` (any async context manager, e.g. an
+    `AdaptiveConcurrencyLimiter`) can be passed to control concurrency instead of a
+    fixed ``asyncio.Semaphore(max_workers)``; ``max_workers`` then only sizes the
+    task window.
     """
     if max_workers == -1:
         tasks = [asyncio.create_task(coro) for coro in coroutines]
-    else:
+        ac_iter = asyncio.as_completed(tasks)
+
+        if cancel_check is None:
+            return ac_iter
+
+        def _iter_with_cancel():
+            for future in ac_iter:
+                if cancel_check():
+                    if cancel_pending:
+                        for t in tasks:
+                            if not t.done():
+                                t.cancel()
+                    break
+                yield future
+
+        return _iter_with_cancel()
+
+    if max_workers < 1:
+        raise ValueError("max_workers must be -1 (unbounded) or a positive integer")
+
+    return _bounded_as_completed(
+        coroutines,
+        max_workers,
+        window=max_workers * max(prefetch_factor, 1),
+        cancel_check=cancel_check,
+        cancel_pending=cancel_pending,
+        semaphore=semaphore,
+    )
+
+
+def _bounded_as_completed(
+    coroutines: t.Iterable[t.Coroutine],
+    max_workers: int,
+    window: int,
+    cancel_check: t.Optional[t.Callable[[], bool]],
+    cancel_pending: bool,
+    semaphore: t.Optional[t.AsyncContextManager[t.Any]] = None,
+) -> t.Iterator[t.Awaitable]:
+    """Yield awaitables for completed tasks while keeping a refilled task window."""
+    if semaphore is None:
         semaphore = asyncio.Semaphore(max_workers)
-
-        async def sema_coro(coro):
-            async with semaphore:
-                return await coro
-
-        tasks = [asyncio.create_task(sema_coro(coro)) for coro in coroutines]
-
-    ac_iter = asyncio.as_completed(tasks)
-
-    if cancel_check is None:
-        return ac_iter
-
-    def _iter_with_cancel():
-        for future in ac_iter:
-            if cancel_check():
-                if cancel_pending:
-                    for t in tasks:
-                        if not t.done():
-                            t.cancel()
+    source = iter(coroutines)
+    pending: t.Dict[asyncio.Task, t.Coroutine] = {}
+    done: t.Deque[asyncio.Task] = deque()
+    exhausted = False
+
+    async def sema_coro(coro):
+        async with semaphore:
+            return await coro
+
+    def _fill() -> None:
+        nonlocal exhausted
+        while not exhausted and len(pending) + len(done) < window:
+            try:
+                coro = next(source)
+            except StopIteration:
+                exhausted = True
                 break
-            yield future
+            pending[asyncio.create_task(sema_coro(coro))] = coro
 
-    return _iter_with_cancel()
+    async def _next_completed() -> t.Any:
+        if not done:
+            finished, _ = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in finished:
+                del pending[task]
+            done.extend(finished)
+        task = done.popleft()
+        _fill()
+        return await task
+
+    _fill()
+    while pending or done:
+        if cancel_check is not None and cancel_check():
+            if cancel_pending:
+                for task, coro in pending.items():
+                    task.cancel()
+                    # tasks cancelled before they started never await their job
+                    if inspect.getcoroutinestate(coro) == inspect.CORO_CREATED:
+                        coro.close()
+            # close coroutines that were materialized but never scheduled
+            if isinstance(coroutines, t.Sequence):
+                for coro in source:
+                    coro.close()
+            break
+        yield _next_completed()
 
 
 async def process_futures(
@@ -127,33 +334,22 @@ def run(
     allow_nest_asyncio: bool = True,
 ) -> t.Any:
     """
-    Run an async function in the current event loop or a new one if not running.
+    Run an async function on the shared background event loop and wait for it.
+
+    All sync entry points run on the same long-lived loop in a daemon thread, so
+    async clients and their connections are reused across calls. This works both
+    in scripts and when an event loop is already running in the calling thread,
+    like in Jupyter, without patching that loop.
 
     Parameters
     ----------
     async_func : Callable or Coroutine
         The async function or coroutine to run
     allow_nest_asyncio : bool, optional
-        Whether to apply nest_asyncio for Jupyter compatibility. Default is True.
-        Set to False in production environments to avoid event loop patching.
+        Kept for backward compatibility, nest_asyncio is no longer applied.
     """
-    nest_asyncio_applied = False
-    if allow_nest_asyncio:
-        nest_asyncio_applied = apply_nest_asyncio()
-
     coro = async_func() if callable(async_func) else async_func
-
-    if is_event_loop_running() and not nest_asyncio_applied:
-        loop = asyncio.get_running_loop()
-        loop_type = type(loop).__name__
-        raise RuntimeError(
-            f"Cannot execute nested async code with {loop_type}. "
-            f"uvloop does not support nested event loop execution. "
-            f"Please use asyncio's standard event loop in Jupyter environments, "
-            f"or refactor your code to avoid nested async calls."
-        )
-
-    return asyncio.run(coro)
+    return _background_loop.run(coro)
 
 
 def run_async_tasks(
@@ -0,0 +1,648 @@
+"""
+Batch-request mode: send the LLM calls of an evaluation as provider batch jobs.
+
+Batch APIs, like the OpenAI Batch API, process large numbers of requests at a
+fraction of the price of synchronous calls, within hours instead of seconds. This
+suits nightly regression evaluations, where cost and throughput matter but latency
+does not.
+
+An evaluation in batch mode runs in rounds. The LLMs of the metrics are replaced by
+proxies that answer the prompts they already have a response for, and record the
+others and fail the job with `BatchResponsePending`. At the end of a round, the
+recorded prompts of all rows and metrics are submitted together as one batch job
+through a `BatchTransport`, and the next round starts once the job is done. Each
+round advances multi-step metrics by one step, until a round records no prompt.
+
+Use it with ``evaluate(..., mode="batch", batch_transport=...)``, or run any async
+function in rounds with a `BatchSession`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import typing as t
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+
+from langchain_core.callbacks import Callbacks
+from langchain_core.outputs import Generation, LLMResult
+from langchain_core.prompt_values import PromptValue
+
+from ragas.exceptions import BatchResponsePending, LLMDidNotFinishException
+from ragas.llms.base import BaseRagasLLM, InstructorBaseRagasLLM, InstructorTypeVar
+
+if t.TYPE_CHECKING:
+    from ragas.dataset_schema import EvaluationResult
+
+logger = logging.getLogger(__name__)
+
+# endpoint of the requests in the batch-job file
+CHAT_COMPLETIONS_URL = "/v1/chat/completions"
+
+T = t.TypeVar("T")
+
+
+@dataclass
+class BatchRequest:
+    """
+    A chat completion request of a batch job.
+
+    Attributes
+    ----------
+    custom_id : str
+        Identifies the request and its response. Identical requests share it.
+    model : str
+        Model to call.
+    prompt : str
+        The rendered prompt, sent as a single user message.
+    params : dict
+        Other parameters of the request body, like ``n``, ``temperature``,
+        ``stop`` or ``response_format``.
+    """
+
+    custom_id: str
+    model: str
+    prompt: str
+    params: t.Dict[str, t.Any] = field(default_factory=dict)
+
+    def body(self) -> t.Dict[str, t.Any]:
+        return {
+            "model": self.model,
+            "messages": [{"role": "user", "content": self.prompt}],
+            **self.params,
+        }
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        """The request as a line of an OpenAI batch-job file."""
+        return {
+            "custom_id": self.custom_id,
+            "method": "POST",
+            "url": CHAT_COMPLETIONS_URL,
+            "body": self.body(),
+        }
+
+    @classmethod
+    def from_dict(cls, line: t.Dict[str, t.Any]) -> "BatchRequest":
+        body = dict(line["body"])
+        model = body.pop("model")
+        messages = body.pop("messages")
+        return cls(line["custom_id"], model, messages[-1]["content"], body)
+
+
+@dataclass
+class BatchResponse:
+    """
+    The response to a `BatchRequest`.
+
+    Attributes
+    ----------
+    texts : list of str
+        The content of every choice.
+    finish_reasons : list of str
+        The finish reason of every choice.
+    usage : dict, optional
+        Token usage of the request.
+    error : str, optional
+        Error message when the request failed, the other fields are then empty.
+    """
+
+    texts: t.List[str] = field(default_factory=list)
+    finish_reasons: t.List[t.Optional[str]] = field(default_factory=list)
+    usage: t.Optional[t.Dict[str, t.Any]] = None
+    error: t.Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, line: t.Dict[str, t.Any]) -> "BatchResponse":
+        """Parse a line of an OpenAI batch output or error file."""
+        response = line.get("response") or {}
+        body = response.get("body") or {}
+        error = line.get("error") or body.get("error")
+        if error or response.get("status_code", 200) != 200:
+            message = error.get("message") if isinstance(error, dict) else error
+            return cls(error=str(message or f"status {response.get('status_code')}"))
+        choices = sorted(body.get("choices", []), key=lambda c: c.get("index", 0))
+        return cls(
+            texts=[choice["message"].get("content") or "" for choice in choices],
+            finish_reasons=[choice.get("finish_reason") for choice in choices],
+            usage=body.get("usage"),
+        )
+
+
+def write_batch_file(requests: t.Iterable[BatchRequest], path: str) -> None:
+    """Write requests as an OpenAI batch-job file, one JSON request per line."""
+    with open(path, "w", encoding="utf-8") as f:
+        for request in requests:
+            f.write(json.dumps(request.to_dict(), ensure_ascii=False) + "\n")
+
+
+def read_batch_file(path: str) -> t.List[BatchRequest]:
+    """Read the requests of a batch-job file written by `write_batch_file`."""
+    with open(path, encoding="utf-8") as f:
+        return [BatchRequest.from_dict(json.loads(line)) for line in f if line.strip()]
+
+
+def parse_batch_output(lines: t.Iterable[str]) -> t.Dict[str, BatchResponse]:
+    """Parse the lines of an OpenAI batch output file, keyed by custom id."""
+    responses = {}
+    for line in lines:
+        if line.strip():
+            data = json.loads(line)
+            responses[data["custom_id"]] = BatchResponse.from_dict(data)
+    return responses
+
+
+class BatchTransport(ABC):
+    """
+    Submits batch jobs to a provider and collects their responses.
+
+    Attributes
+    ----------
+    poll_interval : float
+        Seconds between two polls of a running job.
+    """
+
+    poll_interval: float = 30.0
+
+    @abstractmethod
+    def submit(self, requests: t.Sequence[BatchRequest]) -> str:
+        """Submit a batch job and return its id."""
+        ...
+
+    @abstractmethod
+    def poll(self, job_id: str) -> t.Optional[t.Dict[str, BatchResponse]]:
+        """
+        Return the responses of a finished job by custom id, None while it runs.
+
+        Requests without a response are treated as failed. Raise an exception when
+        the whole job failed.
+        """
+        ...
+
+
+class LocalBatchTransport(BatchTransport):
+    """
+    File-based stand-in for a provider batch API, to run batch mode offline.
+
+    Every job is a directory under ``directory`` with the batch-job file
+    ``input.jsonl``. The job is done when ``output.jsonl``, in the format of the
+    OpenAI batch output files, is written next to it, either by ``responder`` when
+    the job is submitted, or by another process.
+
+    Parameters
+    ----------
+    directory : str
+        Directory of the jobs.
+    responder : callable, optional
+        Function returning the content of the response to a request, or a list of
+        contents for requests with ``n`` > 1. If it raises, the request fails.
+    poll_interval : float
+        Seconds between two checks for the output file.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        responder: t.Optional[
+            t.Callable[[BatchRequest], t.Union[str, t.List[str]]]
+        ] = None,
+        poll_interval: float = 1.0,
+    ):
+        self.directory = directory
+        self.responder = responder
+        self.poll_interval = poll_interval
+        os.makedirs(directory, exist_ok=True)
+
+    def job_path(self, job_id: str, name: str = "") -> str:
+        return os.path.join(self.directory, job_id, name)
+
+    def submit(self, requests: t.Sequence[BatchRequest]) -> str:
+        job_id = f"batch_{uuid.uuid4().hex}"
+        os.makedirs(self.job_path(job_id))
+        write_batch_file(requests, self.job_path(job_id, "input.jsonl"))
+        if self.responder is not None:
+            self._respond(job_id, requests)
+        return job_id
+
+    def _respond(self, job_id: str, requests: t.Sequence[BatchRequest]) -> None:
+        lines = []
+        for request in requests:
+            line: t.Dict[str, t.Any] = {"custom_id": request.custom_id}
+            try:
+                contents = t.cast(t.Callable, self.responder)(request)
+            except Exception as e:
+                line["response"] = None
+                line["error"] = {"message": f"{type(e).__name__}: {e}"}
+            else:
+                if isinstance(contents, str):
+                    contents = [contents]
+                line["response"] = {
+                    "status_code": 200,
+                    "body": {
+                        "choices": [
+                            {
+                                "index": i,
+                                "message": {"role": "assistant", "content": content},
+                                "finish_reason": "stop",
+                            }
+                            for i, content in enumerate(contents)
+                        ]
+                    },
+                }
+                line["error"] = None
+            lines.append(json.dumps(line, ensure_ascii=False))
+        # written under another name first, so that pollers never read half a file
+        tmp_path = self.job_path(job_id, "output.jsonl.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp_path, self.job_path(job_id, "output.jsonl"))
+
+    def poll(self, job_id: str) -> t.Optional[t.Dict[str, BatchResponse]]:
+        path = self.job_path(job_id, "output.jsonl")
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            return parse_batch_output(f)
+
+    def __repr__(self) -> str:
+        return f"LocalBatchTransport(directory={self.directory!r})"
+
+
+class OpenAIBatchTransport(BatchTransport):
+    """
+    Runs batch jobs with the OpenAI Batch API.
+
+    Parameters
+    ----------
+    client : openai.OpenAI, optional
+        Synchronous OpenAI client. Defaults to an ``OpenAI()`` client using the
+        shared connection pool of `ragas.http_clients`.
+    completion_window : str
+        Time frame within which the job should be processed.
+    poll_interval : float
+        Seconds between two polls of a running job.
+    """
+
+    _RUNNING = ("validating", "in_progress", "finalizing")
+
+    def __init__(
+        self,
+        client: t.Optional[t.Any] = None,
+        completion_window: str = "24h",
+        poll_interval: float = 30.0,
+    ):
+        if client is None:
+            from openai import OpenAI
+
+            from ragas.http_clients import get_http_client
+
+            client = OpenAI(http_client=get_http_client())
+        self.client = client
+        self.completion_window = completion_window
+        self.poll_interval = poll_interval
+
+    def submit(self, requests: t.Sequence[BatchRequest]) -> str:
+        data = "".join(
+            json.dumps(request.to_dict(), ensure_ascii=False) + "\n"
+            for request in requests
+        ).encode()
+        batch_file = self.client.files.create(
+            file=("ragas_batch.jsonl", data), purpose="batch"
+        )
+        job = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=CHAT_COMPLETIONS_URL,
+            completion_window=self.completion_window,
+        )
+        return job.id
+
+    def poll(self, job_id: str) -> t.Optional[t.Dict[str, BatchResponse]]:
+        job = self.client.batches.retrieve(job_id)
+        if job.status in self._RUNNING:
+            return None
+        if job.status != "completed":
+            raise RuntimeError(f"Batch job {job_id} ended with status {job.status}")
+        responses: t.Dict[str, BatchResponse] = {}
+        for file_id in (job.output_file_id, job.error_file_id):
+            if file_id:
+                content = self.client.files.content(file_id).text
+                responses.update(parse_batch_output(content.splitlines()))
+        return responses
+
+    def __repr__(self) -> str:
+        return f"OpenAIBatchTransport(completion_window={self.completion_window!r})"
+
+
+def _model_name(llm: t.Any) -> str:
+    model = getattr(llm, "model", None)
+    if not isinstance(model, str):
+        rate_limit_key = getattr(llm, "_rate_limit_key", None)
+        model = rate_limit_key()[1] if callable(rate_limit_key) else None
+    if not isinstance(model, str):
+        raise ValueError(
+            f"Cannot find the model name of {llm!r} to send its prompts in batch jobs"
+        )
+    return model
+
+
+class BatchSession:
+    """
+    Collects the prompts of deferred LLM calls and runs them as batch jobs.
+
+    Parameters
+    ----------
+    transport : BatchTransport
+        Transport of the batch jobs.
+    max_rounds : int
+        Maximum number of batch jobs, the calls still pending after the last one
+        fail with `BatchResponsePending`.
+
+    Examples
+    --------
+    >>> session = BatchSession(LocalBatchTransport(".batches", responder=answer))
+    >>> llm = session.wrap(llm_factory("gpt-4o-mini", client=client))
+    >>> result = await session.arun(lambda: metric.ascore(..., llm=llm))
+    """
+
+    def __init__(self, transport: BatchTransport, max_rounds: int = 20):
+        if max_rounds < 1:
+            raise ValueError("max_rounds must be at least 1")
+        self.transport = transport
+        self.max_rounds = max_rounds
+        self.responses: t.Dict[str, BatchResponse] = {}
+        self.jobs: t.List[str] = []
+        self._pending: t.Dict[str, BatchRequest] = {}
+        self._proxies: t.Dict[int, t.Any] = {}
+
+    def wrap(
+        self, llm: t.Union[BaseRagasLLM, InstructorBaseRagasLLM]
+    ) -> t.Union[BaseRagasLLM, InstructorBaseRagasLLM]:
+        """Return a proxy of the LLM whose calls are sent in batch jobs."""
+        if isinstance(llm, (_DeferredLLM, _DeferredInstructorLLM)):
+            return llm
+        proxy = self._proxies.get(id(llm))
+        if proxy is None:
+            if isinstance(llm, InstructorBaseRagasLLM):
+                proxy = _DeferredInstructorLLM(self, llm)
+            elif isinstance(llm, BaseRagasLLM):
+                proxy = _DeferredLLM(self, llm)
+            else:
+                raise TypeError(f"Cannot send the calls of {llm!r} in batch jobs")
+            self._proxies[id(llm)] = proxy
+        return proxy
+
+    def respond(
+        self, model: str, prompt: str, params: t.Dict[str, t.Any]
+    ) -> BatchResponse:
+        """
+        Return the response to a prompt, or record the prompt for a batch job.
+
+        Raises `BatchResponsePending` when the prompt has no response yet.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(
+            json.dumps([model, prompt, params], sort_keys=True, default=str).encode()
+        )
+        custom_id = hasher.hexdigest()
+        response = self.responses.get(custom_id)
+        if response is None:
+            self._pending.setdefault(
+                custom_id, BatchRequest(custom_id, model, prompt, params)
+            )
+            raise BatchResponsePending(custom_id)
+        if response.error is not None:
+            raise RuntimeError(f"Batch request failed: {response.error}")
+        return response
+
+    def take_pending(self) -> t.List[BatchRequest]:
+        """Return and forget the requests recorded since the last call."""
+        pending, self._pending = self._pending, {}
+        return list(pending.values())
+
+    async def run_batch(self, requests: t.Sequence[BatchRequest]) -> None:
+        """Submit a batch job, wait for it and store its responses."""
+        job_id = await asyncio.to_thread(self.transport.submit, requests)
+        self.jobs.append(job_id)
+        logger.info("Submitted batch job %s with %d requests", job_id, len(requests))
+        while True:
+            responses = await asyncio.to_thread(self.transport.poll, job_id)
+            if responses is not None:
+                break
+            await asyncio.sleep(self.transport.poll_interval)
+        for request in requests:
+            self.responses[request.custom_id] = responses.get(
+                request.custom_id, BatchResponse(error="no response in the batch job")
+            )
+        logger.info("Batch job %s done", job_id)
+
+    async def arun(self, fn: t.Callable[[], t.Awaitable[T]]) -> T:
+        """
+        Call ``fn`` in rounds until a round records no prompt.
+
+        The prompts recorded by each round are run as one batch job. ``fn`` must
+        be safe to call again: every round starts over, with the responses of the
+        previous jobs.
+        """
+        for round_number in range(1, self.max_rounds + 2):
+            try:
+                result = await fn()
+                error = None
+            except BatchResponsePending as e:
+                error = e
+            requests = self.take_pending()
+            if not requests:
+                if error is not None:
+                    raise error
+                return result
+            if round_number > self.max_rounds:
+                break
+            await self.run_batch(requests)
+        logger.warning(
+            "Stopped after %d batch jobs, %d prompts are still pending",
+            self.max_rounds,
+            len(requests),
+        )
+        if error is not None:
+            raise error
+        return result
+
+
+class _DeferredLLM(BaseRagasLLM):
+    """Proxy of a `BaseRagasLLM` that answers prompts from batch jobs."""
+
+    def __init__(self, session: BatchSession, llm: BaseRagasLLM):
+        self.session = session
+        self.llm = llm
+        self.model = _model_name(llm)
+        self.run_config = llm.run_config
+        self.multiple_completion_supported = True
+        self.cache = None
+
+    def generate_text(
+        self,
+        prompt: PromptValue,
+        n: int = 1,
+        temperature: t.Optional[float] = 0.01,
+        stop: t.Optional[t.List[str]] = None,
+        callbacks: Callbacks = None,
+    ) -> LLMResult:
+        params: t.Dict[str, t.Any] = {"n": n}
+        if temperature is not None:
+            params["temperature"] = temperature
+        if stop:
+            params["stop"] = stop
+        response = self.session.respond(self.model, prompt.to_string(), params)
+        generations = [
+            Generation(text=text, generation_info={"finish_reason": reason})
+            for text, reason in zip(response.texts, response.finish_reasons)
+        ]
+        llm_output = {"token_usage": response.usage} if response.usage else None
+        return LLMResult(generations=[generations], llm_output=llm_output)
+
+    async def agenerate_text(
+        self,
+        prompt: PromptValue,
+        n: int = 1,
+        temperature: t.Optional[float] = 0.01,
+        stop: t.Optional[t.List[str]] = None,
+        callbacks: Callbacks = None,
+    ) -> LLMResult:
+        return self.generate_text(prompt, n, temperature, stop, callbacks)
+
+    async def generate(
+        self,
+        prompt: PromptValue,
+        n: int = 1,
+        temperature: t.Optional[float] = 0.01,
+        stop: t.Optional[t.List[str]] = None,
+        callbacks: Callbacks = None,
+    ) -> LLMResult:
+        # no retries, pending prompts must fail the job right away
+        if temperature is None:
+            temperature = self.get_temperature(n)
+        result = self.generate_text(prompt, n, temperature, stop, callbacks)
+        if not self.is_finished(result):
+            raise LLMDidNotFinishException()
+        return result
+
+    def is_finished(self, response: LLMResult) -> bool:
+        return self.llm.is_finished(response)
+
+    def __repr__(self) -> str:
+        return f"Batched({self.llm!r})"
+
+
+class _DeferredInstructorLLM(InstructorBaseRagasLLM):
+    """
+    Proxy of an `InstructorBaseRagasLLM` that answers prompts from batch jobs.
+
+    The response model is requested with a JSON schema response format.
+    """
+
+    # makes prompts call `agenerate`
+    is_async = True
+
+    def __init__(self, session: BatchSession, llm: InstructorBaseRagasLLM):
+        self.session = session
+        self.llm = llm
+        self.model = _model_name(llm)
+        model_args = getattr(llm, "model_args", None) or {}
+        self.params = {
+            k: model_args[k]
+            for k in ("temperature", "top_p", "max_tokens")
+            if k in model_args
+        }
+
+    def generate(
+        self, prompt: str, response_model: t.Type[InstructorTypeVar]
+    ) -> InstructorTypeVar:
+        params = {
+            **self.params,
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": response_model.__name__,
+                    "schema": response_model.model_json_schema(),
+                },
+            },
+        }
+        response = self.session.respond(self.model, prompt, params)
+        return response_model.model_validate_json(response.texts[0])
+
+    async def agenerate(
+        self, prompt: str, response_model: t.Type[InstructorTypeVar]
+    ) -> InstructorTypeVar:
+        return self.generate(prompt, response_model)
+
+    def __repr__(self) -> str:
+        return f"Batched({self.llm!r})"
+
+
+async def aevaluate_batch(
+    transport: BatchTransport,
+    max_rounds: int = 20,
+    **evaluate_kwargs: t.Any,
+) -> "EvaluationResult":
+    """
+    Evaluate with the LLM calls of the metrics sent as batch jobs.
+
+    Takes the arguments of `ragas.evaluate`. Returns the result of the last round,
+    in which every prompt was answered by a batch job.
+    """
+    import warnings
+
+    from ragas.evaluation import aevaluate
+    from ragas.llms.base import LangchainLLMWrapper
+    from ragas.metrics.base import MetricWithLLM
+
+    session = BatchSession(transport, max_rounds=max_rounds)
+    metrics = evaluate_kwargs.get("metrics")
+    llm = evaluate_kwargs.get("llm")
+    if llm is not None and not isinstance(llm, (BaseRagasLLM, InstructorBaseRagasLLM)):
+        llm = LangchainLLMWrapper(llm, run_config=evaluate_kwargs.get("run_config"))
+    if llm is None and (
+        metrics is None
+        or any(isinstance(m, MetricWithLLM) and m.llm is None for m in metrics)
+    ):
+        # the default LLM of `evaluate`
+        from openai import OpenAI
+
+        from ragas.http_clients import get_http_client
+        from ragas.llms import llm_factory
+
+        http_client = get_http_client(evaluate_kwargs.get("run_config"))
+        llm = llm_factory("gpt-4o-mini", client=OpenAI(http_client=http_client))
+    if llm is not None:
+        evaluate_kwargs["llm"] = session.wrap(llm)
+
+    # LLMs set on the metrics are replaced by proxies for the run
+    replaced = [
+        (m, m.llm)
+        for m in metrics or []
+        if isinstance(m, MetricWithLLM) and m.llm is not None
+    ]
+    raise_exceptions = evaluate_kwargs.pop("raise_exceptions", False)
+
+    async def _round(raise_exceptions: bool) -> "EvaluationResult":
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            result = await aevaluate(
+                raise_exceptions=raise_exceptions, **evaluate_kwargs
+            )
+        return t.cast("EvaluationResult", result)
+
+    try:
+        for metric, metric_llm in replaced:
+            metric.llm = t.cast(BaseRagasLLM, session.wrap(metric_llm))
+        result = await session.arun(lambda: _round(False))
+        if raise_exceptions:
+            # answered from the responses of the batch jobs, without new requests
+            result = await _round(True)
+    finally:
+        for metric, metric_llm in replaced:
+            metric.llm = metric_llm
+    return result
@@ -1,16 +1,103 @@
+import asyncio
+import atexit
+import dataclasses
 import functools
 import hashlib
 import inspect
-import json
 import logging
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
+from urllib.parse import quote
 
+import numpy as np
 from pydantic import BaseModel, GetCoreSchemaHandler
 from pydantic_core import CoreSchema, core_schema
 
+from ragas.cache_codec import (  # noqa: F401
+    _FLOAT32,
+    CompactCodec,
+    PickleCodec,
+    ValueCodec,
+    _as_float_array,
+)
+
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """Hit and miss counters of a cache backend, recorded by `cacher`.
+
+    Attributes:
+        hits: Calls answered from the cache.
+        misses: Calls that were not in the cache and were made.
+        coalesced: Calls that were not in the cache but shared the result of an
+            identical call in flight.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record(self, hits: int = 0, misses: int = 0, coalesced: int = 0) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+            self.coalesced += coalesced
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses + self.coalesced
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of the calls that did not reach the model."""
+        lookups = self.lookups
+        return (self.hits + self.coalesced) / lookups if lookups else 0.0
+
+    def snapshot(self) -> "CacheStats":
+        with self._lock:
+            return CacheStats(self.hits, self.misses, self.coalesced)
+
+    def __add__(self, other: "CacheStats") -> "CacheStats":
+        return CacheStats(
+            self.hits + other.hits,
+            self.misses + other.misses,
+            self.coalesced + other.coalesced,
+        )
+
+    def __sub__(self, other: "CacheStats") -> "CacheStats":
+        return CacheStats(
+            self.hits - other.hits,
+            self.misses - other.misses,
+            self.coalesced - other.coalesced,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": self.hit_rate,
+        }
+
 
 class CacheInterface(ABC):
     """Abstract base class defining the interface for cache implementations.
@@ -53,6 +140,63 @@ class CacheInterface(ABC):
         """
         pass
 
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Retrieve the values of several keys.
+
+        Backends should override this when they can look up keys in bulk.
+
+        Args:
+            keys: The keys to look up in the cache.
+
+        Returns:
+            A dictionary with the keys found in the cache and their values.
+        """
+        return {key: self.get(key) for key in keys if self.has_key(key)}
+
+    def set_many(self, items: Mapping[str, Any]) -> None:
+        """Store several values.
+
+        Backends should override this when they can write values in bulk.
+
+        Args:
+            items: The keys and the values to store under them.
+        """
+        for key, value in items.items():
+            self.set(key, value)
+
+    # The async methods are used by `cacher` for coroutine functions. They run the
+    # sync methods by default, which is fine for in-memory backends. Backends that
+    # do I/O should override them so that the event loop is not blocked.
+
+    async def aget(self, key: str) -> Any:
+        """Async version of `get`."""
+        return self.get(key)
+
+    async def aset(self, key: str, value) -> None:
+        """Async version of `set`."""
+        self.set(key, value)
+
+    async def ahas(self, key: str) -> bool:
+        """Async version of `has_key`."""
+        return self.has_key(key)
+
+    async def aget_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Async version of `get_many`."""
+        return self.get_many(keys)
+
+    async def aset_many(self, items: Mapping[str, Any]) -> None:
+        """Async version of `set_many`."""
+        self.set_many(items)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit and miss counters of the calls cached with this backend."""
+        # created on first use, so that subclasses need not call __init__
+        stats = self.__dict__.get("_stats")
+        if stats is None:
+            stats = self.__dict__.setdefault("_stats", CacheStats())
+        return stats
+
     @classmethod
     def __get_pydantic_core_schema__(
         cls, source_type: Any, handler: GetCoreSchemaHandler
@@ -66,17 +210,53 @@ class CacheInterface(ABC):
         )
 
 
+class _IOThreadPool:
+    """Small thread pool, created on first use, for the blocking I/O of async methods."""
+
+    def __init__(self, workers: int = 4):
+        self.workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    async def run(self, fn, *args):
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers,
+                        thread_name_prefix="ragas-cache-io",
+                    )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
 class DiskCacheBackend(CacheInterface):
     """A cache implementation that stores data on disk using the diskcache library.
 
     This cache backend persists data to disk, allowing it to survive between program runs.
     It implements the CacheInterface for use with Ragas caching functionality.
 
+    The async methods run the disk I/O in a small thread pool owned by the backend,
+    so that cache lookups do not block the event loop.
+
     Args:
         cache_dir (str, optional): Directory where cache files will be stored. Defaults to ".cache".
+        codec (ValueCodec, optional): Codec of the values, e.g. `CompactCodec`.
+            Defaults to None, which lets diskcache pickle them.
+        io_workers (int, optional): Number of threads used by the async methods. Defaults to 4.
     """
 
-    def __init__(self, cache_dir: str = ".cache"):
+    def __init__(
+        self,
+        cache_dir: str = ".cache",
+        codec: Optional[ValueCodec] = None,
+        io_workers: int = 4,
+    ):
         try:
             from diskcache import Cache
         except ImportError:
@@ -85,6 +265,18 @@ class DiskCacheBackend(CacheInterface):
             )
 
         self.cache = Cache(cache_dir)
+        self.codec = codec
+        self.io_workers = io_workers
+        self._io = _IOThreadPool(io_workers)
+
+    def _dump(self, value: Any) -> Any:
+        return value if self.codec is None else self.codec.encode(value)
+
+    def _load(self, value: Any) -> Any:
+        # values written without a codec are not bytes
+        if self.codec is None or not isinstance(value, bytes):
+            return value
+        return self.codec.decode(value)
 
     def get(self, key: str) -> Any:
         """Retrieve a value from the disk cache by key.
@@ -95,7 +287,7 @@ class DiskCacheBackend(CacheInterface):
         Returns:
             The cached value associated with the key, or None if not found.
         """
-        return self.cache.get(key)
+        return self._load(self.cache.get(key))
 
     def set(self, key: str, value) -> None:
         """Store a value in the disk cache with the given key.
@@ -104,7 +296,7 @@ class DiskCacheBackend(CacheInterface):
             key: The key to store the value under.
             value: The value to cache.
         """
-        self.cache.set(key, value)
+        self.cache.set(key, self._dump(value))
 
     def has_key(self, key: str) -> bool:
         """Check if a key exists in the disk cache.
@@ -117,8 +309,57 @@ class DiskCacheBackend(CacheInterface):
         """
         return key in self.cache
 
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Retrieve the values of several keys in a single transaction.
+
+        Args:
+            keys: The keys to look up in the cache.
+
+        Returns:
+            A dictionary with the keys found in the cache and their values.
+        """
+        found = {}
+        with self.cache.transact():
+            for key in keys:
+                value = self.cache.get(key, default=_MISSING)
+                if value is not _MISSING:
+                    found[key] = self._load(value)
+        return found
+
+    def set_many(self, items: Mapping[str, Any]) -> None:
+        """Store several values in a single transaction.
+
+        Args:
+            items: The keys and the values to store under them.
+        """
+        with self.cache.transact():
+            for key, value in items.items():
+                self.cache.set(key, self._dump(value))
+
+    async def aget(self, key: str) -> Any:
+        """Async version of `get`, reading from disk in a thread."""
+        return await self._io.run(self.get, key)
+
+    async def aset(self, key: str, value) -> None:
+        """Async version of `set`, writing to disk in a thread."""
+        await self._io.run(self.set, key, value)
+
+    async def ahas(self, key: str) -> bool:
+        """Async version of `has_key`, reading from disk in a thread."""
+        return await self._io.run(self.has_key, key)
+
+    async def aget_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Async version of `get_many`, reading from disk in a thread."""
+        return await self._io.run(self.get_many, list(keys))
+
+    async def aset_many(self, items: Mapping[str, Any]) -> None:
+        """Async version of `set_many`, writing to disk in a thread."""
+        await self._io.run(self.set_many, dict(items))
+
     def __del__(self):
         """Cleanup method to properly close the cache when the object is destroyed."""
+        if hasattr(self, "_io"):
+            self._io.shutdown()
         if hasattr(self, "cache"):
             self.cache.close()
 
@@ -131,6 +372,1242 @@ class DiskCacheBackend(CacheInterface):
         return f"DiskCacheBackend(cache_dir={self.cache.directory})"
 
 
+# metadata of the entry being written by `cacher`: (function, model)
+_entry_info: ContextVar[Tuple[Optional[str], Optional[str]]] = ContextVar(
+    "ragas_cache_entry_info", default=(None, None)
+)
+
+_SQLITE_SCHEMA_VERSION = 3
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    function TEXT,
+    model TEXT,
+    ragas_version TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cache_model ON cache (model);
+CREATE INDEX IF NOT EXISTS cache_created_at ON cache (created_at);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+# SQLite limits the number of parameters of a statement
+_SQLITE_MAX_PARAMS = 500
+
+
+def _sqlite_schema_version(path: str) -> int:
+    """Schema version of an existing SQLite cache file, read without changing it."""
+    conn = sqlite3.connect(f"file:{quote(os.path.abspath(path))}?mode=ro", uri=True)
+    try:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _ragas_version() -> str:
+    try:
+        from ragas._version import __version__
+
+        return __version__
+    except ImportError:
+        return "unknown"
+
+
+def _flush_periodically(
+    ref: "weakref.ref[SQLiteCacheBackend]", wake: threading.Event, interval: float
+) -> None:
+    # holds the backend only while flushing, so that it can be garbage collected
+    while True:
+        wake.wait(interval)
+        wake.clear()
+        backend = ref()
+        if backend is None or backend._closed:
+            return
+        try:
+            backend.flush()
+        except Exception as e:
+            logger.warning(f"Failed to write cache entries to {backend.path}: {e}")
+        del backend
+
+
+# backends with values that may still be queued when the interpreter exits
+_open_sqlite_backends: "weakref.WeakSet[SQLiteCacheBackend]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_sqlite_backends() -> None:
+    for backend in list(_open_sqlite_backends):
+        try:
+            backend.flush()
+        except Exception as e:
+            logger.warning(f"Failed to write cache entries to {backend.path}: {e}")
+
+
+class SQLiteCacheBackend(CacheInterface):
+    """A cache implementation that stores data in a SQLite database in WAL mode.
+
+    Many threads and processes can share the same cache file: readers never block
+    writers, and writes from all processes are serialized by SQLite. Writes are
+    queued in memory and written in a single transaction every ``flush_interval``
+    seconds, or as soon as ``max_pending`` writes are queued, so that concurrent
+    jobs do not contend for the write lock on every call. Queued values are visible
+    to `get` before they are written.
+
+    Values are encoded with ``codec``, by default pickled and compressed with zlib
+    when larger than ``compress_min_bytes``. Every entry records the cached function, the model of
+    the LLM or embedding wrapper, the Ragas version (which versions the prompts) and
+    its creation time, so that entries can be removed selectively with `prune`.
+
+    Args:
+        path (str, optional): Path of the database file. Defaults to
+            ".cache/ragas_cache.db".
+        flush_interval (float, optional): Seconds between writes of the queued
+            values. Defaults to 0.5.
+        max_pending (int, optional): Number of queued values that triggers a write.
+            Defaults to 500.
+        compress_min_bytes (int, optional): Minimum size of a pickled value to be
+            compressed. Defaults to 1024, None to disable compression.
+        codec (ValueCodec, optional): Codec of the values, e.g. `CompactCodec`.
+            Defaults to a `PickleCodec` with ``compress_min_bytes``.
+        io_workers (int, optional): Number of threads used by the async methods.
+            Defaults to 4.
+    """
+
+    def __init__(
+        self,
+        path: str = ".cache/ragas_cache.db",
+        flush_interval: float = 0.5,
+        max_pending: int = 500,
+        compress_min_bytes: Optional[int] = 1024,
+        codec: Optional[ValueCodec] = None,
+        io_workers: int = 4,
+    ):
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.compress_min_bytes = compress_min_bytes
+        self.codec = codec if codec is not None else PickleCodec(compress_min_bytes)
+        self.io_workers = io_workers
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._init()
+        with self._connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, _SQLITE_SCHEMA_VERSION):
+                # entries can always be computed again, start over
+                logger.warning(
+                    f"Cache {path} has schema version {version}, clearing it"
+                )
+                conn.execute("DROP TABLE IF EXISTS cache")
+                conn.execute("DROP TABLE IF EXISTS counters")
+            conn.executescript(_SQLITE_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {_SQLITE_SCHEMA_VERSION}")
+
+    @classmethod
+    def open_existing(cls, path: str, **kwargs: Any) -> "SQLiteCacheBackend":
+        """Open an existing cache without creating, migrating or clearing it.
+
+        The constructor clears caches of another schema version, since their
+        entries can be computed again. Tools that inspect or maintain a cache use
+        this method instead, so that a wrong path or a cache written by another
+        version of Ragas is left untouched.
+
+        Args:
+            path: Path of the SQLite cache file.
+            **kwargs: Other arguments of the constructor.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file is not a cache of the current schema version.
+        """
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"Cache {path} does not exist")
+        try:
+            version = _sqlite_schema_version(path)
+        except sqlite3.DatabaseError as e:
+            raise ValueError(f"{path} is not a SQLite cache: {e}") from e
+        if version != _SQLITE_SCHEMA_VERSION:
+            raise ValueError(
+                f"Cache {path} has schema version {version}, "
+                f"expected {_SQLITE_SCHEMA_VERSION}"
+            )
+        return cls(path, **kwargs)
+
+    def _init(self) -> None:
+        # state that is not shared with forked or unpickled copies
+        self._pid = os.getpid()
+        self._local = threading.local()
+        # key -> row to insert, see `_row`
+        self._pending: Dict[str, Tuple] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._flusher: Optional[threading.Thread] = None
+        self._io = _IOThreadPool(self.io_workers)
+        # counters already added to the counters table
+        self._saved_stats = self.stats.snapshot()
+        _open_sqlite_backends.add(self)
+
+    def _check_pid(self) -> None:
+        if self._pid != os.getpid():
+            # forked: the connections and the flusher thread belong to the parent
+            self._init()
+
+    def _connection(self) -> sqlite3.Connection:
+        self._check_pid()
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _row(self, key: str, value: Any) -> Tuple:
+        data = self.codec.encode(value)
+        function, model = _entry_info.get()
+        return (
+            key,
+            data,
+            len(data),
+            function,
+            model,
+            _ragas_version(),
+            time.time(),
+        )
+
+    def get(self, key: str) -> Any:
+        """Retrieve a value from the database by key.
+
+        Args:
+            key: The key to look up in the cache.
+
+        Returns:
+            The cached value associated with the key, or None if not found.
+        """
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Retrieve the values of several keys with a few queries.
+
+        Args:
+            keys: The keys to look up in the cache.
+
+        Returns:
+            A dictionary with the keys found in the cache and their values.
+        """
+        self._check_pid()
+        keys = list(keys)
+        found: Dict[str, Any] = {}
+        with self._pending_lock:
+            rows = [self._pending[key] for key in keys if key in self._pending]
+        for row in rows:
+            found[row[0]] = self.codec.decode(row[1])
+
+        missing = [key for key in keys if key not in found]
+        conn = self._connection()
+        for i in range(0, len(missing), _SQLITE_MAX_PARAMS):
+            chunk = missing[i : i + _SQLITE_MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            for key, data in conn.execute(
+                f"SELECT key, value FROM cache WHERE key IN ({placeholders})",
+                chunk,
+            ):
+                found[key] = self.codec.decode(data)
+        return found
+
+    def has_key(self, key: str) -> bool:
+        """Check if a key exists in the database or the write queue.
+
+        Args:
+            key: The key to check for.
+
+        Returns:
+            True if the key exists in the cache, False otherwise.
+        """
+        self._check_pid()
+        with self._pending_lock:
+            if key in self._pending:
+                return True
+        row = (
+            self._connection()
+            .execute("SELECT 1 FROM cache WHERE key = ?", (key,))
+            .fetchone()
+        )
+        return row is not None
+
+    def set(self, key: str, value) -> None:
+        """Queue a value to be written to the database.
+
+        Args:
+            key: The key to store the value under.
+            value: The value to cache.
+        """
+        self.set_many({key: value})
+
+    def set_many(self, items: Mapping[str, Any]) -> None:
+        """Queue several values to be written to the database.
+
+        Args:
+            items: The keys and the values to store under them.
+        """
+        self._check_pid()
+        if self._closed:
+            raise RuntimeError("The cache is closed")
+        rows = {key: self._row(key, value) for key, value in items.items()}
+        with self._pending_lock:
+            self._pending.update(rows)
+            full = len(self._pending) >= self.max_pending
+        self._ensure_flusher()
+        if full:
+            self._wake.set()
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is None or not self._flusher.is_alive():
+            with self._flush_lock:
+                if self._flusher is None or not self._flusher.is_alive():
+                    self._flusher = threading.Thread(
+                        target=_flush_periodically,
+                        args=(weakref.ref(self), self._wake, self.flush_interval),
+                        name="ragas-cache-flush",
+                        daemon=True,
+                    )
+                    self._flusher.start()
+
+    def flush(self) -> None:
+        """Write the queued values and the hit and miss counters to the database."""
+        self._check_pid()
+        with self._flush_lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, {}
+            stats = self.stats.snapshot()
+            counts = (stats - self._saved_stats).to_dict()
+            counts.pop("hit_rate")
+            if not pending and not any(counts.values()):
+                return
+            conn = self._connection()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    list(pending.values()),
+                )
+                conn.executemany(
+                    "INSERT INTO counters VALUES (?, ?) "
+                    "ON CONFLICT (name) DO UPDATE SET value = value + excluded.value",
+                    [(name, count) for name, count in counts.items() if count],
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                with self._pending_lock:
+                    # keep the values that were not written, unless overwritten since
+                    for key, row in pending.items():
+                        self._pending.setdefault(key, row)
+                raise
+            self._saved_stats = stats
+
+    async def aget(self, key: str) -> Any:
+        """Async version of `get`, reading from the database in a thread."""
+        return await self._io.run(self.get, key)
+
+    async def ahas(self, key: str) -> bool:
+        """Async version of `has_key`, reading from the database in a thread."""
+        return await self._io.run(self.has_key, key)
+
+    async def aget_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Async version of `get_many`, reading from the database in a thread."""
+        return await self._io.run(self.get_many, list(keys))
+
+    # `set` only queues values, so the sync methods do not block the event loop
+
+    @staticmethod
+    def _where(
+        older_than: Optional[float] = None,
+        model: Optional[str] = None,
+        function: Optional[str] = None,
+        ragas_version: Optional[str] = None,
+    ) -> Tuple[str, list]:
+        conditions, params = [], []
+        if older_than is not None:
+            conditions.append("created_at < ?")
+            params.append(time.time() - older_than)
+        for column, value in (
+            ("model", model),
+            ("function", function),
+            ("ragas_version", ragas_version),
+        ):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return where, params
+
+    def prune(
+        self,
+        older_than: Optional[float] = None,
+        model: Optional[str] = None,
+        function: Optional[str] = None,
+        ragas_version: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> int:
+        """Remove the entries matching all the given conditions.
+
+        Args:
+            older_than: Remove entries created more than this many seconds ago.
+            model: Remove entries of this model.
+            function: Remove entries of this cached function, e.g.
+                "LangchainLLMWrapper.agenerate_text".
+            ragas_version: Remove entries written by this version of Ragas.
+            max_bytes: Then remove the oldest entries until the stored values take
+                at most this many bytes.
+
+        Returns:
+            The number of entries removed.
+        """
+        self.flush()
+        conn = self._connection()
+        removed = 0
+        if any(v is not None for v in (older_than, model, function, ragas_version)):
+            where, params = self._where(older_than, model, function, ragas_version)
+            removed += conn.execute(f"DELETE FROM cache{where}", params).rowcount
+        if max_bytes is not None:
+            removed += conn.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM ("
+                "SELECT key, SUM(size) OVER (ORDER BY created_at DESC, key) AS total "
+                "FROM cache) WHERE total > ?)",
+                (max_bytes,),
+            ).rowcount
+        return removed
+
+    def vacuum(self) -> None:
+        """Shrink the database file after entries were removed."""
+        self.flush()
+        conn = self._connection()
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+
+    def summary(self) -> Dict[str, Any]:
+        """Describe the content of the cache and its recorded hit and miss counts.
+
+        Returns:
+            A dictionary with the number of entries, their total size, the file
+            size, the oldest and newest creation times, the entries and bytes by
+            function, model and Ragas version, and the counters of all processes
+            that used the file.
+        """
+        self.flush()
+        conn = self._connection()
+        entries, size, oldest, newest = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), MIN(created_at), "
+            "MAX(created_at) FROM cache"
+        ).fetchone()
+        summary: Dict[str, Any] = {
+            "path": self.path,
+            "entries": entries,
+            "size_bytes": size,
+            "file_bytes": sum(
+                os.path.getsize(self.path + suffix)
+                for suffix in ("", "-wal")
+                if os.path.exists(self.path + suffix)
+            ),
+            "oldest": oldest,
+            "newest": newest,
+        }
+        for column in ("function", "model", "ragas_version"):
+            summary[f"by_{column}"] = {
+                value: {"entries": count, "size_bytes": nbytes}
+                for value, count, nbytes in conn.execute(
+                    f"SELECT {column}, COUNT(*), SUM(size) FROM cache "
+                    f"GROUP BY {column} ORDER BY COUNT(*) DESC"
+                )
+            }
+        counters = dict(conn.execute("SELECT name, value FROM counters"))
+        stats = CacheStats(
+            counters.get("hits", 0),
+            counters.get("misses", 0),
+            counters.get("coalesced", 0),
+        )
+        summary["stats"] = stats.to_dict()
+        return summary
+
+    def export_bundle(
+        self,
+        path: str,
+        model: Optional[str] = None,
+        function: Optional[str] = None,
+        ragas_version: Optional[str] = None,
+    ) -> int:
+        """Copy the entries matching the given conditions to a bundle file.
+
+        A bundle is a SQLite database with the same schema, which can be shipped to
+        another machine, e.g. to run regression evaluations in CI without calling
+        the models, and loaded with `import_bundle`.
+
+        Args:
+            path: Path of the bundle. Entries are added to it if it exists.
+            model: Only export entries of this model.
+            function: Only export entries of this cached function.
+            ragas_version: Only export entries written by this version of Ragas.
+
+        Returns:
+            The number of entries exported.
+
+        Raises:
+            ValueError: If the bundle exists and is not a cache of the current
+                schema version.
+        """
+        if os.path.exists(path):
+            SQLiteCacheBackend.open_existing(path).close()
+        else:
+            SQLiteCacheBackend(path).close()  # create the schema
+        self.flush()
+        where, params = self._where(
+            model=model, function=function, ragas_version=ragas_version
+        )
+        conn = self._connection()
+        conn.execute("ATTACH DATABASE ? AS bundle", (path,))
+        try:
+            return conn.execute(
+                f"INSERT OR REPLACE INTO bundle.cache SELECT * FROM main.cache{where}",
+                params,
+            ).rowcount
+        finally:
+            conn.execute("DETACH DATABASE bundle")
+
+    def import_bundle(self, path: str, overwrite: bool = False) -> int:
+        """Add the entries of a bundle created with `export_bundle`.
+
+        Args:
+            path: Path of the bundle.
+            overwrite: Whether entries of the bundle replace existing entries with
+                the same key. By default, existing entries are kept.
+
+        Returns:
+            The number of entries imported.
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Cache bundle {path} does not exist")
+        version = _sqlite_schema_version(path)
+        if version != _SQLITE_SCHEMA_VERSION:
+            raise ValueError(
+                f"Cache bundle {path} has schema version {version}, "
+                f"expected {_SQLITE_SCHEMA_VERSION}"
+            )
+        self.flush()
+        conn = self._connection()
+        conn.execute("ATTACH DATABASE ? AS bundle", (path,))
+        try:
+            verb = "REPLACE" if overwrite else "IGNORE"
+            return conn.execute(
+                f"INSERT OR {verb} INTO main.cache SELECT * FROM bundle.cache"
+            ).rowcount
+        finally:
+            conn.execute("DETACH DATABASE bundle")
+
+    def __len__(self) -> int:
+        self.flush()
+        return self._connection().execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def close(self) -> None:
+        """Write the queued values and stop the background writes."""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._wake.set()
+        _open_sqlite_backends.discard(self)
+        self._io.shutdown()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def __del__(self):
+        """Write the queued values when the object is destroyed."""
+        if getattr(self, "_pending", None) and self._pid == os.getpid():
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"Failed to write cache entries to {self.path}: {e}")
+
+    def __getstate__(self):
+        # worker processes open their own connections to the same file
+        self.flush()
+        return {
+            "path": self.path,
+            "flush_interval": self.flush_interval,
+            "max_pending": self.max_pending,
+            "compress_min_bytes": self.compress_min_bytes,
+            "codec": self.codec,
+            "io_workers": self.io_workers,
+        }
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init()
+
+    def __repr__(self):
+        return f"SQLiteCacheBackend(path={self.path!r})"
+
+
+_EMBEDDING_SCHEMA_VERSION = 1
+_EMBEDDING_SCHEMA = """
+CREATE TABLE IF NOT EXISTS vectors (
+    key TEXT PRIMARY KEY,
+    dim INTEGER NOT NULL,
+    row INTEGER NOT NULL,
+    model TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS vectors_model ON vectors (model);
+CREATE TABLE IF NOT EXISTS files (
+    dim INTEGER PRIMARY KEY,
+    rows INTEGER NOT NULL
+);
+"""
+
+
+class EmbeddingCacheBackend(CacheInterface):
+    """A cache of embeddings stored as float32 vectors in memory-mapped files.
+
+    Vectors of each dimension are appended to their own file in ``directory`` and
+    read through a read-only memory map, so that a lookup returns numpy arrays that
+    share the pages of the file instead of unpickling lists of floats. A SQLite
+    index in WAL mode maps keys to rows, and is queried once for a whole batch of
+    keys. Like `SQLiteCacheBackend`, the cache can be shared by many threads and
+    processes.
+
+    Only embeddings (lists of floats or 1-d float arrays) can be stored, values
+    lose the precision beyond float32. `BaseRagasEmbedding` models use it like any
+    cache backend, e.g. ``embedding_factory("openai", client=client,
+    cache=EmbeddingCacheBackend())``, and return the cached vectors as lists.
+    Legacy `BaseRagasEmbeddings` cache whole batches and cannot use it.
+
+    Args:
+        directory (str, optional): Directory of the index and the vector files.
+            Defaults to ".cache/ragas_embeddings".
+        io_workers (int, optional): Number of threads used by the async methods.
+            Defaults to 4.
+    """
+
+    def __init__(self, directory: str = ".cache/ragas_embeddings", io_workers: int = 4):
+        self.directory = directory
+        self.io_workers = io_workers
+        os.makedirs(directory, exist_ok=True)
+        self._init()
+        with self._connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, _EMBEDDING_SCHEMA_VERSION):
+                raise ValueError(
+                    f"Embedding cache {directory} has schema version {version}, "
+                    f"expected {_EMBEDDING_SCHEMA_VERSION}"
+                )
+            conn.executescript(_EMBEDDING_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {_EMBEDDING_SCHEMA_VERSION}")
+
+    def _init(self) -> None:
+        # state that is not shared with forked or unpickled copies
+        self._pid = os.getpid()
+        self._local = threading.local()
+        # dim -> read-only memory map of the vector file
+        self._maps: Dict[int, np.ndarray] = {}
+        self._maps_lock = threading.Lock()
+        self._io = _IOThreadPool(self.io_workers)
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._pid != os.getpid():
+            self._init()
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                os.path.join(self.directory, "index.db"),
+                timeout=30,
+                isolation_level=None,
+            )
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _vector_path(self, dim: int) -> str:
+        return os.path.join(self.directory, f"vectors-{dim}.f32")
+
+    def _vectors(self, dim: int, rows: int) -> np.ndarray:
+        """Memory map of the vectors of a dimension, with at least ``rows`` rows."""
+        vectors = self._maps.get(dim)
+        if vectors is None or len(vectors) < rows:
+            with self._maps_lock:
+                vectors = self._maps.get(dim)
+                if vectors is None or len(vectors) < rows:
+                    # the file grew since it was mapped
+                    path = self._vector_path(dim)
+                    count = os.path.getsize(path) // (dim * _FLOAT32.itemsize)
+                    vectors = np.memmap(
+                        path, dtype=_FLOAT32, mode="r", shape=(count, dim)
+                    ).view(np.ndarray)
+                    self._maps[dim] = vectors
+        return vectors
+
+    def get(self, key: str) -> Any:
+        """Retrieve an embedding by key.
+
+        Args:
+            key: The key to look up in the cache.
+
+        Returns:
+            The embedding as a read-only float32 array, or None if not found.
+        """
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Retrieve the embeddings of several keys with a few index queries.
+
+        Args:
+            keys: The keys to look up in the cache.
+
+        Returns:
+            A dictionary with the keys found in the cache and their embeddings, as
+            read-only float32 arrays backed by the memory-mapped files.
+        """
+        keys = list(keys)
+        conn = self._connection()
+        rows: Dict[str, Tuple[int, int]] = {}
+        for i in range(0, len(keys), _SQLITE_MAX_PARAMS):
+            chunk = keys[i : i + _SQLITE_MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            for key, dim, row in conn.execute(
+                f"SELECT key, dim, row FROM vectors WHERE key IN ({placeholders})",
+                chunk,
+            ):
+                rows[key] = (dim, row)
+        found: Dict[str, Any] = {}
+        for key, (dim, row) in rows.items():
+            found[key] = self._vectors(dim, row + 1)[row]
+        return found
+
+    def has_key(self, key: str) -> bool:
+        """Check if an embedding is stored under a key.
+
+        Args:
+            key: The key to check for.
+
+        Returns:
+            True if the key exists in the cache, False otherwise.
+        """
+        row = (
+            self._connection()
+            .execute("SELECT 1 FROM vectors WHERE key = ?", (key,))
+            .fetchone()
+        )
+        return row is not None
+
+    def set(self, key: str, value) -> None:
+        """Store an embedding.
+
+        Args:
+            key: The key to store the embedding under.
+            value: The embedding, a list of floats or a 1-d float array.
+        """
+        self.set_many({key: value})
+
+    def set_many(self, items: Mapping[str, Any]) -> None:
+        """Store several embeddings, appending them to the vector files in one
+        transaction.
+
+        Args:
+            items: The keys and the embeddings to store under them.
+        """
+        by_dim: Dict[int, Dict[str, np.ndarray]] = {}
+        for key, value in items.items():
+            vector = _as_float_array(value)
+            if vector is None or vector.ndim != 1:
+                raise TypeError(
+                    f"EmbeddingCacheBackend only stores embeddings, got {type(value).__name__}"
+                )
+            by_dim.setdefault(len(vector), {})[key] = vector
+        if not by_dim:
+            return
+
+        _, model = _entry_info.get()
+        now = time.time()
+        conn = self._connection()
+        try:
+            # the write lock of the index also serializes the appends to the files
+            conn.execute("BEGIN IMMEDIATE")
+            for dim, vectors in by_dim.items():
+                row = conn.execute(
+                    "SELECT rows FROM files WHERE dim = ?", (dim,)
+                ).fetchone()
+                start = row[0] if row is not None else 0
+                with open(self._vector_path(dim), "ab") as f:
+                    # drop the rows of a write that was not committed
+                    f.truncate(start * dim * _FLOAT32.itemsize)
+                    f.write(np.stack(list(vectors.values())).tobytes())
+                conn.executemany(
+                    "INSERT OR REPLACE INTO vectors VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (key, dim, start + i, model, now)
+                        for i, key in enumerate(vectors)
+                    ],
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?)",
+                    (dim, start + len(vectors)),
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+    async def aget(self, key: str) -> Any:
+        """Async version of `get`, reading the index in a thread."""
+        return await self._io.run(self.get, key)
+
+    async def ahas(self, key: str) -> bool:
+        """Async version of `has_key`, reading the index in a thread."""
+        return await self._io.run(self.has_key, key)
+
+    async def aget_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Async version of `get_many`, reading the index in a thread."""
+        return await self._io.run(self.get_many, list(keys))
+
+    async def aset(self, key: str, value) -> None:
+        """Async version of `set`, writing in a thread."""
+        await self._io.run(self.set, key, value)
+
+    async def aset_many(self, items: Mapping[str, Any]) -> None:
+        """Async version of `set_many`, writing in a thread."""
+        await self._io.run(self.set_many, dict(items))
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM vectors").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the index and release the memory maps."""
+        self._io.shutdown()
+        with self._maps_lock:
+            self._maps = {}
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def __getstate__(self):
+        # worker processes open and map the same files
+        return {"directory": self.directory, "io_workers": self.io_workers}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init()
+
+    def __repr__(self):
+        return f"EmbeddingCacheBackend(directory={self.directory!r})"
+
+
+def _sizeof(value: Any) -> int:
+    """Estimate the size of a value in bytes, by the size of its pickle."""
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class InMemoryCacheBackend(CacheInterface):
+    """A cache implementation that keeps data in memory with LRU eviction.
+
+    Values are stored as is, so cache hits cost a dictionary lookup instead of
+    reading and deserializing from disk. When the cache holds more than
+    ``max_entries`` entries or ``max_bytes`` bytes, the least recently used entries
+    are evicted. Entries older than ``ttl`` seconds are treated as missing.
+
+    Cached values are shared with the callers, so they should not be mutated.
+
+    Args:
+        max_entries (int, optional): Maximum number of entries. Defaults to 10000,
+            None for no limit.
+        max_bytes (int, optional): Maximum total size of the values in bytes,
+            estimated by the size of their pickle. Defaults to None for no limit.
+        ttl (float, optional): Seconds after which an entry expires. Defaults to
+            None for entries that never expire.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 10_000,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ):
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        # key -> (value, size in bytes, expiry time)
+        self._entries: OrderedDict[str, Tuple[Any, int, Optional[float]]] = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def _lookup(self, key: str) -> Optional[Tuple[Any, int, Optional[float]]]:
+        # must be called with the lock held
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at = entry[2]
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._entries[key]
+            self._bytes -= entry[1]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def get(self, key: str) -> Any:
+        """Retrieve a value from the memory cache by key.
+
+        Args:
+            key: The key to look up in the cache.
+
+        Returns:
+            The cached value associated with the key, or None if not found.
+        """
+        with self._lock:
+            entry = self._lookup(key)
+            return None if entry is None else entry[0]
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Retrieve the values of several keys that are present and not expired.
+
+        Args:
+            keys: The keys to look up in the cache.
+
+        Returns:
+            A dictionary with the keys found in the cache and their values.
+        """
+        found = {}
+        with self._lock:
+            for key in keys:
+                entry = self._lookup(key)
+                if entry is not None:
+                    found[key] = entry[0]
+        return found
+
+    def set(self, key: str, value) -> None:
+        """Store a value in the memory cache with the given key.
+
+        Args:
+            key: The key to store the value under.
+            value: The value to cache.
+        """
+        size = _sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            logger.debug(f"Not caching {key}, value of {size} bytes is too large")
+            self.delete(key)
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, size, expires_at)
+            self._bytes += size
+            self._evict()
+
+    def _evict(self) -> None:
+        # must be called with the lock held
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, (_, size, _) = self._entries.popitem(last=False)
+            self._bytes -= size
+
+    def has_key(self, key: str) -> bool:
+        """Check if a key exists in the memory cache and has not expired.
+
+        Args:
+            key: The key to check for.
+
+        Returns:
+            True if the key exists in the cache, False otherwise.
+        """
+        with self._lock:
+            return self._lookup(key) is not None
+
+    def delete(self, key: str) -> None:
+        """Remove a key from the memory cache, if present.
+
+        Args:
+            key: The key to remove.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[1]
+
+    def clear(self) -> None:
+        """Remove all entries from the memory cache."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Estimated total size of the cached values in bytes, if ``max_bytes`` is set."""
+        return self._bytes
+
+    def __repr__(self):
+        return (
+            f"InMemoryCacheBackend(max_entries={self.max_entries}, "
+            f"max_bytes={self.max_bytes}, ttl={self.ttl})"
+        )
+
+
+class TieredCacheBackend(CacheInterface):
+    """A cache implementation that puts a fast cache in front of a slower one.
+
+    Lookups go to the ``memory`` cache first and fall back to the ``persistent``
+    cache, copying hits into memory so that repeated lookups never reach the
+    persistent cache.
+
+    With ``write_back=False`` (write-through), every value is written to both
+    caches immediately. With ``write_back=True``, values are written to memory and
+    queued, and the queue is written to the persistent cache in batches of
+    ``flush_every`` values, when `flush` is called, and when the backend is closed
+    or garbage collected. Write-back saves persistent writes during a run at the
+    risk of losing the queued values if the process crashes.
+
+    Args:
+        persistent (CacheInterface): The slower cache, e.g. a `DiskCacheBackend`.
+        memory (CacheInterface, optional): The fast cache. Defaults to an
+            `InMemoryCacheBackend` with default limits.
+        write_back (bool, optional): Whether to queue writes to the persistent cache.
+            Defaults to False.
+        flush_every (int, optional): Number of queued writes that triggers a flush
+            with ``write_back=True``. Defaults to 100.
+    """
+
+    def __init__(
+        self,
+        persistent: CacheInterface,
+        memory: Optional[CacheInterface] = None,
+        write_back: bool = False,
+        flush_every: int = 100,
+    ):
+        if flush_every < 1:
+            raise ValueError("flush_every must be at least 1")
+        self.persistent = persistent
+        self.memory = memory if memory is not None else InMemoryCacheBackend()
+        self.write_back = write_back
+        self.flush_every = flush_every
+        self._pending: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        """Retrieve a value by key from memory, or else from the persistent cache.
+
+        Args:
+            key: The key to look up in the cache.
+
+        Returns:
+            The cached value associated with the key, or None if not found.
+        """
+        if self.memory.has_key(key):
+            return self.memory.get(key)
+        with self._lock:
+            if key in self._pending:
+                return self._pending[key]
+        if not self.persistent.has_key(key):
+            return None
+        value = self.persistent.get(key)
+        self.memory.set(key, value)
+        return value
+
+    def set(self, key: str, value) -> None:
+        """Store a value in memory and write it, or queue it, to the persistent cache.
+
+        Args:
+            key: The key to store the value under.
+            value: The value to cache.
+        """
+        self.memory.set(key, value)
+        if not self.write_back:
+            self.persistent.set(key, value)
+            return
+        with self._lock:
+            self._pending[key] = value
+            should_flush = len(self._pending) >= self.flush_every
+        if should_flush:
+            self.flush()
+
+    def has_key(self, key: str) -> bool:
+        """Check if a key exists in memory, the write queue or the persistent cache.
+
+        Args:
+            key: The key to check for.
+
+        Returns:
+            True if the key exists in the cache, False otherwise.
+        """
+        if self.memory.has_key(key):
+            return True
+        with self._lock:
+            if key in self._pending:
+                return True
+        return self.persistent.has_key(key)
+
+    def _get_pending(self, keys: Iterable[str]) -> Dict[str, Any]:
+        with self._lock:
+            return {key: self._pending[key] for key in keys if key in self._pending}
+
+    def _queue(self, items: Mapping[str, Any]) -> bool:
+        # returns whether the queue should be flushed
+        with self._lock:
+            self._pending.update(items)
+            return len(self._pending) >= self.flush_every
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Retrieve the values of several keys, looking up the missing ones in bulk.
+
+        Args:
+            keys: The keys to look up in the cache.
+
+        Returns:
+            A dictionary with the keys found in the cache and their values.
+        """
+        keys = list(keys)
+        found = self.memory.get_many(keys)
+        missing = [key for key in keys if key not in found]
+        if missing:
+            found.update(self._get_pending(missing))
+            missing = [key for key in missing if key not in found]
+        if missing:
+            loaded = self.persistent.get_many(missing)
+            if loaded:
+                self.memory.set_many(loaded)
+                found.update(loaded)
+        return found
+
+    def set_many(self, items: Mapping[str, Any]) -> None:
+        """Store several values in memory and write, or queue, them in bulk.
+
+        Args:
+            items: The keys and the values to store under them.
+        """
+        self.memory.set_many(items)
+        if not self.write_back:
+            self.persistent.set_many(items)
+        elif self._queue(items):
+            self.flush()
+
+    async def aget(self, key: str) -> Any:
+        """Async version of `get`, using the async methods of the persistent cache."""
+        if await self.memory.ahas(key):
+            return await self.memory.aget(key)
+        pending = self._get_pending([key])
+        if pending:
+            return pending[key]
+        if not await self.persistent.ahas(key):
+            return None
+        value = await self.persistent.aget(key)
+        await self.memory.aset(key, value)
+        return value
+
+    async def aset(self, key: str, value) -> None:
+        """Async version of `set`, using the async methods of the persistent cache."""
+        await self.memory.aset(key, value)
+        if not self.write_back:
+            await self.persistent.aset(key, value)
+        elif self._queue({key: value}):
+            await self.aflush()
+
+    async def ahas(self, key: str) -> bool:
+        """Async version of `has_key`, using the async methods of the persistent cache."""
+        if await self.memory.ahas(key) or self._get_pending([key]):
+            return True
+        return await self.persistent.ahas(key)
+
+    async def aget_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Async version of `get_many`, using the async methods of the persistent cache."""
+        keys = list(keys)
+        found = await self.memory.aget_many(keys)
+        missing = [key for key in keys if key not in found]
+        if missing:
+            found.update(self._get_pending(missing))
+            missing = [key for key in missing if key not in found]
+        if missing:
+            loaded = await self.persistent.aget_many(missing)
+            if loaded:
+                await self.memory.aset_many(loaded)
+                found.update(loaded)
+        return found
+
+    async def aset_many(self, items: Mapping[str, Any]) -> None:
+        """Async version of `set_many`, using the async methods of the persistent cache."""
+        await self.memory.aset_many(items)
+        if not self.write_back:
+            await self.persistent.aset_many(items)
+        elif self._queue(items):
+            await self.aflush()
+
+    def _take_pending(self) -> Dict[str, Any]:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return pending
+
+    def flush(self) -> None:
+        """Write the queued values to the persistent cache."""
+        pending = self._take_pending()
+        if pending:
+            self.persistent.set_many(pending)
+
+    async def aflush(self) -> None:
+        """Async version of `flush`."""
+        pending = self._take_pending()
+        if pending:
+            await self.persistent.aset_many(pending)
+
+    def close(self) -> None:
+        """Flush the queued values."""
+        self.flush()
+
+    def __del__(self):
+        """Flush the queued values when the object is destroyed."""
+        if getattr(self, "_pending", None):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(
+                    f"Failed to flush {len(self._pending)} cache values: {e}"
+                )
+
+    def __repr__(self):
+        return (
+            f"TieredCacheBackend(memory={self.memory!r}, "
+            f"persistent={self.persistent!r}, write_back={self.write_back})"
+        )
+
+
 def _make_hashable(o):
     if isinstance(o, (tuple, list)):
         return tuple(_make_hashable(e) for e in o)
@@ -146,66 +1623,284 @@ def _make_hashable(o):
 
 EXCLUDE_KEYS = ["callbacks"]
 
+# Version of the cache key format, part of every key. Bump it whenever the way keys
+# are computed changes, so that old entries are not mistaken for new ones.
+CACHE_KEY_VERSION = 2
+
+# Attributes of the object a cached method is bound to that identify the model and
+# its configuration, used when the object does not define `_cache_fingerprint`.
+_OWNER_FINGERPRINT_ATTRS = ("provider", "model", "model_name", "model_args")
+
+# digests of immutable (frozen) pydantic models, by id, dropped with the model
+_model_digests: Dict[int, bytes] = {}
+
+
+def _frozen_model_digest(model: BaseModel) -> bytes:
+    key = id(model)
+    digest = _model_digests.get(key)
+    if digest is None:
+        hasher = hashlib.blake2b(digest_size=16)
+        _update_fingerprint(hasher, model, memoize=False)
+        digest = hasher.digest()
+        try:
+            weakref.finalize(model, _model_digests.pop, key, None)
+        except TypeError:
+            return digest
+        _model_digests[key] = digest
+    return digest
+
+
+def _update_fingerprint(hasher, o: Any, memoize: bool = True) -> None:
+    """Feed an unambiguous encoding of a value into a hash."""
+    if isinstance(o, str):
+        data = o.encode("utf-8", "surrogatepass")
+        hasher.update(b"s%d:" % len(data))
+        hasher.update(data)
+    elif o is None or isinstance(o, (bool, int, float)):
+        hasher.update(f"{type(o).__name__}:{o!r};".encode())
+    elif isinstance(o, (bytes, bytearray)):
+        hasher.update(b"b%d:" % len(o))
+        hasher.update(o)
+    elif isinstance(o, (list, tuple)):
+        hasher.update(b"l%d:" % len(o))
+        for e in o:
+            _update_fingerprint(hasher, e)
+    elif isinstance(o, dict):
+        hasher.update(b"d%d:" % len(o))
+        for k, v in sorted(o.items(), key=lambda item: str(item[0])):
+            _update_fingerprint(hasher, k)
+            _update_fingerprint(hasher, v)
+    elif isinstance(o, (set, frozenset)):
+        hasher.update(b"t%d:" % len(o))
+        for digest in sorted(_fingerprint(e) for e in o):
+            hasher.update(digest)
+    elif isinstance(o, BaseModel):
+        if memoize and o.model_config.get("frozen"):
+            hasher.update(b"h")
+            hasher.update(_frozen_model_digest(o))
+            return
+        cls = type(o)
+        hasher.update(f"m{cls.__module__}.{cls.__qualname__}:".encode())
+        for name in cls.model_fields:
+            _update_fingerprint(hasher, name)
+            _update_fingerprint(hasher, getattr(o, name, None))
+        if o.__pydantic_extra__:
+            _update_fingerprint(hasher, o.__pydantic_extra__)
+    elif isinstance(o, Enum):
+        _update_fingerprint(hasher, o.value)
+    elif dataclasses.is_dataclass(o) and not isinstance(o, type):
+        cls = type(o)
+        hasher.update(f"c{cls.__module__}.{cls.__qualname__}:".encode())
+        for field in dataclasses.fields(o):
+            _update_fingerprint(hasher, field.name)
+            _update_fingerprint(hasher, getattr(o, field.name, None))
+    else:
+        text = repr(o)
+        if " at 0x" in text:
+            # the repr includes the address of the object, which changes every run
+            text = f"{type(o).__module__}.{type(o).__qualname__}"
+        hasher.update(b"r")
+        _update_fingerprint(hasher, text)
+
+
+def _fingerprint(o: Any) -> bytes:
+    """Stable digest of a value, for use in cache keys."""
+    hasher = hashlib.blake2b(digest_size=16)
+    _update_fingerprint(hasher, o)
+    return hasher.digest()
+
+
+def _owner_fingerprint(owner: Any) -> Any:
+    """Identify the model and configuration of the object a cached method is bound to.
+
+    Objects can define a ``_cache_fingerprint()`` method returning the values that
+    identify them. Otherwise, the provider, model and model arguments are used, and
+    the object itself is never hashed.
+    """
+    cache_fingerprint = getattr(owner, "_cache_fingerprint", None)
+    if callable(cache_fingerprint):
+        return cache_fingerprint()
+
+    parts: Dict[str, Any] = {}
+    for attr in _OWNER_FINGERPRINT_ATTRS:
+        value = getattr(owner, attr, None)
+        if isinstance(value, (str, int, float, bool, dict)):
+            parts[attr] = value
+    rate_limit_key = getattr(owner, "_rate_limit_key", None)
+    if callable(rate_limit_key):
+        try:
+            parts["rate_limit_key"] = rate_limit_key()
+        except Exception:
+            pass
+    return parts
+
+
+def _entry_info_for(func) -> Tuple[Optional[str], Optional[str]]:
+    """The cached function and the model it calls, recorded by some backends."""
+    owner = getattr(func, "__self__", None)
+    model = None
+    if owner is not None:
+        fingerprint = _owner_fingerprint(owner)
+        if isinstance(fingerprint, dict):
+            model = fingerprint.get("model") or fingerprint.get("model_name")
+            if model is None and fingerprint.get("rate_limit_key"):
+                model = fingerprint["rate_limit_key"][1]
+    return func.__qualname__, model if isinstance(model, str) else None
+
 
 def _generate_cache_key(func, args, kwargs):
     filtered_kwargs = {k: v for k, v in kwargs.items() if k not in EXCLUDE_KEYS}
 
-    key_data = {
-        "function": func.__qualname__,
-        "args": _make_hashable(args),
-        "kwargs": _make_hashable(filtered_kwargs),
-    }
+    hasher = hashlib.blake2b(digest_size=32)
+    hasher.update(f"ragas-cache-v{CACHE_KEY_VERSION}:".encode())
+    _update_fingerprint(hasher, func.__qualname__)
+    owner = getattr(func, "__self__", None)
+    if owner is not None:
+        _update_fingerprint(hasher, _owner_fingerprint(owner))
+    _update_fingerprint(hasher, args)
+    _update_fingerprint(hasher, filtered_kwargs)
+    return f"v{CACHE_KEY_VERSION}:{hasher.hexdigest()}"
+
+
+class _SingleFlight:
+    """Coalesces concurrent async calls that share a cache key.
+
+    The first caller of a key runs the call, and callers arriving while it is in
+    flight await its result instead of making the same call again. Results are
+    only shared while the call is in flight, nothing is kept afterwards.
+    """
+
+    def __init__(self, on_coalesced: Optional[Callable[[], None]] = None):
+        self._calls: Dict[str, asyncio.Future] = {}
+        self._on_coalesced = on_coalesced
+
+    async def run(self, key: str, call):
+        loop = asyncio.get_running_loop()
+        while True:
+            future = self._calls.get(key)
+            # futures belong to a loop, calls from other loops are not coalesced
+            if future is None or future.get_loop() is not loop:
+                break
+            logger.debug(f"Coalesced call for {key}")
+            if self._on_coalesced is not None:
+                self._on_coalesced()
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # the caller running the call was cancelled, try again
 
-    key_string = json.dumps(key_data, sort_keys=True, default=str)
-    cache_key = hashlib.sha256(key_string.encode("utf-8")).hexdigest()
-    return cache_key
+        future = loop.create_future()
+        self._calls[key] = future
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # the waiting callers receive the exception, avoid the warning for a
+            # future whose exception is never retrieved when there are none
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
 
 
-def cacher(cache_backend: Optional[CacheInterface] = None):
+def cacher(
+    cache_backend: Optional[CacheInterface] = None, coalesce: Optional[bool] = None
+):
     """Decorator that adds caching functionality to a function.
 
     This decorator can be applied to both synchronous and asynchronous functions to cache their results.
-    If no cache backend is provided, the original function is returned unchanged.
+    If no cache backend is provided and coalescing is off, the original function is returned unchanged.
+
+    Concurrent calls of an async function with the same arguments are coalesced: the
+    first call runs, and the others await its result instead of missing the cache
+    too and repeating it.
 
     Args:
         cache_backend (Optional[CacheInterface]): The cache backend to use for storing results.
             If None, caching is disabled.
+        coalesce (Optional[bool]): Whether to coalesce concurrent calls with the same
+            arguments. Defaults to None, which coalesces only when a cache backend is
+            given. Set it to True to coalesce calls without a cache backend, when
+            identical concurrent calls may share one result.
 
     Returns:
         Callable: A decorated function that implements caching behavior.
     """
 
     def decorator(func):
-        if cache_backend is None:
+        is_async = inspect.iscoroutinefunction(func)
+        should_coalesce = cache_backend is not None if coalesce is None else coalesce
+        # sync calls are not coalesced
+        if cache_backend is None and not (should_coalesce and is_async):
             return func
 
-        # hack to make pyright happy
-        backend: CacheInterface = cache_backend
+        backend = cache_backend
+        single_flight = None
+        if should_coalesce:
+            single_flight = _SingleFlight(
+                on_coalesced=None
+                if backend is None
+                else functools.partial(backend.stats.record, coalesced=1)
+            )
 
-        is_async = inspect.iscoroutinefunction(func)
+        async def call_and_cache(cache_key, args, kwargs):
+            if backend is not None:
+                backend.stats.record(misses=1)
+            result = await func(*args, **kwargs)
+            if backend is not None:
+                # resolved per write, the owner may be configured after decorating
+                token = _entry_info.set(_entry_info_for(func))
+                try:
+                    await backend.aset(cache_key, result)
+                finally:
+                    _entry_info.reset(token)
+            return result
 
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
             cache_key = _generate_cache_key(func, args, kwargs)
 
-            if backend.has_key(cache_key):
-                logger.debug(f"Cache hit for {cache_key}")
-                return backend.get(cache_key)
+            if backend is not None:
+                # a single lookup, an entry could expire between a check and a read
+                found = await backend.aget_many([cache_key])
+                if cache_key in found:
+                    logger.debug(f"Cache hit for {cache_key}")
+                    backend.stats.record(hits=1)
+                    return found[cache_key]
 
-            result = await func(*args, **kwargs)
-            backend.set(cache_key, result)
-            return result
+            if single_flight is None:
+                return await call_and_cache(cache_key, args, kwargs)
+            return await single_flight.run(
+                cache_key, lambda: call_and_cache(cache_key, args, kwargs)
+            )
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
+            assert backend is not None
             cache_key = _generate_cache_key(func, args, kwargs)
 
-            if backend.has_key(cache_key):
+            found = backend.get_many([cache_key])
+            if cache_key in found:
                 logger.debug(f"Cache hit for {cache_key}")
-                return backend.get(cache_key)
+                backend.stats.record(hits=1)
+                return found[cache_key]
 
+            backend.stats.record(misses=1)
             result = func(*args, **kwargs)
-            backend.set(cache_key, result)
+            token = _entry_info.set(_entry_info_for(func))
+            try:
+                backend.set(cache_key, result)
+            finally:
+                _entry_info.reset(token)
             return result
 
         return async_wrapper if is_async else sync_wrapper
@@ -0,0 +1,355 @@
+"""
+Value codecs that turn cached values into bytes for cache backends.
+
+Every encoded value starts with a two byte header: a tag for the format of the
+payload and flags for its compression. `decode_value` reads any encoded value,
+so a cache can mix values written by different codecs.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import pickle
+import struct
+import typing as t
+import zlib
+from abc import ABC, abstractmethod
+
+import numpy as np
+from pydantic import BaseModel
+
+# formats of the payload
+_PICKLE = b"K"
+_JSON = b"J"
+_MSGPACK = b"G"
+_PYDANTIC = b"P"
+_VECTOR = b"E"
+_MATRIX = b"M"
+
+# compression flags
+_ZLIB = 1
+_ZSTD = 2
+
+_FLOAT32 = np.dtype("<f4")
+
+# metadata needed to check that an LLM response is complete, see
+# `LangchainLLMWrapper.is_finished`
+_KEPT_METADATA = ("finish_reason", "stop_reason")
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "For zstd compression of cached values, please install zstandard with "
+            "`pip install zstandard`."
+        )
+    return zstandard
+
+
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        raise ImportError(
+            "For msgpack serialization of cached values, please install msgpack "
+            "with `pip install msgpack`."
+        )
+    return msgpack
+
+
+def _compress(
+    payload: bytes, compression: t.Optional[str], level: int
+) -> t.Tuple[bytes, int]:
+    if compression == "zlib":
+        return zlib.compress(payload, level), _ZLIB
+    if compression == "zstd":
+        return _zstd().ZstdCompressor(level=level).compress(payload), _ZSTD
+    return payload, 0
+
+
+def _decompress(
+    payload: t.Union[bytes, memoryview], flags: int
+) -> t.Union[bytes, memoryview]:
+    if flags & _ZLIB:
+        return zlib.decompress(payload)
+    if flags & _ZSTD:
+        return _zstd().ZstdDecompressor().decompress(payload)
+    return payload
+
+
+def _pack(tag: bytes, payload: bytes, flags: int = 0) -> bytes:
+    return tag + bytes([flags]) + payload
+
+
+def _import_class(path: str) -> type:
+    module, _, qualname = path.partition(":")
+    obj: t.Any = importlib.import_module(module)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def decode_value(data: t.Union[bytes, memoryview]) -> t.Any:
+    """
+    Decode a value encoded by any codec of this module.
+
+    Embeddings are returned as read-only float32 numpy arrays that share the memory
+    of ``data``, without copying it.
+    """
+    view = memoryview(data)
+    tag, flags = bytes(view[:1]), view[1]
+    payload = _decompress(view[2:], flags)
+    if tag == _VECTOR:
+        return np.frombuffer(payload, dtype=_FLOAT32)
+    if tag == _MATRIX:
+        rows, cols = struct.unpack_from("<II", payload)
+        return np.frombuffer(payload, dtype=_FLOAT32, offset=8).reshape(rows, cols)
+    if tag == _JSON:
+        return json.loads(bytes(payload))
+    if tag == _MSGPACK:
+        return _msgpack().unpackb(payload, strict_map_key=False)
+    if tag == _PYDANTIC:
+        (length,) = struct.unpack_from("<H", payload)
+        cls = _import_class(bytes(payload[2 : 2 + length]).decode())
+        return cls.model_validate_json(bytes(payload[2 + length :]))
+    if tag == _PICKLE:
+        return pickle.loads(payload)
+    raise ValueError(f"Unknown format of cached value: {tag!r}")
+
+
+class ValueCodec(ABC):
+    """
+    Converts cached values to bytes and back for a cache backend.
+
+    Codecs only choose how values are encoded: all of them write the header read
+    by `decode_value`.
+    """
+
+    @abstractmethod
+    def encode(self, value: t.Any) -> bytes:
+        """Encode a value to bytes."""
+        ...
+
+    def decode(self, data: t.Union[bytes, memoryview]) -> t.Any:
+        """Decode bytes produced by `encode`."""
+        return decode_value(data)
+
+
+class PickleCodec(ValueCodec):
+    """
+    Pickles values, compressing them with zlib when larger than
+    ``compress_min_bytes``.
+
+    Parameters
+    ----------
+    compress_min_bytes : int, optional
+        Minimum size of a pickle to be compressed, None to disable compression.
+    """
+
+    def __init__(self, compress_min_bytes: t.Optional[int] = 1024):
+        self.compress_min_bytes = compress_min_bytes
+
+    def encode(self, value: t.Any) -> bytes:
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if (
+            self.compress_min_bytes is not None
+            and len(payload) >= self.compress_min_bytes
+        ):
+            return _pack(_PICKLE, *_compress(payload, "zlib", 6))
+        return _pack(_PICKLE, payload)
+
+
+class CompactCodec(ValueCodec):
+    """
+    Encodes cached LLM and embedding results compactly.
+
+    - Embeddings (lists of floats, lists of such lists, and float numpy arrays)
+      are stored as packed float32 buffers, about a quarter of the size of their
+      pickle. They are decoded as read-only numpy arrays without copying. Values
+      lose the precision beyond float32.
+    - Pydantic models, like structured outputs, are stored as JSON with the path of
+      their class, if they come back unchanged from JSON. Other models, like
+      langchain ``LLMResult``, are pickled.
+    - Other JSON values are stored as JSON, or msgpack with ``format="msgpack"``.
+    - Anything else is pickled.
+
+    With ``strip_metadata``, the token usage, model names, ids and other provider
+    metadata of langchain results are dropped before writing, only the
+    ``finish_reason`` and ``stop_reason`` needed to check that a response is
+    complete are kept.
+
+    Parameters
+    ----------
+    format : str
+        "json" or "msgpack" (requires the msgpack package) for plain values.
+    compression : str, optional
+        "zlib", "zstd" (requires the zstandard package) or None. Embeddings are
+        never compressed.
+    compression_level : int, optional
+        Compression level, defaults to 6 for zlib and 3 for zstd.
+    compress_min_bytes : int
+        Minimum size of a payload to be compressed.
+    strip_metadata : bool
+        Whether to drop the provider metadata of langchain results.
+    """
+
+    def __init__(
+        self,
+        format: t.Literal["json", "msgpack"] = "json",
+        compression: t.Optional[t.Literal["zlib", "zstd"]] = "zlib",
+        compression_level: t.Optional[int] = None,
+        compress_min_bytes: int = 1024,
+        strip_metadata: bool = True,
+    ):
+        if format not in ("json", "msgpack"):
+            raise ValueError(f"Unknown format {format!r}, use 'json' or 'msgpack'")
+        if compression not in (None, "zlib", "zstd"):
+            raise ValueError(
+                f"Unknown compression {compression!r}, use 'zlib', 'zstd' or None"
+            )
+        if format == "msgpack":
+            _msgpack()
+        if compression == "zstd":
+            _zstd()
+        self.format = format
+        self.compression = compression
+        self.compression_level = (
+            compression_level
+            if compression_level is not None
+            else (3 if compression == "zstd" else 6)
+        )
+        self.compress_min_bytes = compress_min_bytes
+        self.strip_metadata = strip_metadata
+
+    def _pack(self, tag: bytes, payload: bytes) -> bytes:
+        if self.compression is not None and len(payload) >= self.compress_min_bytes:
+            return _pack(
+                tag, *_compress(payload, self.compression, self.compression_level)
+            )
+        return _pack(tag, payload)
+
+    def encode(self, value: t.Any) -> bytes:
+        vector = _as_float_array(value)
+        if vector is not None:
+            if vector.ndim == 1:
+                return _pack(_VECTOR, vector.tobytes())
+            rows, cols = vector.shape
+            return _pack(_MATRIX, struct.pack("<II", rows, cols) + vector.tobytes())
+
+        if isinstance(value, BaseModel):
+            if self.strip_metadata:
+                value = _strip_metadata(value)
+            cls = type(value)
+            path = f"{cls.__module__}:{cls.__qualname__}"
+            # classes defined in functions cannot be imported to decode them
+            if "<locals>" not in path:
+                payload = value.model_dump_json().encode()
+                # JSON loses the subclass of fields typed with a base class, like
+                # the messages of langchain results, those models are pickled
+                if cls.model_validate_json(payload) == value:
+                    name = path.encode()
+                    return self._pack(
+                        _PYDANTIC, struct.pack("<H", len(name)) + name + payload
+                    )
+
+        if _is_json_value(value):
+            if self.format == "msgpack":
+                return self._pack(_MSGPACK, _msgpack().packb(value))
+            return self._pack(
+                _JSON,
+                json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode(),
+            )
+
+        return self._pack(
+            _PICKLE, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+
+    def __repr__(self):
+        return (
+            f"CompactCodec(format={self.format!r}, compression={self.compression!r}, "
+            f"strip_metadata={self.strip_metadata})"
+        )
+
+
+def _as_float_array(value: t.Any) -> t.Optional[np.ndarray]:
+    """Return embeddings as a float32 array, or None for other values."""
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind == "f" and value.ndim in (1, 2) and value.size:
+            return np.ascontiguousarray(value, dtype=_FLOAT32)
+        return None
+    if not isinstance(value, list) or not value:
+        return None
+    first = value[0]
+    if type(first) is float:
+        if all(type(x) is float for x in value):
+            return np.asarray(value, dtype=_FLOAT32)
+        return None
+    if isinstance(first, list) and first and type(first[0]) is float:
+        width = len(first)
+        if all(
+            isinstance(row, list)
+            and len(row) == width
+            and all(type(x) is float for x in row)
+            for row in value
+        ):
+            return np.asarray(value, dtype=_FLOAT32)
+    return None
+
+
+def _is_json_value(value: t.Any) -> bool:
+    """Check that a value comes back unchanged from JSON."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return True
+    if type(value) is list:
+        return all(_is_json_value(v) for v in value)
+    if type(value) is dict:
+        return all(isinstance(k, str) and _is_json_value(v) for k, v in value.items())
+    return False
+
+
+def _filter_metadata(
+    metadata: t.Optional[t.Dict[str, t.Any]],
+) -> t.Optional[t.Dict[str, t.Any]]:
+    if metadata is None:
+        return None
+    return {k: metadata[k] for k in _KEPT_METADATA if k in metadata}
+
+
+def _strip_metadata(value: BaseModel) -> BaseModel:
+    """Drop the provider metadata of langchain LLM results."""
+    try:
+        from langchain_core.messages import AIMessage
+        from langchain_core.outputs import ChatGeneration, LLMResult
+    except ImportError:
+        return value
+    if not isinstance(value, LLMResult):
+        return value
+
+    generations = []
+    for candidates in value.generations:
+        stripped = []
+        for generation in candidates:
+            update: t.Dict[str, t.Any] = {
+                "generation_info": _filter_metadata(generation.generation_info)
+            }
+            if isinstance(generation, ChatGeneration) and isinstance(
+                generation.message, AIMessage
+            ):
+                update["message"] = generation.message.model_copy(
+                    update={
+                        "response_metadata": _filter_metadata(
+                            generation.message.response_metadata
+                        )
+                        or {},
+                        "usage_metadata": None,
+                        "id": None,
+                    }
+                )
+            stripped.append(generation.model_copy(update=update))
+        generations.append(stripped)
+    return value.model_copy(
+        update={"generations": generations, "llm_output": None, "run": None}
+    )
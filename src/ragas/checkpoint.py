@@ -0,0 +1,263 @@
+"""
+Checkpoints for resuming long evaluation runs.
+
+A checkpoint store records every score as soon as its job finishes, keyed by a run
+id, a hash of the row and a fingerprint of the metric. When an evaluation is
+started again with the same store, scores that are already in the checkpoint are
+reused and only the missing (row, metric) pairs are submitted. This makes runs
+that crash, are killed or are cancelled with `Executor.cancel()` resumable.
+
+Examples
+--------
+>>> from ragas import evaluate
+>>> from ragas.checkpoint import SQLiteCheckpointStore
+>>> checkpoint = SQLiteCheckpointStore("eval.db", run_id="nightly")
+>>> result = evaluate(dataset, metrics, checkpoint=checkpoint)  # resumes if interrupted
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import typing as t
+from abc import ABC, abstractmethod
+
+from pydantic import BaseModel
+
+if t.TYPE_CHECKING:
+    from ragas.metrics.base import Metric
+
+logger = logging.getLogger(__name__)
+
+CheckpointKey = t.Tuple[str, str]
+
+
+def _json_default(o: t.Any) -> t.Any:
+    # numpy scalars are common metric outputs
+    if hasattr(o, "item"):
+        return o.item()
+    return str(o)
+
+
+def hash_row(sample: t.Union[BaseModel, t.Dict[str, t.Any]]) -> str:
+    """Return a stable hash of a dataset row."""
+    data = sample.model_dump() if isinstance(sample, BaseModel) else sample
+    payload = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def fingerprint_metric(metric: Metric) -> str:
+    """
+    Return a fingerprint of a metric's configuration.
+
+    The fingerprint covers the metric class, its name, its mode (if any), the
+    instructions and examples of its prompts and the models of its LLM and
+    embeddings, so that a changed prompt or judge model does not reuse stale
+    scores.
+    """
+    from ragas.cache import _owner_fingerprint
+    from ragas.prompt.mixin import PromptMixin
+
+    data: t.Dict[str, t.Any] = {
+        "class": f"{type(metric).__module__}.{type(metric).__qualname__}",
+        "name": metric.name,
+        "mode": str(getattr(metric, "mode", None)),
+    }
+    for attr in ("llm", "embeddings"):
+        model = getattr(metric, attr, None)
+        if model is not None:
+            data[attr] = {
+                "class": type(model).__qualname__,
+                "model": _owner_fingerprint(model),
+            }
+    if isinstance(metric, PromptMixin):
+        data["prompts"] = {
+            name: {
+                "instruction": prompt.instruction,
+                "examples": prompt.examples,
+                "language": prompt.language,
+            }
+            for name, prompt in metric.get_prompts().items()
+        }
+    payload = json.dumps(data, sort_keys=True, default=str)
+    return f"{metric.name}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]}"
+
+
+class CheckpointStore(ABC):
+    """
+    Abstract base class for checkpoint stores.
+
+    Parameters
+    ----------
+    run_id : str
+        Identifier of the run. Scores are only reused by runs with the same id, so
+        the same store can hold several runs.
+    """
+
+    def __init__(self, run_id: str = "default"):
+        self.run_id = run_id
+
+    @abstractmethod
+    def load(self) -> t.Dict[CheckpointKey, t.Any]:
+        """Return all scores of the run, keyed by (row hash, metric fingerprint)."""
+        pass
+
+    @abstractmethod
+    def save(self, row_hash: str, metric_fingerprint: str, value: t.Any) -> None:
+        """Durably record the score of a (row, metric) pair."""
+        pass
+
+    def close(self) -> None:
+        """Release the resources held by the store."""
+        pass
+
+    def checkpointed(
+        self,
+        func: t.Callable[..., t.Awaitable[t.Any]],
+        row_hash: str,
+        metric_fingerprint: str,
+    ) -> t.Callable[..., t.Awaitable[t.Any]]:
+        """
+        Wrap a scoring coroutine function so that its result is saved on success.
+
+        Failed jobs are not recorded and will be retried by a resumed run.
+        """
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            value = await func(*args, **kwargs)
+            try:
+                self.save(row_hash, metric_fingerprint, value)
+            except Exception as e:
+                # losing a checkpoint entry must not fail the evaluation
+                logger.warning("Failed to save checkpoint: %s", e)
+            return value
+
+        return wrapper
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """
+    Checkpoint store backed by a local SQLite database.
+
+    Every score is committed as soon as it is saved, so a run killed at any point
+    only loses the jobs that were in flight.
+
+    Parameters
+    ----------
+    path : str
+        Path of the database file. It is created if it does not exist.
+    run_id : str
+        Identifier of the run.
+    """
+
+    def __init__(self, path: str, run_id: str = "default"):
+        super().__init__(run_id)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints ("
+                "run_id TEXT NOT NULL, row_hash TEXT NOT NULL, metric TEXT NOT NULL, "
+                "value TEXT, PRIMARY KEY (run_id, row_hash, metric))"
+            )
+            self._conn.commit()
+
+    def load(self) -> t.Dict[CheckpointKey, t.Any]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT row_hash, metric, value FROM checkpoints WHERE run_id = ?",
+                (self.run_id,),
+            ).fetchall()
+        return {
+            (row_hash, metric): json.loads(value) for row_hash, metric, value in rows
+        }
+
+    def save(self, row_hash: str, metric_fingerprint: str, value: t.Any) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?)",
+                (
+                    self.run_id,
+                    row_hash,
+                    metric_fingerprint,
+                    json.dumps(value, default=_json_default),
+                ),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __repr__(self) -> str:
+        return f"SQLiteCheckpointStore(path={self.path!r}, run_id={self.run_id!r})"
+
+
+class JSONLCheckpointStore(CheckpointStore):
+    """
+    Checkpoint store that appends one JSON line per score to a local file.
+
+    The file can hold several runs. A line truncated by a crash is ignored when
+    the checkpoint is loaded.
+
+    Parameters
+    ----------
+    path : str
+        Path of the JSONL file. It is created if it does not exist.
+    run_id : str
+        Identifier of the run.
+    """
+
+    def __init__(self, path: str, run_id: str = "default"):
+        super().__init__(run_id)
+        self.path = path
+        self._lock = threading.Lock()
+        self._tail_checked = False
+
+    def load(self) -> t.Dict[CheckpointKey, t.Any]:
+        scores: t.Dict[CheckpointKey, t.Any] = {}
+        if not os.path.exists(self.path):
+            return scores
+        with self._lock, open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if entry.get("run_id") == self.run_id:
+                    scores[(entry["row"], entry["metric"])] = entry["value"]
+        return scores
+
+    def save(self, row_hash: str, metric_fingerprint: str, value: t.Any) -> None:
+        line = json.dumps(
+            {
+                "run_id": self.run_id,
+                "row": row_hash,
+                "metric": metric_fingerprint,
+                "value": value,
+            },
+            default=_json_default,
+        )
+        with self._lock, open(self.path, "ab+") as f:
+            if not self._tail_checked:
+                # terminate a line left truncated by a crash before appending
+                self._tail_checked = True
+                f.seek(0, os.SEEK_END)
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        f.write(b"\n")
+            f.write(line.encode("utf-8") + b"\n")
+            f.flush()
+
+    def __repr__(self) -> str:
+        return f"JSONLCheckpointStore(path={self.path!r}, run_id={self.run_id!r})"
@@ -1036,5 +1036,220 @@ async def run_experiment(row: TestDataRow):
     )
 
 
+cache_app = typer.Typer(help="Inspect and manage the LLM and embedding cache")
+app.add_typer(cache_app, name="cache")
+
+DEFAULT_CACHE_PATH = ".cache/ragas_cache.db"
+
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+_SIZE_UNITS = {"b": 1, "kb": 1024, "mb": 1024**2, "gb": 1024**3}
+
+
+def parse_duration(value: str) -> float:
+    """Parse a duration like "90s", "12h" or "7d" into seconds."""
+    value = value.strip().lower()
+    unit = value[-1:] if value[-1:] in _DURATION_UNITS else "s"
+    number = value[:-1] if value[-1:] in _DURATION_UNITS else value
+    try:
+        return float(number) * _DURATION_UNITS[unit]
+    except ValueError:
+        raise typer.BadParameter(f"Invalid duration: {value}")
+
+
+def parse_size(value: str) -> int:
+    """Parse a size like "500MB" or "2GB" into bytes."""
+    value = value.strip().lower()
+    for unit in ("kb", "mb", "gb", "b"):
+        if value.endswith(unit):
+            number, factor = value[: -len(unit)], _SIZE_UNITS[unit]
+            break
+    else:
+        number, factor = value, 1
+    try:
+        return int(float(number) * factor)
+    except ValueError:
+        raise typer.BadParameter(f"Invalid size: {value}")
+
+
+def format_size(size: float) -> str:
+    """Format a number of bytes for display."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def open_cache(path: str):
+    """Open an existing SQLite cache, exiting if it is missing or of another schema."""
+    from ragas.cache import SQLiteCacheBackend
+
+    try:
+        return SQLiteCacheBackend.open_existing(path)
+    except (FileNotFoundError, ValueError) as e:
+        error(str(e))
+        raise typer.Exit(1)
+
+
+@cache_app.command("stats")
+def cache_stats(
+    path: str = typer.Option(
+        DEFAULT_CACHE_PATH, "--path", "-p", help="Path of the SQLite cache"
+    ),
+):
+    """Show the size, hit rate and entries by function, model and version of a cache."""
+    from datetime import datetime
+
+    cache = open_cache(path)
+    summary = cache.summary()
+    cache.close()
+
+    stats = summary["stats"]
+    lookups = stats["hits"] + stats["misses"] + stats["coalesced"]
+    table = Table(title=f"Cache {path}")
+    table.add_column("", style="bold")
+    table.add_column("", justify="right")
+    table.add_row("Entries", str(summary["entries"]))
+    table.add_row("Size of values", format_size(summary["size_bytes"]))
+    table.add_row("Size on disk", format_size(summary["file_bytes"]))
+    for label, key in (("Oldest entry", "oldest"), ("Newest entry", "newest")):
+        if summary[key] is not None:
+            created = datetime.fromtimestamp(summary[key])
+            table.add_row(label, created.strftime("%Y-%m-%d %H:%M"))
+    table.add_row("Hits", str(stats["hits"]))
+    table.add_row("Misses", str(stats["misses"]))
+    table.add_row("Coalesced", str(stats["coalesced"]))
+    table.add_row("Hit rate", f"{stats['hit_rate']:.1%}" if lookups else "-")
+    console.print(table)
+
+    for column, title in (
+        ("function", "Function"),
+        ("model", "Model"),
+        ("ragas_version", "Ragas Version"),
+    ):
+        groups = summary[f"by_{column}"]
+        if not groups:
+            continue
+        table = Table(title=f"Entries by {title}")
+        table.add_column(title, style="bold")
+        table.add_column("Entries", justify="right")
+        table.add_column("Size", justify="right")
+        for value, group in groups.items():
+            table.add_row(
+                str(value) if value is not None else "-",
+                str(group["entries"]),
+                format_size(group["size_bytes"]),
+            )
+        console.print(table)
+
+
+@cache_app.command("prune")
+def cache_prune(
+    path: str = typer.Option(
+        DEFAULT_CACHE_PATH, "--path", "-p", help="Path of the SQLite cache"
+    ),
+    older_than: Optional[str] = typer.Option(
+        None, "--older-than", help="Remove entries older than this, e.g. 30d or 12h"
+    ),
+    model: Optional[str] = typer.Option(
+        None, "--model", help="Remove entries of this model"
+    ),
+    function: Optional[str] = typer.Option(
+        None, "--function", help="Remove entries of this cached function"
+    ),
+    ragas_version: Optional[str] = typer.Option(
+        None, "--ragas-version", help="Remove entries written by this Ragas version"
+    ),
+    max_size: Optional[str] = typer.Option(
+        None,
+        "--max-size",
+        help="Then remove the oldest entries until the cache is at most this size, e.g. 500MB",
+    ),
+    vacuum: bool = typer.Option(
+        True, "--vacuum/--no-vacuum", help="Shrink the cache file afterwards"
+    ),
+):
+    """Remove cache entries by age, model, function, Ragas version or total size."""
+    if all(
+        option is None
+        for option in (older_than, model, function, ragas_version, max_size)
+    ):
+        error(
+            "Pass at least one of --older-than, --model, --function, "
+            "--ragas-version or --max-size"
+        )
+        raise typer.Exit(1)
+
+    cache = open_cache(path)
+    removed = cache.prune(
+        older_than=parse_duration(older_than) if older_than is not None else None,
+        model=model,
+        function=function,
+        ragas_version=ragas_version,
+        max_bytes=parse_size(max_size) if max_size is not None else None,
+    )
+    if vacuum and removed:
+        cache.vacuum()
+    cache.close()
+    success(f"Removed {removed} entries from {path}")
+
+
+@cache_app.command("export")
+def cache_export(
+    bundle: str = typer.Argument(..., help="Path of the bundle to write"),
+    path: str = typer.Option(
+        DEFAULT_CACHE_PATH, "--path", "-p", help="Path of the SQLite cache"
+    ),
+    model: Optional[str] = typer.Option(
+        None, "--model", help="Only export entries of this model"
+    ),
+    function: Optional[str] = typer.Option(
+        None, "--function", help="Only export entries of this cached function"
+    ),
+    ragas_version: Optional[str] = typer.Option(
+        None, "--ragas-version", help="Only export entries of this Ragas version"
+    ),
+):
+    """Export cache entries to a bundle that can be imported on another machine."""
+    cache = open_cache(path)
+    try:
+        exported = cache.export_bundle(
+            bundle, model=model, function=function, ragas_version=ragas_version
+        )
+    except ValueError as e:
+        error(str(e))
+        raise typer.Exit(1)
+    finally:
+        cache.close()
+    success(f"Exported {exported} entries to {bundle}")
+
+
+@cache_app.command("import")
+def cache_import(
+    bundle: str = typer.Argument(..., help="Path of the bundle to import"),
+    path: str = typer.Option(
+        DEFAULT_CACHE_PATH, "--path", "-p", help="Path of the SQLite cache"
+    ),
+    overwrite: bool = typer.Option(
+        False, "--overwrite", help="Replace existing entries with the same key"
+    ),
+):
+    """Import the entries of a bundle into a cache, creating it if needed."""
+    from ragas.cache import SQLiteCacheBackend
+
+    if not Path(bundle).exists():
+        error(f"Bundle {bundle} does not exist")
+        raise typer.Exit(1)
+    cache = open_cache(path) if Path(path).exists() else SQLiteCacheBackend(path)
+    try:
+        imported = cache.import_bundle(bundle, overwrite=overwrite)
+    except ValueError as e:
+        error(str(e))
+        raise typer.Exit(1)
+    finally:
+        cache.close()
+    success(f"Imported {imported} entries into {path}")
+
+
 if __name__ == "__main__":
     app()
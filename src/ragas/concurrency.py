@@ -0,0 +1,183 @@
+"""Adaptive concurrency control for Ragas executors."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import typing as t
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# HTTP status codes providers use to signal throttling or overload
+THROTTLING_STATUS_CODES = (429, 503, 529)
+
+
+def is_throttling_error(exc: BaseException) -> bool:
+    """
+    Check whether an exception signals that the provider is overloaded.
+
+    Rate limit errors (HTTP 429 and provider specific overload codes) and timeouts
+    are treated as throttling signals. Other errors, like output parsing failures,
+    say nothing about the provider's capacity and are ignored.
+    """
+    if isinstance(exc, (asyncio.TimeoutError, TimeoutError)):
+        return True
+
+    status_code = getattr(exc, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(exc, "response", None), "status_code", None)
+    if status_code in THROTTLING_STATUS_CODES:
+        return True
+
+    name = type(exc).__name__.lower()
+    return "ratelimit" in name or "timeout" in name
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Concurrency limit that adapts to provider health using AIMD.
+
+    The limit grows additively (by ``increase_step`` per ``limit`` successful jobs)
+    while the recent latency stays within ``latency_tolerance`` times the long term
+    latency, and is cut multiplicatively by ``decrease_factor`` when a throttling
+    error (rate limit or timeout) is observed. Cuts are spaced by ``cooldown``
+    seconds so a burst of failures from the same overload event only counts once.
+
+    The limiter is an async context manager and can be used in place of an
+    ``asyncio.Semaphore``.
+
+    Parameters
+    ----------
+    initial_limit : int
+        Concurrency limit to start with.
+    min_limit : int
+        Lower bound for the limit.
+    max_limit : int
+        Upper bound for the limit.
+    increase_step : float
+        Additive increase applied per window of successful jobs.
+    decrease_factor : float
+        Multiplicative factor applied to the limit on throttling errors.
+    latency_tolerance : float
+        Growth is paused while recent latency exceeds this multiple of the long
+        term latency.
+    cooldown : float
+        Minimum number of seconds between two multiplicative decreases.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase_step: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        cooldown: float = 1.0,
+    ):
+        if min_limit < 1:
+            raise ValueError("min_limit must be at least 1")
+        if max_limit < min_limit:
+            raise ValueError("max_limit must be greater than or equal to min_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.cooldown = cooldown
+
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._waiters: t.Deque[asyncio.Future] = deque()
+        self._recent_latency: t.Optional[float] = None
+        self._baseline_latency: t.Optional[float] = None
+        self._last_decrease = float("-inf")
+
+    @property
+    def limit(self) -> int:
+        """The current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of jobs currently holding a slot."""
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        """Wait until a slot is free under the current limit and take it."""
+        loop = asyncio.get_running_loop()
+        while self._in_flight >= self.limit:
+            waiter = loop.create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif waiter.done() and not waiter.cancelled():
+                    # we were woken up but will not use the slot, pass it on
+                    self._wake_waiters()
+                raise
+        self._in_flight += 1
+
+    def release(self) -> None:
+        """Release a slot taken with `acquire`."""
+        self._in_flight = max(self._in_flight - 1, 0)
+        self._wake_waiters()
+
+    async def __aenter__(self) -> "AdaptiveConcurrencyLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+    def record_success(self, latency: float) -> None:
+        """Record a successful job and grow the limit if latency is healthy."""
+        if self._baseline_latency is None or self._recent_latency is None:
+            self._baseline_latency = self._recent_latency = latency
+        else:
+            self._recent_latency = 0.7 * self._recent_latency + 0.3 * latency
+            self._baseline_latency = 0.95 * self._baseline_latency + 0.05 * latency
+
+        if self._recent_latency > self.latency_tolerance * self._baseline_latency:
+            return
+
+        previous = self.limit
+        self._limit = min(
+            self._limit + self.increase_step / max(self._limit, 1.0),
+            float(self.max_limit),
+        )
+        if self.limit != previous:
+            logger.debug("Concurrency limit increased to %s", self.limit)
+            self._wake_waiters()
+
+    def record_failure(self, exc: BaseException) -> None:
+        """Record a failed job and cut the limit if it signals throttling."""
+        if not is_throttling_error(exc):
+            return
+
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+
+        self._limit = max(self._limit * self.decrease_factor, float(self.min_limit))
+        logger.debug(
+            "Concurrency limit decreased to %s after %s",
+            self.limit,
+            type(exc).__name__,
+        )
+
+    def _wake_waiters(self) -> None:
+        free_slots = self.limit - self._in_flight
+        while free_slots > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free_slots -= 1
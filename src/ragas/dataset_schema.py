@@ -423,6 +423,14 @@ class EvaluationResult:
         List of columns that are binary metrics. Default is an empty list.
     cost_cb : CostCallbackHandler, optional
         The callback handler for cost computation. Default is None.
+    coverage : dict, optional
+        For runs with a deadline, the number of scores computed before it, overall
+        and per metric (``by_metric``), and the number of jobs ``skipped`` or
+        ``cut`` short by it. Missing scores are NaN. Default is None.
+    cache_stats : dict, optional
+        The cache ``hits``, ``misses``, ``coalesced`` calls and ``hit_rate`` of the
+        LLM and embedding calls of the run, if the models of the metrics use a
+        cache. Default is None.
     """
 
     scores: t.List[t.Dict[str, t.Any]]
@@ -432,6 +440,8 @@ class EvaluationResult:
     traces: t.List[t.Dict[str, t.Any]] = field(default_factory=list)
     ragas_traces: t.Dict[str, ChainRun] = field(default_factory=dict, repr=False)
     run_id: t.Optional[UUID] = None
+    coverage: t.Optional[t.Dict[str, t.Any]] = None
+    cache_stats: t.Optional[t.Dict[str, t.Any]] = None
 
     def __post_init__(self):
         # transform scores from list of dicts to dict of lists
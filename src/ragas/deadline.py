@@ -0,0 +1,138 @@
+"""Run-level deadlines that turn a run into a partial result instead of a timeout."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import typing as t
+from collections import deque
+
+from ragas.exceptions import DeadlineExceededError
+from ragas.scheduling import DEFAULT_GROUP
+
+
+class RunDeadline:
+    """
+    Deadline for a whole run of jobs.
+
+    A job is only started if it is projected to finish before the deadline: the
+    median latency of the last jobs of its group must fit in the remaining time.
+    Jobs already running when the deadline is reached are cancelled. Skipped and
+    cancelled jobs raise `DeadlineExceededError` and are counted, so that the
+    coverage of a partial run can be reported.
+
+    Parameters
+    ----------
+    seconds : float
+        Time budget of the run, counted from `start`.
+    window : int
+        Number of recent latencies per group used to project job durations.
+    """
+
+    def __init__(self, seconds: float, window: int = 100):
+        if seconds <= 0:
+            raise ValueError("seconds must be positive")
+        self.seconds = seconds
+        self.window = window
+        self._ends_at: t.Optional[float] = None
+        self._latencies: t.Dict[str, t.Deque[float]] = {}
+        self._lock = threading.Lock()
+        self.skipped: t.Set[int] = set()
+        self.cut: t.Set[int] = set()
+        self.completed = 0
+
+    def start(self) -> None:
+        """Start the clock, the first call wins."""
+        if self._ends_at is None:
+            self._ends_at = time.monotonic() + self.seconds
+
+    @property
+    def remaining(self) -> float:
+        """Seconds left before the deadline."""
+        if self._ends_at is None:
+            return self.seconds
+        return self._ends_at - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has been reached."""
+        return self.remaining <= 0
+
+    def projected_duration(self, group: t.Optional[str] = None) -> t.Optional[float]:
+        """Median recent latency of the jobs of a group, None before the first one."""
+        with self._lock:
+            latencies = self._latencies.get(group or DEFAULT_GROUP)
+            if not latencies:
+                return None
+            ordered = sorted(latencies)
+        return ordered[len(ordered) // 2]
+
+    def admit(self, group: t.Optional[str] = None) -> bool:
+        """Whether a job of the group can start and still finish in time."""
+        remaining = self.remaining
+        if remaining <= 0:
+            return False
+        projected = self.projected_duration(group)
+        return projected is None or projected <= remaining
+
+    def record_latency(self, group: t.Optional[str], latency: float) -> None:
+        with self._lock:
+            latencies = self._latencies.get(group or DEFAULT_GROUP)
+            if latencies is None:
+                latencies = self._latencies[group or DEFAULT_GROUP] = deque(
+                    maxlen=self.window
+                )
+            latencies.append(latency)
+
+    async def run(
+        self,
+        index: int,
+        group: t.Optional[str],
+        callable: t.Callable[..., t.Awaitable[t.Any]],
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> t.Any:
+        """
+        Run a job if it is admitted, cancelling it when the deadline is reached.
+
+        Raises
+        ------
+        DeadlineExceededError
+            If the job was skipped or cut short by the deadline.
+        """
+        if not self.admit(group):
+            self.skipped.add(index)
+            raise DeadlineExceededError(started=False)
+        start = time.monotonic()
+        try:
+            result = await asyncio.wait_for(
+                callable(*args, **kwargs), timeout=self.remaining
+            )
+        except asyncio.TimeoutError:
+            if not self.expired:
+                # raised by the job itself, e.g. its own timeout
+                raise
+            self.cut.add(index)
+            raise DeadlineExceededError(started=True)
+        except Exception:
+            self.completed += 1
+            raise
+        self.completed += 1
+        self.record_latency(group, time.monotonic() - start)
+        return result
+
+    def coverage(self) -> t.Dict[str, t.Any]:
+        """
+        Counts of the jobs that completed, were skipped or were cut short.
+
+        Jobs that failed with another error count as completed.
+        """
+        total = self.completed + len(self.skipped) + len(self.cut)
+        return {
+            "jobs": total,
+            "completed": self.completed,
+            "skipped": len(self.skipped),
+            "cut": len(self.cut),
+            "coverage": self.completed / total if total else 1.0,
+        }
@@ -0,0 +1,583 @@
+"""
+Distributed evaluation over a shared work queue.
+
+A coordinator enqueues one job per (row, metric) pair of a dataset and waits for
+the results, while any number of workers, on the same or other machines, lease
+jobs from the queue, score them and write the scores back. A lease expires if its
+worker stops renewing it, e.g. because it crashed, and the job is then handed to
+another worker.
+
+`WorkQueue` is the interface to implement for a queue service. `SQLiteWorkQueue` is
+the reference implementation: a single SQLite file, which works for processes on
+one machine and for machines sharing a file system with working locks.
+
+Examples
+--------
+On the coordinator:
+
+>>> from ragas import evaluate
+>>> from ragas.distributed import SQLiteWorkQueue
+>>> result = evaluate(dataset, metrics, work_queue=SQLiteWorkQueue("queue.db"))
+
+On every worker, with metrics of the same names:
+
+>>> from ragas.distributed import SQLiteWorkQueue, run_worker
+>>> run_worker(SQLiteWorkQueue("queue.db"), metrics, llm=llm)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import typing as t
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+import numpy as np
+from tqdm.auto import tqdm
+
+from ragas.callbacks import ChainRun, ChainType
+from ragas.checkpoint import _json_default
+from ragas.dataset_schema import (
+    EvaluationDataset,
+    EvaluationResult,
+    MultiTurnSample,
+    SingleTurnSample,
+)
+from ragas.exceptions import RagasException
+from ragas.run_config import RunConfig
+
+if t.TYPE_CHECKING:
+    from ragas.embeddings.base import BaseRagasEmbeddings
+    from ragas.llms.base import BaseRagasLLM
+    from ragas.metrics.base import Metric
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+RAGAS_DISTRIBUTED_CHAIN_NAME = "ragas distributed evaluation"
+
+
+@dataclass
+class QueuedJob:
+    """A job leased by a worker."""
+
+    run_id: str
+    job_id: str
+    payload: t.Dict[str, t.Any]
+    worker_id: str
+    attempts: int
+
+
+@dataclass
+class JobOutcome:
+    """The final state of a job: ``done`` with a result or ``failed`` with an error."""
+
+    status: str
+    result: t.Any = None
+    error: t.Optional[str] = None
+
+
+class WorkQueue(ABC):
+    """
+    Queue of jobs shared by a coordinator and its workers.
+
+    Jobs belong to a run and are identified by a job id within it. A leased job
+    belongs to its worker until the lease expires; `complete`, `fail` and `renew`
+    only succeed while the worker still holds the lease. A job whose lease expired
+    ``max_attempts`` times is failed instead of being leased again.
+    """
+
+    @abstractmethod
+    def put(self, run_id: str, jobs: t.Iterable[t.Tuple[str, t.Dict]]) -> None:
+        """Enqueue ``(job_id, payload)`` pairs, ignoring job ids already queued."""
+        ...
+
+    @abstractmethod
+    def lease(
+        self, worker_id: str, lease_seconds: float, max_jobs: int = 1
+    ) -> t.List[QueuedJob]:
+        """Lease up to ``max_jobs`` jobs of any run."""
+        ...
+
+    @abstractmethod
+    def renew(self, job: QueuedJob, lease_seconds: float) -> bool:
+        """Extend the lease of a job, returning False if the lease was lost."""
+        ...
+
+    @abstractmethod
+    def complete(self, job: QueuedJob, result: t.Any) -> bool:
+        """Record the result of a job, returning False if the lease was lost."""
+        ...
+
+    @abstractmethod
+    def fail(self, job: QueuedJob, error: str) -> bool:
+        """Record that a job failed, returning False if the lease was lost."""
+        ...
+
+    @abstractmethod
+    def outcomes(self, run_id: str) -> t.Dict[str, JobOutcome]:
+        """Return the outcome of every finished job of a run."""
+        ...
+
+    @abstractmethod
+    def delete(self, run_id: str) -> None:
+        """Remove all jobs of a run."""
+        ...
+
+    def close(self) -> None:
+        """Release the resources held by the queue."""
+        pass
+
+
+class SQLiteWorkQueue(WorkQueue):
+    """
+    Work queue stored in a SQLite database.
+
+    Leases are taken in an immediate transaction, so concurrent workers never lease
+    the same job. The database runs in WAL mode, which needs a local file system or
+    one with working file locks.
+
+    Parameters
+    ----------
+    path : str
+        Path of the database file. It is created if it does not exist.
+    max_attempts : int
+        Number of leases a job gets before it is failed.
+    """
+
+    def __init__(self, path: str, max_attempts: int = 3):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.path = path
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None, timeout=30
+        )
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "run_id TEXT NOT NULL, job_id TEXT NOT NULL, payload TEXT NOT NULL, "
+                "status TEXT NOT NULL, worker_id TEXT, lease_expires REAL, "
+                "attempts INTEGER NOT NULL DEFAULT 0, result TEXT, error TEXT, "
+                "PRIMARY KEY (run_id, job_id))"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, lease_expires)"
+            )
+
+    def put(self, run_id: str, jobs: t.Iterable[t.Tuple[str, t.Dict]]) -> None:
+        rows = [
+            (run_id, job_id, json.dumps(payload, default=_json_default), PENDING)
+            for job_id, payload in jobs
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO jobs (run_id, job_id, payload, status) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def lease(
+        self, worker_id: str, lease_seconds: float, max_jobs: int = 1
+    ) -> t.List[QueuedJob]:
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # jobs of crashed workers that used up their attempts
+                self._conn.execute(
+                    "UPDATE jobs SET status = ?, error = ?, worker_id = NULL "
+                    "WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+                    (
+                        FAILED,
+                        f"lease expired {self.max_attempts} times",
+                        LEASED,
+                        now,
+                        self.max_attempts,
+                    ),
+                )
+                rows = self._conn.execute(
+                    "SELECT rowid, run_id, job_id, payload, attempts FROM jobs "
+                    "WHERE status = ? OR (status = ? AND lease_expires < ?) "
+                    "ORDER BY rowid LIMIT ?",
+                    (PENDING, LEASED, now, max_jobs),
+                ).fetchall()
+                self._conn.executemany(
+                    "UPDATE jobs SET status = ?, worker_id = ?, lease_expires = ?, "
+                    "attempts = attempts + 1 WHERE rowid = ?",
+                    [(LEASED, worker_id, now + lease_seconds, row[0]) for row in rows],
+                )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return [
+            QueuedJob(
+                run_id=run_id,
+                job_id=job_id,
+                payload=json.loads(payload),
+                worker_id=worker_id,
+                attempts=attempts + 1,
+            )
+            for _, run_id, job_id, payload, attempts in rows
+        ]
+
+    def _update_leased(self, job: QueuedJob, assignments: str, values: t.Tuple) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                f"UPDATE jobs SET {assignments} "
+                "WHERE run_id = ? AND job_id = ? AND status = ? AND worker_id = ?",
+                (*values, job.run_id, job.job_id, LEASED, job.worker_id),
+            )
+        return cursor.rowcount > 0
+
+    def renew(self, job: QueuedJob, lease_seconds: float) -> bool:
+        return self._update_leased(
+            job, "lease_expires = ?", (time.time() + lease_seconds,)
+        )
+
+    def complete(self, job: QueuedJob, result: t.Any) -> bool:
+        return self._update_leased(
+            job,
+            "status = ?, result = ?, worker_id = NULL",
+            (DONE, json.dumps(result, default=_json_default)),
+        )
+
+    def fail(self, job: QueuedJob, error: str) -> bool:
+        return self._update_leased(
+            job, "status = ?, error = ?, worker_id = NULL", (FAILED, error)
+        )
+
+    def outcomes(self, run_id: str) -> t.Dict[str, JobOutcome]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job_id, status, result, error FROM jobs "
+                "WHERE run_id = ? AND status IN (?, ?)",
+                (run_id, DONE, FAILED),
+            ).fetchall()
+        return {
+            job_id: JobOutcome(
+                status=status,
+                result=json.loads(result) if result is not None else None,
+                error=error,
+            )
+            for job_id, status, result, error in rows
+        }
+
+    def delete(self, run_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM jobs WHERE run_id = ?", (run_id,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __repr__(self) -> str:
+        return f"SQLiteWorkQueue(path={self.path!r}, max_attempts={self.max_attempts})"
+
+
+def _job_id(row: int, metric_name: str) -> str:
+    return f"{row}:{metric_name}"
+
+
+def evaluate_distributed(
+    dataset: EvaluationDataset,
+    metrics: t.Sequence[Metric],
+    work_queue: WorkQueue,
+    run_id: t.Optional[str] = None,
+    poll_interval: float = 1.0,
+    deadline: t.Optional[float] = None,
+    raise_exceptions: bool = False,
+    show_progress: bool = True,
+    keep_jobs: bool = False,
+) -> EvaluationResult:
+    """
+    Enqueue every (row, metric) pair of a dataset and assemble the scores.
+
+    Workers started with `run_worker` and metrics of the same names do the scoring.
+    Starting the coordinator again with the same ``run_id`` resumes a run: jobs
+    already queued or finished are kept. Token usage and traces stay with the
+    workers.
+
+    Parameters
+    ----------
+    dataset : EvaluationDataset
+        The dataset to evaluate.
+    metrics : Sequence[Metric]
+        The metrics to compute. Their names identify them on the workers.
+    work_queue : WorkQueue
+        The queue shared with the workers.
+    run_id : str, optional
+        Identifier of the run in the queue. A new one is generated if None.
+    poll_interval : float
+        Seconds between two checks of the queue for results.
+    deadline : float, optional
+        Seconds to wait for results. Missing scores are then NaN and reported in
+        `EvaluationResult.coverage`. Jobs still queued are left for the workers.
+    raise_exceptions : bool
+        Whether to raise if a job failed, instead of scoring it NaN.
+    show_progress : bool
+        Whether to show a progress bar.
+    keep_jobs : bool
+        Whether to keep the jobs of the run in the queue once it is assembled.
+    """
+    names = [m.name for m in metrics]
+    if len(set(names)) != len(names):
+        raise ValueError("Metric names must be unique to evaluate on a work queue")
+
+    run_id = run_id or uuid.uuid4().hex
+    sample_type = dataset.get_sample_type()
+    work_queue.put(
+        run_id,
+        (
+            (
+                _job_id(i, name),
+                {
+                    "row": i,
+                    "metric": name,
+                    "multi_turn": sample_type == MultiTurnSample,
+                    "sample": sample.model_dump(),
+                },
+            )
+            for i, sample in enumerate(dataset)
+            for name in names
+        ),
+    )
+
+    total = len(dataset) * len(names)
+    ends_at = time.monotonic() + deadline if deadline is not None else None
+    outcomes: t.Dict[str, JobOutcome] = {}
+    with tqdm(total=total, desc="Evaluating", disable=not show_progress) as pbar:
+        while True:
+            outcomes = work_queue.outcomes(run_id)
+            pbar.update(len(outcomes) - pbar.n)
+            if len(outcomes) >= total:
+                break
+            if ends_at is not None and time.monotonic() >= ends_at:
+                break
+            time.sleep(poll_interval)
+
+    scores: t.List[t.Dict[str, t.Any]] = []
+    missing: t.Dict[str, int] = {name: 0 for name in names}
+    for i in range(len(dataset)):
+        row: t.Dict[str, t.Any] = {}
+        for name in names:
+            outcome = outcomes.get(_job_id(i, name))
+            if outcome is None:
+                missing[name] += 1
+                row[name] = np.nan
+            elif outcome.status == FAILED:
+                if raise_exceptions:
+                    raise RagasException(
+                        f"Job for row {i} and metric {name} failed: {outcome.error}"
+                    )
+                logger.error(
+                    "Job for row %s and metric %s failed: %s", i, name, outcome.error
+                )
+                row[name] = np.nan
+            else:
+                row[name] = outcome.result
+        scores.append(row)
+
+    coverage = None
+    if deadline is not None:
+        computed = total - sum(missing.values())
+        coverage = {
+            "scores": total,
+            "computed": computed,
+            "skipped": total - computed,
+            "cut": 0,
+            "coverage": computed / total if total else 1.0,
+            "by_metric": {
+                name: 1 - missing[name] / len(dataset) if len(dataset) else 1.0
+                for name in names
+            },
+        }
+    if not keep_jobs and (coverage is None or coverage["computed"] == total):
+        work_queue.delete(run_id)
+
+    from ragas.metrics._aspect_critic import AspectCritic
+
+    # the traces of the metrics are recorded by the workers
+    root = ChainRun(
+        run_id=run_id,
+        parent_run_id=None,
+        name=RAGAS_DISTRIBUTED_CHAIN_NAME,
+        inputs={},
+        metadata={"type": ChainType.EVALUATION},
+        outputs={"scores": scores},
+    )
+    return EvaluationResult(
+        scores=scores,
+        dataset=dataset,
+        binary_columns=[m.name for m in metrics if isinstance(m, AspectCritic)],
+        ragas_traces={root.run_id: root},
+        coverage=coverage,
+    )
+
+
+def _init_metrics(
+    metrics: t.Sequence[Metric],
+    llm: t.Optional[BaseRagasLLM],
+    embeddings: t.Optional[BaseRagasEmbeddings],
+    run_config: RunConfig,
+) -> None:
+    from ragas.metrics.base import MetricWithEmbeddings, MetricWithLLM
+
+    for metric in metrics:
+        if isinstance(metric, MetricWithLLM) and metric.llm is None:
+            if llm is None:
+                raise ValueError(f"Metric {metric.name} needs an llm")
+            metric.llm = llm
+        if isinstance(metric, MetricWithEmbeddings) and metric.embeddings is None:
+            if embeddings is None:
+                raise ValueError(f"Metric {metric.name} needs embeddings")
+            metric.embeddings = t.cast(t.Any, embeddings)
+        metric.init(run_config)
+
+
+async def arun_worker(
+    work_queue: WorkQueue,
+    metrics: t.Sequence[Metric],
+    llm: t.Optional[BaseRagasLLM] = None,
+    embeddings: t.Optional[BaseRagasEmbeddings] = None,
+    run_config: t.Optional[RunConfig] = None,
+    worker_id: t.Optional[str] = None,
+    lease_seconds: float = 60.0,
+    poll_interval: float = 1.0,
+    idle_timeout: t.Optional[float] = None,
+    max_jobs: t.Optional[int] = None,
+) -> int:
+    """
+    Lease jobs from a work queue and score them until stopped.
+
+    ``run_config.max_workers`` jobs are scored concurrently. The lease of a
+    running job is renewed every third of ``lease_seconds``, so a job is only
+    reassigned if its worker stops.
+
+    Parameters
+    ----------
+    work_queue : WorkQueue
+        The queue shared with the coordinator.
+    metrics : Sequence[Metric]
+        The metrics to score, matched to jobs by name.
+    llm : BaseRagasLLM, optional
+        LLM for the metrics that need one and have none.
+    embeddings : BaseRagasEmbeddings, optional
+        Embeddings for the metrics that need them and have none.
+    run_config : RunConfig, optional
+        Timeouts, retries and concurrency of the worker.
+    worker_id : str, optional
+        Identifier of the worker. Defaults to the host name and process id.
+    lease_seconds : float
+        Duration of a lease.
+    poll_interval : float
+        Seconds to wait before polling an empty queue again.
+    idle_timeout : float, optional
+        Stop after the queue has been empty for this many seconds. Runs until
+        cancelled if None.
+    max_jobs : int, optional
+        Stop after scoring this many jobs.
+
+    Returns
+    -------
+    int
+        Number of jobs processed.
+    """
+    run_config = run_config or RunConfig()
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    by_name = {m.name: m for m in metrics}
+    _init_metrics(metrics, llm, embeddings, run_config)
+
+    processed = 0
+    idle_since = time.monotonic()
+    stop = asyncio.Event()
+
+    async def _renew(job: QueuedJob) -> None:
+        while True:
+            await asyncio.sleep(lease_seconds / 3)
+            if not await asyncio.to_thread(work_queue.renew, job, lease_seconds):
+                logger.warning("Lost the lease of job %s", job.job_id)
+                return
+
+    async def _score(job: QueuedJob) -> None:
+        metric = by_name.get(job.payload["metric"])
+        if metric is None:
+            await asyncio.to_thread(
+                work_queue.fail, job, f"Unknown metric {job.payload['metric']!r}"
+            )
+            return
+        renewer = asyncio.create_task(_renew(job))
+        try:
+            if job.payload["multi_turn"]:
+                value = await t.cast(t.Any, metric).multi_turn_ascore(
+                    MultiTurnSample(**job.payload["sample"]),
+                    timeout=run_config.timeout,
+                )
+            else:
+                value = await t.cast(t.Any, metric).single_turn_ascore(
+                    SingleTurnSample(**job.payload["sample"]),
+                    timeout=run_config.timeout,
+                )
+        except Exception as e:
+            logger.error(
+                "Job %s failed: %s(%s)", job.job_id, type(e).__name__, e, exc_info=False
+            )
+            await asyncio.to_thread(work_queue.fail, job, f"{type(e).__name__}: {e}")
+        else:
+            await asyncio.to_thread(work_queue.complete, job, value)
+        finally:
+            renewer.cancel()
+
+    async def _slot() -> None:
+        nonlocal processed, idle_since
+        while not stop.is_set():
+            if max_jobs is not None and processed >= max_jobs:
+                stop.set()
+                return
+            # claimed before leasing so that concurrent slots respect max_jobs
+            processed += 1
+            jobs = await asyncio.to_thread(work_queue.lease, worker_id, lease_seconds)
+            if not jobs:
+                processed -= 1
+                if (
+                    idle_timeout is not None
+                    and time.monotonic() - idle_since >= idle_timeout
+                ):
+                    stop.set()
+                    return
+                await asyncio.sleep(poll_interval)
+                continue
+            await _score(jobs[0])
+            idle_since = time.monotonic()
+
+    n_slots = run_config.max_workers if run_config.max_workers > 0 else 16
+    await asyncio.gather(*(_slot() for _ in range(n_slots)))
+    return processed
+
+
+def run_worker(work_queue: WorkQueue, metrics: t.Sequence[Metric], **kwargs) -> int:
+    """Synchronous version of `arun_worker`."""
+    from ragas.async_utils import run
+
+    return run(arun_worker(work_queue, metrics, **kwargs))
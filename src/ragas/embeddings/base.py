@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
 import inspect
 import typing as t
 import warnings
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import field
 
@@ -14,8 +17,21 @@ from pydantic.dataclasses import dataclass
 from pydantic_core import CoreSchema, core_schema
 
 from ragas._analytics import EmbeddingUsageEvent, track
-from ragas.cache import CacheInterface, cacher
+from ragas.cache import (
+    CACHE_KEY_VERSION,
+    EXCLUDE_KEYS,
+    CacheInterface,
+    EmbeddingCacheBackend,
+    _entry_info,
+    _entry_info_for,
+    _owner_fingerprint,
+    _SingleFlight,
+    _update_fingerprint,
+    cacher,
+)
 from ragas.embeddings.utils import run_async_in_current_loop, validate_texts
+from ragas.http_clients import get_http_client
+from ragas.rate_limit import acquire_rate_limit, acquire_rate_limit_sync
 from ragas.run_config import RunConfig, add_async_retry, add_retry
 
 if t.TYPE_CHECKING:
@@ -34,18 +50,64 @@ class BaseRagasEmbedding(ABC):
     embedding single texts, with batch methods automatically provided.
     """
 
-    def __init__(self, cache: t.Optional[CacheInterface] = None):
-        """Initialize embedding with optional caching.
+    def __init__(
+        self,
+        cache: t.Optional[CacheInterface] = None,
+        micro_batch_window: t.Optional[float] = None,
+        micro_batch_size: int = 256,
+        coalesce: bool = False,
+    ):
+        """Initialize embedding with optional caching and micro-batching.
 
         Args:
             cache: Optional cache backend for caching embeddings.
-                Use DiskCacheBackend() for persistent caching.
+                Use DiskCacheBackend() for persistent caching, or
+                EmbeddingCacheBackend() to keep the vectors in memory-mapped
+                float32 files. The texts of `embed_texts` and `aembed_texts` are
+                looked up in bulk, and only the texts that are not cached are
+                embedded, in one batch.
+            micro_batch_window: Optional number of seconds during which concurrent
+                `aembed_text` calls are collected and embedded with one
+                `aembed_texts` call, e.g. 0.01. Disabled by default.
+            micro_batch_size: Maximum number of texts of a micro-batch. A batch is
+                sent as soon as it is full.
+            coalesce: Whether concurrent async calls with the same texts share one
+                call of the model without a cache. Always on with a cache.
         """
         self.cache = cache
+        self.coalesce = coalesce
+        self.micro_batch_window = micro_batch_window
+        self.micro_batch_size = micro_batch_size
+
+        if micro_batch_window is not None:
+            if micro_batch_window < 0:
+                raise ValueError("micro_batch_window must not be negative")
+            if micro_batch_size < 1:
+                raise ValueError("micro_batch_size must be at least 1")
+            if type(self).aembed_texts is BaseRagasEmbedding.aembed_texts:
+                warnings.warn(
+                    f"{type(self).__name__} does not embed texts in batches, "
+                    "micro_batch_window is ignored",
+                    stacklevel=2,
+                )
+            else:
+                # cache misses are batched too, the cache wraps the batcher
+                self.aembed_text = _MicroBatcher(
+                    self.aembed_text,
+                    self.aembed_texts,
+                    micro_batch_window,
+                    micro_batch_size,
+                ).aembed_text
 
         if self.cache is not None:
-            self.embed_text = cacher(cache_backend=self.cache)(self.embed_text)
-            self.aembed_text = cacher(cache_backend=self.cache)(self.aembed_text)
+            cached = _CachedEmbeddings(self, self.cache)
+            self.embed_text = cached.embed_text
+            self.aembed_text = cached.aembed_text
+            self.embed_texts = cached.embed_texts
+            self.aembed_texts = cached.aembed_texts
+        elif coalesce:
+            self.aembed_text = cacher(coalesce=True)(self.aembed_text)
+            self.aembed_texts = cacher(coalesce=True)(self.aembed_texts)
 
     @abstractmethod
     def embed_text(self, text: str, **kwargs: t.Any) -> t.List[float]:
@@ -129,10 +191,7 @@ class BaseRagasEmbedding(ABC):
             return False
 
     def _run_async_in_current_loop(self, coro):
-        """Run an async coroutine in the current event loop if possible.
-
-        This handles Jupyter environments correctly by using a separate thread
-        when a running event loop is detected.
+        """Run an async coroutine from sync code on the shared background loop.
 
         Args:
             coro: The coroutine to run
@@ -179,6 +238,245 @@ class BaseRagasEmbedding(ABC):
         return cls(**init_kwargs)
 
 
+class _MicroBatch:
+    __slots__ = ("texts", "futures", "timer")
+
+    def __init__(self):
+        self.texts: t.List[str] = []
+        self.futures: t.List[asyncio.Future] = []
+        self.timer: t.Optional[asyncio.TimerHandle] = None
+
+
+class _MicroBatcher:
+    """Collects concurrent single text embedding calls into batch calls.
+
+    Calls made within ``window`` seconds of the first call of a batch, or until
+    ``max_size`` texts are collected, are embedded with one call of the batch
+    method, and every caller receives its own embedding. If the batch call fails,
+    all its callers receive the exception. Calls with keyword arguments are not
+    batched.
+    """
+
+    def __init__(
+        self,
+        aembed_text: t.Callable[..., t.Awaitable[t.Any]],
+        aembed_texts: t.Callable[..., t.Awaitable[t.List[t.Any]]],
+        window: float,
+        max_size: int,
+    ):
+        self._aembed_text = aembed_text
+        self._aembed_texts = aembed_texts
+        self.window = window
+        self.max_size = max_size
+        # futures belong to a loop, each loop collects its own batches
+        self._batches: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _MicroBatch
+        ] = weakref.WeakKeyDictionary()
+        # keeps the running batch calls from being garbage collected
+        self._tasks: t.Set[asyncio.Task] = set()
+
+    async def aembed_text(self, text: str, **kwargs: t.Any) -> t.Any:
+        if kwargs:
+            return await self._aembed_text(text, **kwargs)
+        loop = asyncio.get_running_loop()
+        batch = self._batches.get(loop)
+        if batch is None:
+            batch = self._batches[loop] = _MicroBatch()
+            batch.timer = loop.call_later(self.window, self._send, loop, batch)
+        future = loop.create_future()
+        batch.texts.append(text)
+        batch.futures.append(future)
+        if len(batch.texts) >= self.max_size:
+            self._send(loop, batch)
+        return await future
+
+    def _send(self, loop: asyncio.AbstractEventLoop, batch: _MicroBatch) -> None:
+        if self._batches.get(loop) is not batch:
+            return
+        del self._batches[loop]
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = loop.create_task(self._embed(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _embed(self, batch: _MicroBatch) -> None:
+        try:
+            embeddings = await self._aembed_texts(batch.texts)
+            if len(embeddings) != len(batch.texts):
+                raise ValueError(
+                    f"Expected {len(batch.texts)} embeddings, got {len(embeddings)}"
+                )
+        except asyncio.CancelledError:
+            for future in batch.futures:
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for future, embedding in zip(batch.futures, embeddings):
+            # callers that were cancelled no longer wait for their result
+            if not future.done():
+                future.set_result(embedding)
+
+
+class _CachedEmbeddings:
+    """Caches the embeddings of a `BaseRagasEmbedding` by model and text.
+
+    The single and batch methods, sync and async, share the cache entries. The
+    texts of a batch are looked up with one `get_many`, and only the texts that are
+    not cached are embedded, in one call of the batch method of the model.
+    """
+
+    def __init__(self, embedding: BaseRagasEmbedding, backend: CacheInterface):
+        self.embedding = embedding
+        self.backend = backend
+        self._embed_text = embedding.embed_text
+        self._aembed_text = embedding.aembed_text
+        cls = type(embedding)
+        # the default batch methods call the single text methods, call the
+        # uncached ones directly instead of looking up the cache again
+        self._embed_texts = (
+            self._embed_each
+            if cls.embed_texts is BaseRagasEmbedding.embed_texts
+            else embedding.embed_texts
+        )
+        self._aembed_texts = (
+            self._aembed_each
+            if cls.aembed_texts is BaseRagasEmbedding.aembed_texts
+            else embedding.aembed_texts
+        )
+        self._single_flight = _SingleFlight(
+            on_coalesced=functools.partial(backend.stats.record, coalesced=1)
+        )
+
+    @staticmethod
+    def _as_list(embedding: t.Any) -> t.Any:
+        # backends like EmbeddingCacheBackend return read-only arrays, callers
+        # expect the lists of floats the model returns
+        if isinstance(embedding, np.ndarray):
+            return embedding.tolist()
+        return embedding
+
+    def _embed_each(self, texts: t.List[str], **kwargs: t.Any) -> t.List[t.Any]:
+        return [self._embed_text(text, **kwargs) for text in texts]
+
+    async def _aembed_each(self, texts: t.List[str], **kwargs: t.Any) -> t.List[t.Any]:
+        return list(
+            await asyncio.gather(*(self._aembed_text(text, **kwargs) for text in texts))
+        )
+
+    def _keys(self, texts: t.List[str], kwargs: t.Dict[str, t.Any]) -> t.List[str]:
+        # the model is read on every call, providers set it after __init__
+        hasher = hashlib.blake2b(digest_size=32)
+        hasher.update(f"ragas-embedding-v{CACHE_KEY_VERSION}:".encode())
+        _update_fingerprint(hasher, type(self.embedding).__qualname__)
+        _update_fingerprint(hasher, _owner_fingerprint(self.embedding))
+        _update_fingerprint(
+            hasher, {k: v for k, v in kwargs.items() if k not in EXCLUDE_KEYS}
+        )
+        keys = []
+        for text in texts:
+            text_hasher = hasher.copy()
+            text_hasher.update(text.encode())
+            keys.append(f"v{CACHE_KEY_VERSION}:{text_hasher.hexdigest()}")
+        return keys
+
+    def _missing(
+        self, texts: t.List[str], keys: t.List[str], found: t.Dict[str, t.Any]
+    ) -> t.Dict[str, str]:
+        """The texts to embed by key, without duplicates, and record the counts."""
+        missing: t.Dict[str, str] = {}
+        hits = 0
+        for key, text in zip(keys, texts):
+            if key in found:
+                hits += 1
+            else:
+                missing.setdefault(key, text)
+        self.backend.stats.record(
+            hits=hits,
+            misses=len(missing),
+            coalesced=len(texts) - hits - len(missing),
+        )
+        return missing
+
+    def _set_many(self, embedded: t.Dict[str, t.Any]) -> None:
+        token = _entry_info.set(_entry_info_for(self._embed_text))
+        try:
+            self.backend.set_many(embedded)
+        finally:
+            _entry_info.reset(token)
+
+    async def _aset_many(self, embedded: t.Dict[str, t.Any]) -> None:
+        token = _entry_info.set(_entry_info_for(self._embed_text))
+        try:
+            await self.backend.aset_many(embedded)
+        finally:
+            _entry_info.reset(token)
+
+    def embed_text(self, text: str, **kwargs: t.Any) -> t.List[float]:
+        (key,) = self._keys([text], kwargs)
+        found = self.backend.get_many([key])
+        if key in found:
+            self.backend.stats.record(hits=1)
+            return self._as_list(found[key])
+        self.backend.stats.record(misses=1)
+        embedding = self._embed_text(text, **kwargs)
+        self._set_many({key: embedding})
+        return embedding
+
+    def embed_texts(self, texts: t.List[str], **kwargs: t.Any) -> t.List[t.List[float]]:
+        texts = validate_texts(texts)
+        if not texts:
+            return []
+        keys = self._keys(texts, kwargs)
+        found = self.backend.get_many(dict.fromkeys(keys))
+        missing = self._missing(texts, keys, found)
+        if missing:
+            embeddings = self._embed_texts(list(missing.values()), **kwargs)
+            embedded = dict(zip(missing, embeddings))
+            self._set_many(embedded)
+            found.update(embedded)
+        return [self._as_list(found[key]) for key in keys]
+
+    async def aembed_text(self, text: str, **kwargs: t.Any) -> t.List[float]:
+        (key,) = self._keys([text], kwargs)
+        found = await self.backend.aget_many([key])
+        if key in found:
+            self.backend.stats.record(hits=1)
+            return self._as_list(found[key])
+        # concurrent calls for the same text share one call of the model
+        return await self._single_flight.run(
+            key, lambda: self._aembed_and_cache(key, text, kwargs)
+        )
+
+    async def _aembed_and_cache(
+        self, key: str, text: str, kwargs: t.Dict[str, t.Any]
+    ) -> t.Any:
+        self.backend.stats.record(misses=1)
+        embedding = await self._aembed_text(text, **kwargs)
+        await self._aset_many({key: embedding})
+        return embedding
+
+    async def aembed_texts(
+        self, texts: t.List[str], **kwargs: t.Any
+    ) -> t.List[t.List[float]]:
+        texts = validate_texts(texts)
+        if not texts:
+            return []
+        keys = self._keys(texts, kwargs)
+        found = await self.backend.aget_many(dict.fromkeys(keys))
+        missing = self._missing(texts, keys, found)
+        if missing:
+            embeddings = await self._aembed_texts(list(missing.values()), **kwargs)
+            embedded = dict(zip(missing, embeddings))
+            await self._aset_many(embedded)
+            found.update(embedded)
+        return [self._as_list(found[key]) for key in keys]
+
+
 class BaseRagasEmbeddings(Embeddings, ABC):
     """
     Abstract base class for Ragas embeddings.
@@ -194,18 +492,29 @@ class BaseRagasEmbeddings(Embeddings, ABC):
     run_config: RunConfig
     cache: t.Optional[CacheInterface] = None
 
-    def __init__(self, cache: t.Optional[CacheInterface] = None):
+    def __init__(
+        self, cache: t.Optional[CacheInterface] = None, coalesce: bool = False
+    ):
         super().__init__()
+        if isinstance(cache, EmbeddingCacheBackend):
+            # embed_documents returns a batch, the backend stores single vectors
+            raise ValueError(
+                "EmbeddingCacheBackend only supports BaseRagasEmbedding models, "
+                "use DiskCacheBackend or SQLiteCacheBackend with "
+                f"{type(self).__name__}"
+            )
         self.cache = cache
+        self.coalesce = coalesce
         if self.cache is not None:
             self.embed_query = cacher(cache_backend=self.cache)(self.embed_query)
             self.embed_documents = cacher(cache_backend=self.cache)(
                 self.embed_documents
             )
-            self.aembed_query = cacher(cache_backend=self.cache)(self.aembed_query)
-            self.aembed_documents = cacher(cache_backend=self.cache)(
-                self.aembed_documents
-            )
+        if self.cache is not None or coalesce:
+            # concurrent calls with the same texts share one call of the model
+            coalescing = cacher(cache_backend=self.cache, coalesce=coalesce or None)
+            self.aembed_query = coalescing(self.aembed_query)
+            self.aembed_documents = coalescing(self.aembed_documents)
 
     async def embed_text(self, text: str, is_async=True) -> t.List[float]:
         """
@@ -280,6 +589,7 @@ class LangchainEmbeddingsWrapper(BaseRagasEmbeddings):
         embeddings: Embeddings,
         run_config: t.Optional[RunConfig] = None,
         cache: t.Optional[CacheInterface] = None,
+        coalesce: bool = False,
     ):
         warnings.warn(
             "LangchainEmbeddingsWrapper is deprecated and will be removed in a future version. "
@@ -289,16 +599,22 @@ class LangchainEmbeddingsWrapper(BaseRagasEmbeddings):
             DeprecationWarning,
             stacklevel=2,
         )
-        super().__init__(cache=cache)
+        super().__init__(cache=cache, coalesce=coalesce)
         self.embeddings = embeddings
         if run_config is None:
             run_config = RunConfig()
         self.set_run_config(run_config)
 
+    def _rate_limit_key(self) -> t.Tuple[str, t.Optional[str]]:
+        """Provider and model used to look up the shared rate limit."""
+        provider = _infer_embedding_provider_from_llm(self.embeddings)
+        return provider, getattr(self.embeddings, "model", None)
+
     def embed_query(self, text: str) -> t.List[float]:
         """
         Embed a single query text.
         """
+        acquire_rate_limit_sync(*self._rate_limit_key(), text)
         result = self.embeddings.embed_query(text)
 
         # Track usage
@@ -317,6 +633,7 @@ class LangchainEmbeddingsWrapper(BaseRagasEmbeddings):
         """
         Embed multiple documents.
         """
+        acquire_rate_limit_sync(*self._rate_limit_key(), texts)
         result = self.embeddings.embed_documents(texts)
 
         # Track usage
@@ -335,6 +652,7 @@ class LangchainEmbeddingsWrapper(BaseRagasEmbeddings):
         """
         Asynchronously embed a single query text.
         """
+        await acquire_rate_limit(*self._rate_limit_key(), text)
         result = await self.embeddings.aembed_query(text)
 
         # Track usage
@@ -353,6 +671,7 @@ class LangchainEmbeddingsWrapper(BaseRagasEmbeddings):
         """
         Asynchronously embed multiple documents.
         """
+        await acquire_rate_limit(*self._rate_limit_key(), texts)
         result = await self.embeddings.aembed_documents(texts)
 
         # Track usage
@@ -570,6 +889,7 @@ class LlamaIndexEmbeddingsWrapper(BaseRagasEmbeddings):
         embeddings: BaseEmbedding,
         run_config: t.Optional[RunConfig] = None,
         cache: t.Optional[CacheInterface] = None,
+        coalesce: bool = False,
     ):
         warnings.warn(
             "LlamaIndexEmbeddingsWrapper is deprecated and will be removed in a future version. "
@@ -579,7 +899,7 @@ class LlamaIndexEmbeddingsWrapper(BaseRagasEmbeddings):
             DeprecationWarning,
             stacklevel=2,
         )
-        super().__init__(cache=cache)
+        super().__init__(cache=cache, coalesce=coalesce)
         self.embeddings = embeddings
         if run_config is None:
             run_config = RunConfig()
@@ -678,7 +998,8 @@ def embedding_factory(
         The embedding model name. If not provided, uses provider defaults.
         For legacy calls, defaults to "text-embedding-ada-002".
     run_config : RunConfig, optional
-        Configuration for the run, by default None.
+        Configuration for the run, by default None. Legacy OpenAI embeddings use
+        the shared connection pool sized for it, see `ragas.http_clients`.
     client : Any, optional
         Pre-initialized client for modern providers. When provided, uses modern interface.
     interface : str, optional
@@ -734,7 +1055,11 @@ def embedding_factory(
             if _looks_like_model_name(provider)
             else (model or "text-embedding-ada-002")
         )
-        openai_embeddings = OpenAIEmbeddings(model=model_name, base_url=base_url)
+        openai_embeddings = OpenAIEmbeddings(
+            model=model_name,
+            base_url=base_url,
+            http_client=get_http_client(run_config),
+        )
         if run_config is not None:
             openai_embeddings.request_timeout = run_config.timeout
         else:
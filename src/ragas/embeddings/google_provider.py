@@ -54,9 +54,17 @@ class GoogleEmbeddings(BaseRagasEmbedding):
         project_id: t.Optional[str] = None,
         location: t.Optional[str] = "us-central1",
         cache: t.Optional[CacheInterface] = None,
+        micro_batch_window: t.Optional[float] = None,
+        micro_batch_size: int = 256,
+        coalesce: bool = False,
         **kwargs: t.Any,
     ):
-        super().__init__(cache=cache)
+        super().__init__(
+            cache=cache,
+            micro_batch_window=micro_batch_window,
+            micro_batch_size=micro_batch_size,
+            coalesce=coalesce,
+        )
         self._original_client = client
         self.model = model
         self.use_vertex = use_vertex
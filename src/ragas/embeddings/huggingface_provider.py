@@ -27,9 +27,17 @@ class HuggingFaceEmbeddings(BaseRagasEmbedding):
         normalize_embeddings: bool = True,
         batch_size: int = 32,
         cache: t.Optional[CacheInterface] = None,
+        micro_batch_window: t.Optional[float] = None,
+        micro_batch_size: int = 256,
+        coalesce: bool = False,
         **model_kwargs: t.Any,
     ):
-        super().__init__(cache=cache)
+        super().__init__(
+            cache=cache,
+            micro_batch_window=micro_batch_window,
+            micro_batch_size=micro_batch_size,
+            coalesce=coalesce,
+        )
         self.model = model
         self.use_api = use_api
         self.api_key = api_key
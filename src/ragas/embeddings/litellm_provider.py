@@ -3,6 +3,7 @@
 import typing as t
 
 from ragas.cache import CacheInterface
+from ragas.rate_limit import acquire_rate_limit, acquire_rate_limit_sync
 
 from .base import BaseRagasEmbedding
 from .utils import batch_texts, get_optimal_batch_size, safe_import, validate_texts
@@ -28,9 +29,17 @@ class LiteLLMEmbeddings(BaseRagasEmbedding):
         max_retries: int = 3,
         batch_size: t.Optional[int] = None,
         cache: t.Optional[CacheInterface] = None,
+        micro_batch_window: t.Optional[float] = None,
+        micro_batch_size: int = 256,
+        coalesce: bool = False,
         **litellm_params: t.Any,
     ):
-        super().__init__(cache=cache)
+        super().__init__(
+            cache=cache,
+            micro_batch_window=micro_batch_window,
+            micro_batch_size=micro_batch_size,
+            coalesce=coalesce,
+        )
         self.litellm = safe_import("litellm", "litellm")
         self.model = model
         self.api_key = api_key
@@ -63,12 +72,14 @@ class LiteLLMEmbeddings(BaseRagasEmbedding):
     def embed_text(self, text: str, **kwargs: t.Any) -> t.List[float]:
         """Embed a single text using LiteLLM."""
         call_kwargs = self._prepare_kwargs(**kwargs)
+        acquire_rate_limit_sync(self.PROVIDER_NAME, self.model, text)
         response = self.litellm.embedding(input=[text], **call_kwargs)
         return response.data[0]["embedding"]
 
     async def aembed_text(self, text: str, **kwargs: t.Any) -> t.List[float]:
         """Asynchronously embed a single text using LiteLLM."""
         call_kwargs = self._prepare_kwargs(**kwargs)
+        await acquire_rate_limit(self.PROVIDER_NAME, self.model, text)
         response = await self.litellm.aembedding(input=[text], **call_kwargs)
         return response.data[0]["embedding"]
 
@@ -83,6 +94,7 @@ class LiteLLMEmbeddings(BaseRagasEmbedding):
 
         for batch in batches:
             call_kwargs = self._prepare_kwargs(**kwargs)
+            acquire_rate_limit_sync(self.PROVIDER_NAME, self.model, batch)
             response = self.litellm.embedding(input=batch, **call_kwargs)
             embeddings.extend([item["embedding"] for item in response.data])
 
@@ -101,6 +113,7 @@ class LiteLLMEmbeddings(BaseRagasEmbedding):
 
         for batch in batches:
             call_kwargs = self._prepare_kwargs(**kwargs)
+            await acquire_rate_limit(self.PROVIDER_NAME, self.model, batch)
             response = await self.litellm.aembedding(input=batch, **call_kwargs)
             embeddings.extend([item["embedding"] for item in response.data])
 
@@ -2,6 +2,7 @@ import typing as t
 
 from ragas._analytics import EmbeddingUsageEvent, track
 from ragas.cache import CacheInterface
+from ragas.rate_limit import acquire_rate_limit, acquire_rate_limit_sync
 
 from .base import BaseRagasEmbedding
 from .utils import validate_texts
@@ -23,8 +24,16 @@ class OpenAIEmbeddings(BaseRagasEmbedding):
         client: t.Any,
         model: str = "text-embedding-3-small",
         cache: t.Optional[CacheInterface] = None,
+        micro_batch_window: t.Optional[float] = None,
+        micro_batch_size: int = 256,
+        coalesce: bool = False,
     ):
-        super().__init__(cache=cache)
+        super().__init__(
+            cache=cache,
+            micro_batch_window=micro_batch_window,
+            micro_batch_size=micro_batch_size,
+            coalesce=coalesce,
+        )
         self.client = client
         self.model = model
         self.is_async = self._check_client_async(client)
@@ -37,6 +46,7 @@ class OpenAIEmbeddings(BaseRagasEmbedding):
         if self.is_async:
             result = self._run_async_in_current_loop(self.aembed_text(text, **kwargs))
         else:
+            acquire_rate_limit_sync(self.PROVIDER_NAME, self.model, text)
             response = self.client.embeddings.create(
                 input=text, model=self.model, **kwargs
             )
@@ -61,6 +71,7 @@ class OpenAIEmbeddings(BaseRagasEmbedding):
                 "Cannot use aembed_text() with a synchronous client. Use embed_text() instead."
             )
 
+        await acquire_rate_limit(self.PROVIDER_NAME, self.model, text)
         response = await self.client.embeddings.create(
             input=text, model=self.model, **kwargs
         )
@@ -88,6 +99,7 @@ class OpenAIEmbeddings(BaseRagasEmbedding):
             result = self._run_async_in_current_loop(self.aembed_texts(texts, **kwargs))
         else:
             # OpenAI supports batch embedding natively
+            acquire_rate_limit_sync(self.PROVIDER_NAME, self.model, texts)
             response = self.client.embeddings.create(
                 input=texts, model=self.model, **kwargs
             )
@@ -118,6 +130,7 @@ class OpenAIEmbeddings(BaseRagasEmbedding):
                 "Cannot use aembed_texts() with a synchronous client. Use embed_texts() instead."
             )
 
+        await acquire_rate_limit(self.PROVIDER_NAME, self.model, texts)
         response = await self.client.embeddings.create(
             input=texts, model=self.model, **kwargs
         )
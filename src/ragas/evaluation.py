@@ -1,17 +1,26 @@
 from __future__ import annotations
 
+import logging
 import typing as t
 import warnings
+from collections import Counter
 from uuid import UUID
 
 from datasets import Dataset
-from langchain_core.callbacks import BaseCallbackHandler, BaseCallbackManager
+from langchain_core.callbacks import (
+    BaseCallbackHandler,
+    BaseCallbackManager,
+    CallbackManagerForChainGroup,
+    CallbackManagerForChainRun,
+)
 from langchain_core.embeddings import Embeddings as LangchainEmbeddings
 from langchain_core.language_models import BaseLanguageModel as LangchainLLM
 from tqdm.auto import tqdm
 
 from ragas._analytics import track_was_completed  # type: ignore
+from ragas.cache import CacheInterface, CacheStats
 from ragas.callbacks import ChainType, RagasTracer, new_group
+from ragas.checkpoint import CheckpointStore, fingerprint_metric, hash_row
 from ragas.dataset_schema import (
     EvaluationDataset,
     EvaluationResult,
@@ -41,6 +50,7 @@ from ragas.metrics.base import (
     SingleTurnMetric,
 )
 from ragas.run_config import RunConfig
+from ragas.scheduling import FairScheduling
 from ragas.utils import convert_v1_to_v2_dataset
 from ragas.validation import (
     remap_column_names,
@@ -51,11 +61,93 @@ from ragas.validation import (
 if t.TYPE_CHECKING:
     from langchain_core.callbacks import Callbacks
 
+    from ragas.batch import BatchTransport
     from ragas.cost import CostCallbackHandler, TokenUsageParser
+    from ragas.distributed import WorkQueue
+
+logger = logging.getLogger(__name__)
 
 RAGAS_EVALUATION_CHAIN_NAME = "ragas evaluation"
 
 
+class MetricScore(t.NamedTuple):
+    """A single score produced while an evaluation is running."""
+
+    row_index: int
+    metric_name: str
+    value: t.Any
+
+
+class EvaluationStream:
+    """
+    Async iterator over the scores of a running evaluation.
+
+    Returned by `aevaluate` with ``stream=True``. Iterating over the stream runs
+    the evaluation and yields a `MetricScore` ``(row_index, metric_name, value)``
+    for every job as soon as it completes, in completion order. Use `arows` to get
+    complete per-row records instead. Once the stream is exhausted, `result` holds
+    the `EvaluationResult` of the run, or None if the run was cancelled.
+
+    A stream can only be consumed once.
+    """
+
+    def __init__(
+        self,
+        scores: t.AsyncGenerator[MetricScore, None],
+        executor: Executor,
+        metric_names: t.List[str],
+    ):
+        self._scores = scores
+        self.executor = executor
+        self.metric_names = metric_names
+        self.result: t.Optional[EvaluationResult] = None
+
+    def __aiter__(self) -> t.AsyncIterator[MetricScore]:
+        return self._scores
+
+    async def arows(self) -> t.AsyncIterator[t.Tuple[int, t.Dict[str, t.Any]]]:
+        """
+        Yield ``(row_index, scores)`` for every row once all its metrics finished.
+
+        Only rows that are still missing scores are kept in memory.
+        """
+        partial: t.Dict[int, t.Dict[str, t.Any]] = {}
+        async for score in self:
+            row = partial.setdefault(score.row_index, {})
+            row[score.metric_name] = score.value
+            if len(row) == len(self.metric_names):
+                del partial[score.row_index]
+                yield score.row_index, {name: row[name] for name in self.metric_names}
+
+    def cancel(self) -> None:
+        """Cancel the evaluation; the stream ends after the running jobs finish."""
+        self.executor.cancel()
+
+    async def aclose(self) -> None:
+        """Stop the evaluation and release the stream."""
+        self.executor.cancel()
+        await self._scores.aclose()
+
+
+def _metric_caches(metrics: t.Sequence[Metric]) -> t.List[CacheInterface]:
+    """The distinct cache backends of the LLMs and embeddings of the metrics."""
+    backends: t.Dict[int, CacheInterface] = {}
+    for metric in metrics:
+        for attr in ("llm", "embeddings"):
+            cache = getattr(getattr(metric, attr, None), "cache", None)
+            if isinstance(cache, CacheInterface):
+                backends.setdefault(id(cache), cache)
+    return list(backends.values())
+
+
+def _metric_keys(metrics: t.Sequence[Metric]) -> t.List[str]:
+    """Column names of the scores of the metrics."""
+    return [
+        f"{m.name}(mode={m.mode})" if isinstance(m, ModeMetric) else m.name  # type: ignore
+        for m in metrics
+    ]
+
+
 async def aevaluate(
     dataset: t.Union[Dataset, EvaluationDataset],
     metrics: t.Optional[t.Sequence[Metric]] = None,
@@ -74,20 +166,30 @@ async def aevaluate(
     _run_id: t.Optional[UUID] = None,
     _pbar: t.Optional[tqdm] = None,
     return_executor: bool = False,
-) -> t.Union[EvaluationResult, Executor]:
+    scheduling: t.Optional[FairScheduling] = None,
+    checkpoint: t.Optional[CheckpointStore] = None,
+    stream: bool = False,
+    deadline: t.Optional[float] = None,
+) -> t.Union[EvaluationResult, Executor, EvaluationStream]:
     """
     Async version of evaluate that performs evaluation without applying nest_asyncio.
 
     This function is the async-first implementation that doesn't patch the event loop,
     making it safe to use in production async applications.
 
-    Parameters are identical to evaluate() function.
+    Parameters are identical to evaluate() function, plus:
+
+    stream : bool, optional
+        If True, returns an `EvaluationStream` that yields the scores as soon as each
+        metric finishes on a row, instead of waiting for the whole evaluation.
+        Default is False.
 
     Returns
     -------
-    EvaluationResult or Executor
+    EvaluationResult, Executor or EvaluationStream
         If return_executor is False, returns EvaluationResult object containing the scores of each metric.
         If return_executor is True, returns the Executor instance for cancellable execution.
+        If stream is True, returns an EvaluationStream over the scores.
 
     Examples
     --------
@@ -101,6 +203,16 @@ async def aevaluate(
 
     asyncio.run(main())
     ```
+
+    Streaming the scores while the evaluation runs:
+
+    ```python
+    async def main():
+        stream = await aevaluate(dataset, metrics, stream=True)
+        async for row_index, metric_name, value in stream:
+            print(row_index, metric_name, value)
+        print(stream.result)
+    ```
     """
     warnings.warn(
         "aevaluate() is deprecated and will be removed in a future version. "
@@ -175,7 +287,9 @@ async def aevaluate(
             if llm is None:
                 from openai import OpenAI
 
-                client = OpenAI()
+                from ragas.http_clients import get_http_client
+
+                client = OpenAI(http_client=get_http_client(run_config))
                 llm = llm_factory("gpt-4o-mini", client=client)
             metric.llm = t.cast(t.Optional[BaseRagasLLM], llm)
             llm_changed.append(i)
@@ -199,6 +313,10 @@ async def aevaluate(
         # init all the models
         metric.init(run_config)
 
+    # the counters are shared with other runs, report the calls of this run only
+    cache_backends = _metric_caches(metrics)
+    cache_stats_start = [backend.stats.snapshot() for backend in cache_backends]
+
     executor = Executor(
         desc="Evaluating",
         keep_progress_bar=True,
@@ -207,6 +325,8 @@ async def aevaluate(
         show_progress=show_progress,
         batch_size=batch_size,
         pbar=_pbar,
+        scheduling=scheduling,
+        deadline=deadline,
     )
 
     # Ragas Callbacks
@@ -232,7 +352,9 @@ async def aevaluate(
             callbacks.append(cb)
 
     # new evaluation chain
-    row_run_managers = []
+    row_run_managers: t.Dict[
+        int, t.Tuple[CallbackManagerForChainRun, CallbackManagerForChainGroup]
+    ] = {}
     evaluation_rm, evaluation_group_cm = new_group(
         name=experiment_name or RAGAS_EVALUATION_CHAIN_NAME,
         inputs={},
@@ -241,77 +363,135 @@ async def aevaluate(
     )
 
     sample_type = dataset.get_sample_type()
-    for i, sample in enumerate(dataset):
-        row = t.cast(t.Dict[str, t.Any], sample.model_dump())
-        row_rm, row_group_cm = new_group(
-            name=f"row {i}",
-            inputs=row,
-            callbacks=evaluation_group_cm,
-            metadata={"type": ChainType.ROW, "row_index": i},
-        )
-        row_run_managers.append((row_rm, row_group_cm))
-        if sample_type == SingleTurnSample:
-            _ = [
-                executor.submit(
-                    metric.single_turn_ascore,
-                    sample,
-                    row_group_cm,
-                    name=f"{metric.name}-{i}",
-                    timeout=run_config.timeout,
+    if sample_type == SingleTurnSample:
+        row_metrics = [m for m in metrics if isinstance(m, SingleTurnMetric)]
+    elif sample_type == MultiTurnSample:
+        row_metrics = [m for m in metrics if isinstance(m, MultiTurnMetric)]
+    else:
+        raise ValueError(f"Unsupported sample type {sample_type}")
+
+    metric_keys = _metric_keys(metrics)
+
+    # scores restored from the checkpoint, keyed by (row, metric) position
+    restored: t.Dict[t.Tuple[int, int], t.Any] = {}
+    # positions of the submitted jobs, only needed when some jobs are skipped
+    job_positions: t.Optional[t.List[t.Tuple[int, int]]] = None
+    if checkpoint is not None:
+        row_hashes = [hash_row(sample) for sample in dataset]
+        fingerprints = [fingerprint_metric(m) for m in metrics]
+        saved = checkpoint.load()
+        for i, row_hash in enumerate(row_hashes):
+            for j, fingerprint in enumerate(fingerprints):
+                if (row_hash, fingerprint) in saved:
+                    restored[(i, j)] = saved[(row_hash, fingerprint)]
+        job_positions = []
+        if restored:
+            logger.info(
+                "Resuming from checkpoint: %d of %d scores already computed",
+                len(restored),
+                len(dataset) * len(metrics),
+            )
+
+    def _close_row(i: int, s: t.Dict[str, t.Any]) -> None:
+        if i not in row_run_managers:
+            # the row chain is closed when it is created
+            return
+        row_rm, row_group_cm = row_run_managers[i]
+        if not row_group_cm.ended:
+            row_rm.on_chain_end(s)
+
+    scores: t.List[t.Dict[str, t.Any]] = [{} for _ in range(len(dataset))]
+
+    def _record(i: int, j: int, value: t.Any) -> None:
+        scores[i][metric_keys[j]] = value
+        if len(scores[i]) == len(metrics):
+            # keep the column order of the metrics and close the row chain
+            scores[i] = {key: scores[i][key] for key in metric_keys}
+            _close_row(i, scores[i])
+
+    def _row_jobs():
+        # jobs are generated lazily so that only the rows inside the executor's
+        # concurrency window hold coroutines and callback groups at any time
+        for i, sample in enumerate(dataset):
+            row = t.cast(t.Dict[str, t.Any], sample.model_dump())
+            row_rm, row_group_cm = new_group(
+                name=f"row {i}",
+                inputs=row,
+                callbacks=evaluation_group_cm,
+                metadata={"type": ChainType.ROW, "row_index": i},
+            )
+            row_run_managers[i] = (row_rm, row_group_cm)
+            if len(scores[i]) == len(metrics):
+                # every score of the row was restored from the checkpoint
+                _close_row(i, scores[i])
+            for j, metric in enumerate(row_metrics):
+                if (i, j) in restored:
+                    continue
+                score_fn = (
+                    metric.single_turn_ascore
+                    if sample_type == SingleTurnSample
+                    else metric.multi_turn_ascore
                 )
-                for metric in metrics
-                if isinstance(metric, SingleTurnMetric)
-            ]
-        elif sample_type == MultiTurnSample:
-            _ = [
-                executor.submit(
-                    metric.multi_turn_ascore,
-                    sample,
-                    row_group_cm,
-                    name=f"{metric.name}-{i}",
-                    timeout=run_config.timeout,
+                if checkpoint is not None:
+                    score_fn = checkpoint.checkpointed(
+                        score_fn, row_hashes[i], fingerprints[j]
+                    )
+                    t.cast(t.List[t.Tuple[int, int]], job_positions).append((i, j))
+                yield (
+                    score_fn,
+                    (sample, row_group_cm),
+                    {"timeout": run_config.timeout},
+                    f"{metric.name}-{i}",
+                    metric.name,
                 )
-                for metric in metrics
-                if isinstance(metric, MultiTurnMetric)
-            ]
-        else:
-            raise ValueError(f"Unsupported sample type {sample_type}")
+
+    executor.submit_jobs(
+        _row_jobs(), total=len(dataset) * len(row_metrics) - len(restored)
+    )
 
     # Return executor for cancellable execution if requested
     if return_executor:
         return executor
 
-    scores: t.List[t.Dict[str, t.Any]] = []
-    try:
-        # get the results using async method
-        results = await executor.aresults()
-        if results == []:
-            raise ExceptionInRunner()
-
-        # convert results to dataset_like
-        for i, _ in enumerate(dataset):
-            s = {}
-            for j, m in enumerate(metrics):
-                if isinstance(m, ModeMetric):  # type: ignore
-                    key = f"{m.name}(mode={m.mode})"
-                else:
-                    key = m.name
-                s[key] = results[len(metrics) * i + j]
-            scores.append(s)
-            # close the row chain
-            row_rm, row_group_cm = row_run_managers[i]
-            if not row_group_cm.ended:
-                row_rm.on_chain_end(s)
-
-    # run evaluation task
-    except Exception as e:
-        if not evaluation_group_cm.ended:
-            evaluation_rm.on_chain_error(e)
-
-        raise e
-    else:
-        # evalution run was successful
-        # now lets process the results
+    def _position(index: int) -> t.Tuple[int, int]:
+        if job_positions is not None:
+            return job_positions[index]
+        i, j = divmod(index, len(metrics))
+        return i, j
+
+    def _coverage() -> t.Optional[t.Dict[str, t.Any]]:
+        report = executor.coverage
+        if report is None:
+            return None
+        missing = Counter(
+            _position(index)[1] for index in report["skipped_jobs"] + report["cut_jobs"]
+        )
+        total = len(dataset) * len(metrics)
+        computed = total - sum(missing.values())
+        if computed < total:
+            logger.warning(
+                "Run deadline reached: computed %d of %d scores", computed, total
+            )
+        return {
+            "scores": total,
+            "computed": computed,
+            "skipped": report["skipped"],
+            "cut": report["cut"],
+            "coverage": computed / total if total else 1.0,
+            "by_metric": {
+                key: 1 - missing[j] / len(dataset) for j, key in enumerate(metric_keys)
+            },
+        }
+
+    def _cache_stats() -> t.Optional[t.Dict[str, t.Any]]:
+        if not cache_backends:
+            return None
+        stats = CacheStats()
+        for backend, start in zip(cache_backends, cache_stats_start):
+            stats = stats + (backend.stats.snapshot() - start)
+        return stats.to_dict()
+
+    def _build_result() -> EvaluationResult:
         cost_cb = ragas_callbacks["cost_cb"] if "cost_cb" in ragas_callbacks else None
         result = EvaluationResult(
             scores=scores,
@@ -323,10 +503,14 @@ async def aevaluate(
             ),
             ragas_traces=tracer.traces,
             run_id=_run_id,
+            coverage=_coverage(),
+            cache_stats=_cache_stats(),
         )
         if not evaluation_group_cm.ended:
             evaluation_rm.on_chain_end({"scores": result.scores})
-    finally:
+        return result
+
+    def _reset_metrics() -> None:
         # reset llms and embeddings if changed
         for i in llm_changed:
             t.cast(MetricWithLLM, metrics[i]).llm = None
@@ -342,6 +526,61 @@ async def aevaluate(
 
         _analytics_batcher.flush()
 
+    if stream:
+
+        async def _stream_scores() -> t.AsyncGenerator[MetricScore, None]:
+            n_scores = 0
+            try:
+                for (i, j), value in restored.items():
+                    _record(i, j, value)
+                    n_scores += 1
+                    yield MetricScore(i, metric_keys[j], value)
+                async for index, value in executor.astream():
+                    i, j = _position(index)
+                    _record(i, j, value)
+                    n_scores += 1
+                    yield MetricScore(i, metric_keys[j], value)
+                if n_scores == 0:
+                    raise ExceptionInRunner()
+            except Exception as e:
+                if not evaluation_group_cm.ended:
+                    evaluation_rm.on_chain_error(e)
+                raise e
+            else:
+                # the run may have been cancelled before every row finished
+                if n_scores == len(dataset) * len(metrics):
+                    score_stream.result = _build_result()
+            finally:
+                _reset_metrics()
+
+        score_stream = EvaluationStream(_stream_scores(), executor, metric_keys)
+        return score_stream
+
+    try:
+        # get the results using async method
+        results = await executor.aresults()
+        if results == [] and not restored:
+            raise ExceptionInRunner()
+
+        # convert results to dataset_like
+        for (i, j), value in restored.items():
+            _record(i, j, value)
+        for index, value in enumerate(results):
+            _record(*_position(index), value)
+
+    # run evaluation task
+    except Exception as e:
+        if not evaluation_group_cm.ended:
+            evaluation_rm.on_chain_error(e)
+
+        raise e
+    else:
+        # evalution run was successful
+        # now lets process the results
+        result = _build_result()
+    finally:
+        _reset_metrics()
+
     return result
 
 
@@ -365,6 +604,14 @@ def evaluate(
     _pbar: t.Optional[tqdm] = None,
     return_executor: bool = False,
     allow_nest_asyncio: bool = True,
+    scheduling: t.Optional[FairScheduling] = None,
+    checkpoint: t.Optional[CheckpointStore] = None,
+    deadline: t.Optional[float] = None,
+    num_processes: t.Optional[int] = None,
+    work_queue: t.Optional[WorkQueue] = None,
+    run_id: t.Optional[str] = None,
+    mode: t.Literal["online", "batch"] = "online",
+    batch_transport: t.Optional[BatchTransport] = None,
 ) -> t.Union[EvaluationResult, Executor]:
     """
     Perform the evaluation on the dataset with different metrics
@@ -410,8 +657,54 @@ def evaluate(
         The returned executor can be used to cancel execution by calling executor.cancel().
         To get results, call executor.results(). Default is False.
     allow_nest_asyncio : bool, optional
-        Whether to allow nest_asyncio patching for Jupyter compatibility.
-        Set to False in production async applications to avoid event loop conflicts. Default is True.
+        Kept for backward compatibility. The evaluation runs on the shared background
+        event loop (see `ragas.async_utils.run`), which works in Jupyter and in
+        running event loops without nest_asyncio patching.
+    scheduling : FairScheduling, optional
+        Schedule jobs fairly across metrics, with optional per-metric weights and priorities
+        keyed by metric name, so that cheap or important metrics are not stuck behind slow ones.
+        If not provided, jobs run in submission order (row by row).
+    checkpoint : CheckpointStore, optional
+        Store that records every score as soon as it is computed. Scores already in the
+        checkpoint are reused and only the missing (row, metric) pairs are evaluated, so a
+        crashed, killed or cancelled run can be resumed by running it again with the same
+        store. See `ragas.checkpoint`. Default is None.
+    deadline : float, optional
+        Time budget of the whole evaluation in seconds, unlike `RunConfig.timeout` which
+        applies per operation. Jobs that are not projected to finish in time are not
+        started and jobs still running at the deadline are cancelled. Their scores are
+        NaN, and `EvaluationResult.coverage` reports how many scores were computed.
+        Default is None.
+    num_processes : int, optional
+        Number of worker processes to evaluate the dataset in. The dataset is split into
+        contiguous shards and every process gets an equal share of `RunConfig.max_workers`
+        and of the registered rate limits. Scores, traces and token usage are merged in
+        the original row order. Callbacks run in the worker processes. Cannot be combined
+        with `return_executor` or `checkpoint`. Default is None, a single process.
+    work_queue : WorkQueue, optional
+        Queue to distribute the evaluation on. Every (row, metric) pair is enqueued and
+        scored by workers started with `ragas.distributed.run_worker` on any machine
+        sharing the queue, and this call waits for their scores, or for `deadline`.
+        Traces and token usage stay with the workers. Models, callbacks and the run
+        configuration are given to `run_worker`, so `llm`, `embeddings`, `callbacks`,
+        `run_config`, `token_usage_parser`, `batch_size`, `scheduling` and
+        `num_processes` cannot be combined with it. See `ragas.distributed`.
+        Default is None, the evaluation runs in this process.
+    run_id : str, optional
+        Identifier of the run on `work_queue`. Calling `evaluate` again with the same
+        `run_id`, e.g. after a deadline or a crash, resumes the run: jobs already
+        queued or scored are kept. Default is None, a new run.
+    mode : str, optional
+        "online" (default) calls the LLMs as the metrics need them. "batch" sends the
+        LLM calls of all rows as provider batch jobs, cheaper but slower, for offline
+        runs like nightly regression evaluations. The evaluation runs in rounds,
+        each round submits the prompts it could not answer as one batch job and
+        waits for it, so that multi-step metrics take one job per step. Cannot be
+        combined with `return_executor`, `checkpoint`, `deadline`, `num_processes`
+        or `work_queue`. See `ragas.batch`.
+    batch_transport : BatchTransport, optional
+        Transport of the batch jobs in batch mode. Defaults to the OpenAI Batch API,
+        use `ragas.batch.LocalBatchTransport` to run batch mode offline.
 
     Returns
     -------
@@ -452,6 +745,111 @@ def evaluate(
         stacklevel=2,
     )
 
+    if mode not in ("online", "batch"):
+        raise ValueError(f"Unknown mode {mode!r}, use 'online' or 'batch'")
+    if run_id is not None and work_queue is None:
+        raise ValueError("run_id is only used with work_queue")
+    if mode == "batch":
+        if (
+            return_executor
+            or checkpoint is not None
+            or deadline is not None
+            or work_queue is not None
+            or (num_processes is not None and num_processes > 1)
+        ):
+            raise ValueError(
+                "mode='batch' cannot be combined with return_executor, checkpoint, "
+                "deadline, num_processes or work_queue"
+            )
+        from ragas.async_utils import run
+        from ragas.batch import OpenAIBatchTransport, aevaluate_batch
+
+        return run(
+            aevaluate_batch(
+                batch_transport or OpenAIBatchTransport(),
+                dataset=dataset,
+                metrics=metrics,
+                llm=llm,
+                embeddings=embeddings,
+                experiment_name=experiment_name,
+                callbacks=callbacks,
+                run_config=run_config,
+                token_usage_parser=token_usage_parser,
+                raise_exceptions=raise_exceptions,
+                column_map=column_map,
+                show_progress=show_progress,
+                batch_size=batch_size,
+                _run_id=_run_id,
+                scheduling=scheduling,
+            )
+        )
+
+    if work_queue is not None or (num_processes is not None and num_processes > 1):
+        if return_executor or checkpoint is not None:
+            raise ValueError(
+                "num_processes and work_queue cannot be combined with "
+                "return_executor or checkpoint"
+            )
+        if isinstance(dataset, Dataset):
+            dataset = remap_column_names(dataset, column_map or {})
+            dataset = convert_v1_to_v2_dataset(dataset)
+            dataset = EvaluationDataset.from_list(dataset.to_list())
+
+    if work_queue is not None:
+        from ragas.distributed import evaluate_distributed
+
+        if not metrics:
+            raise ValueError("Provide the metrics to evaluate on a work queue")
+        unsupported = {
+            "llm": llm,
+            "embeddings": embeddings,
+            "callbacks": callbacks,
+            "run_config": run_config,
+            "token_usage_parser": token_usage_parser,
+            "batch_size": batch_size,
+            "scheduling": scheduling,
+            "num_processes": num_processes if (num_processes or 1) > 1 else None,
+        }
+        given = [name for name, value in unsupported.items() if value is not None]
+        if given:
+            raise ValueError(
+                f"work_queue cannot be combined with {', '.join(given)}: metrics are "
+                "scored by the workers, pass these to ragas.distributed.run_worker"
+            )
+        dataset = t.cast(EvaluationDataset, dataset)
+        validate_required_columns(dataset, metrics)
+        validate_supported_metrics(dataset, metrics)
+        return evaluate_distributed(
+            dataset=dataset,
+            metrics=metrics,
+            work_queue=work_queue,
+            run_id=run_id,
+            deadline=deadline,
+            raise_exceptions=raise_exceptions,
+            show_progress=show_progress,
+        )
+
+    if num_processes is not None and num_processes > 1:
+        from ragas.sharding import evaluate_sharded
+
+        return evaluate_sharded(
+            dataset=dataset,
+            num_processes=num_processes,
+            run_config=run_config or RunConfig(),
+            token_usage_parser=token_usage_parser,
+            experiment_name=experiment_name,
+            show_progress=show_progress,
+            _run_id=_run_id,
+            metrics=metrics,
+            llm=llm,
+            embeddings=embeddings,
+            callbacks=callbacks,
+            raise_exceptions=raise_exceptions,
+            batch_size=batch_size,
+            scheduling=scheduling,
+            deadline=deadline,
+        )
+
     # Create async wrapper for aevaluate
     async def _async_wrapper():
         return await aevaluate(
@@ -470,15 +868,11 @@ def evaluate(
             _run_id=_run_id,
             _pbar=_pbar,
             return_executor=return_executor,
+            scheduling=scheduling,
+            checkpoint=checkpoint,
+            deadline=deadline,
         )
 
-    if not allow_nest_asyncio:
-        # Run without nest_asyncio - creates a new event loop
-        import asyncio
-
-        return asyncio.run(_async_wrapper())
-    else:
-        # Default behavior: use nest_asyncio for backward compatibility (Jupyter notebooks)
-        from ragas.async_utils import run
+    from ragas.async_utils import run
 
-        return run(_async_wrapper())
+    return run(_async_wrapper())
@@ -41,6 +41,47 @@ class LLMDidNotFinishException(RagasException):
         super().__init__(msg)
 
 
+class CircuitOpenError(RagasException):
+    """
+    Exception raised when a call is rejected because the circuit breaker of its
+    provider is open after repeated failures.
+    """
+
+    def __init__(self, key: str, retry_after: float):
+        self.key = key
+        self.retry_after = retry_after
+        msg = f"Circuit breaker for {key} is open after repeated failures, retry in {retry_after:.1f}s."
+        super().__init__(msg)
+
+
+class DeadlineExceededError(RagasException):
+    """
+    Exception raised for a job that was not run, or was cut short, because the
+    deadline of its run was reached.
+    """
+
+    def __init__(self, started: bool):
+        self.started = started
+        msg = (
+            "The job was cancelled because the run deadline was reached."
+            if started
+            else "The job was not started because it could not finish before the run deadline."
+        )
+        super().__init__(msg)
+
+
+class BatchResponsePending(RagasException):
+    """
+    Exception raised in batch mode by an LLM call whose prompt was recorded for
+    the next batch job, see `ragas.batch`.
+    """
+
+    def __init__(self, custom_id: str):
+        self.custom_id = custom_id
+        msg = f"The response to batch request {custom_id} is not available yet."
+        super().__init__(msg)
+
+
 # Exceptions migrated from experimental module
 class RagasError(Exception):
     """Base class for all Ragas-related exceptions."""
@@ -1,19 +1,60 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import threading
+import time
 import typing as t
 from dataclasses import dataclass, field
 
 import numpy as np
 from tqdm.auto import tqdm
 
-from ragas.async_utils import apply_nest_asyncio, as_completed, process_futures, run
+from ragas.async_utils import as_completed, process_futures, run
+from ragas.concurrency import AdaptiveConcurrencyLimiter
+from ragas.deadline import RunDeadline
+from ragas.exceptions import BatchResponsePending, DeadlineExceededError
+from ragas.instrumentation import JobRecord, JobSink, JobStats
 from ragas.run_config import RunConfig
+from ragas.scheduling import DEFAULT_GROUP, FairScheduler, FairScheduling
 from ragas.utils import ProgressBarManager, batched
 
 logger = logging.getLogger(__name__)
 
+# (callable, args, kwargs), optionally followed by name and group
+JobSpec = t.Union[
+    t.Tuple[t.Callable, t.Sequence[t.Any], t.Dict[str, t.Any]],
+    t.Tuple[t.Callable, t.Sequence[t.Any], t.Dict[str, t.Any], t.Optional[str]],
+    t.Tuple[
+        t.Callable,
+        t.Sequence[t.Any],
+        t.Dict[str, t.Any],
+        t.Optional[str],
+        t.Optional[str],
+    ],
+]
+
+
+class _Job(t.NamedTuple):
+    """A job with its position in submission order."""
+
+    index: int
+    callable: t.Callable
+    args: t.Sequence[t.Any]
+    kwargs: t.Dict[str, t.Any]
+    name: t.Optional[str]
+    group: t.Optional[str]
+
+
+@dataclass
+class _JobStream:
+    """A lazily consumed stream of jobs added with `Executor.submit_jobs`."""
+
+    jobs: t.Iterator[JobSpec]
+    total: t.Optional[int] = None
+    name: t.Optional[str] = None
+    group: t.Optional[str] = None
+
 
 @dataclass
 class Executor:
@@ -29,13 +70,25 @@ class Executor:
     keep_progress_bar : bool
         Whether to keep the progress bar after completion
     jobs : List[Any]
-        List of jobs to execute
+        List of jobs to execute, either single jobs added with `submit` or lazy
+        job streams added with `submit_jobs`
     raise_exceptions : bool
         Whether to raise exceptions or log them
     batch_size : int
         Whether to batch (large) lists of tasks
     run_config : RunConfig
         Configuration for the run
+    scheduling : FairScheduling, optional
+        Policy to schedule jobs fairly across groups (e.g. metrics) with weights
+        and priorities. Jobs are dispatched in submission order if None.
+    job_sinks : List[JobSink]
+        Sinks receiving the timing record of every finished job. Aggregated
+        timings are available from `job_stats` regardless.
+    deadline : float, optional
+        Time budget of a run in seconds. Once a job is not projected to finish
+        before the deadline it is skipped, and jobs still running at the deadline
+        are cancelled. Their result is NaN and `coverage` reports how many jobs
+        completed.
     _nest_asyncio_applied : bool
         Whether nest_asyncio has been applied
     _cancel_event : threading.Event
@@ -50,7 +103,14 @@ class Executor:
     batch_size: t.Optional[int] = None
     run_config: t.Optional[RunConfig] = field(default=None, repr=False)
     pbar: t.Optional[tqdm] = None
+    scheduling: t.Optional[FairScheduling] = None
+    job_sinks: t.List[JobSink] = field(default_factory=list, repr=False)
+    deadline: t.Optional[float] = None
+    _run_deadline: t.Optional[RunDeadline] = field(default=None, repr=False)
+    _job_stats: t.Optional[JobStats] = field(default=None, repr=False)
     _jobs_processed: int = field(default=0, repr=False)
+    _group_progress: t.Dict[str, int] = field(default_factory=dict, repr=False)
+    _scheduler: t.Optional[FairScheduler] = field(default=None, repr=False)
     _cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
 
     def cancel(self) -> None:
@@ -61,14 +121,111 @@ class Executor:
         """Check if the execution has been cancelled."""
         return self._cancel_event.is_set()
 
+    @property
+    def concurrency_limiter(self) -> t.Optional[AdaptiveConcurrencyLimiter]:
+        """The adaptive concurrency limiter of the run config, if enabled."""
+        return getattr(self.run_config, "concurrency_limiter", None)
+
+    @property
+    def concurrency_limit(self) -> t.Optional[int]:
+        """
+        The current concurrency limit, or None if concurrency is unbounded.
+
+        With adaptive concurrency enabled this value changes during the run.
+        """
+        if self.concurrency_limiter is not None:
+            return self.concurrency_limiter.limit
+        if self.run_config is not None and self.run_config.max_workers > 0:
+            return self.run_config.max_workers
+        return None
+
+    @property
+    def job_stats(self) -> JobStats:
+        """
+        Timings of the jobs run by this executor.
+
+        Call ``job_stats.summary()`` for per-name latency and queue wait
+        percentiles, throughput and queue depth over time.
+        """
+        if self._job_stats is None:
+            self._job_stats = JobStats(sinks=self.job_sinks)
+        return self._job_stats
+
+    @property
+    def coverage(self) -> t.Optional[t.Dict[str, t.Any]]:
+        """
+        Jobs of the last run that completed, or were skipped or cut short by the
+        deadline, or None if no deadline is set.
+
+        ``skipped_jobs`` and ``cut_jobs`` hold the indices of the affected jobs.
+        """
+        if self._run_deadline is None:
+            return None
+        return {
+            **self._run_deadline.coverage(),
+            "skipped_jobs": sorted(self._run_deadline.skipped),
+            "cut_jobs": sorted(self._run_deadline.cut),
+        }
+
+    @property
+    def group_progress(self) -> t.Dict[str, int]:
+        """Number of finished jobs per group for the current run."""
+        return dict(self._group_progress)
+
+    def _on_job_done(self, group: t.Optional[str], latency: t.Optional[float]) -> None:
+        group = group or DEFAULT_GROUP
+        self._group_progress[group] = self._group_progress.get(group, 0) + 1
+        if self._scheduler is not None and latency is not None:
+            self._scheduler.record_latency(group, latency)
+
     def wrap_callable_with_index(
-        self, callable: t.Callable, counter: int
+        self,
+        callable: t.Callable,
+        counter: int,
+        group: t.Optional[str] = None,
+        record: t.Optional[JobRecord] = None,
     ) -> t.Callable:
         async def wrapped_callable_async(*args, **kwargs) -> t.Tuple[int, t.Any]:
+            limiter = self.concurrency_limiter
+            stats = self.job_stats
+            deadline = self._run_deadline
+            token = stats.job_started(record) if record is not None else None
+            start = time.monotonic()
             try:
-                result = await callable(*args, **kwargs)
+                if deadline is not None:
+                    result = await deadline.run(
+                        counter, group, callable, *args, **kwargs
+                    )
+                else:
+                    result = await callable(*args, **kwargs)
+                latency = time.monotonic() - start
+                if limiter is not None:
+                    limiter.record_success(latency)
+                self._on_job_done(group, latency)
+                if record is not None:
+                    stats.job_finished(record, token)
                 return counter, result
+            except DeadlineExceededError as e:
+                # a partial result is expected, so this is never raised
+                if record is not None:
+                    stats.job_finished(record, token, exc=e)
+                # skipped jobs did not run, so they tell nothing about latency
+                self._on_job_done(
+                    group, time.monotonic() - start if e.started else None
+                )
+                return counter, np.nan
+            except BatchResponsePending as e:
+                # the job runs again once the batch job answered its prompt
+                if record is not None:
+                    stats.job_finished(record, token, exc=e)
+                self._on_job_done(group, None)
+                return counter, np.nan
             except Exception as e:
+                if limiter is not None:
+                    limiter.record_failure(e)
+                self._on_job_done(group, time.monotonic() - start)
+                if record is not None:
+                    stats.job_finished(record, token, exc=e)
                 if self.raise_exceptions:
                     raise e
                 else:
@@ -82,6 +239,10 @@ class Executor:
                         exc_info=False,
                     )
                 return counter, np.nan
+            except asyncio.CancelledError as e:
+                if record is not None:
+                    stats.job_finished(record, token, exc=e)
+                raise
 
         return wrapped_callable_async
 
@@ -93,62 +254,164 @@ class Executor:
         **kwargs,
     ) -> None:
         """
-        Submit a job to be executed, wrapping the callable with error handling and indexing to keep track of the job index.
+        Submit a job to be executed. The callable is wrapped with error handling and indexing when the executor runs, to keep track of the job index.
+
+        ``name`` is taken by the executor and never passed to the callable. To put
+        the job in a scheduling group, use ``submit_jobs``, so that every other
+        keyword argument reaches the callable unchanged.
         """
-        # Use _jobs_processed for consistent indexing across multiple runs
-        callable_with_index = self.wrap_callable_with_index(
-            callable, self._jobs_processed
-        )
-        self.jobs.append((callable_with_index, args, kwargs, name))
-        self._jobs_processed += 1
+        self.jobs.append((callable, args, kwargs, name, None))
+
+    def submit_jobs(
+        self,
+        jobs: t.Iterable[JobSpec],
+        total: t.Optional[int] = None,
+        name: t.Optional[str] = None,
+        group: t.Optional[str] = None,
+    ) -> None:
+        """
+        Submit a lazily evaluated stream of jobs.
+
+        Each item of ``jobs`` is a ``(callable, args, kwargs)`` tuple, optionally
+        followed by a per-job name and group. The iterable
+        is only consumed while the executor runs, and only as fast as the
+        concurrency window allows, so a generator can describe millions of jobs
+        while keeping memory flat. Results keep the submission order.
+
+        Parameters
+        ----------
+        jobs : Iterable[Tuple[Callable, Sequence, Dict]]
+            The jobs to run, optionally with a fourth element naming the job and a
+            fifth element giving its group.
+        total : int, optional
+            Number of jobs in the stream, used for progress reporting.
+        name : str, optional
+            Default name for jobs of the stream that do not carry their own.
+        group : str, optional
+            Default group for jobs of the stream that do not carry their own.
+        """
+        self.jobs.append(_JobStream(iter(jobs), total=total, name=name, group=group))
 
     def clear_jobs(self) -> None:
         """Clear all submitted jobs and reset counter."""
         self.jobs.clear()
         self._jobs_processed = 0
 
-    async def _process_jobs(self) -> t.List[t.Any]:
-        """Execute jobs with optional progress tracking."""
+    def _total_jobs(self, jobs: t.List[t.Any]) -> t.Optional[int]:
+        """Number of jobs to run, or None if a job stream has unknown length."""
+        total = 0
+        for job in jobs:
+            if isinstance(job, _JobStream):
+                if job.total is None:
+                    return None
+                total += job.total
+            else:
+                total += 1
+        return total
+
+    def _iter_jobs(self, jobs: t.List[t.Any]) -> t.Iterator[_Job]:
+        """Yield jobs in submission order, indexing them as they are drawn."""
+        for job in jobs:
+            if isinstance(job, _JobStream):
+                entries: t.Iterator[t.Tuple] = (
+                    (
+                        spec[0],
+                        spec[1],
+                        spec[2],
+                        spec[3] if len(spec) > 3 else job.name,
+                        spec[4] if len(spec) > 4 else job.group,
+                    )
+                    for spec in job.jobs
+                )
+            else:
+                entries = iter([job])
+            for callable, args, kwargs, name, group in entries:
+                # Use _jobs_processed for consistent indexing across multiple runs
+                yield _Job(self._jobs_processed, callable, args, kwargs, name, group)
+                self._jobs_processed += 1
+
+    def _schedule(self, jobs: t.List[t.Any]) -> t.Iterator[_Job]:
+        """Order jobs for dispatch, fairly across groups if a policy is set."""
+        job_iter = self._iter_jobs(jobs)
+        self._group_progress = {}
+        self._scheduler = None
+        if self.scheduling is not None:
+            self._scheduler = FairScheduler(
+                job_iter, group_of=lambda job: job.group, policy=self.scheduling
+            )
+            return self._scheduler
+        return job_iter
+
+    def _make_coroutines(self, jobs: t.Iterable[_Job]) -> t.Iterator[t.Coroutine]:
+        # coroutines are created lazily so that only the jobs in the concurrency
+        # window are materialized at any time
+        stats = self.job_stats
+        for job in jobs:
+            record = stats.job_submitted(job.index, job.name, job.group)
+            afunc = self.wrap_callable_with_index(
+                job.callable, job.index, job.group, record
+            )
+            yield afunc(*job.args, **job.kwargs)
+
+    def _update_progress(self, pbar: tqdm) -> None:
+        pbar.update(1)
+        if len(self._group_progress) > 1:
+            pbar.set_postfix(self._group_progress, refresh=False)
+
+    async def _process_jobs(self) -> t.AsyncIterator[t.Tuple[int, t.Any]]:
+        """Execute jobs with optional progress tracking, yielding results as they complete."""
         if not self.jobs:
-            return []
+            return
 
         # Make a copy of jobs to process and clear the original list to prevent re-execution
         jobs_to_process = self.jobs.copy()
         self.jobs.clear()
+        total = self._total_jobs(jobs_to_process)
+        job_iter = self._schedule(jobs_to_process)
+        self._run_deadline = None
+        if self.deadline is not None:
+            self._run_deadline = RunDeadline(self.deadline)
+            self._run_deadline.start()
 
         max_workers = (
             self.run_config.max_workers
             if self.run_config and hasattr(self.run_config, "max_workers")
             else -1
         )
-        results = []
+        if self.concurrency_limiter is not None:
+            # the limiter controls concurrency, max_workers only sizes the window
+            max_workers = self.concurrency_limiter.max_limit
         pbm = ProgressBarManager(self.desc, self.show_progress)
 
         if not self.batch_size:
             # Use external progress bar if provided, otherwise create one
             if self.pbar is None:
-                with pbm.create_single_bar(len(jobs_to_process)) as internal_pbar:
-                    await self._process_coroutines(
-                        jobs_to_process, internal_pbar, results, max_workers
-                    )
+                with pbm.create_single_bar(total) as internal_pbar:
+                    async for result in self._process_coroutines(
+                        job_iter, internal_pbar, max_workers
+                    ):
+                        yield result
             else:
-                await self._process_coroutines(
-                    jobs_to_process, self.pbar, results, max_workers
-                )
-            return results
+                async for result in self._process_coroutines(
+                    job_iter, self.pbar, max_workers
+                ):
+                    yield result
+            return
 
         # Process jobs in batches with nested progress bars
-        await self._process_batched_jobs(jobs_to_process, pbm, max_workers, results)
-        return results
+        async for result in self._process_batched_jobs(
+            job_iter, pbm, max_workers, total=total
+        ):
+            yield result
 
     async def _process_batched_jobs(
-        self, jobs_to_process, progress_manager, max_workers, results
+        self, jobs_to_process, progress_manager, max_workers, total=None
     ):
         """Process jobs in batches with nested progress tracking."""
-        batch_size = self.batch_size or len(jobs_to_process)
+        batch_size = t.cast(int, self.batch_size)
         batches = batched(jobs_to_process, batch_size)
         overall_pbar, batch_pbar, n_batches = progress_manager.create_nested_bars(
-            len(jobs_to_process), batch_size
+            total, batch_size
         )
 
         with overall_pbar, batch_pbar:
@@ -160,35 +423,61 @@ class Executor:
                 progress_manager.update_batch_bar(batch_pbar, i, n_batches, len(batch))
 
                 # Create coroutines per batch
-                coroutines = [
-                    afunc(*args, **kwargs) for afunc, args, kwargs, _ in batch
-                ]
+                coroutines = self._make_coroutines(batch)
 
                 async for result in process_futures(
                     as_completed(
-                        coroutines, max_workers, cancel_check=self.is_cancelled
+                        coroutines,
+                        max_workers,
+                        cancel_check=self.is_cancelled,
+                        prefetch_factor=self._prefetch_factor,
+                        semaphore=self.concurrency_limiter,
                     )
                 ):
                     # If jobs are configured to raise exceptions, propagate immediately
                     if isinstance(result, Exception) and self.raise_exceptions:
                         raise result
-                    results.append(result)
-                    batch_pbar.update(1)
+                    self._update_progress(batch_pbar)
+                    yield result
                 # Update overall progress bar for all futures in this batch
                 overall_pbar.update(len(batch))
 
-    async def _process_coroutines(self, jobs, pbar, results, max_workers):
+    @property
+    def _prefetch_factor(self) -> int:
+        # with fair scheduling jobs are only drawn when a worker is free, so that
+        # the scheduling decision is made at dispatch time
+        return 1 if self.scheduling is not None else 2
+
+    async def _process_coroutines(self, jobs, pbar, max_workers):
         """Helper function to process coroutines and update the progress bar."""
-        coroutines = [afunc(*args, **kwargs) for afunc, args, kwargs, _ in jobs]
+        coroutines = self._make_coroutines(jobs)
 
         async for result in process_futures(
-            as_completed(coroutines, max_workers, cancel_check=self.is_cancelled)
+            as_completed(
+                coroutines,
+                max_workers,
+                cancel_check=self.is_cancelled,
+                prefetch_factor=self._prefetch_factor,
+                semaphore=self.concurrency_limiter,
+            )
         ):
             # If jobs are configured to raise exceptions, propagate immediately
             if isinstance(result, Exception) and self.raise_exceptions:
                 raise result
-            results.append(result)
-            pbar.update(1)
+            self._update_progress(pbar)
+            yield result
+
+    async def astream(self) -> t.AsyncIterator[t.Tuple[int, t.Any]]:
+        """
+        Execute all submitted jobs and yield ``(index, result)`` pairs as they complete.
+
+        Results are yielded in completion order; ``index`` is the position of the
+        job in submission order, the same position it has in `aresults`. Nothing
+        is accumulated, so this is the entry point to consume results
+        incrementally during long runs.
+        """
+        async for index, result in self._process_jobs():
+            yield index, result
 
     async def aresults(self) -> t.List[t.Any]:
         """
@@ -197,7 +486,7 @@ class Executor:
 
         This is the async entry point for executing async jobs when already in an async context.
         """
-        results = await self._process_jobs()
+        results = [result async for result in self.astream()]
         sorted_results = sorted(results, key=lambda x: x[0])
         return [r[1] for r in sorted_results]
 
@@ -211,7 +500,6 @@ class Executor:
         async def _async_wrapper():
             return await self.aresults()
 
-        apply_nest_asyncio()
         return run(_async_wrapper)
 
 
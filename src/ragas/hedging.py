@@ -0,0 +1,160 @@
+"""Hedged requests to cut the tail latency of LLM and embedding calls."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import time
+import typing as t
+from collections import deque
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class RequestHedger:
+    """
+    Fire a duplicate of slow requests and keep whichever finishes first.
+
+    Latencies of successful calls are tracked per key, the wrapped function and
+    model. Once a key has ``min_samples`` observations, a call that is still
+    running after the ``percentile`` latency gets a second, identical request.
+    The first request to succeed wins and the other one is cancelled. Duplicates
+    are limited by ``budget``, the maximum ratio of extra calls to calls.
+
+    Only use hedging for idempotent calls, such as LLM generations and
+    embeddings, since both requests may reach the provider.
+
+    Parameters
+    ----------
+    percentile : float
+        Latency percentile after which a duplicate request is sent.
+    budget : float
+        Maximum number of duplicate requests as a fraction of all requests, e.g.
+        0.05 allows at most 5% extra calls.
+    min_samples : int
+        Number of latencies to observe before hedging starts.
+    min_delay : float
+        Lower bound, in seconds, for the time to wait before hedging.
+    window : int
+        Number of recent latencies the percentile is computed over.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        budget: float = 0.05,
+        min_samples: int = 20,
+        min_delay: float = 0.0,
+        window: int = 1000,
+    ):
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if budget < 0:
+            raise ValueError("budget must be non-negative")
+        if min_samples < 1:
+            raise ValueError("min_samples must be at least 1")
+
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.window = window
+
+        self._latencies: t.Dict[str, t.Deque[float]] = {}
+        self._requests = 0
+        self._hedged = 0
+
+    @property
+    def requests(self) -> int:
+        """Number of calls made through the hedger."""
+        return self._requests
+
+    @property
+    def hedged(self) -> int:
+        """Number of duplicate requests sent."""
+        return self._hedged
+
+    def delay(self, key: str) -> t.Optional[float]:
+        """Seconds to wait before hedging a call to ``key``, None if not hedging yet."""
+        latencies = self._latencies.get(key)
+        if latencies is None or len(latencies) < self.min_samples:
+            return None
+        return max(float(np.percentile(latencies, self.percentile)), self.min_delay)
+
+    def record_latency(self, key: str, latency: float) -> None:
+        """Add the latency of a successful call to ``key``."""
+        latencies = self._latencies.get(key)
+        if latencies is None:
+            latencies = self._latencies[key] = deque(maxlen=self.window)
+        latencies.append(latency)
+
+    def _take_budget(self) -> bool:
+        if self._hedged + 1 > self.budget * self._requests:
+            return False
+        self._hedged += 1
+        return True
+
+    async def call(
+        self,
+        key: str,
+        fn: t.Callable[..., t.Awaitable[t.Any]],
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> t.Any:
+        """Call ``fn``, hedging it with a duplicate request if it is slow."""
+        self._requests += 1
+        delay = self.delay(key)
+        start = time.monotonic()
+        tasks = [asyncio.ensure_future(fn(*args, **kwargs))]
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and self._take_budget():
+                    logger.debug("Hedging %s after %.2fs", key, delay)
+                    tasks.append(asyncio.ensure_future(fn(*args, **kwargs)))
+
+            pending = set(tasks)
+            error: t.Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    exc = task.exception()
+                    if exc is None:
+                        # the primary took at least this long, even if the hedge won
+                        self.record_latency(key, time.monotonic() - start)
+                        return task.result()
+                    error = error or exc
+            raise t.cast(BaseException, error)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def wrap(
+        self, fn: t.Callable[..., t.Awaitable[t.Any]], key: t.Optional[str] = None
+    ) -> t.Callable[..., t.Awaitable[t.Any]]:
+        """
+        Return a version of the coroutine function ``fn`` with hedged calls.
+
+        Calls sharing a ``key`` share latency statistics, by default the qualified
+        name of ``fn``. Give calls to different models different keys, so that a
+        slow model does not trigger hedges against a fast one.
+        """
+        key = key or getattr(fn, "__qualname__", repr(fn))
+
+        @functools.wraps(fn)
+        async def hedged(*args, **kwargs):
+            return await self.call(key, fn, *args, **kwargs)
+
+        return hedged
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestHedger(percentile={self.percentile}, budget={self.budget}, "
+            f"requests={self._requests}, hedged={self._hedged})"
+        )
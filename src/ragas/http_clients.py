@@ -0,0 +1,162 @@
+"""
+Process-wide HTTP connection pools shared by the clients Ragas creates.
+
+Clients constructed per call or per row each open their own small connection pool,
+which repeats TCP and TLS handshakes and caps concurrency at httpx's default limits
+regardless of `RunConfig.max_workers`. The functions here hand out one
+`httpx.Client` per pool configuration, and one `httpx.AsyncClient` per pool
+configuration and event loop, sized from the `RunConfig` and kept alive for the
+life of the process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import typing as t
+import weakref
+
+import httpx
+
+from ragas.run_config import RunConfig
+
+# seconds an idle connection is kept open for reuse
+KEEPALIVE_EXPIRY = 60.0
+
+PoolKey = t.Tuple[int, int, float, bool]
+
+_lock = threading.Lock()
+_pid = os.getpid()
+_clients: t.Dict[PoolKey, httpx.Client] = {}
+_async_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, t.Dict[PoolKey, httpx.AsyncClient]
+] = weakref.WeakKeyDictionary()
+
+
+def pool_limits(run_config: t.Optional[RunConfig] = None) -> httpx.Limits:
+    """
+    Connection pool limits for the concurrency allowed by a run configuration.
+
+    Every worker can keep its own connection alive, and the pool can open as many
+    again for hedged requests and retries that overlap a slow request.
+    """
+    run_config = run_config or RunConfig()
+    workers = run_config.max_workers
+    if run_config.adaptive_concurrency:
+        workers = max(workers, run_config.max_adaptive_workers)
+    workers = max(workers, 1)
+    return httpx.Limits(
+        max_connections=2 * workers,
+        max_keepalive_connections=workers,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+
+
+def _pool_key(run_config: RunConfig) -> PoolKey:
+    limits = pool_limits(run_config)
+    return (
+        t.cast(int, limits.max_connections),
+        t.cast(int, limits.max_keepalive_connections),
+        float(run_config.timeout),
+        run_config.http2,
+    )
+
+
+def _client_kwargs(key: PoolKey) -> t.Dict[str, t.Any]:
+    max_connections, max_keepalive_connections, timeout, http2 = key
+    return {
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+        "timeout": httpx.Timeout(timeout),
+        "http2": http2,
+        "follow_redirects": True,
+    }
+
+
+def _reset_after_fork() -> None:
+    # connections inherited from the parent process are not safe to share
+    global _pid
+    if os.getpid() != _pid:
+        _pid = os.getpid()
+        _clients.clear()
+        _async_clients.clear()
+
+
+def get_http_client(run_config: t.Optional[RunConfig] = None) -> httpx.Client:
+    """
+    Get the shared synchronous HTTP client for a run configuration.
+
+    Configurations with the same pool limits, timeout and HTTP/2 setting share
+    a client. Pass it as the `http_client` of an OpenAI client (or any SDK built on
+    httpx) to reuse its connections.
+
+    Parameters
+    ----------
+    run_config : RunConfig, optional
+        The configuration the pool is sized for, by default `RunConfig()`.
+
+    Returns
+    -------
+    httpx.Client
+        A client that lives until `close_http_clients` is called.
+    """
+    key = _pool_key(run_config or RunConfig())
+    with _lock:
+        _reset_after_fork()
+        client = _clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.Client(**_client_kwargs(key))
+            _clients[key] = client
+        return client
+
+
+def get_async_http_client(
+    run_config: t.Optional[RunConfig] = None,
+) -> httpx.AsyncClient:
+    """
+    Get the shared asynchronous HTTP client for a run configuration.
+
+    Connections of an async client are bound to the event loop that opened them,
+    so there is one client per configuration and running event loop. Must be
+    called from a coroutine.
+
+    Parameters
+    ----------
+    run_config : RunConfig, optional
+        The configuration the pool is sized for, by default `RunConfig()`.
+
+    Returns
+    -------
+    httpx.AsyncClient
+        A client that lives as long as the event loop, or until
+        `close_http_clients` is called.
+    """
+    loop = asyncio.get_running_loop()
+    key = _pool_key(run_config or RunConfig())
+    with _lock:
+        _reset_after_fork()
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(**_client_kwargs(key))
+            clients[key] = client
+        return client
+
+
+def close_http_clients() -> None:
+    """
+    Close the shared synchronous clients and forget all shared clients.
+
+    Async clients are dropped without closing them, since their connections can
+    only be closed from their own event loop. New clients are created on the next
+    request for one.
+    """
+    with _lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
+        _async_clients.clear()
@@ -0,0 +1,280 @@
+"""
+Per-job timing instrumentation for the Executor.
+
+Every job run by an `Executor` gets a `JobRecord` with the time it entered the
+concurrency window, the time it got a worker slot and started, the time it ended,
+the number of retries made while it ran and the type of the exception it failed
+with. `JobStats` aggregates the records into per-name latency percentiles,
+throughput and queue depth over time, and forwards each finished record to the
+configured `JobSink`s.
+
+Long queue waits point to the concurrency limit, long run times to provider
+latency, and a high retry count to rate limiting.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import re
+import threading
+import time
+import typing as t
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+
+import numpy as np
+
+DEFAULT_NAME = "default"
+
+_current_job: contextvars.ContextVar[t.Optional[JobRecord]] = contextvars.ContextVar(
+    "ragas_current_job", default=None
+)
+
+_INDEX_SUFFIX = re.compile(r"-\d+$")
+
+
+@dataclass
+class JobRecord:
+    """
+    Timing of a single job.
+
+    Timestamps are seconds since the epoch; ``started_at`` and ``ended_at`` are
+    None until the job started and ended.
+    """
+
+    index: int
+    name: t.Optional[str]
+    group: t.Optional[str]
+    submitted_at: float
+    started_at: t.Optional[float] = None
+    ended_at: t.Optional[float] = None
+    retries: int = 0
+    exception_type: t.Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        """Name the job is aggregated under: its group, or its name without index."""
+        if self.group:
+            return self.group
+        if self.name:
+            return _INDEX_SUFFIX.sub("", self.name)
+        return DEFAULT_NAME
+
+    @property
+    def queue_wait(self) -> t.Optional[float]:
+        """Seconds spent waiting for a worker slot."""
+        if self.started_at is None:
+            return None
+        return self.started_at - self.submitted_at
+
+    @property
+    def run_time(self) -> t.Optional[float]:
+        """Seconds spent running, retries included."""
+        if self.started_at is None or self.ended_at is None:
+            return None
+        return self.ended_at - self.started_at
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        data = asdict(self)
+        data["key"] = self.key
+        data["queue_wait"] = self.queue_wait
+        data["run_time"] = self.run_time
+        return data
+
+
+def record_retry() -> None:
+    """Count a retry against the job running in the current context, if any."""
+    record = _current_job.get()
+    if record is not None:
+        record.retries += 1
+
+
+class JobSink(ABC):
+    """Receives every finished `JobRecord`, e.g. to export it to a monitoring system."""
+
+    @abstractmethod
+    def emit(self, record: JobRecord) -> None:
+        """Handle a finished job."""
+        ...
+
+    def close(self) -> None:
+        """Flush and release the sink."""
+        pass
+
+
+class JSONLJobSink(JobSink):
+    """Append every finished job as a JSON line to a file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file: t.Optional[t.TextIO] = None
+
+    def emit(self, record: JobRecord) -> None:
+        line = json.dumps(record.to_dict())
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def _percentiles(values: t.List[float]) -> t.Dict[str, float]:
+    if not values:
+        return {"p50": float("nan"), "p95": float("nan"), "p99": float("nan")}
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {"p50": float(p50), "p95": float(p95), "p99": float(p99)}
+
+
+class JobStats:
+    """
+    Collect `JobRecord`s and summarize them.
+
+    Only the per-name latencies needed for the percentiles are kept, not the
+    records themselves, so memory grows by a few floats per job. Queue depth is
+    sampled at most once every ``sample_interval`` seconds.
+
+    Parameters
+    ----------
+    sinks : List[JobSink], optional
+        Sinks receiving every finished record.
+    sample_interval : float
+        Minimum number of seconds between two queue depth samples.
+    """
+
+    def __init__(
+        self,
+        sinks: t.Optional[t.Sequence[JobSink]] = None,
+        sample_interval: float = 1.0,
+    ):
+        self.sinks = list(sinks or [])
+        self.sample_interval = sample_interval
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        self._queued = 0
+        self._running = 0
+        self._first_submit: t.Optional[float] = None
+        self._last_end: t.Optional[float] = None
+        self._last_sample = float("-inf")
+        self._queue_depth: t.List[t.Tuple[float, int, int]] = []
+        self._run_times: t.Dict[str, t.List[float]] = {}
+        self._queue_waits: t.Dict[str, t.List[float]] = {}
+        self._counts: t.Dict[str, t.Dict[str, int]] = {}
+
+    @property
+    def queued(self) -> int:
+        """Jobs in the concurrency window waiting for a worker slot."""
+        return self._queued
+
+    @property
+    def running(self) -> int:
+        """Jobs currently running."""
+        return self._running
+
+    def job_submitted(
+        self, index: int, name: t.Optional[str], group: t.Optional[str]
+    ) -> JobRecord:
+        """Create the record of a job entering the concurrency window."""
+        now = time.time()
+        if self._first_submit is None:
+            self._first_submit = now
+        self._queued += 1
+        self._sample(now)
+        return JobRecord(index=index, name=name, group=group, submitted_at=now)
+
+    def job_started(self, record: JobRecord) -> contextvars.Token:
+        """
+        Mark a job as started and make it the current job of the context.
+
+        Returns the token to pass to `job_finished`.
+        """
+        record.started_at = time.time()
+        self._queued -= 1
+        self._running += 1
+        self._sample(record.started_at)
+        return _current_job.set(record)
+
+    def job_finished(
+        self,
+        record: JobRecord,
+        token: t.Optional[contextvars.Token] = None,
+        exc: t.Optional[BaseException] = None,
+    ) -> None:
+        """Mark a job as finished, aggregate it and send it to the sinks."""
+        if token is not None:
+            _current_job.reset(token)
+        record.ended_at = time.time()
+        if exc is not None:
+            record.exception_type = type(exc).__name__
+        self._running -= 1
+        self._last_end = record.ended_at
+        self._sample(record.ended_at)
+
+        key = record.key
+        counts = self._counts.setdefault(key, {"count": 0, "failed": 0, "retries": 0})
+        counts["count"] += 1
+        counts["failed"] += exc is not None
+        counts["retries"] += record.retries
+        self._run_times.setdefault(key, []).append(t.cast(float, record.run_time))
+        self._queue_waits.setdefault(key, []).append(t.cast(float, record.queue_wait))
+
+        for sink in self.sinks:
+            sink.emit(record)
+
+    def _sample(self, now: float) -> None:
+        if now - self._last_sample < self.sample_interval:
+            return
+        self._last_sample = now
+        offset = now - t.cast(float, self._first_submit)
+        self._queue_depth.append((offset, self._queued, self._running))
+
+    def summary(self) -> t.Dict[str, t.Any]:
+        """
+        Summarize the recorded jobs.
+
+        Returns
+        -------
+        Dict[str, Any]
+            ``jobs``, ``failed`` and ``retries`` totals, the wall clock
+            ``duration`` and ``throughput`` (jobs per second), per-name
+            ``by_name`` counts with ``run_time`` and ``queue_wait`` percentiles
+            (p50, p95, p99), and ``queue_depth`` samples of
+            ``(seconds since start, queued, running)``.
+        """
+        n_jobs = sum(c["count"] for c in self._counts.values())
+        duration = (
+            self._last_end - self._first_submit
+            if self._first_submit is not None and self._last_end is not None
+            else 0.0
+        )
+        by_name = {
+            key: {
+                **counts,
+                "run_time": _percentiles(self._run_times[key]),
+                "queue_wait": _percentiles(self._queue_waits[key]),
+            }
+            for key, counts in self._counts.items()
+        }
+        return {
+            "jobs": n_jobs,
+            "failed": sum(c["failed"] for c in self._counts.values()),
+            "retries": sum(c["retries"] for c in self._counts.values()),
+            "duration": duration,
+            "throughput": n_jobs / duration if duration > 0 else float("nan"),
+            "by_name": by_name,
+            "queue_depth": list(self._queue_depth),
+        }
+
+    def close(self) -> None:
+        """Close all sinks."""
+        for sink in self.sinks:
+            sink.close()
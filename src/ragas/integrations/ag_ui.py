@@ -992,7 +992,7 @@ async def call_ag_ui_endpoint(
     using AG-UI's RunAgentInput model.
     """
     try:
-        import httpx
+        from ragas.http_clients import get_async_http_client
     except ImportError as e:
         raise ImportError(
             "AG-UI FastAPI integration requires httpx. "
@@ -1042,32 +1042,34 @@ async def call_ag_ui_endpoint(
     if extra_headers:
         headers.update(extra_headers)
 
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-        async with client.stream(
-            "POST",
-            endpoint_url,
-            json=payload.model_dump(exclude_none=True),
-            headers=headers,
-        ) as response:
-            response.raise_for_status()
-
-            # Parse SSE stream line by line
-            async for line in response.aiter_lines():
-                line = line.strip()
-
-                # SSE format: "data: {...}"
-                if line.startswith("data: "):
-                    json_data = line[6:]  # Remove "data: " prefix
-
-                    try:
-                        # Parse JSON and convert to Event using TypeAdapter
-                        # TypeAdapter properly handles discriminated unions based on 'type' field
-                        event_dict = json.loads(json_data)
-                        event = event_adapter.validate_python(event_dict)
-                        events.append(event)
-                    except (json.JSONDecodeError, ValueError) as e:
-                        logger.warning(f"Failed to parse SSE event: {e}")
-                        continue
+    # Rows share the keep-alive connections of the process-wide pool
+    client = get_async_http_client()
+    async with client.stream(
+        "POST",
+        endpoint_url,
+        json=payload.model_dump(exclude_none=True),
+        headers=headers,
+        timeout=timeout,
+    ) as response:
+        response.raise_for_status()
+
+        # Parse SSE stream line by line
+        async for line in response.aiter_lines():
+            line = line.strip()
+
+            # SSE format: "data: {...}"
+            if line.startswith("data: "):
+                json_data = line[6:]  # Remove "data: " prefix
+
+                try:
+                    # Parse JSON and convert to Event using TypeAdapter
+                    # TypeAdapter properly handles discriminated unions based on 'type' field
+                    event_dict = json.loads(json_data)
+                    event = event_adapter.validate_python(event_dict)
+                    events.append(event)
+                except (json.JSONDecodeError, ValueError) as e:
+                    logger.warning(f"Failed to parse SSE event: {e}")
+                    continue
 
     return events
 
@@ -1,9 +1,7 @@
 from __future__ import annotations
 
-import asyncio
 import inspect
 import logging
-import threading
 import typing as t
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -19,8 +17,10 @@ from langchain_openai.llms.base import BaseOpenAI
 from pydantic import BaseModel
 
 from ragas._analytics import LLMUsageEvent, track
+from ragas.async_utils import run
 from ragas.cache import CacheInterface, cacher
 from ragas.exceptions import LLMDidNotFinishException
+from ragas.rate_limit import acquire_rate_limit, acquire_rate_limit_sync
 from ragas.run_config import RunConfig, add_async_retry
 
 if t.TYPE_CHECKING:
@@ -58,12 +58,17 @@ class BaseRagasLLM(ABC):
     run_config: RunConfig = field(default_factory=RunConfig, repr=False)
     multiple_completion_supported: bool = field(default=False, repr=False)
     cache: t.Optional[CacheInterface] = field(default=None, repr=False)
+    # share one call between concurrent identical prompts, even without a cache
+    coalesce: bool = field(default=False, repr=False)
 
     def __post_init__(self):
         # If a cache_backend is provided, wrap the implementation methods at construction time.
         if self.cache is not None:
             self.generate_text = cacher(cache_backend=self.cache)(self.generate_text)
-            self.agenerate_text = cacher(cache_backend=self.cache)(self.agenerate_text)
+        if self.cache is not None or self.coalesce:
+            self.agenerate_text = cacher(
+                cache_backend=self.cache, coalesce=self.coalesce or None
+            )(self.agenerate_text)
 
     def set_run_config(self, run_config: RunConfig):
         self.run_config = run_config
@@ -152,6 +157,7 @@ class LangchainLLMWrapper(BaseRagasLLM):
         cache: t.Optional[CacheInterface] = None,
         bypass_temperature: bool = False,
         bypass_n: bool = False,
+        coalesce: bool = False,
     ):
         import warnings
 
@@ -163,7 +169,7 @@ class LangchainLLMWrapper(BaseRagasLLM):
             DeprecationWarning,
             stacklevel=2,
         )
-        super().__init__(cache=cache)
+        super().__init__(cache=cache, coalesce=coalesce)
         self.langchain_llm = langchain_llm
         if run_config is None:
             run_config = RunConfig()
@@ -174,6 +180,16 @@ class LangchainLLMWrapper(BaseRagasLLM):
         # Certain reasoning LLMs (e.g., OpenAI o1 series) do not support n parameter for
         self.bypass_n = bypass_n
 
+    def _rate_limit_key(self) -> t.Tuple[str, t.Optional[str]]:
+        """Provider and model used to look up the shared rate limit."""
+        from ragas.embeddings.base import _infer_embedding_provider_from_llm
+
+        provider = _infer_embedding_provider_from_llm(self.langchain_llm)
+        model = getattr(self.langchain_llm, "model_name", None) or getattr(
+            self.langchain_llm, "model", None
+        )
+        return provider, model
+
     def is_finished(self, response: LLMResult) -> bool:
         """
         Parse the response to check if the LLM finished by checking the finish_reason
@@ -232,6 +248,8 @@ class LangchainLLMWrapper(BaseRagasLLM):
         stop: t.Optional[t.List[str]] = None,
         callbacks: Callbacks = None,
     ) -> LLMResult:
+        acquire_rate_limit_sync(*self._rate_limit_key(), prompt.to_string())
+
         # figure out the temperature to set
         old_temperature: float | None = None
         if temperature is None:
@@ -284,6 +302,8 @@ class LangchainLLMWrapper(BaseRagasLLM):
         stop: t.Optional[t.List[str]] = None,
         callbacks: Callbacks = None,
     ) -> LLMResult:
+        await acquire_rate_limit(*self._rate_limit_key(), prompt.to_string())
+
         # handle temperature
         old_temperature: float | None = None
         if temperature is None:
@@ -369,6 +389,7 @@ class LlamaIndexLLMWrapper(BaseRagasLLM):
         run_config: t.Optional[RunConfig] = None,
         cache: t.Optional[CacheInterface] = None,
         bypass_temperature: bool = False,
+        coalesce: bool = False,
     ):
         import warnings
 
@@ -380,7 +401,7 @@ class LlamaIndexLLMWrapper(BaseRagasLLM):
             DeprecationWarning,
             stacklevel=2,
         )
-        super().__init__(cache=cache)
+        super().__init__(cache=cache, coalesce=coalesce)
         self.llm = llm
         # Certain LLMs (e.g., OpenAI o1 series) do not support temperature
         self.bypass_temperature = bypass_temperature
@@ -582,6 +603,7 @@ def llm_factory(
     client: t.Optional[t.Any] = None,
     adapter: str = "auto",
     cache: t.Optional[CacheInterface] = None,
+    coalesce: bool = False,
     **kwargs: t.Any,
 ) -> InstructorBaseRagasLLM:
     """
@@ -609,6 +631,9 @@ def llm_factory(
         cache: Optional cache backend for caching LLM responses.
                Pass DiskCacheBackend() for persistent caching across runs.
                Saves costs and speeds up repeated evaluations by 60x.
+        coalesce: Whether concurrent calls with the same prompt and response model
+               share one call of the model (default: False). Always on with a
+               cache; set it to coalesce without one.
         **kwargs: Additional model arguments (temperature, max_tokens, top_p, etc).
 
     Returns:
@@ -678,7 +703,7 @@ def llm_factory(
     try:
         adapter_instance = get_adapter(adapter)
         llm = adapter_instance.create_llm(
-            client, model, provider_lower, cache=cache, **kwargs
+            client, model, provider_lower, cache=cache, coalesce=coalesce, **kwargs
         )
     except ValueError as e:
         # Re-raise ValueError from get_adapter for unknown adapter names
@@ -757,6 +782,7 @@ class InstructorLLM(InstructorBaseRagasLLM):
         provider: str,
         model_args: t.Optional[InstructorModelArgs] = None,
         cache: t.Optional[CacheInterface] = None,
+        coalesce: bool = False,
         **kwargs,
     ):
         self.client = client
@@ -771,13 +797,17 @@ class InstructorLLM(InstructorBaseRagasLLM):
         self.model_args = {**model_args.model_dump(), **kwargs}
 
         self.cache = cache
+        self.coalesce = coalesce
 
         # Check if client is async-capable at initialization
         self.is_async = self._check_client_async()
 
         if self.cache is not None:
             self.generate = cacher(cache_backend=self.cache)(self.generate)  # type: ignore
-            self.agenerate = cacher(cache_backend=self.cache)(self.agenerate)  # type: ignore
+        if self.cache is not None or coalesce:
+            self.agenerate = cacher(  # type: ignore
+                cache_backend=self.cache, coalesce=coalesce or None
+            )(self.agenerate)
 
     def _map_provider_params(self) -> t.Dict[str, t.Any]:
         """Route to provider-specific parameter mapping.
@@ -968,61 +998,13 @@ class InstructorLLM(InstructorBaseRagasLLM):
             return False
 
     def _run_async_in_current_loop(self, coro: t.Awaitable[t.Any]) -> t.Any:
-        """Run an async coroutine in the current event loop if possible.
+        """Run an async coroutine from sync code and wait for its result.
 
-        This handles Jupyter environments correctly by using a separate thread
-        when a running event loop is detected.
+        The coroutine runs on the shared background event loop, so the async
+        client keeps its connections across calls, also in Jupyter where an event
+        loop is already running.
         """
-        try:
-            # Try to get the current event loop
-            loop = asyncio.get_event_loop()
-
-            if loop.is_running():
-                # If the loop is already running (like in Jupyter notebooks),
-                # we run the coroutine in a separate thread with its own event loop
-                result_container: t.Dict[str, t.Any] = {
-                    "result": None,
-                    "exception": None,
-                }
-
-                def run_in_thread():
-                    # Create a new event loop for this thread
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
-                    try:
-                        # Run the coroutine in this thread's event loop
-                        result_container["result"] = new_loop.run_until_complete(coro)
-                    except Exception as e:
-                        # Capture any exceptions to re-raise in the main thread
-                        result_container["exception"] = e
-                    finally:
-                        # Clean up the event loop
-                        new_loop.close()
-
-                # Start the thread and wait for it to complete
-                thread = threading.Thread(target=run_in_thread)
-                thread.start()
-                thread.join()
-
-                # Re-raise any exceptions that occurred in the thread
-                if result_container["exception"]:
-                    raise result_container["exception"]
-
-                return result_container["result"]
-            else:
-                # Standard case - event loop exists but isn't running
-                return loop.run_until_complete(coro)
-
-        except RuntimeError:
-            # If we get a runtime error about no event loop, create a new one
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(coro)
-            finally:
-                # Clean up
-                loop.close()
-                asyncio.set_event_loop(None)
+        return run(t.cast(t.Coroutine[t.Any, t.Any, t.Any], coro))
 
     def generate(
         self, prompt: str, response_model: t.Type[InstructorTypeVar]
@@ -1039,6 +1021,12 @@ class InstructorLLM(InstructorBaseRagasLLM):
                 self.agenerate(prompt, response_model)
             )
         else:
+            acquire_rate_limit_sync(
+                self.provider,
+                self.model,
+                prompt,
+                extra_tokens=self.model_args.get("max_tokens", 0),
+            )
             # Map parameters based on provider requirements
             provider_kwargs = self._map_provider_params()
 
@@ -1084,6 +1072,13 @@ class InstructorLLM(InstructorBaseRagasLLM):
                 "Cannot use agenerate() with a synchronous client. Use generate() instead."
             )
 
+        await acquire_rate_limit(
+            self.provider,
+            self.model,
+            prompt,
+            extra_tokens=self.model_args.get("max_tokens", 0),
+        )
+
         # Map parameters based on provider requirements
         provider_kwargs = self._map_provider_params()
 
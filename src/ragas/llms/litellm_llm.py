@@ -1,12 +1,12 @@
-import asyncio
 import inspect
 import logging
-import threading
 import typing as t
 
 from ragas._analytics import LLMUsageEvent, track
+from ragas.async_utils import run
 from ragas.cache import CacheInterface, cacher
 from ragas.llms.base import InstructorBaseRagasLLM, InstructorTypeVar
+from ragas.rate_limit import acquire_rate_limit, acquire_rate_limit_sync
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +27,7 @@ class LiteLLMStructuredLLM(InstructorBaseRagasLLM):
         model: str,
         provider: str,
         cache: t.Optional[CacheInterface] = None,
+        coalesce: bool = False,
         **kwargs,
     ):
         """
@@ -37,6 +38,8 @@ class LiteLLMStructuredLLM(InstructorBaseRagasLLM):
             model: Model name (e.g., "gemini-2.0-flash")
             provider: Provider name
             cache: Optional cache backend for caching LLM responses
+            coalesce: Whether concurrent calls with the same prompt share one
+                call of the model, also without a cache backend
             **kwargs: Additional model arguments (temperature, max_tokens, etc.)
         """
         self.client = client
@@ -44,13 +47,17 @@ class LiteLLMStructuredLLM(InstructorBaseRagasLLM):
         self.provider = provider
         self.model_args = kwargs
         self.cache = cache
+        self.coalesce = coalesce
 
         # Check if client is async-capable at initialization
         self.is_async = self._check_client_async()
 
         if self.cache is not None:
             self.generate = cacher(cache_backend=self.cache)(self.generate)  # type: ignore
-            self.agenerate = cacher(cache_backend=self.cache)(self.agenerate)  # type: ignore
+        if self.cache is not None or coalesce:
+            self.agenerate = cacher(  # type: ignore
+                cache_backend=self.cache, coalesce=coalesce or None
+            )(self.agenerate)
 
     def _check_client_async(self) -> bool:
         """Determine if the client is async-capable.
@@ -113,61 +120,13 @@ class LiteLLMStructuredLLM(InstructorBaseRagasLLM):
             return False
 
     def _run_async_in_current_loop(self, coro: t.Awaitable[t.Any]) -> t.Any:
-        """Run an async coroutine in the current event loop if possible.
+        """Run an async coroutine from sync code and wait for its result.
 
-        This handles Jupyter environments correctly by using a separate thread
-        when a running event loop is detected.
+        The coroutine runs on the shared background event loop, so the async
+        client keeps its connections across calls, also in Jupyter where an event
+        loop is already running.
         """
-        try:
-            # Try to get the current event loop
-            loop = asyncio.get_event_loop()
-
-            if loop.is_running():
-                # If the loop is already running (like in Jupyter notebooks),
-                # we run the coroutine in a separate thread with its own event loop
-                result_container: t.Dict[str, t.Any] = {
-                    "result": None,
-                    "exception": None,
-                }
-
-                def run_in_thread():
-                    # Create a new event loop for this thread
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
-                    try:
-                        # Run the coroutine in this thread's event loop
-                        result_container["result"] = new_loop.run_until_complete(coro)
-                    except Exception as e:
-                        # Capture any exceptions to re-raise in the main thread
-                        result_container["exception"] = e
-                    finally:
-                        # Clean up the event loop
-                        new_loop.close()
-
-                # Start the thread and wait for it to complete
-                thread = threading.Thread(target=run_in_thread)
-                thread.start()
-                thread.join()
-
-                # Re-raise any exceptions that occurred in the thread
-                if result_container["exception"]:
-                    raise result_container["exception"]
-
-                return result_container["result"]
-            else:
-                # Standard case - event loop exists but isn't running
-                return loop.run_until_complete(coro)
-
-        except RuntimeError:
-            # If we get a runtime error about no event loop, create a new one
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(coro)
-            finally:
-                # Clean up
-                loop.close()
-                asyncio.set_event_loop(None)
+        return run(t.cast(t.Coroutine[t.Any, t.Any, t.Any], coro))
 
     def generate(
         self, prompt: str, response_model: t.Type[InstructorTypeVar]
@@ -191,6 +150,12 @@ class LiteLLMStructuredLLM(InstructorBaseRagasLLM):
                 self.agenerate(prompt, response_model)
             )
         else:
+            acquire_rate_limit_sync(
+                self.provider,
+                self.model,
+                prompt,
+                extra_tokens=self.model_args.get("max_tokens", 0),
+            )
             # Call LiteLLM with structured output
             result = self.client.chat.completions.create(
                 model=self.model,
@@ -233,6 +198,13 @@ class LiteLLMStructuredLLM(InstructorBaseRagasLLM):
                 "Cannot use agenerate() with a synchronous client. Use generate() instead."
             )
 
+        await acquire_rate_limit(
+            self.provider,
+            self.model,
+            prompt,
+            extra_tokens=self.model_args.get("max_tokens", 0),
+        )
+
         # Call LiteLLM async with structured output
         result = await self.client.chat.completions.create(
             model=self.model,
@@ -83,6 +83,7 @@ from ragas.metrics._tool_call_accuracy import ToolCallAccuracy as _ToolCallAccur
 from ragas.metrics._tool_call_f1 import ToolCallF1 as _ToolCallF1
 from ragas.metrics._topic_adherence import TopicAdherenceScore as _TopicAdherenceScore
 from ragas.metrics.base import (
+    CPUBoundMetric,
     Metric,
     MetricOutputType,
     MetricType,
@@ -103,6 +104,7 @@ __all__ = [
     "Metric",
     "MetricType",
     "MetricWithEmbeddings",
+    "CPUBoundMetric",
     "MetricWithLLM",
     "SingleTurnMetric",
     "MultiTurnMetric",
@@ -4,12 +4,11 @@ from dataclasses import dataclass, field
 from langchain_core.callbacks import Callbacks
 
 from ragas.dataset_schema import SingleTurnSample
-from ragas.metrics.base import MetricType, SingleTurnMetric
-from ragas.run_config import RunConfig
+from ragas.metrics.base import CPUBoundMetric, MetricType
 
 
 @dataclass
-class ChrfScore(SingleTurnMetric):
+class ChrfScore(CPUBoundMetric):
     name: str = "chrf_score"
     _required_columns: t.Dict[MetricType, t.Set[str]] = field(
         default_factory=lambda: {MetricType.SINGLE_TURN: {"reference", "response"}}
@@ -25,12 +24,7 @@ class ChrfScore(SingleTurnMetric):
             )
         self.corpus_chrf = corpus_chrf
 
-    def init(self, run_config: RunConfig):
-        pass
-
-    async def _single_turn_ascore(
-        self, sample: SingleTurnSample, callbacks: Callbacks
-    ) -> float:
+    def _score_sample(self, sample: SingleTurnSample) -> float:
         reference, response = sample.reference, sample.response
 
         if reference is None or response is None:
@@ -7,14 +7,13 @@ import numpy as np
 from langchain_core.callbacks import Callbacks
 
 from ragas.dataset_schema import SingleTurnSample
-from ragas.metrics.base import MetricType, SingleTurnMetric
-from ragas.run_config import RunConfig
+from ragas.metrics.base import CPUBoundMetric, MetricType
 
 logger = logging.getLogger(__name__)
 
 
 @dataclass
-class DataCompyScore(SingleTurnMetric):
+class DataCompyScore(CPUBoundMetric):
     name: str = "data_compare_score"
     _required_columns: t.Dict[MetricType, t.Set[str]] = field(
         default_factory=lambda: {MetricType.SINGLE_TURN: {"reference", "response"}}
@@ -39,12 +38,7 @@ class DataCompyScore(SingleTurnMetric):
         if self.metric not in ["precision", "recall", "f1"]:
             raise ValueError("Metric should be either precision, recall or f1")
 
-    def init(self, run_config: RunConfig):
-        pass
-
-    async def _single_turn_ascore(
-        self, sample: SingleTurnSample, callbacks: Callbacks
-    ) -> float:
+    def _score_sample(self, sample: SingleTurnSample) -> float:
         reference = sample.reference
         response = sample.response
         assert isinstance(reference, str), "Expecting a string"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import typing as t
 from dataclasses import dataclass, field
@@ -261,16 +262,21 @@ class FaithfulnesswithHHEM(Faithfulness):
         if statements == []:
             return np.nan
 
-        scores = []
         pairs = self._create_pairs(row, statements)
+        # the classifier is CPU/GPU-bound and releases the GIL, run it in a thread
+        # so that it does not block the event loop
+        scores = await asyncio.to_thread(self._classify_pairs, pairs)
+        return sum(scores) / len(scores)
+
+    def _classify_pairs(self, pairs: t.List[t.Tuple[str, str]]) -> t.List[float]:
+        scores = []
         for input_pairs in self._create_batch(pairs):  # to avoid OOM
             batch_scores = (
                 self.nli_classifier.predict(input_pairs).cpu().detach().round()
             )
             # convert tensor to list of floats
             scores.extend(batch_scores.tolist())
-
-        return sum(scores) / len(scores)
+        return scores
 
 
 faithfulness = Faithfulness()
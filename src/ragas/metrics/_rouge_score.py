@@ -4,12 +4,11 @@ from dataclasses import dataclass, field
 from langchain_core.callbacks import Callbacks
 
 from ragas.dataset_schema import SingleTurnSample
-from ragas.metrics.base import MetricType, SingleTurnMetric
-from ragas.run_config import RunConfig
+from ragas.metrics.base import CPUBoundMetric, MetricType
 
 
 @dataclass
-class RougeScore(SingleTurnMetric):
+class RougeScore(CPUBoundMetric):
     name: str = "rouge_score"
     _required_columns: t.Dict[MetricType, t.Set[str]] = field(
         default_factory=lambda: {MetricType.SINGLE_TURN: {"reference", "response"}}
@@ -26,12 +25,7 @@ class RougeScore(SingleTurnMetric):
             )
         self.rouge_scorer = rouge_scorer
 
-    def init(self, run_config: RunConfig):
-        pass
-
-    async def _single_turn_ascore(
-        self, sample: SingleTurnSample, callbacks: Callbacks
-    ) -> float:
+    def _score_sample(self, sample: SingleTurnSample) -> float:
         assert isinstance(sample.reference, str), "Sample reference must be a string"
         assert isinstance(sample.response, str), "Sample response must be a string"
         scorer = self.rouge_scorer.RougeScorer([self.rouge_type], use_stemmer=True)
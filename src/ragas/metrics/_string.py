@@ -5,7 +5,7 @@ from enum import Enum
 from langchain_core.callbacks import Callbacks
 
 from ragas.dataset_schema import SingleTurnSample
-from ragas.metrics.base import MetricType, SingleTurnMetric
+from ragas.metrics.base import CPUBoundMetric, MetricType, SingleTurnMetric
 from ragas.run_config import RunConfig
 
 
@@ -59,7 +59,7 @@ class StringPresence(SingleTurnMetric):
 
 
 @dataclass
-class NonLLMStringSimilarity(SingleTurnMetric):
+class NonLLMStringSimilarity(CPUBoundMetric):
     name: str = "non_llm_string_similarity"
     _required_columns: t.Dict[MetricType, t.Set[str]] = field(
         default_factory=lambda: {MetricType.SINGLE_TURN: {"reference", "response"}}
@@ -81,12 +81,7 @@ class NonLLMStringSimilarity(SingleTurnMetric):
             DistanceMeasure.JARO_WINKLER: distance.JaroWinkler,
         }
 
-    def init(self, run_config: RunConfig):
-        pass
-
-    async def _single_turn_ascore(
-        self, sample: SingleTurnSample, callbacks: Callbacks
-    ) -> float:
+    def _score_sample(self, sample: SingleTurnSample) -> float:
         reference = sample.reference
         response = sample.response
         assert isinstance(reference, str), "Expecting a string"
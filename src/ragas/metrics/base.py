@@ -5,14 +5,14 @@ import logging
 import typing as t
 from abc import ABC, abstractmethod
 from collections import Counter
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
 
 from pydantic import ValidationError
 from tqdm import tqdm
 
 from ragas._analytics import EvaluationEvent, _analytics_batcher
-from ragas.async_utils import apply_nest_asyncio, run
+from ragas.async_utils import run
 from ragas.callbacks import ChainType, new_group
 from ragas.dataset_schema import MetricAnnotation, MultiTurnSample, SingleTurnSample
 from ragas.llms import BaseRagasLLM
@@ -30,6 +30,7 @@ if t.TYPE_CHECKING:
     from ragas.dataset import Dataset
     from ragas.embeddings import BaseRagasEmbedding, BaseRagasEmbeddings
     from ragas.metrics.result import MetricResult
+    from ragas.process_pool import ProcessPoolRunner
     from ragas.prompt.simple_prompt import Prompt
 
     # Type alias for embedding model parameters (union of old and new embedding interfaces)
@@ -416,8 +417,6 @@ class SingleTurnMetric(Metric):
     ) -> float:
         """
         Synchronously score a single-turn sample.
-
-        May raise ImportError if nest_asyncio is not installed in a Jupyter-like environment.
         """
         callbacks = callbacks or []
         # only get the required columns
@@ -443,7 +442,6 @@ class SingleTurnMetric(Metric):
                     rm.on_chain_end({"output": result})
                 return result
 
-        apply_nest_asyncio()
         score = run(_async_wrapper)
 
         # track the evaluation event
@@ -513,6 +511,49 @@ class SingleTurnMetric(Metric):
         ...
 
 
+class CPUBoundMetric(SingleTurnMetric):
+    """
+    A single-turn metric whose score is computed by CPU-bound, non-LLM work.
+
+    Subclasses implement the synchronous `_score_sample`. When the metric is
+    initialized with a `RunConfig` that has ``cpu_workers`` set, samples are
+    scored in the run config's process pool so that the computation neither blocks
+    the event loop nor is limited to a single core; otherwise they are scored
+    inline.
+
+    The metric is pickled without its derived attributes, which are rebuilt by
+    ``__post_init__`` in the worker process.
+    """
+
+    def init(self, run_config: RunConfig) -> None:
+        self._process_pool: t.Optional[ProcessPoolRunner] = getattr(
+            run_config, "process_pool", None
+        )
+
+    @abstractmethod
+    def _score_sample(self, sample: SingleTurnSample) -> float:
+        """Compute the score of a sample, run in a worker process if configured."""
+        ...
+
+    async def _single_turn_ascore(
+        self, sample: SingleTurnSample, callbacks: Callbacks
+    ) -> float:
+        process_pool = getattr(self, "_process_pool", None)
+        if process_pool is None:
+            return self._score_sample(sample)
+        return await process_pool.run(self._score_sample, sample)
+
+    def __getstate__(self) -> t.Dict[str, t.Any]:
+        # only the dataclass fields are configuration; imported modules and other
+        # derived attributes are not picklable and are rebuilt in __post_init__
+        field_names = {f.name for f in fields(t.cast(t.Any, self))}
+        return {k: v for k, v in self.__dict__.items() if k in field_names}
+
+    def __setstate__(self, state: t.Dict[str, t.Any]) -> None:
+        self.__dict__.update(state)
+        self.__post_init__()
+
+
 class MultiTurnMetric(Metric):
     """
     A metric class for evaluating multi-turn conversations.
@@ -541,8 +582,6 @@ class MultiTurnMetric(Metric):
     ) -> float:
         """
         Score a multi-turn conversation sample synchronously.
-
-        May raise ImportError if nest_asyncio is not installed in Jupyter-like environments.
         """
         callbacks = callbacks or []
         sample = self._only_required_columns_multi_turn(sample)
@@ -567,7 +606,6 @@ class MultiTurnMetric(Metric):
                     rm.on_chain_end({"output": result})
                 return result
 
-        apply_nest_asyncio()
         score = run(_async_wrapper)
 
         # track the evaluation event
@@ -3,6 +3,7 @@
 import asyncio
 import typing as t
 
+from ragas.async_utils import run
 from ragas.embeddings.base import BaseRagasEmbedding
 from ragas.llms.base import InstructorBaseRagasLLM
 from ragas.metrics.base import SimpleBaseMetric
@@ -78,8 +79,8 @@ class BaseMetric(SimpleBaseMetric, NumericValidator):
         except RuntimeError as e:
             if "Use ascore() instead" in str(e):
                 raise  # Re-raise our custom error
-            # No running loop found, safe to use asyncio.run()
-            return asyncio.run(self.ascore(**kwargs))
+            # No running loop found, run on the shared background loop
+            return run(self.ascore(**kwargs))
 
     def batch_score(
         self,
@@ -107,8 +108,8 @@ class BaseMetric(SimpleBaseMetric, NumericValidator):
         except RuntimeError as e:
             if "Use abatch_score() instead" in str(e):
                 raise  # Re-raise our custom error
-            # No running loop found, safe to use asyncio.run()
-            return asyncio.run(self.abatch_score(inputs))
+            # No running loop found, run on the shared background loop
+            return run(self.abatch_score(inputs))
 
     def _validate_llm(self):
         """Validate that a modern InstructorLLM is provided."""
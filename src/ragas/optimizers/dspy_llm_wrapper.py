@@ -43,14 +43,14 @@ class RagasDSPyLM:
         List[str]
             List of completions.
         """
-        import asyncio
+        from ragas.async_utils import run
 
         if prompt is not None:
             messages = [{"role": "user", "content": prompt}]
         elif messages is None:
             raise ValueError("Either prompt or messages must be provided")
 
-        result = asyncio.run(self._generate(messages, **kwargs))
+        result = run(self._generate(messages, **kwargs))
         return [result]
 
     async def _generate(
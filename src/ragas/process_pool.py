@@ -0,0 +1,182 @@
+"""Process pool for running CPU-bound metric computations off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import typing as t
+from concurrent.futures import Future, ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+BatchKey = t.Tuple[int, int, t.Any]
+
+
+def _run_batch(
+    fn: t.Callable[[t.Any], t.Any], items: t.List[t.Any]
+) -> t.List[t.Tuple[bool, t.Any]]:
+    # runs in the worker process; errors are returned per item so that one bad
+    # sample does not fail the whole batch
+    results: t.List[t.Tuple[bool, t.Any]] = []
+    for item in items:
+        try:
+            results.append((True, fn(item)))
+        except Exception as e:
+            results.append((False, e))
+    return results
+
+
+class ProcessPoolRunner:
+    """
+    Run a CPU-bound function on items in a pool of worker processes.
+
+    Calls made with the same function in the same event loop iteration are sent to
+    the pool together, in batches of up to ``max_batch_size`` items, so the function
+    (usually a bound method of a metric) is pickled once per batch instead of once
+    per item. The pool is started on first use.
+
+    If the pool cannot be used, for example because the function or its items can
+    not be pickled, the runner logs a warning and runs everything inline from then on.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Number of worker processes. Defaults to the number of CPUs.
+    max_batch_size : int
+        Maximum number of items sent to a worker at once.
+    """
+
+    def __init__(self, max_workers: t.Optional[int] = None, max_batch_size: int = 64):
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_batch_size = max_batch_size
+        self._pool: t.Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending: t.Dict[BatchKey, t.List[t.Tuple[t.Any, asyncio.Future]]] = {}
+        self._functions: t.Dict[BatchKey, t.Callable[[t.Any], t.Any]] = {}
+        self._disabled = False
+
+    @property
+    def is_inline(self) -> bool:
+        """Whether the runner fell back to inline execution."""
+        return self._disabled
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._pool
+
+    async def run(self, fn: t.Callable[[t.Any], t.Any], item: t.Any) -> t.Any:
+        """Compute ``fn(item)`` in a worker process."""
+        if self._disabled:
+            return fn(item)
+
+        loop = asyncio.get_running_loop()
+        key = _batch_key(loop, fn)
+        future = loop.create_future()
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = []
+            self._functions[key] = fn
+            loop.call_soon(self._flush, key)
+        batch.append((item, future))
+        if len(batch) >= self.max_batch_size:
+            self._flush(key)
+        return await future
+
+    def _flush(self, key: BatchKey) -> None:
+        entries = self._pending.pop(key, None)
+        fn = self._functions.pop(key, None)
+        if not entries or fn is None:
+            return
+        if self._disabled:
+            self._run_inline(fn, entries)
+            return
+
+        try:
+            batch_future = self._get_pool().submit(
+                _run_batch, fn, [item for item, _ in entries]
+            )
+        except Exception as e:
+            self._fall_back(e)
+            self._run_inline(fn, entries)
+            return
+
+        loop = entries[0][1].get_loop()
+
+        def _resolve(done: Future) -> None:
+            loop.call_soon_threadsafe(self._resolve, fn, entries, done)
+
+        batch_future.add_done_callback(_resolve)
+
+    def _resolve(
+        self,
+        fn: t.Callable[[t.Any], t.Any],
+        entries: t.List[t.Tuple[t.Any, asyncio.Future]],
+        done: Future,
+    ) -> None:
+        exc = done.exception()
+        if exc is not None:
+            # the batch itself failed (pickling, broken pool), not the function
+            self._fall_back(exc)
+            self._run_inline(fn, entries)
+            return
+        for (ok, value), (_, future) in zip(done.result(), entries):
+            if future.done():
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    def _fall_back(self, exc: BaseException) -> None:
+        if not self._disabled:
+            logger.warning(
+                "Process pool unavailable, running CPU-bound metrics inline: %r", exc
+            )
+        self._disabled = True
+
+    @staticmethod
+    def _run_inline(
+        fn: t.Callable[[t.Any], t.Any],
+        entries: t.List[t.Tuple[t.Any, asyncio.Future]],
+    ) -> None:
+        for item, future in entries:
+            if future.done():
+                continue
+            try:
+                future.set_result(fn(item))
+            except Exception as e:
+                future.set_exception(e)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    def __getstate__(self) -> t.Dict[str, t.Any]:
+        return {"max_workers": self.max_workers, "max_batch_size": self.max_batch_size}
+
+    def __setstate__(self, state: t.Dict[str, t.Any]) -> None:
+        self.__init__(**state)
+
+    def __repr__(self) -> str:
+        return (
+            f"ProcessPoolRunner(max_workers={self.max_workers}, "
+            f"max_batch_size={self.max_batch_size})"
+        )
+
+
+def _batch_key(loop: asyncio.AbstractEventLoop, fn: t.Callable) -> BatchKey:
+    # bound methods are recreated on every attribute access, so they are keyed by
+    # their instance and function instead of their identity
+    owner = getattr(fn, "__self__", None)
+    return id(loop), id(owner), getattr(fn, "__func__", fn)
@@ -0,0 +1,265 @@
+"""
+Process-wide rate limiting for LLM and embedding providers.
+
+Provider limits are expressed in requests and tokens per minute and are shared by
+everything calling the same provider and model in a process: concurrent
+`evaluate()` runs, testset generation and experiments. Registering a limit with
+`set_rate_limit` makes all Ragas LLM and embedding wrappers for that provider and
+model wait for capacity before sending a request, instead of bursting into rate
+limit errors and retries.
+
+Examples
+--------
+>>> from ragas.rate_limit import set_rate_limit
+>>> set_rate_limit("openai", "gpt-4o-mini", requests_per_minute=500, tokens_per_minute=200_000)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import typing as t
+
+if t.TYPE_CHECKING:
+    from ragas.tokenizers import BaseTokenizer
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at ``rate`` units per second.
+
+    Capacity is reserved up front, so callers are served in arrival order and a
+    request larger than the bucket capacity is admitted once the bucket is full
+    instead of waiting forever.
+    """
+
+    def __init__(self, capacity: float, rate: float):
+        if capacity <= 0 or rate <= 0:
+            raise ValueError("capacity and rate must be positive")
+        self.capacity = float(capacity)
+        self.rate = float(rate)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> float:
+        """Units currently available (negative when capacity is owed)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def reserve(self, amount: float) -> float:
+        """Reserve ``amount`` units and return the seconds to wait before using them."""
+        with self._lock:
+            self._refill(time.monotonic())
+            # requests larger than the bucket only need a full bucket
+            needed = min(amount, self.capacity)
+            wait = max(needed - self._tokens, 0.0) / self.rate
+            self._tokens -= amount
+            return wait
+
+    def refund(self, amount: float) -> None:
+        """Return units of a reservation that was never used."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + amount)
+
+
+class RateLimiter:
+    """
+    Request and token budgets for a single provider and model.
+
+    Parameters
+    ----------
+    requests_per_minute : int, optional
+        Maximum number of requests per minute. No request budget if None.
+    tokens_per_minute : int, optional
+        Maximum number of tokens per minute. No token budget if None.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: t.Optional[int] = None,
+        tokens_per_minute: t.Optional[int] = None,
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = (
+            TokenBucket(requests_per_minute, requests_per_minute / 60.0)
+            if requests_per_minute
+            else None
+        )
+        self._tokens = (
+            TokenBucket(tokens_per_minute, tokens_per_minute / 60.0)
+            if tokens_per_minute
+            else None
+        )
+
+    def _reserve(self, tokens: int) -> t.Tuple[float, t.Callable[[], None]]:
+        waits = [0.0]
+        refunds: t.List[t.Callable[[], None]] = []
+        if self._requests is not None:
+            waits.append(self._requests.reserve(1))
+            refunds.append(lambda: t.cast(TokenBucket, self._requests).refund(1))
+        if self._tokens is not None and tokens > 0:
+            waits.append(self._tokens.reserve(tokens))
+            refunds.append(lambda: t.cast(TokenBucket, self._tokens).refund(tokens))
+
+        def refund() -> None:
+            for r in refunds:
+                r()
+
+        return max(waits), refund
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until one request and ``tokens`` tokens fit in the budgets."""
+        wait, refund = self._reserve(tokens)
+        if wait <= 0:
+            return
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            refund()
+            raise
+
+    def acquire_sync(self, tokens: int = 0) -> None:
+        """Blocking version of `acquire` for synchronous clients."""
+        wait, _ = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    def __repr__(self) -> str:
+        return (
+            f"RateLimiter(requests_per_minute={self.requests_per_minute}, "
+            f"tokens_per_minute={self.tokens_per_minute})"
+        )
+
+
+_registry: t.Dict[t.Tuple[str, t.Optional[str]], RateLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def _key(provider: str, model: t.Optional[str]) -> t.Tuple[str, t.Optional[str]]:
+    return provider.lower(), model
+
+
+def set_rate_limit(
+    provider: str,
+    model: t.Optional[str] = None,
+    requests_per_minute: t.Optional[int] = None,
+    tokens_per_minute: t.Optional[int] = None,
+) -> RateLimiter:
+    """
+    Register a process-wide rate limit for a provider and model.
+
+    Parameters
+    ----------
+    provider : str
+        Provider name, e.g. "openai" or "anthropic".
+    model : str, optional
+        Model name. If None, the limit applies to every model of the provider that
+        has no model specific limit.
+    requests_per_minute : int, optional
+        Request budget per minute.
+    tokens_per_minute : int, optional
+        Token budget per minute. Token usage is estimated from the rendered prompt.
+
+    Returns
+    -------
+    RateLimiter
+        The registered limiter, which replaces any previous one for the same key.
+    """
+    limiter = RateLimiter(
+        requests_per_minute=requests_per_minute,
+        tokens_per_minute=tokens_per_minute,
+    )
+    with _registry_lock:
+        _registry[_key(provider, model)] = limiter
+    return limiter
+
+
+def get_rate_limiter(
+    provider: t.Optional[str], model: t.Optional[str] = None
+) -> t.Optional[RateLimiter]:
+    """Return the limiter for a provider and model, falling back to the provider-wide one."""
+    if not provider or not _registry:
+        return None
+    with _registry_lock:
+        return _registry.get(_key(provider, model)) or _registry.get(
+            _key(provider, None)
+        )
+
+
+def get_rate_limits() -> t.Dict[t.Tuple[str, t.Optional[str]], RateLimiter]:
+    """Return all registered limiters keyed by provider and model."""
+    with _registry_lock:
+        return dict(_registry)
+
+
+def remove_rate_limit(provider: str, model: t.Optional[str] = None) -> None:
+    """Remove the rate limit registered for a provider and model."""
+    with _registry_lock:
+        _registry.pop(_key(provider, model), None)
+
+
+def clear_rate_limits() -> None:
+    """Remove all registered rate limits."""
+    with _registry_lock:
+        _registry.clear()
+
+
+def estimate_tokens(
+    text: t.Union[str, t.Sequence[str]],
+    tokenizer: t.Optional[BaseTokenizer] = None,
+) -> int:
+    """Estimate the number of tokens a prompt (or list of texts) will consume."""
+    if tokenizer is None:
+        from ragas.tokenizers import DEFAULT_TOKENIZER
+
+        tokenizer = DEFAULT_TOKENIZER
+
+    if isinstance(text, str):
+        return tokenizer.count_tokens(text)
+    return sum(tokenizer.count_tokens(item) for item in text)
+
+
+async def acquire_rate_limit(
+    provider: t.Optional[str],
+    model: t.Optional[str],
+    text: t.Union[str, t.Sequence[str]],
+    extra_tokens: int = 0,
+) -> None:
+    """
+    Wait for capacity in the rate limit registered for ``provider`` and ``model``.
+
+    Does nothing, and skips token estimation, when no limit is registered.
+    """
+    limiter = get_rate_limiter(provider, model)
+    if limiter is None:
+        return
+    tokens = 0
+    if limiter.tokens_per_minute:
+        tokens = estimate_tokens(text) + extra_tokens
+    await limiter.acquire(tokens)
+
+
+def acquire_rate_limit_sync(
+    provider: t.Optional[str],
+    model: t.Optional[str],
+    text: t.Union[str, t.Sequence[str]],
+    extra_tokens: int = 0,
+) -> None:
+    """Blocking version of `acquire_rate_limit` for synchronous clients."""
+    limiter = get_rate_limiter(provider, model)
+    if limiter is None:
+        return
+    tokens = 0
+    if limiter.tokens_per_minute:
+        tokens = estimate_tokens(text) + extra_tokens
+    limiter.acquire_sync(tokens)
@@ -0,0 +1,311 @@
+"""
+Retry budgets and circuit breakers for calls to LLM and embedding providers.
+
+During a provider outage, retrying every call independently multiplies the load on
+the provider and stalls a run for as long as the retries last. A `RetryBudget`
+caps the retries of all calls sharing a `RunConfig` to a fraction of the calls
+made, and a `CircuitBreaker` per provider and model stops sending requests after
+repeated failures, then lets a few probe requests through before resuming.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+import typing as t
+
+from ragas.concurrency import is_throttling_error
+from ragas.exceptions import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+ProviderKey = t.Tuple[str, t.Optional[str]]
+
+
+def is_provider_error(exc: BaseException) -> bool:
+    """
+    Check whether an exception signals that the provider itself is failing.
+
+    Throttling, timeouts, server errors (HTTP 5xx) and connection errors count,
+    errors caused by the request or the response content (like output parsing
+    failures) do not.
+    """
+    if is_throttling_error(exc) or isinstance(exc, ConnectionError):
+        return True
+
+    status_code = getattr(exc, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(exc, "response", None), "status_code", None)
+    if isinstance(status_code, int) and status_code >= 500:
+        return True
+
+    name = type(exc).__name__.lower()
+    return "connection" in name or "unavailable" in name or "internalserver" in name
+
+
+class RetryBudget:
+    """
+    Shared budget limiting retries to a fraction of calls.
+
+    Every call deposits ``ratio`` retries into the budget and every retry
+    withdraws one. ``min_retries`` are available up front so that the first calls
+    of a run can be retried too.
+
+    Parameters
+    ----------
+    ratio : float
+        Maximum number of retries per call, e.g. 0.2 for at most 20% extra calls.
+    min_retries : int
+        Retries available before any call has been made.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10):
+        if ratio < 0:
+            raise ValueError("ratio must be non-negative")
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self._balance = float(min_retries)
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> int:
+        """Number of retries that can currently be made."""
+        return int(self._balance)
+
+    def record_call(self) -> None:
+        """Deposit the retry allowance of a new call."""
+        with self._lock:
+            self._balance += self.ratio
+
+    def try_spend(self) -> bool:
+        """Withdraw one retry, returning False if the budget is exhausted."""
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+    def __getstate__(self) -> t.Dict[str, t.Any]:
+        # locks cannot be pickled or copied, a new one is made on unpickling
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: t.Dict[str, t.Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for the calls to a single provider and model.
+
+    The breaker opens after ``failure_threshold`` consecutive provider errors (see
+    `is_provider_error`). While open, calls either fail fast with
+    `CircuitOpenError` or, with ``wait=True``, wait for the breaker, which pauses
+    every job using the provider. After ``reset_timeout`` seconds the breaker is
+    half-open and lets ``half_open_max_calls`` probe requests through: a
+    successful probe closes it, a failed one opens it again.
+
+    Parameters
+    ----------
+    key : str
+        Name of the provider and model, used in errors and logs.
+    failure_threshold : int
+        Consecutive provider errors that open the breaker.
+    reset_timeout : float
+        Seconds the breaker stays open before probing.
+    half_open_max_calls : int
+        Concurrent probe requests allowed while half-open.
+    wait : bool
+        Whether calls wait for the breaker instead of failing when it is open.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        key: str = "default",
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        wait: bool = False,
+    ):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be at least 1")
+        self.key = key
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.wait = wait
+
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """The state of the breaker: "closed", "open" or "half_open"."""
+        with self._lock:
+            self._update_state(time.monotonic())
+            return self._state
+
+    def _update_state(self, now: float) -> None:
+        if self._state == self.OPEN and now - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._probes = 0
+            logger.info("Circuit breaker for %s is half-open, probing", self.key)
+
+    def __getstate__(self) -> t.Dict[str, t.Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: t.Dict[str, t.Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _try_acquire(self) -> t.Tuple[bool, bool, float]:
+        # returns (allowed, is_probe, seconds to wait before trying again)
+        with self._lock:
+            now = time.monotonic()
+            self._update_state(now)
+            if self._state == self.CLOSED:
+                return True, False, 0.0
+            if self._state == self.HALF_OPEN:
+                if self._probes < self.half_open_max_calls:
+                    self._probes += 1
+                    return True, True, 0.0
+                # wait for the probes in flight to settle the state
+                return False, False, min(self.reset_timeout, 1.0)
+            return False, False, self.reset_timeout - (now - self._opened_at)
+
+    async def acquire(self) -> bool:
+        """
+        Wait until a call may be made, returning whether it is a probe.
+
+        Raises
+        ------
+        CircuitOpenError
+            If the breaker is open and ``wait`` is False.
+        """
+        while True:
+            allowed, is_probe, retry_after = self._try_acquire()
+            if allowed:
+                return is_probe
+            if not self.wait:
+                raise CircuitOpenError(self.key, retry_after)
+            await asyncio.sleep(max(retry_after, 0.01))
+
+    def record_success(self, probe: bool = False) -> None:
+        """Record a call that reached the provider."""
+        with self._lock:
+            if probe:
+                self._probes = max(self._probes - 1, 0)
+            if self._state != self.CLOSED:
+                logger.info("Circuit breaker for %s closed", self.key)
+            self._state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self, exc: BaseException, probe: bool = False) -> None:
+        """Record a failed call, opening the breaker on repeated provider errors."""
+        if not is_provider_error(exc):
+            self.record_success(probe)
+            return
+        with self._lock:
+            if probe:
+                self._probes = max(self._probes - 1, 0)
+            self._failures += 1
+            if self._state == self.HALF_OPEN or (
+                self._state == self.CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                logger.warning(
+                    "Circuit breaker for %s opened after %s: %s",
+                    self.key,
+                    type(exc).__name__,
+                    exc,
+                )
+
+    def guard(
+        self, fn: t.Callable[..., t.Awaitable[t.Any]]
+    ) -> t.Callable[..., t.Awaitable[t.Any]]:
+        """Wrap a coroutine function so that every call goes through the breaker."""
+
+        async def guarded(*args, **kwargs):
+            probe = await self.acquire()
+            try:
+                result = await fn(*args, **kwargs)
+            except asyncio.CancelledError:
+                if probe:
+                    with self._lock:
+                        self._probes = max(self._probes - 1, 0)
+                raise
+            except Exception as e:
+                self.record_failure(e, probe)
+                raise
+            self.record_success(probe)
+            return result
+
+        return guarded
+
+
+class CircuitBreakers:
+    """
+    Circuit breakers keyed by provider and model, created on first use.
+
+    Parameters are passed to every `CircuitBreaker` created.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        wait: bool = False,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.wait = wait
+        self._breakers: t.Dict[ProviderKey, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, provider: str, model: t.Optional[str] = None) -> CircuitBreaker:
+        """Return the breaker of a provider and model."""
+        key = (provider.lower(), model)
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = self._breakers[key] = CircuitBreaker(
+                    key=f"{provider}/{model}" if model else provider,
+                    failure_threshold=self.failure_threshold,
+                    reset_timeout=self.reset_timeout,
+                    half_open_max_calls=self.half_open_max_calls,
+                    wait=self.wait,
+                )
+            return breaker
+
+    def states(self) -> t.Dict[ProviderKey, str]:
+        """The state of every breaker."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {key: breaker.state for key, breaker in breakers.items()}
+
+    def __getstate__(self) -> t.Dict[str, t.Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: t.Dict[str, t.Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
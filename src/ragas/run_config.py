@@ -1,3 +1,4 @@
+import functools
 import logging
 import typing as t
 from dataclasses import dataclass
@@ -5,6 +6,7 @@ from dataclasses import dataclass
 import numpy as np
 from tenacity import (
     AsyncRetrying,
+    RetryCallState,
     Retrying,
     WrappedFn,
     after_log,
@@ -14,6 +16,13 @@ from tenacity import (
 )
 from tenacity.after import after_nothing
 
+from ragas.concurrency import AdaptiveConcurrencyLimiter
+from ragas.exceptions import CircuitOpenError
+from ragas.hedging import RequestHedger
+from ragas.instrumentation import record_retry
+from ragas.process_pool import ProcessPoolRunner
+from ragas.resilience import CircuitBreakers, RetryBudget
+
 
 @dataclass
 class RunConfig:
@@ -36,16 +45,74 @@ class RunConfig:
         Whether to log retry attempts using tenacity, by default False.
     seed : int, optional
         Random seed for reproducibility, by default 42.
+    adaptive_concurrency : bool, optional
+        Whether to adapt the number of concurrent workers to provider health, by
+        default False. When enabled, `max_workers` is the starting limit, which
+        grows while latency is healthy and is cut on rate limit or timeout errors.
+    min_workers : int, optional
+        Lower bound for the adaptive concurrency limit, by default 1.
+    max_adaptive_workers : int, optional
+        Upper bound for the adaptive concurrency limit, by default 64.
+    hedge_requests : bool, optional
+        Whether to send a duplicate of LLM and embedding requests that are slower
+        than `hedge_percentile` and keep whichever finishes first, by default False.
+    hedge_percentile : float, optional
+        Latency percentile after which a request is hedged, by default 95.
+    hedge_budget : float, optional
+        Maximum fraction of extra requests sent by hedging, by default 0.05.
+    cpu_workers : int, optional
+        Number of worker processes for CPU-bound metrics such as BleuScore or
+        RougeScore, by default 0, which computes them inline on the event loop.
+        Use -1 for one worker per CPU.
+    max_retry_ratio : float, optional
+        Maximum number of retries per call, shared by all calls using this config,
+        by default None, which only limits retries per call with `max_retries`.
+        For example 0.2 allows at most 20% extra calls across the run, so that an
+        outage does not make every job retry `max_retries` times.
+    circuit_breaker : bool, optional
+        Whether to stop calling a provider and model after
+        `circuit_failure_threshold` consecutive provider errors, by default False.
+        After `circuit_reset_timeout` seconds a probe request is let through, and
+        full concurrency resumes once it succeeds.
+    circuit_failure_threshold : int, optional
+        Consecutive provider errors that open a circuit breaker, by default 5.
+    circuit_reset_timeout : float, optional
+        Seconds a circuit breaker stays open before probing, by default 30.
+    circuit_open_action : str, optional
+        What calls do while a circuit breaker is open: "fail" raises
+        `CircuitOpenError` right away, "wait" pauses them until the provider
+        recovers. By default "fail".
+    http2 : bool, optional
+        Whether the HTTP clients Ragas creates negotiate HTTP/2, by default False.
+        Requires the `h2` package (`pip install httpx[http2]`). See
+        `ragas.http_clients` for the shared connection pools.
 
     Attributes
     ----------
     rng : numpy.random.Generator
         Random number generator initialized with the specified seed.
+    concurrency_limiter : AdaptiveConcurrencyLimiter or None
+        The adaptive concurrency limiter shared by everything using this config,
+        or None if `adaptive_concurrency` is disabled.
+    hedger : RequestHedger or None
+        The request hedger shared by everything using this config, or None if
+        `hedge_requests` is disabled.
+    process_pool : ProcessPoolRunner or None
+        The process pool for CPU-bound metrics, or None if `cpu_workers` is 0.
+    retry_budget : RetryBudget or None
+        The retry budget shared by everything using this config, or None if
+        `max_retry_ratio` is not set.
+    circuit_breakers : CircuitBreakers or None
+        The circuit breakers per provider and model, or None if `circuit_breaker`
+        is disabled.
 
     Notes
     -----
     The `__post_init__` method initializes the `rng` attribute as a numpy random
-    number generator using the specified seed.
+    number generator using the specified seed, the `concurrency_limiter` when
+    adaptive concurrency is enabled, the `hedger` when hedging is enabled and the
+    `process_pool` when `cpu_workers` is set. The worker processes themselves are
+    only started when a CPU-bound metric is first computed.
     """
 
     timeout: int = 180
@@ -58,9 +125,54 @@ class RunConfig:
     ] = (Exception,)
     log_tenacity: bool = False
     seed: int = 42
+    adaptive_concurrency: bool = False
+    min_workers: int = 1
+    max_adaptive_workers: int = 64
+    hedge_requests: bool = False
+    hedge_percentile: float = 95.0
+    hedge_budget: float = 0.05
+    cpu_workers: int = 0
+    max_retry_ratio: t.Optional[float] = None
+    circuit_breaker: bool = False
+    circuit_failure_threshold: int = 5
+    circuit_reset_timeout: float = 30.0
+    circuit_open_action: t.Literal["fail", "wait"] = "fail"
+    http2: bool = False
 
     def __post_init__(self):
         self.rng = np.random.default_rng(seed=self.seed)
+        self.concurrency_limiter: t.Optional[AdaptiveConcurrencyLimiter] = None
+        if self.adaptive_concurrency:
+            self.concurrency_limiter = AdaptiveConcurrencyLimiter(
+                initial_limit=self.max_workers if self.max_workers > 0 else 16,
+                min_limit=self.min_workers,
+                max_limit=max(self.max_adaptive_workers, self.min_workers),
+            )
+        self.hedger: t.Optional[RequestHedger] = None
+        if self.hedge_requests:
+            self.hedger = RequestHedger(
+                percentile=self.hedge_percentile, budget=self.hedge_budget
+            )
+        self.process_pool: t.Optional[ProcessPoolRunner] = None
+        if self.cpu_workers != 0:
+            self.process_pool = ProcessPoolRunner(
+                max_workers=self.cpu_workers if self.cpu_workers > 0 else None
+            )
+        self.retry_budget: t.Optional[RetryBudget] = None
+        if self.max_retry_ratio is not None:
+            self.retry_budget = RetryBudget(ratio=self.max_retry_ratio)
+        self.circuit_breakers: t.Optional[CircuitBreakers] = None
+        if self.circuit_breaker:
+            if self.circuit_open_action not in ("fail", "wait"):
+                raise ValueError(
+                    "circuit_open_action must be 'fail' or 'wait', "
+                    f"got {self.circuit_open_action!r}"
+                )
+            self.circuit_breakers = CircuitBreakers(
+                failure_threshold=self.circuit_failure_threshold,
+                reset_timeout=self.circuit_reset_timeout,
+                wait=self.circuit_open_action == "wait",
+            )
 
 
 def add_retry(fn: WrappedFn, run_config: RunConfig) -> WrappedFn:
@@ -90,13 +202,40 @@ def add_retry(fn: WrappedFn, run_config: RunConfig) -> WrappedFn:
         retry=retry_if_exception_type(run_config.exception_types),
         reraise=True,
         after=tenacity_logger,
+        before_sleep=_count_retry,
     )
     return r.wraps(fn)
 
 
-def add_async_retry(fn: WrappedFn, run_config: RunConfig) -> WrappedFn:
+def _count_retry(retry_state: RetryCallState) -> None:
+    # attribute the retry to the executor job running this call, if any
+    record_retry()
+
+
+def _provider_key(fn: t.Callable) -> t.Tuple[str, t.Optional[str]]:
+    # LLM and embedding wrappers know their provider and model, for anything else
+    # the breaker is shared by the callables of the same class or name
+    owner = getattr(fn, "__self__", None)
+    rate_limit_key = getattr(owner, "_rate_limit_key", None)
+    if callable(rate_limit_key):
+        return rate_limit_key()
+    if owner is not None:
+        return type(owner).__name__, None
+    return getattr(fn, "__qualname__", repr(fn)), None
+
+
+def add_async_retry(
+    fn: WrappedFn,
+    run_config: RunConfig,
+    provider_key: t.Optional[t.Tuple[str, t.Optional[str]]] = None,
+) -> WrappedFn:
     """
     Decorator for retrying a function if it fails.
+
+    Every attempt goes through the circuit breaker of ``provider_key`` (inferred
+    from the LLM or embedding ``fn`` is bound to when not given) if
+    `RunConfig.circuit_breaker` is enabled, and retries are only made while the
+    shared `RunConfig.retry_budget` allows it.
     """
     # configure tenacity's after section wtih logger
     if run_config.log_tenacity is not None:
@@ -105,11 +244,68 @@ def add_async_retry(fn: WrappedFn, run_config: RunConfig) -> WrappedFn:
     else:
         tenacity_logger = after_nothing
 
+    before_sleep = _count_retry
+    limiter = getattr(run_config, "concurrency_limiter", None)
+    if limiter is not None:
+        # let the adaptive limiter react to rate limits before the job gives up
+        def _report_to_limiter(retry_state: RetryCallState) -> None:
+            _count_retry(retry_state)
+            if retry_state.outcome is not None:
+                exc = retry_state.outcome.exception()
+                if exc is not None:
+                    limiter.record_failure(exc)
+
+        before_sleep = _report_to_limiter
+
+    # resolved before wrapping, the wrappers are not bound to the LLM or embedding
+    key = provider_key or _provider_key(fn)
+
+    hedger = getattr(run_config, "hedger", None)
+    if hedger is not None:
+        # every attempt is hedged, so a stuck request does not wait for the timeout
+        provider, model = key
+        hedge_key = f"{getattr(fn, '__qualname__', repr(fn))}[{provider}/{model}]"
+        fn = t.cast(WrappedFn, hedger.wrap(fn, hedge_key))
+
+    breakers = getattr(run_config, "circuit_breakers", None)
+    if breakers is not None:
+        breaker = breakers.get(*key)
+        fn = t.cast(WrappedFn, breaker.guard(fn))
+
+    retry_on_type = retry_if_exception_type(run_config.exception_types)
+    budget = getattr(run_config, "retry_budget", None)
+
+    def _should_retry(retry_state: RetryCallState) -> bool:
+        if not retry_on_type(retry_state):
+            return False
+        outcome = retry_state.outcome
+        if outcome is not None and isinstance(outcome.exception(), CircuitOpenError):
+            # the breaker already decided, retrying would only wait for it
+            return False
+        if retry_state.attempt_number >= run_config.max_retries:
+            return False
+        if budget is not None and not budget.try_spend():
+            logging.getLogger(__name__).debug(
+                "Retry budget exhausted, not retrying %s", retry_state.fn
+            )
+            return False
+        return True
+
     r = AsyncRetrying(
         wait=wait_random_exponential(multiplier=1, max=run_config.max_wait),
         stop=stop_after_attempt(run_config.max_retries),
-        retry=retry_if_exception_type(run_config.exception_types),
+        retry=_should_retry,
         reraise=True,
         after=tenacity_logger,
+        before_sleep=before_sleep,
     )
-    return r.wraps(fn)
+    wrapped = r.wraps(fn)
+    if budget is None:
+        return wrapped
+
+    @functools.wraps(fn)
+    async def _with_budget(*args, **kwargs):
+        budget.record_call()
+        return await wrapped(*args, **kwargs)
+
+    return t.cast(WrappedFn, _with_budget)
@@ -0,0 +1,158 @@
+"""Fair, priority-aware scheduling of jobs across groups (e.g. metrics)."""
+
+from __future__ import annotations
+
+import typing as t
+from collections import deque
+from dataclasses import dataclass, field
+
+T = t.TypeVar("T")
+
+DEFAULT_GROUP = "default"
+
+
+@dataclass
+class FairScheduling:
+    """
+    Policy for scheduling jobs fairly across groups.
+
+    Jobs are kept in one queue per group (for evaluations, one per metric). Groups
+    with a higher priority are always served first. Groups with the same priority
+    share the workers through weighted fair queueing: every dispatched job advances
+    its group's virtual time by the group's observed job latency divided by its
+    weight, and the group with the smallest virtual time goes next. A slow,
+    multi-call metric therefore gets the same share of worker time as a cheap one,
+    instead of the same number of jobs.
+
+    Parameters
+    ----------
+    weights : Dict[str, float]
+        Relative share of worker time per group. Missing groups use
+        ``default_weight``.
+    priorities : Dict[str, int]
+        Priority per group, higher is served first. Missing groups have priority 0.
+    default_weight : float
+        Weight of groups not listed in ``weights``.
+    max_buffered_jobs : int
+        Maximum number of job descriptions read ahead of dispatch to fill the group
+        queues. Bounds memory when jobs come from a lazy stream.
+    """
+
+    weights: t.Dict[str, float] = field(default_factory=dict)
+    priorities: t.Dict[str, int] = field(default_factory=dict)
+    default_weight: float = 1.0
+    max_buffered_jobs: int = 10_000
+
+    def __post_init__(self):
+        if self.default_weight <= 0 or any(w <= 0 for w in self.weights.values()):
+            raise ValueError("weights must be positive")
+        if self.max_buffered_jobs < 1:
+            raise ValueError("max_buffered_jobs must be at least 1")
+
+    def weight(self, group: str) -> float:
+        return self.weights.get(group, self.default_weight)
+
+    def priority(self, group: str) -> int:
+        return self.priorities.get(group, 0)
+
+
+class FairScheduler(t.Generic[T]):
+    """
+    Iterator that reorders jobs from ``jobs`` according to a `FairScheduling` policy.
+
+    Jobs are read lazily: the scheduler only reads ahead until every known group has
+    a queued job and no new groups are showing up, or until ``max_buffered_jobs``
+    are buffered. Report finished jobs with `record_latency` so that the per-group
+    job cost reflects reality.
+    """
+
+    def __init__(
+        self,
+        jobs: t.Iterable[T],
+        group_of: t.Callable[[T], t.Optional[str]],
+        policy: t.Optional[FairScheduling] = None,
+    ):
+        self._source = iter(jobs)
+        self._group_of = group_of
+        self.policy = policy or FairScheduling()
+        self._queues: t.Dict[str, t.Deque[T]] = {}
+        self._virtual_time: t.Dict[str, float] = {}
+        self._cost: t.Dict[str, float] = {}
+        self._global_virtual_time = 0.0
+        self._buffered = 0
+        self._exhausted = False
+
+    def __iter__(self) -> "FairScheduler[T]":
+        return self
+
+    def __next__(self) -> T:
+        self._read_ahead()
+        group = self._next_group()
+        if group is None:
+            raise StopIteration
+
+        job = self._queues[group].popleft()
+        self._buffered -= 1
+
+        start = max(self._virtual_time[group], self._global_virtual_time)
+        self._global_virtual_time = start
+        self._virtual_time[group] = start + self._job_cost(group) / (
+            self.policy.weight(group)
+        )
+        return job
+
+    def record_latency(self, group: t.Optional[str], latency: float) -> None:
+        """Update the estimated cost of a group's jobs with an observed latency."""
+        group = group or DEFAULT_GROUP
+        previous = self._cost.get(group)
+        self._cost[group] = (
+            latency if previous is None else 0.8 * previous + 0.2 * latency
+        )
+
+    @property
+    def queued(self) -> t.Dict[str, int]:
+        """Number of jobs waiting per group."""
+        return {group: len(queue) for group, queue in self._queues.items()}
+
+    def _job_cost(self, group: str) -> float:
+        if group in self._cost:
+            return self._cost[group]
+        if self._cost:
+            # unknown groups are assumed to cost the average of the known ones
+            return sum(self._cost.values()) / len(self._cost)
+        return 1.0
+
+    def _read_ahead(self) -> None:
+        # read until every known group has a queued job; keep going while new
+        # groups show up so that all groups of a row are known before deciding
+        discovered_new_group = False
+        while (
+            not self._exhausted
+            and self._buffered < self.policy.max_buffered_jobs
+            and (
+                discovered_new_group
+                or not self._queues
+                or any(not q for q in self._queues.values())
+            )
+        ):
+            try:
+                job = next(self._source)
+            except StopIteration:
+                self._exhausted = True
+                break
+            group = self._group_of(job) or DEFAULT_GROUP
+            discovered_new_group = group not in self._queues
+            if discovered_new_group:
+                self._queues[group] = deque()
+                self._virtual_time[group] = self._global_virtual_time
+            self._queues[group].append(job)
+            self._buffered += 1
+
+    def _next_group(self) -> t.Optional[str]:
+        candidates = [group for group, queue in self._queues.items() if queue]
+        if not candidates:
+            return None
+        return min(
+            candidates,
+            key=lambda g: (-self.policy.priority(g), self._virtual_time[g]),
+        )
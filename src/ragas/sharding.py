@@ -0,0 +1,383 @@
+"""
+Evaluate a dataset in several processes to use more than one CPU core.
+
+A single process spends a core on parsing responses, validating them and running
+callbacks, on top of string metrics. `evaluate_sharded` splits the dataset into
+contiguous shards and evaluates them in a pool of worker processes, each with its
+own event loop and a share of the concurrency and rate limits, then merges the
+scores, traces and token usage into one `EvaluationResult` in the original row
+order.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import multiprocessing
+import pickle
+import time
+import typing as t
+import uuid
+import warnings
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+from dataclasses import dataclass, replace
+
+from tqdm.auto import tqdm
+
+from ragas.cache import CacheStats
+from ragas.callbacks import ChainRun, ChainType
+from ragas.dataset_schema import EvaluationDataset, EvaluationResult
+from ragas.rate_limit import clear_rate_limits, get_rate_limits, set_rate_limit
+from ragas.run_config import RunConfig
+
+if t.TYPE_CHECKING:
+    from ragas.cost import TokenUsage, TokenUsageParser
+
+logger = logging.getLogger(__name__)
+
+# shards per process, so that a slow shard does not hold up the whole run
+SHARDS_PER_PROCESS = 4
+
+RateLimitSpec = t.Tuple[str, t.Optional[str], t.Optional[int], t.Optional[int]]
+
+
+@dataclass
+class _ShardState:
+    """Everything a worker needs besides the rows of its shard."""
+
+    dataset: EvaluationDataset
+    kwargs: t.Dict[str, t.Any]
+    run_config: RunConfig
+    rate_limits: t.List[RateLimitSpec]
+    # wall clock time of the run deadline, shared by all shards
+    ends_at: t.Optional[float] = None
+
+
+@dataclass
+class _ShardResult:
+    start: int
+    scores: t.List[t.Dict[str, t.Any]]
+    binary_columns: t.List[str]
+    traces: t.Dict[str, ChainRun]
+    n_rows: int
+    usage: t.Optional[t.List[TokenUsage]] = None
+    coverage: t.Optional[t.Dict[str, t.Any]] = None
+    cache_stats: t.Optional[t.Dict[str, t.Any]] = None
+    # whether the shard started after the run deadline and was not evaluated
+    expired: bool = False
+
+
+# set in the parent right before forking, so that forked workers inherit the
+# metrics and models without pickling them
+_inherited_state: t.Optional[_ShardState] = None
+
+
+def _evaluate_shard(
+    start: int, stop: int, state: t.Optional[_ShardState] = None
+) -> _ShardResult:
+    # runs in the worker process
+    from ragas.evaluation import evaluate
+
+    state = state or _inherited_state
+    if state is None:
+        raise RuntimeError("Shard state was not passed to the worker process")
+
+    kwargs = state.kwargs
+    if state.ends_at is not None:
+        # shards queue for a worker, so each one only gets the time that is left
+        remaining = state.ends_at - time.time()
+        if remaining <= 0:
+            return _ShardResult(
+                start=start,
+                scores=[],
+                binary_columns=[],
+                traces={},
+                n_rows=stop - start,
+                expired=True,
+            )
+        kwargs = {**kwargs, "deadline": remaining}
+
+    clear_rate_limits()
+    for provider, model, rpm, tpm in state.rate_limits:
+        set_rate_limit(provider, model, requests_per_minute=rpm, tokens_per_minute=tpm)
+
+    shard = EvaluationDataset(samples=state.dataset.samples[start:stop])
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        result = t.cast(
+            EvaluationResult,
+            evaluate(
+                dataset=shard,
+                run_config=state.run_config,
+                show_progress=False,
+                **kwargs,
+            ),
+        )
+    return _ShardResult(
+        start=start,
+        scores=result.scores,
+        binary_columns=result.binary_columns,
+        traces=result.ragas_traces,
+        usage=result.cost_cb.usage_data if result.cost_cb is not None else None,
+        coverage=result.coverage,
+        cache_stats=result.cache_stats,
+        n_rows=stop - start,
+    )
+
+
+def _shard_run_config(run_config: RunConfig, num_processes: int) -> RunConfig:
+    def _share(value: int) -> int:
+        return max(1, math.ceil(value / num_processes)) if value > 0 else value
+
+    return replace(
+        run_config,
+        max_workers=_share(run_config.max_workers),
+        max_adaptive_workers=_share(run_config.max_adaptive_workers),
+        # the shards already run in worker processes
+        cpu_workers=0,
+    )
+
+
+def _shard_rate_limits(num_processes: int) -> t.List[RateLimitSpec]:
+    def _share(value: t.Optional[int]) -> t.Optional[int]:
+        return max(1, value // num_processes) if value else value
+
+    return [
+        (
+            provider,
+            model,
+            _share(limiter.requests_per_minute),
+            _share(limiter.tokens_per_minute),
+        )
+        for (provider, model), limiter in get_rate_limits().items()
+    ]
+
+
+def _shard_bounds(n_rows: int, n_shards: int) -> t.List[t.Tuple[int, int]]:
+    size, extra = divmod(n_rows, n_shards)
+    bounds = []
+    start = 0
+    for i in range(n_shards):
+        stop = start + size + (1 if i < extra else 0)
+        bounds.append((start, stop))
+        start = stop
+    return bounds
+
+
+def _merge_traces(
+    results: t.List[_ShardResult],
+    scores: t.List[t.Dict[str, t.Any]],
+    name: str,
+    parent_run_id: t.Optional[str],
+) -> t.Dict[str, ChainRun]:
+    # every shard has its own evaluation chain with rows numbered from 0; they are
+    # replaced by a single chain with the rows numbered across the dataset
+    root = ChainRun(
+        run_id=str(uuid.uuid4()),
+        parent_run_id=parent_run_id,
+        name=name,
+        inputs={},
+        metadata={"type": ChainType.EVALUATION},
+        outputs={"scores": scores},
+    )
+    merged: t.Dict[str, ChainRun] = {root.run_id: root}
+    for result in results:
+        shard_roots = [r for r in result.traces.values() if r.parent_run_id is None]
+        for shard_root in shard_roots:
+            for row_id in shard_root.children:
+                row = result.traces[row_id]
+                row_index = result.start + row.metadata.get("row_index", 0)
+                row.parent_run_id = root.run_id
+                row.name = f"row {row_index}"
+                row.metadata = {**row.metadata, "row_index": row_index}
+                root.children.append(row_id)
+        shard_root_ids = {r.run_id for r in shard_roots}
+        merged.update(
+            (run_id, run)
+            for run_id, run in result.traces.items()
+            if run_id not in shard_root_ids
+        )
+    return merged
+
+
+def _expired_coverage(n_rows: int, metric_names: t.List[str]) -> t.Dict[str, t.Any]:
+    n_scores = n_rows * len(metric_names)
+    return {
+        "scores": n_scores,
+        "computed": 0,
+        "skipped": n_scores,
+        "cut": 0,
+        "coverage": 0.0 if n_scores else 1.0,
+        "by_metric": {name: 0.0 for name in metric_names},
+    }
+
+
+def _merge_coverage(
+    results: t.List[_ShardResult], metric_names: t.List[str]
+) -> t.Optional[t.Dict[str, t.Any]]:
+    coverages = [
+        (
+            _expired_coverage(r.n_rows, metric_names) if r.expired else r.coverage,
+            r.n_rows,
+        )
+        for r in results
+        if r.expired or r.coverage is not None
+    ]
+    if not coverages:
+        return None
+    n_rows = sum(n for _, n in coverages)
+    scores = sum(c["scores"] for c, _ in coverages)
+    computed = sum(c["computed"] for c, _ in coverages)
+    return {
+        "scores": scores,
+        "computed": computed,
+        "skipped": sum(c["skipped"] for c, _ in coverages),
+        "cut": sum(c["cut"] for c, _ in coverages),
+        "coverage": computed / scores if scores else 1.0,
+        "by_metric": {
+            name: sum(c["by_metric"].get(name, 1.0) * n for c, n in coverages) / n_rows
+            for name in metric_names
+        },
+    }
+
+
+def _merge_cache_stats(
+    results: t.List[_ShardResult],
+) -> t.Optional[t.Dict[str, t.Any]]:
+    shard_stats = [r.cache_stats for r in results if r.cache_stats is not None]
+    if not shard_stats:
+        return None
+    stats = CacheStats()
+    for s in shard_stats:
+        stats = stats + CacheStats(s["hits"], s["misses"], s["coalesced"])
+    return stats.to_dict()
+
+
+def evaluate_sharded(
+    dataset: EvaluationDataset,
+    num_processes: int,
+    run_config: RunConfig,
+    token_usage_parser: t.Optional[TokenUsageParser] = None,
+    experiment_name: t.Optional[str] = None,
+    show_progress: bool = True,
+    _run_id: t.Optional[uuid.UUID] = None,
+    **kwargs: t.Any,
+) -> EvaluationResult:
+    """
+    Evaluate contiguous shards of a dataset in ``num_processes`` worker processes.
+
+    Every worker gets ``1 / num_processes`` of ``run_config.max_workers`` and of the
+    rate limits registered with `ragas.rate_limit.set_rate_limit`. Metrics and
+    models are inherited by forked workers; where processes cannot be forked they
+    are pickled and must support it. Callbacks run in the worker processes.
+
+    A ``deadline`` applies to the whole run: shards get the time left when they
+    start, and shards starting after it are not evaluated. Their scores are NaN
+    and count as skipped in `EvaluationResult.coverage`.
+
+    Remaining keyword arguments are passed to `ragas.evaluate` for every shard.
+    """
+    global _inherited_state
+
+    deadline = kwargs.pop("deadline", None)
+    if deadline is not None and deadline <= 0:
+        raise ValueError("deadline must be positive")
+    ends_at = time.time() + deadline if deadline is not None else None
+
+    n_rows = len(dataset)
+    n_shards = max(1, min(n_rows, num_processes * SHARDS_PER_PROCESS))
+    bounds = _shard_bounds(n_rows, n_shards)
+    state = _ShardState(
+        dataset=dataset,
+        kwargs={
+            **kwargs,
+            "token_usage_parser": token_usage_parser,
+            "experiment_name": experiment_name,
+        },
+        run_config=_shard_run_config(run_config, num_processes),
+        rate_limits=_shard_rate_limits(num_processes),
+        ends_at=ends_at,
+    )
+
+    fork = "fork" in multiprocessing.get_all_start_methods()
+    passed_state: t.Optional[_ShardState] = None
+    if fork:
+        _inherited_state = state
+    else:
+        try:
+            pickle.dumps(state)
+        except Exception as e:
+            raise ValueError(
+                "num_processes requires picklable metrics, models and callbacks on "
+                f"platforms that cannot fork processes: {e}"
+            ) from e
+        passed_state = state
+
+    results: t.List[_ShardResult] = []
+    context = multiprocessing.get_context("fork" if fork else "spawn")
+    try:
+        with (
+            ProcessPoolExecutor(
+                max_workers=min(num_processes, n_shards), mp_context=context
+            ) as pool,
+            tqdm(total=n_rows, desc="Evaluating", disable=not show_progress) as pbar,
+        ):
+            pending = {
+                pool.submit(_evaluate_shard, start, stop, passed_state)
+                for start, stop in bounds
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_EXCEPTION)
+                for future in done:
+                    error = future.exception()
+                    if error is not None:
+                        for other in pending:
+                            other.cancel()
+                        raise error
+                    result = future.result()
+                    results.append(result)
+                    pbar.update(result.n_rows)
+    finally:
+        _inherited_state = None
+
+    from ragas.evaluation import RAGAS_EVALUATION_CHAIN_NAME, _metric_keys
+
+    results.sort(key=lambda r: r.start)
+    evaluated = [r for r in results if not r.expired and r.scores]
+    metric_names = (
+        list(evaluated[0].scores[0])
+        if evaluated
+        else _metric_keys(kwargs.get("metrics") or [])
+    )
+    for result in results:
+        if result.expired:
+            result.scores = [
+                {name: float("nan") for name in metric_names}
+                for _ in range(result.n_rows)
+            ]
+    scores = [row for result in results for row in result.scores]
+
+    cost_cb = None
+    if token_usage_parser is not None:
+        from ragas.cost import CostCallbackHandler
+
+        cost_cb = CostCallbackHandler(token_usage_parser=token_usage_parser)
+        for result in results:
+            cost_cb.usage_data.extend(result.usage or [])
+
+    traces = _merge_traces(
+        results,
+        scores,
+        experiment_name or RAGAS_EVALUATION_CHAIN_NAME,
+        str(_run_id) if _run_id is not None else None,
+    )
+    return EvaluationResult(
+        scores=scores,
+        dataset=dataset,
+        binary_columns=next((r.binary_columns for r in results if not r.expired), []),
+        cost_cb=cost_cb,
+        ragas_traces=traces,
+        run_id=_run_id,
+        coverage=_merge_coverage(results, metric_names),
+        cache_stats=_merge_cache_stats(results),
+    )
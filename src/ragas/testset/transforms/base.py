@@ -25,7 +25,9 @@ def _default_llm_factory() -> t.Union[BaseRagasLLM, "InstructorBaseRagasLLM"]:
     """
     from openai import OpenAI
 
-    client = OpenAI()
+    from ragas.http_clients import get_http_client
+
+    client = OpenAI(http_client=get_http_client())
     return llm_factory("gpt-4o-mini", client=client)
 
 
@@ -293,7 +293,7 @@ class ProgressBarManager:
         self.desc = desc
         self.show_progress = show_progress
 
-    def create_single_bar(self, total: int) -> tqdm:
+    def create_single_bar(self, total: t.Optional[int]) -> tqdm:
         """Create a single progress bar for non-batch execution."""
         return tqdm(
             total=total,
@@ -301,9 +301,17 @@ class ProgressBarManager:
             disable=not self.show_progress,
         )
 
-    def create_nested_bars(self, total_jobs: int, batch_size: int):
-        """Create nested progress bars for batch execution."""
-        n_batches = (total_jobs + batch_size - 1) // batch_size
+    def create_nested_bars(self, total_jobs: t.Optional[int], batch_size: int):
+        """Create nested progress bars for batch execution.
+
+        ``total_jobs`` may be None when jobs are streamed lazily, in which case the
+        number of batches is unknown.
+        """
+        n_batches = (
+            (total_jobs + batch_size - 1) // batch_size
+            if total_jobs is not None
+            else None
+        )
 
         overall_pbar = tqdm(
             total=total_jobs,
@@ -314,8 +322,8 @@ class ProgressBarManager:
         )
 
         batch_pbar = tqdm(
-            total=min(batch_size, total_jobs),
-            desc=f"Batch 1/{n_batches}",
+            total=min(batch_size, total_jobs) if total_jobs is not None else batch_size,
+            desc=f"Batch 1/{n_batches or '?'}",
             disable=not self.show_progress,
             position=1,
             leave=False,
@@ -324,11 +332,15 @@ class ProgressBarManager:
         return overall_pbar, batch_pbar, n_batches
 
     def update_batch_bar(
-        self, batch_pbar: tqdm, batch_num: int, n_batches: int, batch_size: int
+        self,
+        batch_pbar: tqdm,
+        batch_num: int,
+        n_batches: t.Optional[int],
+        batch_size: int,
     ):
         """Update batch progress bar for new batch."""
         batch_pbar.reset(total=batch_size)
-        batch_pbar.set_description(f"Batch {batch_num}/{n_batches}")
+        batch_pbar.set_description(f"Batch {batch_num}/{n_batches or '?'}")
 
 
 _LOGGER_DATE_TIME = "%Y-%m-%d %H:%M:%S"
@@ -661,23 +673,13 @@ def create_nano_id(size: int = 12) -> str:
 
 def async_to_sync(async_func):
     """Convert an async function to a sync function"""
-    import asyncio
     import functools
 
+    from ragas.async_utils import run
+
     @functools.wraps(async_func)
     def sync_wrapper(*args, **kwargs):
-        try:
-            # Check if we're already in an event loop
-            asyncio.get_running_loop()
-            # If we get here, we're in a running loop
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, async_func(*args, **kwargs))
-                return future.result()
-        except RuntimeError:
-            # No event loop running, safe to use asyncio.run
-            return asyncio.run(async_func(*args, **kwargs))
+        return run(async_func(*args, **kwargs))
 
     return sync_wrapper
 
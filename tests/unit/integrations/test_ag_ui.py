@@ -638,13 +638,11 @@ async def test_call_ag_ui_endpoint():
 
     # Mock httpx client
     mock_client = AsyncMock()
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
     mock_client.stream = MagicMock()
     mock_client.stream.return_value.__aenter__ = AsyncMock(return_value=mock_response)
     mock_client.stream.return_value.__aexit__ = AsyncMock(return_value=None)
 
-    with patch("httpx.AsyncClient", return_value=mock_client):
+    with patch("ragas.http_clients.get_async_http_client", return_value=mock_client):
         events = await call_ag_ui_endpoint(
             endpoint_url="http://localhost:8000/agent",
             user_input="Hello",
@@ -685,13 +683,11 @@ async def test_call_ag_ui_endpoint_with_config():
     mock_response.raise_for_status = MagicMock()
 
     mock_client = AsyncMock()
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
     mock_client.stream = MagicMock()
     mock_client.stream.return_value.__aenter__ = AsyncMock(return_value=mock_response)
     mock_client.stream.return_value.__aexit__ = AsyncMock(return_value=None)
 
-    with patch("httpx.AsyncClient", return_value=mock_client):
+    with patch("ragas.http_clients.get_async_http_client", return_value=mock_client):
         events = await call_ag_ui_endpoint(
             endpoint_url="http://localhost:8000/agent",
             user_input="Test query",
@@ -732,13 +728,11 @@ async def test_call_ag_ui_endpoint_malformed_json():
     mock_response.raise_for_status = MagicMock()
 
     mock_client = AsyncMock()
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
     mock_client.stream = MagicMock()
     mock_client.stream.return_value.__aenter__ = AsyncMock(return_value=mock_response)
     mock_client.stream.return_value.__aexit__ = AsyncMock(return_value=None)
 
-    with patch("httpx.AsyncClient", return_value=mock_client):
+    with patch("ragas.http_clients.get_async_http_client", return_value=mock_client):
         events = await call_ag_ui_endpoint(
             endpoint_url="http://localhost:8000/agent",
             user_input="Test",
@@ -8,18 +8,19 @@ import pytest
 class TestAsyncUtilsControl:
     """Test nest_asyncio application control."""
 
-    def test_run_with_nest_asyncio_default(self):
-        """Test run function applies nest_asyncio by default."""
-        from ragas.async_utils import run
+    def test_run_uses_background_loop(self):
+        """Test run function runs on the shared background loop without nest_asyncio."""
+        from ragas.async_utils import get_background_loop, run
 
         async def test_func():
-            return "test"
+            return asyncio.get_running_loop()
 
         with patch("ragas.async_utils.apply_nest_asyncio") as mock_apply:
-            result = run(test_func)
+            first = run(test_func)
+            second = run(test_func)
 
-        mock_apply.assert_called_once()
-        assert result == "test"
+        mock_apply.assert_not_called()
+        assert first is second is get_background_loop()
 
     def test_run_without_nest_asyncio(self):
         """Test run function can skip nest_asyncio."""
@@ -86,7 +87,7 @@ class TestEvaluateAsyncControl:
         mock_run.assert_called_once()
 
     def test_evaluate_allow_nest_asyncio_false(self):
-        """Test evaluate with allow_nest_asyncio=False."""
+        """Test evaluate with allow_nest_asyncio=False still uses the background loop."""
         with warnings.catch_warnings():
             # Suppress RuntimeWarning about unawaited coroutines in tests
             warnings.filterwarnings(
@@ -108,9 +109,9 @@ class TestEvaluateAsyncControl:
                         allow_nest_asyncio=False,
                     )
 
-        # Should use asyncio.run, not ragas.async_utils.run
-        mock_asyncio_run.assert_called_once()
-        mock_run.assert_not_called()
+        # Should use ragas.async_utils.run, not a new event loop
+        mock_asyncio_run.assert_not_called()
+        mock_run.assert_called_once()
 
 
 class TestAevaluateImport:
@@ -215,3 +216,62 @@ class TestAsyncIntegration:
                                 # We expect other exceptions due to mocking, but not RuntimeError
                                 assert "event loop" not in str(e).lower()
                                 assert "nest_asyncio" not in str(e).lower()
+
+
+class TestAevaluateStream:
+    """Test streaming scores from aevaluate."""
+
+    @staticmethod
+    def _dataset():
+        from ragas.dataset_schema import EvaluationDataset, SingleTurnSample
+
+        return EvaluationDataset(
+            samples=[
+                SingleTurnSample(response=f"answer {i}", reference=f"answer {i % 2}")
+                for i in range(4)
+            ]
+        )
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_every_score(self):
+        from ragas import aevaluate
+        from ragas.evaluation import EvaluationStream
+        from ragas.metrics import ExactMatch, StringPresence
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            stream = await aevaluate(
+                self._dataset(),
+                metrics=[ExactMatch(), StringPresence()],
+                show_progress=False,
+                stream=True,
+            )
+
+        assert isinstance(stream, EvaluationStream)
+        scores = {(row, name): value async for row, name, value in stream}
+        assert len(scores) == 8
+        assert scores[(1, "exact_match")] == 1.0
+        assert scores[(2, "exact_match")] == 0.0
+
+        assert stream.result is not None
+        df = stream.result.to_pandas()
+        assert df["exact_match"].tolist() == [1.0, 1.0, 0.0, 0.0]
+
+    @pytest.mark.asyncio
+    async def test_stream_rows(self):
+        from ragas import aevaluate
+        from ragas.metrics import ExactMatch, StringPresence
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            stream = await aevaluate(
+                self._dataset(),
+                metrics=[ExactMatch(), StringPresence()],
+                show_progress=False,
+                stream=True,
+            )
+
+        rows = {i: row async for i, row in stream.arows()}
+        assert sorted(rows) == [0, 1, 2, 3]
+        assert list(rows[1]) == ["exact_match", "string_present"]
+        assert rows[1]["exact_match"] == 1.0
@@ -67,6 +67,49 @@ def test_run_function():
     assert result == 42
 
 
+def test_run_reuses_background_loop_inside_running_loop():
+    import contextvars
+
+    from ragas.async_utils import get_background_loop, run
+
+    request_id = contextvars.ContextVar("request_id", default=None)
+
+    async def current():
+        return asyncio.get_running_loop(), request_id.get()
+
+    async def outer():
+        request_id.set("abc")
+        # a sync call made while a loop is running, like in Jupyter
+        return run(current)
+
+    loop, value = asyncio.run(outer())
+    assert loop is get_background_loop() is run(current)[0]
+    assert value == "abc"
+
+
+def test_run_from_background_loop_does_not_deadlock():
+    from ragas.async_utils import run
+
+    async def inner():
+        return "inner"
+
+    async def outer():
+        # sync code called from a job running on the background loop
+        return run(inner)
+
+    assert run(outer) == "inner"
+
+
+def test_run_propagates_exceptions():
+    from ragas.async_utils import run
+
+    async def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        run(fail)
+
+
 @pytest.fixture
 def tasks():
     async def echo_order(index: int):
@@ -88,3 +131,32 @@ def test_run_async_tasks_batched(tasks):
 def test_run_async_tasks_no_progress(tasks):
     results = run_async_tasks(tasks, show_progress=False)
     assert sorted(results) == sorted(range(1, 11))
+
+
+def test_as_completed_bounded_window():
+    from ragas.async_utils import as_completed
+
+    created = 0
+
+    async def echo(idx):
+        await asyncio.sleep(0.001)
+        return idx
+
+    def coro_gen():
+        nonlocal created
+        for i in range(20):
+            created += 1
+            yield echo(i)
+
+    async def _run():
+        results = []
+        max_created = []
+        for fut in as_completed(coro_gen(), max_workers=2, prefetch_factor=2):
+            max_created.append(created - len(results))
+            results.append(await fut)
+        return results, max(max_created)
+
+    results, window = asyncio.run(_run())
+    assert sorted(results) == list(range(20))
+    # never more than max_workers * prefetch_factor coroutines outstanding
+    assert window <= 4
@@ -0,0 +1,257 @@
+import json
+import math
+
+import pytest
+from langchain_core.outputs import LLMResult
+from pydantic import BaseModel
+
+from ragas import evaluate
+from ragas.batch import (
+    BatchRequest,
+    BatchSession,
+    LocalBatchTransport,
+    parse_batch_output,
+    read_batch_file,
+)
+from ragas.dataset_schema import EvaluationDataset
+from ragas.exceptions import BatchResponsePending
+from ragas.llms.base import BaseRagasLLM, InstructorBaseRagasLLM
+from ragas.metrics import Faithfulness
+
+
+class OnlineLLM(BaseRagasLLM):
+    """LLM that must not be called in batch mode."""
+
+    model = "gpt-4o-mini"
+
+    def generate_text(self, *args, **kwargs) -> LLMResult:
+        raise AssertionError("called online")
+
+    async def agenerate_text(self, *args, **kwargs) -> LLMResult:
+        raise AssertionError("called online")
+
+    def is_finished(self, response: LLMResult) -> bool:
+        return all(
+            g.generation_info["finish_reason"] == "stop"
+            for g in response.generations[0]
+        )
+
+
+class OnlineInstructorLLM(InstructorBaseRagasLLM):
+    model = "gpt-4o-mini"
+    model_args = {"temperature": 0.01, "max_tokens": 1024}
+
+    def generate(self, prompt, response_model):
+        raise AssertionError("called online")
+
+    async def agenerate(self, prompt, response_model):
+        raise AssertionError("called online")
+
+
+def faithfulness_responder(request: BatchRequest) -> str:
+    if "Break down each sentence" in request.prompt:
+        return json.dumps({"statements": ["Paris is in France.", "It is cold."]})
+    return json.dumps(
+        {
+            "statements": [
+                {"statement": "Paris is in France.", "reason": "r", "verdict": 1},
+                {"statement": "It is cold.", "reason": "r", "verdict": 0},
+            ]
+        }
+    )
+
+
+@pytest.fixture
+def dataset():
+    return EvaluationDataset.from_list(
+        [
+            {
+                "user_input": f"Where is Paris? {i}",
+                "response": "Paris is in France. It is cold.",
+                "retrieved_contexts": [f"Paris is the capital of France. {i}"],
+            }
+            for i in range(3)
+        ]
+    )
+
+
+def test_evaluate_in_batch_mode(tmp_path, dataset):
+    transport = LocalBatchTransport(
+        str(tmp_path), responder=faithfulness_responder, poll_interval=0
+    )
+    llm = OnlineLLM()
+    metric = Faithfulness(llm=llm)
+
+    result = evaluate(
+        dataset,
+        metrics=[metric],
+        mode="batch",
+        batch_transport=transport,
+        show_progress=False,
+    )
+
+    assert result["faithfulness"] == [0.5, 0.5, 0.5]
+    assert metric.llm is llm
+    # one job per step of the metric, with the prompts of every row
+    jobs = sorted(tmp_path.iterdir())
+    assert len(jobs) == 2
+    sizes = [len(read_batch_file(str(job / "input.jsonl"))) for job in jobs]
+    assert sizes == [3, 3]
+    request = read_batch_file(str(jobs[0] / "input.jsonl"))[0]
+    assert request.model == "gpt-4o-mini"
+    assert request.to_dict()["url"] == "/v1/chat/completions"
+
+
+def test_failed_batch_requests_score_nan(tmp_path, dataset):
+    def responder(request):
+        if "France. 1" in request.prompt:
+            raise RuntimeError("rejected")
+        return faithfulness_responder(request)
+
+    transport = LocalBatchTransport(str(tmp_path), responder=responder)
+    result = evaluate(
+        dataset,
+        metrics=[Faithfulness(llm=OnlineLLM())],
+        mode="batch",
+        batch_transport=transport,
+        show_progress=False,
+    )
+
+    scores = result["faithfulness"]
+    assert scores[0] == 0.5 and math.isnan(scores[1]) and scores[2] == 0.5
+
+
+def test_batch_mode_rejects_incompatible_options(tmp_path, dataset):
+    with pytest.raises(ValueError):
+        evaluate(dataset, metrics=[Faithfulness(llm=OnlineLLM())], mode="later")  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        evaluate(
+            dataset,
+            metrics=[Faithfulness(llm=OnlineLLM())],
+            mode="batch",
+            batch_transport=LocalBatchTransport(str(tmp_path)),
+            deadline=60,
+        )
+
+
+class Verdict(BaseModel):
+    verdict: int
+
+
+@pytest.mark.asyncio
+async def test_session_runs_structured_calls_in_rounds(tmp_path):
+    transport = LocalBatchTransport(
+        str(tmp_path), responder=lambda request: '{"verdict": 1}', poll_interval=0
+    )
+    session = BatchSession(transport)
+    llm = session.wrap(OnlineInstructorLLM())
+    assert session.wrap(llm) is llm
+
+    async def judge():
+        first = await llm.agenerate("first", Verdict)
+        second = await llm.agenerate("second", Verdict)
+        return first.verdict + second.verdict
+
+    assert await session.arun(judge) == 2
+    assert len(session.jobs) == 2
+    request = read_batch_file(str(tmp_path / session.jobs[0] / "input.jsonl"))[0]
+    assert request.params["response_format"]["json_schema"]["name"] == "Verdict"
+    assert request.params["max_tokens"] == 1024
+
+
+@pytest.mark.asyncio
+async def test_session_stops_after_max_rounds(tmp_path):
+    transport = LocalBatchTransport(
+        str(tmp_path), responder=lambda request: '{"verdict": 1}', poll_interval=0
+    )
+    session = BatchSession(transport, max_rounds=1)
+    llm = session.wrap(OnlineInstructorLLM())
+
+    async def judge():
+        await llm.agenerate("first", Verdict)
+        await llm.agenerate("second", Verdict)
+
+    with pytest.raises(BatchResponsePending):
+        await session.arun(judge)
+    assert len(session.jobs) == 1
+
+
+def test_parse_batch_output():
+    lines = [
+        json.dumps(
+            {
+                "custom_id": "a",
+                "response": {
+                    "status_code": 200,
+                    "body": {
+                        "choices": [
+                            {
+                                "index": 1,
+                                "message": {"content": "y"},
+                                "finish_reason": "length",
+                            },
+                            {
+                                "index": 0,
+                                "message": {"content": "x"},
+                                "finish_reason": "stop",
+                            },
+                        ],
+                        "usage": {"total_tokens": 3},
+                    },
+                },
+                "error": None,
+            }
+        ),
+        json.dumps(
+            {
+                "custom_id": "b",
+                "response": None,
+                "error": {"code": "x", "message": "bad request"},
+            }
+        ),
+    ]
+    responses = parse_batch_output(lines)
+    assert responses["a"].texts == ["x", "y"]
+    assert responses["a"].finish_reasons == ["stop", "length"]
+    assert responses["a"].usage == {"total_tokens": 3}
+    assert responses["b"].error == "bad request"
+
+
+def test_openai_transport():
+    from unittest.mock import MagicMock
+
+    from ragas.batch import OpenAIBatchTransport
+
+    client = MagicMock()
+    client.files.create.return_value = MagicMock(id="file-in")
+    client.batches.create.return_value = MagicMock(id="batch-1")
+    transport = OpenAIBatchTransport(client)
+
+    request = BatchRequest("a", "gpt-4o-mini", "hello", {"n": 1})
+    assert transport.submit([request]) == "batch-1"
+    name, data = client.files.create.call_args.kwargs["file"]
+    assert json.loads(data) == request.to_dict()
+    assert client.batches.create.call_args.kwargs["input_file_id"] == "file-in"
+
+    client.batches.retrieve.return_value = MagicMock(status="in_progress")
+    assert transport.poll("batch-1") is None
+
+    client.batches.retrieve.return_value = MagicMock(
+        status="completed", output_file_id="file-out", error_file_id=None
+    )
+    client.files.content.return_value = MagicMock(
+        text=json.dumps(
+            {
+                "custom_id": "a",
+                "response": {
+                    "status_code": 200,
+                    "body": {"choices": [{"message": {"content": "hi"}}]},
+                },
+            }
+        )
+    )
+    assert transport.poll("batch-1")["a"].texts == ["hi"]
+
+    client.batches.retrieve.return_value = MagicMock(status="expired")
+    with pytest.raises(RuntimeError):
+        transport.poll("batch-1")
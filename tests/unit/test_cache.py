@@ -3,7 +3,14 @@ import asyncio
 import pytest
 
 from ragas import cacher
-from ragas.cache import DiskCacheBackend, _generate_cache_key, _make_hashable
+from ragas.cache import (
+    DiskCacheBackend,
+    InMemoryCacheBackend,
+    SQLiteCacheBackend,
+    TieredCacheBackend,
+    _generate_cache_key,
+    _make_hashable,
+)
 
 
 @pytest.fixture(scope="function")
@@ -135,3 +142,610 @@ def test_caching_with_different_args(cache_backend):
     # Different arguments, cache miss
     assert multiply(3, 3) == 9
     assert call_count["count"] == 2
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryCacheBackend(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    cache.set("c", 3)
+
+    assert cache.has_key("a") and cache.has_key("c")
+    assert not cache.has_key("b")
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+
+def test_in_memory_cache_max_bytes():
+    cache = InMemoryCacheBackend(max_entries=None, max_bytes=300)
+    cache.set("a", "x" * 100)
+    cache.set("b", "x" * 100)
+    cache.set("c", "x" * 100)
+    assert not cache.has_key("a")
+    assert cache.has_key("c")
+    assert cache.size_bytes <= 300
+
+    # values larger than the whole cache are not stored
+    cache.set("d", "x" * 1000)
+    assert not cache.has_key("d")
+
+
+def test_in_memory_cache_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("ragas.cache.time.monotonic", lambda: now[0])
+    cache = InMemoryCacheBackend(ttl=10)
+    cache.set("a", 1)
+    now[0] += 5
+    assert cache.get("a") == 1
+    now[0] += 5
+    assert not cache.has_key("a")
+    assert len(cache) == 0
+
+
+def test_tiered_cache_write_through(cache_backend):
+    memory = InMemoryCacheBackend()
+    cache = TieredCacheBackend(cache_backend, memory=memory)
+    cache.set("a", {"value": 1})
+    assert memory.get("a") == {"value": 1}
+    assert cache_backend.get("a") == {"value": 1}
+
+    # hits in the persistent cache are copied into memory
+    cache_backend.set("b", 2)
+    assert cache.get("b") == 2
+    assert memory.has_key("b")
+    assert cache.get("missing") is None
+
+
+def test_tiered_cache_write_back(cache_backend):
+    cache = TieredCacheBackend(
+        cache_backend, memory=InMemoryCacheBackend(max_entries=1), write_back=True
+    )
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # "a" is evicted from memory but still queued
+    assert not cache_backend.has_key("a")
+    assert cache.has_key("a") and cache.get("a") == 1
+
+    cache.flush()
+    assert cache_backend.get("a") == 1 and cache_backend.get("b") == 2
+
+
+def test_tiered_cache_flushes_in_batches(cache_backend):
+    cache = TieredCacheBackend(cache_backend, write_back=True, flush_every=2)
+    cache.set("a", 1)
+    assert not cache_backend.has_key("a")
+    cache.set("b", 2)
+    assert cache_backend.has_key("a") and cache_backend.has_key("b")
+
+
+def test_caching_with_tiered_backend(cache_backend):
+    call_count = {"count": 0}
+
+    @cacher(cache_backend=TieredCacheBackend(cache_backend))
+    def square(x):
+        call_count["count"] += 1
+        return x * x
+
+    assert square(3) == 9
+    assert square(3) == 9
+    assert call_count["count"] == 1
+
+
+def test_disk_cache_get_many_set_many(cache_backend):
+    cache_backend.set_many({"a": 1, "b": None})
+    assert cache_backend.get_many(["a", "b", "c"]) == {"a": 1, "b": None}
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_async_methods_run_off_the_event_loop(cache_backend):
+    import threading
+
+    threads = []
+    original_get = cache_backend.get
+
+    def get(key):
+        threads.append(threading.current_thread())
+        return original_get(key)
+
+    cache_backend.get = get
+    await cache_backend.aset("a", 1)
+    assert await cache_backend.ahas("a")
+    assert await cache_backend.aget("a") == 1
+    assert threads and threads[0] is not threading.current_thread()
+
+    await cache_backend.aset_many({"b": 2, "c": 3})
+    assert await cache_backend.aget_many(["b", "c", "d"]) == {"b": 2, "c": 3}
+
+
+@pytest.mark.asyncio
+async def test_cacher_uses_async_methods_for_coroutines():
+    class AsyncOnlyBackend(InMemoryCacheBackend):
+        def get(self, key):
+            raise AssertionError("sync get called")
+
+        def has_key(self, key):
+            raise AssertionError("sync has_key called")
+
+        async def aget(self, key):
+            return super().get(key)
+
+        async def ahas(self, key):
+            return super().has_key(key)
+
+    call_count = {"count": 0}
+
+    @cacher(cache_backend=AsyncOnlyBackend())
+    async def double(x):
+        call_count["count"] += 1
+        return x * 2
+
+    assert await double(2) == 4
+    assert await double(2) == 4
+    assert call_count["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_async_methods(cache_backend):
+    memory = InMemoryCacheBackend()
+    cache = TieredCacheBackend(cache_backend, memory=memory, write_back=True)
+    await cache.aset_many({"a": 1, "b": 2})
+    assert not cache_backend.has_key("a")
+    assert await cache.aget_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+
+    await cache.aflush()
+    memory.clear()
+    assert await cache.ahas("a")
+    assert await cache.aget("a") == 1
+    assert memory.has_key("a")
+
+
+@pytest.mark.asyncio
+async def test_cacher_coalesces_concurrent_calls(cache_backend):
+    call_count = {"count": 0}
+
+    @cacher(cache_backend=cache_backend)
+    async def slow_double(x):
+        call_count["count"] += 1
+        await asyncio.sleep(0.05)
+        return x * 2
+
+    results = await asyncio.gather(*[slow_double(2) for _ in range(5)], slow_double(3))
+    assert results == [4, 4, 4, 4, 4, 6]
+    assert call_count["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cacher_coalesces_without_backend():
+    call_count = {"count": 0}
+
+    @cacher(coalesce=True)
+    async def slow_call():
+        call_count["count"] += 1
+        await asyncio.sleep(0.05)
+        return call_count["count"]
+
+    assert await asyncio.gather(slow_call(), slow_call()) == [1, 1]
+    # nothing is cached once the call has finished
+    assert await slow_call() == 2
+
+
+@pytest.mark.asyncio
+async def test_cacher_coalesced_calls_share_exceptions():
+    call_count = {"count": 0}
+
+    @cacher(coalesce=True)
+    async def failing_call():
+        call_count["count"] += 1
+        await asyncio.sleep(0.05)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        failing_call(), failing_call(), return_exceptions=True
+    )
+    assert all(isinstance(r, ValueError) for r in results)
+    assert call_count["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cacher_coalesced_call_retries_when_owner_is_cancelled():
+    call_count = {"count": 0}
+
+    @cacher(coalesce=True)
+    async def slow_call():
+        call_count["count"] += 1
+        await asyncio.sleep(0.05)
+        return "done"
+
+    owner = asyncio.ensure_future(slow_call())
+    await asyncio.sleep(0.01)
+    follower = asyncio.ensure_future(slow_call())
+    await asyncio.sleep(0.01)
+    owner.cancel()
+
+    assert await follower == "done"
+    assert call_count["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_llm_and_embeddings_coalesce_without_cache():
+    import typing as t
+
+    from langchain_core.outputs import Generation, LLMResult
+
+    from ragas.embeddings.base import BaseRagasEmbedding
+    from ragas.llms.base import BaseRagasLLM
+
+    calls = []
+
+    class SlowLLM(BaseRagasLLM):
+        def generate_text(self, prompt, *args, **kwargs):
+            raise NotImplementedError
+
+        async def agenerate_text(self, prompt, *args, **kwargs):
+            calls.append(prompt)
+            await asyncio.sleep(0.05)
+            return LLMResult(generations=[[Generation(text=prompt)]])
+
+        def is_finished(self, response):
+            return True
+
+    class SlowEmbeddings(BaseRagasEmbedding):
+        def embed_text(self, text: str, **kwargs: t.Any) -> t.List[float]:
+            raise NotImplementedError
+
+        async def aembed_text(self, text: str, **kwargs: t.Any) -> t.List[float]:
+            calls.append(text)
+            await asyncio.sleep(0.05)
+            return [1.0]
+
+    llm = SlowLLM(coalesce=True)
+    await asyncio.gather(*(llm.agenerate_text("same") for _ in range(3)))
+    embeddings = SlowEmbeddings(coalesce=True)
+    await asyncio.gather(*(embeddings.aembed_text("text") for _ in range(3)))
+    assert calls == ["same", "text"]
+
+    # off by default
+    llm = SlowLLM()
+    await asyncio.gather(*(llm.agenerate_text("same") for _ in range(2)))
+    assert calls == ["same", "text", "same", "same"]
+
+
+def test_generate_cache_key_is_versioned_and_stable():
+    from pydantic import BaseModel
+
+    from ragas.cache import CACHE_KEY_VERSION
+
+    class Question(BaseModel):
+        text: str
+        tags: list
+
+    def sample_func(q):
+        return q
+
+    key1 = _generate_cache_key(sample_func, (Question(text="a", tags=[1]),), {})
+    key2 = _generate_cache_key(sample_func, (Question(text="a", tags=[1]),), {})
+    key3 = _generate_cache_key(sample_func, (Question(text="b", tags=[1]),), {})
+    assert key1 == key2 != key3
+    assert key1.startswith(f"v{CACHE_KEY_VERSION}:")
+
+
+def test_generate_cache_key_ignores_object_addresses():
+    class Opaque:
+        pass
+
+    def sample_func(a, b):
+        return a
+
+    key1 = _generate_cache_key(sample_func, ("text", Opaque()), {})
+    key2 = _generate_cache_key(sample_func, ("text", Opaque()), {})
+    assert key1 == key2
+
+
+def test_generate_cache_key_distinguishes_ambiguous_args():
+    def sample_func(*args):
+        return args
+
+    assert _generate_cache_key(sample_func, ("ab", "c"), {}) != _generate_cache_key(
+        sample_func, ("a", "bc"), {}
+    )
+    assert _generate_cache_key(sample_func, (1,), {}) != _generate_cache_key(
+        sample_func, ("1",), {}
+    )
+
+
+def test_generate_cache_key_bound_method_uses_model_fingerprint():
+    class LLM:
+        def __init__(self, model, client):
+            self.model = model
+            self.client = client
+
+        def generate(self, prompt):
+            return prompt
+
+    key1 = _generate_cache_key(LLM("gpt-4o", object()).generate, ("hi",), {})
+    key2 = _generate_cache_key(LLM("gpt-4o", object()).generate, ("hi",), {})
+    key3 = _generate_cache_key(LLM("gpt-4o-mini", object()).generate, ("hi",), {})
+    assert key1 == key2
+    assert key1 != key3, "Different models should not share cache entries"
+
+
+def test_frozen_pydantic_fingerprint_is_memoized():
+    from pydantic import BaseModel, ConfigDict
+
+    from ragas import cache as cache_module
+
+    class Context(BaseModel):
+        model_config = ConfigDict(frozen=True)
+        text: str
+
+    context = Context(text="a long context")
+    first = cache_module._fingerprint(context)
+    key = id(context)
+    assert key in cache_module._model_digests
+
+    # the memoized digest is used instead of hashing the fields again
+    cache_module._model_digests[key] = b"memoized"
+    assert cache_module._fingerprint(context) != first
+
+    del context
+    assert key not in cache_module._model_digests
+
+
+@pytest.fixture
+def sqlite_backend(tmp_path):
+    backend = SQLiteCacheBackend(str(tmp_path / "cache.db"), flush_interval=60)
+    yield backend
+    backend.close()
+
+
+def test_sqlite_cache_queues_writes(sqlite_backend):
+    sqlite_backend.set("a", {"value": 1})
+    # queued values are visible before they are written
+    assert sqlite_backend.has_key("a")
+    assert sqlite_backend.get("a") == {"value": 1}
+
+    other = SQLiteCacheBackend(sqlite_backend.path)
+    assert not other.has_key("a")
+    sqlite_backend.flush()
+    assert other.get("a") == {"value": 1}
+    assert other.get("missing") is None
+    other.close()
+
+
+def test_sqlite_cache_flushes_when_queue_is_full(tmp_path):
+    import time
+
+    backend = SQLiteCacheBackend(
+        str(tmp_path / "cache.db"), flush_interval=60, max_pending=2
+    )
+    backend.set_many({"a": 1, "b": 2})
+    deadline = time.monotonic() + 5
+    while backend._pending and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not backend._pending
+    backend.close()
+
+
+def test_sqlite_cache_get_many_and_compression(sqlite_backend):
+    large = "x" * 10_000
+    sqlite_backend.set_many({"small": 1, "large": large, "none": None})
+    sqlite_backend.flush()
+    assert sqlite_backend.get_many(["small", "large", "none", "missing"]) == {
+        "small": 1,
+        "large": large,
+        "none": None,
+    }
+    (size,) = (
+        sqlite_backend._connection()
+        .execute("SELECT size FROM cache WHERE key = 'large'")
+        .fetchone()
+    )
+    assert size < 1000
+
+
+def test_sqlite_cache_records_metadata_and_prunes(sqlite_backend):
+    class Embeddings:
+        def __init__(self, model):
+            self.model = model
+
+        def embed(self, text):
+            return [len(text)]
+
+    cached_small = cacher(sqlite_backend)(Embeddings("small").embed)
+    cached_large = cacher(sqlite_backend)(Embeddings("large").embed)
+    cached_small("a")
+    cached_large("a")
+    sqlite_backend.flush()
+
+    rows = sqlite_backend._connection().execute(
+        "SELECT function, model, ragas_version FROM cache ORDER BY model"
+    )
+    assert [
+        (function.split(".<locals>.")[-1], model) for function, model, _ in rows
+    ] == [
+        ("Embeddings.embed", "large"),
+        ("Embeddings.embed", "small"),
+    ]
+
+    assert sqlite_backend.prune(model="small") == 1
+    assert len(sqlite_backend) == 1
+    assert sqlite_backend.prune(older_than=3600) == 0
+    assert sqlite_backend.prune(older_than=0) == 1
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_records_model_of_langchain_llm(sqlite_backend):
+    from langchain_core.language_models.fake import FakeListLLM
+    from langchain_core.prompt_values import StringPromptValue
+
+    from ragas.llms import LangchainLLMWrapper
+
+    class NamedLLM(FakeListLLM):
+        model_name: str = "fake-model"
+
+    # the wrapper sets its LLM after the cached methods are decorated
+    llm = LangchainLLMWrapper(NamedLLM(responses=["hi"]), cache=sqlite_backend)
+    await llm.agenerate_text(StringPromptValue(text="question"))
+    sqlite_backend.flush()
+
+    rows = sqlite_backend._connection().execute("SELECT function, model FROM cache")
+    assert list(rows) == [("LangchainLLMWrapper.agenerate_text", "fake-model")]
+    assert sqlite_backend.prune(model="fake-model") == 1
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_async_methods(sqlite_backend):
+    await sqlite_backend.aset("a", 1)
+    assert await sqlite_backend.ahas("a")
+    sqlite_backend.flush()
+    assert await sqlite_backend.aget("a") == 1
+    assert await sqlite_backend.aget_many(["a", "b"]) == {"a": 1}
+
+
+def _write_entries(path, start):
+    backend = SQLiteCacheBackend(path, flush_interval=0.01, max_pending=10)
+    for i in range(start, start + 50):
+        backend.set(f"key-{i}", i)
+    backend.close()
+
+
+def test_sqlite_cache_shared_between_processes(tmp_path):
+    import multiprocessing
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("requires the fork start method")
+    path = str(tmp_path / "cache.db")
+    SQLiteCacheBackend(path).close()
+    ctx = multiprocessing.get_context("fork")
+    processes = [
+        ctx.Process(target=_write_entries, args=(path, start)) for start in (0, 50, 100)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(60)
+        assert process.exitcode == 0
+
+    backend = SQLiteCacheBackend(path)
+    found = backend.get_many([f"key-{i}" for i in range(150)])
+    assert found == {f"key-{i}": i for i in range(150)}
+    backend.close()
+
+
+def test_sqlite_cache_pickles_to_the_same_file(sqlite_backend):
+    import pickle
+
+    sqlite_backend.set("a", 1)
+    copy = pickle.loads(pickle.dumps(sqlite_backend))
+    assert copy.path == sqlite_backend.path
+    assert copy.get("a") == 1
+    copy.close()
+
+
+@pytest.mark.asyncio
+async def test_cacher_records_hits_and_misses():
+    backend = InMemoryCacheBackend()
+
+    @cacher(cache_backend=backend)
+    async def slow_double(x):
+        await asyncio.sleep(0.01)
+        return x * 2
+
+    await asyncio.gather(slow_double(1), slow_double(1))
+    await slow_double(1)
+    await slow_double(2)
+    assert (backend.stats.hits, backend.stats.misses, backend.stats.coalesced) == (
+        1,
+        2,
+        1,
+    )
+    assert backend.stats.hit_rate == 0.5
+
+
+@pytest.mark.asyncio
+async def test_cacher_treats_entry_expired_after_lookup_as_miss(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("ragas.cache.time.monotonic", lambda: now[0])
+    lookups = []
+
+    class ExpiringBackend(InMemoryCacheBackend):
+        async def aget_many(self, keys):
+            lookups.append(keys)
+            return await super().aget_many(keys)
+
+        def has_key(self, key):
+            # the entry expires right after a separate presence check
+            found = super().has_key(key)
+            now[0] += 10
+            return found
+
+    backend = ExpiringBackend(ttl=10)
+
+    @cacher(cache_backend=backend)
+    async def double(x):
+        return x * 2
+
+    assert await double(1) == 2
+    assert await double(1) == 2
+    now[0] += 10
+    assert await double(1) == 2
+    assert len(lookups) == 3
+    assert (backend.stats.hits, backend.stats.misses) == (1, 2)
+
+
+def test_sqlite_cache_summary_includes_saved_counters(sqlite_backend):
+    @cacher(cache_backend=sqlite_backend)
+    def double(x):
+        return x * 2
+
+    double(1)
+    double(1)
+    sqlite_backend.close()
+
+    other = SQLiteCacheBackend(sqlite_backend.path)
+    summary = other.summary()
+    assert summary["entries"] == 1
+    assert summary["stats"] == {
+        "hits": 1,
+        "misses": 1,
+        "coalesced": 0,
+        "hit_rate": 0.5,
+    }
+    assert list(summary["by_function"].values()) == [
+        {"entries": 1, "size_bytes": summary["size_bytes"]}
+    ]
+    other.close()
+
+
+def test_sqlite_cache_prune_by_size(sqlite_backend):
+    import time
+
+    for i in range(5):
+        sqlite_backend.set(f"key-{i}", "x" * 100)
+        sqlite_backend.flush()
+        time.sleep(0.01)
+    size = sqlite_backend.summary()["size_bytes"] // 5
+
+    assert sqlite_backend.prune(max_bytes=2 * size) == 3
+    assert set(sqlite_backend.get_many([f"key-{i}" for i in range(5)])) == {
+        "key-3",
+        "key-4",
+    }
+
+
+def test_sqlite_cache_export_and_import_bundle(sqlite_backend, tmp_path):
+    sqlite_backend.set("a", 1)
+    sqlite_backend.set("b", 2)
+    with pytest.raises(FileNotFoundError):
+        sqlite_backend.import_bundle(str(tmp_path / "missing.db"))
+
+    bundle = str(tmp_path / "bundle.db")
+    assert sqlite_backend.export_bundle(bundle) == 2
+
+    other = SQLiteCacheBackend(str(tmp_path / "other.db"))
+    other.set("a", "local")
+    other.flush()
+    assert other.import_bundle(bundle) == 1
+    assert other.get_many(["a", "b"]) == {"a": "local", "b": 2}
+    other.close()
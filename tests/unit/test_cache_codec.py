@@ -0,0 +1,165 @@
+import pickle
+
+import numpy as np
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+from pydantic import BaseModel
+
+from ragas.cache import DiskCacheBackend, SQLiteCacheBackend
+from ragas.cache_codec import CompactCodec, PickleCodec, decode_value
+
+
+class Verdict(BaseModel):
+    reason: str
+    verdict: int
+
+
+def test_embedding_is_stored_as_float32():
+    embedding = [float(i) / 7 for i in range(1536)]
+    data = CompactCodec().encode(embedding)
+    assert len(data) == 2 + 4 * 1536
+    assert len(data) < len(pickle.dumps(embedding)) / 2
+
+    decoded = CompactCodec().decode(data)
+    assert isinstance(decoded, np.ndarray) and decoded.dtype == np.float32
+    np.testing.assert_allclose(decoded, embedding, rtol=1e-6)
+    # decoded without copying the buffer
+    assert not decoded.flags.writeable and not decoded.flags.owndata
+
+
+def test_embedding_matrix_round_trip():
+    embeddings = [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
+    decoded = decode_value(CompactCodec().encode(embeddings))
+    assert decoded.shape == (2, 3)
+    np.testing.assert_allclose(decoded, embeddings, rtol=1e-6)
+
+    array = np.arange(6, dtype=np.float64).reshape(3, 2)
+    np.testing.assert_array_equal(decode_value(CompactCodec().encode(array)), array)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "text",
+        {"statements": ["a", "b"], "score": 0.5, "ok": True, "missing": None},
+        [1, 2.5, "x"],
+        (1, 2),  # not JSON, pickled so that it stays a tuple
+        {1: "a"},
+        [],
+        [1.0, 2],  # not an embedding
+    ],
+)
+def test_plain_values_round_trip(value):
+    assert decode_value(CompactCodec().encode(value)) == value
+    assert type(decode_value(CompactCodec().encode(value))) is type(value)
+
+
+def test_pydantic_models_are_stored_as_json():
+    verdict = Verdict(reason="supported by the context", verdict=1)
+    data = CompactCodec(compression=None).encode(verdict)
+    assert b'"verdict":1' in data
+    assert decode_value(data) == verdict
+
+
+def test_llm_result_metadata_is_stripped():
+    message = AIMessage(
+        content="yes",
+        id="run-123",
+        response_metadata={"finish_reason": "stop", "model_name": "gpt-4o"},
+        usage_metadata={"input_tokens": 10, "output_tokens": 1, "total_tokens": 11},
+    )
+    result = LLMResult(
+        generations=[
+            [
+                ChatGeneration(
+                    message=message,
+                    generation_info={"finish_reason": "stop", "logprobs": None},
+                )
+            ]
+        ],
+        llm_output={"token_usage": {"total_tokens": 11}, "model_name": "gpt-4o"},
+    )
+
+    data = CompactCodec().encode(result)
+    # JSON would turn the AIMessage into a BaseMessage
+    assert data[:1] == b"K"
+    decoded = decode_value(data)
+    assert isinstance(decoded, LLMResult)
+    generation = decoded.generations[0][0]
+    assert isinstance(generation, ChatGeneration)
+    assert isinstance(generation.message, AIMessage)
+    assert generation.text == "yes"
+    assert generation.generation_info == {"finish_reason": "stop"}
+    assert generation.message.response_metadata == {"finish_reason": "stop"}
+    assert generation.message.usage_metadata is None
+    assert decoded.llm_output is None
+
+    kept = decode_value(CompactCodec(strip_metadata=False).encode(result))
+    assert kept.llm_output == result.llm_output
+
+
+def test_compression():
+    value = {"text": "x" * 10_000}
+    assert len(CompactCodec().encode(value)) < 200
+    assert len(CompactCodec(compression=None).encode(value)) > 10_000
+    assert decode_value(CompactCodec().encode(value)) == value
+
+
+def test_zstd_compression():
+    pytest.importorskip("zstandard")
+    value = {"text": "x" * 10_000}
+    data = CompactCodec(compression="zstd").encode(value)
+    assert len(data) < 200
+    assert decode_value(data) == value
+
+
+def test_msgpack_format():
+    pytest.importorskip("msgpack")
+    value = {"score": 1, "items": ["a"]}
+    assert decode_value(CompactCodec(format="msgpack").encode(value)) == value
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        CompactCodec(format="xml")  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        CompactCodec(compression="lz4")  # type: ignore[arg-type]
+
+
+def test_pickle_codec_round_trip():
+    value = {"text": "x" * 10_000, "tuple": (1, 2)}
+    data = PickleCodec().encode(value)
+    assert len(data) < 500
+    assert decode_value(data) == value
+
+
+def test_backends_with_compact_codec(tmp_path):
+    embedding = [0.25, 0.5, 0.75]
+    for backend in (
+        DiskCacheBackend(str(tmp_path / "disk"), codec=CompactCodec()),
+        SQLiteCacheBackend(str(tmp_path / "cache.db"), codec=CompactCodec()),
+    ):
+        backend.set("embedding", embedding)
+        backend.set("verdict", Verdict(reason="r", verdict=0))
+        found = backend.get_many(["embedding", "verdict"])
+        np.testing.assert_array_equal(found["embedding"], embedding)
+        assert backend.get("verdict") == Verdict(reason="r", verdict=0)
+
+
+def test_sqlite_cache_with_old_schema_is_cleared(tmp_path):
+    import sqlite3
+
+    path = str(tmp_path / "cache.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE cache (key TEXT PRIMARY KEY, value BLOB)")
+    conn.execute("INSERT INTO cache VALUES ('a', x'00')")
+    conn.execute("PRAGMA user_version = 1")
+    conn.commit()
+    conn.close()
+
+    backend = SQLiteCacheBackend(path)
+    assert len(backend) == 0
+    backend.set("a", 1)
+    assert backend.get("a") == 1
+    backend.close()
@@ -0,0 +1,150 @@
+import math
+import typing as t
+import warnings
+from dataclasses import dataclass
+
+import pytest
+from langchain_core.callbacks import Callbacks
+
+from ragas.checkpoint import (
+    JSONLCheckpointStore,
+    SQLiteCheckpointStore,
+    fingerprint_metric,
+    hash_row,
+)
+from ragas.dataset_schema import EvaluationDataset, SingleTurnSample
+from ragas.metrics import ExactMatch
+
+
+@dataclass
+class CountingExactMatch(ExactMatch):
+    """ExactMatch that counts its calls and can fail on selected responses."""
+
+    calls: int = 0
+    fail_on: t.Optional[str] = None
+    on_call: t.Optional[t.Callable[[int], None]] = None
+
+    async def _single_turn_ascore(
+        self, sample: SingleTurnSample, callbacks: Callbacks
+    ) -> float:
+        self.calls += 1
+        if sample.response == self.fail_on:
+            raise ValueError("failed")
+        if self.on_call is not None:
+            self.on_call(self.calls)
+        return await super()._single_turn_ascore(sample, callbacks)
+
+
+def _dataset(n=4):
+    return EvaluationDataset(
+        samples=[
+            SingleTurnSample(response=f"answer {i}", reference=f"answer {i % 2}")
+            for i in range(n)
+        ]
+    )
+
+
+def _evaluate(metric, checkpoint, **kwargs):
+    from ragas import evaluate
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        return evaluate(
+            _dataset(),
+            metrics=[metric],
+            checkpoint=checkpoint,
+            show_progress=False,
+            **kwargs,
+        )
+
+
+@pytest.fixture(params=["sqlite", "jsonl"])
+def make_store(request, tmp_path):
+    def make(run_id="default"):
+        if request.param == "sqlite":
+            return SQLiteCheckpointStore(str(tmp_path / "checkpoint.db"), run_id)
+        return JSONLCheckpointStore(str(tmp_path / "checkpoint.jsonl"), run_id)
+
+    return make
+
+
+def test_store_roundtrip(make_store):
+    store = make_store()
+    store.save("row", "metric", 0.5)
+    store.save("row", "other", None)
+    store.save("row", "metric", 1.0)
+
+    assert make_store().load() == {("row", "metric"): 1.0, ("row", "other"): None}
+    assert make_store(run_id="another run").load() == {}
+
+
+def test_jsonl_store_ignores_truncated_line(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    store = JSONLCheckpointStore(str(path))
+    store.save("row-0", "metric", 1.0)
+    with open(path, "a") as f:
+        f.write('{"run_id": "default", "row": "row-1"')
+
+    store = JSONLCheckpointStore(str(path))
+    store.save("row-2", "metric", 0.0)
+    assert store.load() == {("row-0", "metric"): 1.0, ("row-2", "metric"): 0.0}
+
+
+def test_fingerprint_and_row_hash_are_stable():
+    assert fingerprint_metric(ExactMatch()) == fingerprint_metric(ExactMatch())
+    assert fingerprint_metric(ExactMatch()) != fingerprint_metric(
+        ExactMatch(name="other")
+    )
+    sample = SingleTurnSample(response="a", reference="b")
+    assert hash_row(sample) == hash_row(SingleTurnSample(response="a", reference="b"))
+    assert hash_row(sample) != hash_row(SingleTurnSample(response="a", reference="c"))
+
+
+@dataclass
+class Judge:
+    model: str
+
+
+def test_fingerprint_covers_the_judge_model():
+    from ragas.metrics import Faithfulness
+
+    def fingerprint(model: str) -> str:
+        return fingerprint_metric(Faithfulness(llm=Judge(model)))  # type: ignore[arg-type]
+
+    assert fingerprint("gpt-4o") == fingerprint("gpt-4o")
+    assert fingerprint("gpt-4o") != fingerprint("gpt-4o-mini")
+
+
+def test_evaluate_resumes_only_missing_scores(make_store):
+    metric = CountingExactMatch(fail_on="answer 2")
+    result = _evaluate(metric, make_store())
+    assert metric.calls == 4
+    assert math.isnan(result.to_pandas()["exact_match"][2])
+
+    # the failed row is the only one evaluated again
+    metric = CountingExactMatch()
+    result = _evaluate(metric, make_store())
+    assert metric.calls == 1
+    assert result.to_pandas()["exact_match"].tolist() == [1.0, 1.0, 0.0, 0.0]
+
+    metric = CountingExactMatch()
+    _evaluate(metric, make_store())
+    assert metric.calls == 0
+
+
+def test_cancelled_run_can_be_resumed(make_store):
+    from ragas.run_config import RunConfig
+
+    metric = CountingExactMatch()
+    executor = _evaluate(
+        metric, make_store(), return_executor=True, run_config=RunConfig(max_workers=1)
+    )
+    metric.on_call = lambda calls: executor.cancel() if calls == 2 else None
+    executor.results()
+    n_saved = len(make_store().load())
+    assert 2 <= n_saved < 4
+
+    metric = CountingExactMatch()
+    result = _evaluate(metric, make_store())
+    assert metric.calls == 4 - n_saved
+    assert result.to_pandas()["exact_match"].tolist() == [1.0, 1.0, 0.0, 0.0]
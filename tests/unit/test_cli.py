@@ -97,3 +97,88 @@ if __name__ == "__main__":
     test_quickstart_invalid_template()
     print("✓ Quickstart invalid template test passed")
     print("All CLI tests passed!")
+
+
+def test_cache_stats_prune_export_import(tmp_path):
+    """Test the cache sub-commands on a SQLite cache."""
+    from ragas.cache import SQLiteCacheBackend
+
+    path = str(tmp_path / "cache.db")
+    cache = SQLiteCacheBackend(path)
+    cache.set_many({"a": 1, "b": 2})
+    cache.close()
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["cache", "stats", "--path", path])
+    assert result.exit_code == 0
+    assert "Entries" in result.stdout
+
+    bundle = str(tmp_path / "bundle.db")
+    result = runner.invoke(app, ["cache", "export", bundle, "--path", path])
+    assert result.exit_code == 0
+    assert "Exported 2 entries" in result.stdout
+
+    result = runner.invoke(app, ["cache", "prune", "--path", path])
+    assert result.exit_code == 1
+
+    result = runner.invoke(app, ["cache", "prune", "--path", path, "--max-size", "0"])
+    assert result.exit_code == 0
+    assert "Removed 2 entries" in result.stdout
+
+    result = runner.invoke(app, ["cache", "import", bundle, "--path", path])
+    assert result.exit_code == 0
+    assert "Imported 2 entries" in result.stdout
+
+
+def test_cache_stats_missing_cache(tmp_path):
+    """Test that cache stats fails on a missing cache."""
+    runner = CliRunner()
+    result = runner.invoke(
+        app, ["cache", "stats", "--path", str(tmp_path / "missing.db")]
+    )
+    assert result.exit_code == 1
+    assert "does not exist" in result.stdout
+
+
+def test_cache_commands_keep_cache_of_other_schema(tmp_path):
+    """Test that cache commands refuse, without clearing, caches of another schema."""
+    import sqlite3
+
+    from ragas.cache import SQLiteCacheBackend
+
+    path = tmp_path / "old.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE cache (key TEXT PRIMARY KEY, value BLOB)")
+        conn.execute("INSERT INTO cache VALUES ('a', x'00')")
+        conn.execute("PRAGMA user_version = 2")
+    conn.close()
+    current = str(tmp_path / "cache.db")
+    cache = SQLiteCacheBackend(current)
+    cache.set("b", 1)
+    cache.close()
+
+    runner = CliRunner()
+    for args in (
+        ["stats", "--path", str(path)],
+        ["import", current, "--path", str(path)],
+        ["export", str(path), "--path", current],
+    ):
+        result = runner.invoke(app, ["cache", *args])
+        assert result.exit_code == 1, args
+        assert "schema version 2" in result.stdout
+
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0] == 1
+    conn.close()
+
+
+def test_parse_duration_and_size():
+    """Test the parsing of durations and sizes of cache options."""
+    from ragas.cli import parse_duration, parse_size
+
+    assert parse_duration("90") == 90
+    assert parse_duration("12h") == 12 * 3600
+    assert parse_duration("7d") == 7 * 86400
+    assert parse_size("500MB") == 500 * 1024**2
+    assert parse_size("1.5kb") == 1536
+    assert parse_size("100") == 100
@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+
+from ragas.concurrency import AdaptiveConcurrencyLimiter, is_throttling_error
+from ragas.executor import Executor
+from ragas.run_config import RunConfig, add_async_retry
+
+
+class RateLimitError(Exception):
+    pass
+
+
+class StatusError(Exception):
+    def __init__(self, status_code: int):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+
+
+def test_is_throttling_error():
+    assert is_throttling_error(RateLimitError("slow down"))
+    assert is_throttling_error(StatusError(429))
+    assert is_throttling_error(asyncio.TimeoutError())
+    assert not is_throttling_error(StatusError(400))
+    assert not is_throttling_error(ValueError("bad output"))
+
+
+def test_limiter_additive_increase_with_healthy_latency():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=6)
+    for _ in range(100):
+        limiter.record_success(0.1)
+    assert limiter.limit == 6
+
+
+def test_limiter_holds_when_latency_degrades():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=64)
+    for _ in range(20):
+        limiter.record_success(0.1)
+    limit = limiter.limit
+    for _ in range(5):
+        limiter.record_success(5.0)
+    assert limiter.limit == limit
+
+
+def test_limiter_multiplicative_decrease_on_throttling():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=16, min_limit=2, cooldown=0)
+    limiter.record_failure(RateLimitError())
+    assert limiter.limit == 8
+    limiter.record_failure(ValueError("not a throttling error"))
+    assert limiter.limit == 8
+    for _ in range(5):
+        limiter.record_failure(StatusError(429))
+    assert limiter.limit == 2
+
+
+def test_limiter_cooldown_groups_failures():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=16, cooldown=60)
+    for _ in range(10):
+        limiter.record_failure(RateLimitError())
+    assert limiter.limit == 8
+
+
+def test_limiter_invalid_arguments():
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(min_limit=0)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(min_limit=4, max_limit=2)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(decrease_factor=1.5)
+
+
+def test_limiter_bounds_in_flight_jobs():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+    peak = 0
+
+    async def job():
+        nonlocal peak
+        async with limiter:
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    async def _run():
+        await asyncio.gather(*(job() for _ in range(10)))
+
+    asyncio.run(_run())
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+
+def test_run_config_creates_limiter():
+    assert RunConfig().concurrency_limiter is None
+
+    run_config = RunConfig(
+        max_workers=8, adaptive_concurrency=True, max_adaptive_workers=32
+    )
+    limiter = run_config.concurrency_limiter
+    assert limiter is not None
+    assert limiter.limit == 8
+    assert limiter.max_limit == 32
+
+
+def test_executor_adapts_concurrency_limit():
+    run_config = RunConfig(max_workers=8, adaptive_concurrency=True)
+    limiter = run_config.concurrency_limiter
+    assert limiter is not None
+    limiter.cooldown = 0
+
+    async def throttled(i):
+        await asyncio.sleep(0.001)
+        if i < 2:
+            raise RateLimitError("429")
+        return i
+
+    executor = Executor(run_config=run_config, show_progress=False)
+    assert executor.concurrency_limit == 8
+    for i in range(4):
+        executor.submit(throttled, i)
+    results = executor.results()
+
+    assert results[2:] == [2, 3]
+    assert executor.concurrency_limit is not None
+    assert executor.concurrency_limit < 8
+
+
+def test_async_retry_reports_throttling_to_limiter():
+    run_config = RunConfig(
+        max_retries=3, max_wait=0, adaptive_concurrency=True, max_workers=16
+    )
+    limiter = run_config.concurrency_limiter
+    assert limiter is not None
+    limiter.cooldown = 0
+    calls = 0
+
+    async def flaky():
+        nonlocal calls
+        calls += 1
+        if calls < 3:
+            raise StatusError(429)
+        return "ok"
+
+    result = asyncio.run(add_async_retry(flaky, run_config)())
+    assert result == "ok"
+    assert limiter.limit == 4
@@ -0,0 +1,122 @@
+import asyncio
+import math
+import typing as t
+import warnings
+from dataclasses import dataclass, field
+
+import pytest
+
+from ragas.callbacks import Callbacks
+from ragas.dataset_schema import EvaluationDataset, SingleTurnSample
+from ragas.deadline import RunDeadline
+from ragas.exceptions import DeadlineExceededError
+from ragas.executor import Executor
+from ragas.metrics import ExactMatch
+from ragas.metrics.base import MetricType, SingleTurnMetric
+from ragas.run_config import RunConfig
+
+
+@dataclass
+class SlowMetric(SingleTurnMetric):
+    name: str = "slow"
+    delay: float = 0.3
+    _required_columns: t.Dict[MetricType, t.Set[str]] = field(
+        default_factory=lambda: {MetricType.SINGLE_TURN: {"response"}}
+    )
+
+    def init(self, run_config: RunConfig):
+        pass
+
+    async def _single_turn_ascore(
+        self, sample: SingleTurnSample, callbacks: Callbacks
+    ) -> float:
+        await asyncio.sleep(self.delay)
+        return 1.0
+
+
+def test_deadline_skips_jobs_projected_to_miss_it():
+    deadline = RunDeadline(seconds=1.0)
+    deadline.start()
+    assert deadline.admit("slow")
+    deadline.record_latency("slow", 5.0)
+    deadline.record_latency("fast", 0.01)
+    assert not deadline.admit("slow")
+    assert deadline.admit("fast")
+
+
+def test_deadline_cuts_running_jobs():
+    deadline = RunDeadline(seconds=0.05)
+    deadline.start()
+
+    async def main():
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            await deadline.run(0, None, asyncio.sleep, 1)
+        assert exc_info.value.started
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            await deadline.run(1, None, asyncio.sleep, 1)
+        assert not exc_info.value.started
+
+    asyncio.run(main())
+    assert deadline.coverage() == {
+        "jobs": 2,
+        "completed": 0,
+        "skipped": 1,
+        "cut": 1,
+        "coverage": 0.0,
+    }
+
+
+def test_executor_returns_partial_results_at_deadline():
+    async def work(x):
+        await asyncio.sleep(0.2 if x >= 3 else 0.01)
+        return x
+
+    executor = Executor(
+        run_config=RunConfig(max_workers=1),
+        show_progress=False,
+        raise_exceptions=True,
+        deadline=0.3,
+    )
+    for i in range(6):
+        executor.submit(work, i)
+    results = executor.results()
+
+    assert results[:4] == [0, 1, 2, 3]
+    assert all(math.isnan(r) for r in results[4:])
+    coverage = executor.coverage
+    assert coverage is not None
+    assert coverage["completed"] == 4
+    assert coverage["cut"] == 1
+    assert coverage["skipped"] == 1
+    assert coverage["cut_jobs"] == [4]
+
+
+def test_executor_without_deadline_has_no_coverage():
+    executor = Executor(show_progress=False)
+    assert executor.coverage is None
+
+
+def test_evaluate_with_deadline_reports_coverage():
+    from ragas import evaluate
+
+    dataset = EvaluationDataset(
+        samples=[SingleTurnSample(response="a", reference="a") for _ in range(4)]
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        result = evaluate(
+            dataset,
+            metrics=[ExactMatch(), SlowMetric()],
+            run_config=RunConfig(max_workers=2),
+            show_progress=False,
+            deadline=0.5,
+        )
+
+    assert result["exact_match"] == [1.0] * 4
+    assert result.coverage is not None
+    assert result.coverage["by_metric"]["exact_match"] == 1.0
+    assert result.coverage["by_metric"]["slow"] < 1.0
+    assert result.coverage["computed"] < result.coverage["scores"] == 8
+    assert sum(not math.isnan(v) for v in result["slow"]) == (
+        result.coverage["computed"] - 4
+    )
@@ -0,0 +1,187 @@
+import math
+import threading
+import time
+import warnings
+
+import pytest
+
+from ragas.dataset_schema import EvaluationDataset, SingleTurnSample
+from ragas.distributed import (
+    DONE,
+    FAILED,
+    SQLiteWorkQueue,
+    evaluate_distributed,
+    run_worker,
+)
+from ragas.exceptions import RagasException
+from ragas.metrics import ExactMatch, StringPresence
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = SQLiteWorkQueue(str(tmp_path / "queue.db"), max_attempts=2)
+    yield queue
+    queue.close()
+
+
+@pytest.fixture
+def dataset():
+    return EvaluationDataset(
+        samples=[
+            SingleTurnSample(response=f"answer {i}", reference=f"answer {i % 2}")
+            for i in range(4)
+        ]
+    )
+
+
+def test_leases_are_exclusive_and_expire(queue):
+    queue.put("run", [("a", {"x": 1}), ("b", {"x": 2})])
+    queue.put("run", [("a", {"x": 1})])  # already queued
+
+    (first,) = queue.lease("w1", lease_seconds=0.05)
+    (second,) = queue.lease("w2", lease_seconds=60)
+    assert {first.job_id, second.job_id} == {"a", "b"}
+    assert queue.lease("w3", lease_seconds=60) == []
+
+    # the first worker crashed: its job goes to another worker
+    time.sleep(0.06)
+    (retried,) = queue.lease("w3", lease_seconds=60)
+    assert retried.job_id == first.job_id
+    assert retried.attempts == 2
+    assert not queue.complete(first, 1.0)
+    assert queue.complete(retried, 1.0)
+    assert queue.fail(second, "boom")
+
+    outcomes = queue.outcomes("run")
+    assert outcomes[first.job_id].status == DONE
+    assert outcomes[first.job_id].result == 1.0
+    assert outcomes[second.job_id].status == FAILED
+
+
+def test_jobs_fail_after_max_attempts(queue):
+    queue.put("run", [("a", {})])
+    for _ in range(2):
+        assert queue.lease("w", lease_seconds=0.01)
+        time.sleep(0.02)
+    assert queue.lease("w", lease_seconds=60) == []
+    assert queue.outcomes("run")["a"].status == FAILED
+
+
+def test_coordinator_and_workers(queue, dataset, tmp_path):
+    metrics = [ExactMatch(), StringPresence()]
+    workers = [
+        threading.Thread(
+            target=run_worker,
+            args=(SQLiteWorkQueue(queue.path), [ExactMatch(), StringPresence()]),
+            kwargs={"poll_interval": 0.01, "idle_timeout": 1.0},
+        )
+        for _ in range(2)
+    ]
+    for worker in workers:
+        worker.start()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        from ragas import evaluate
+
+        result = evaluate(
+            dataset,
+            metrics=metrics,
+            work_queue=queue,
+            show_progress=False,
+        )
+    for worker in workers:
+        worker.join()
+
+    assert result["exact_match"] == [1.0, 1.0, 0.0, 0.0]
+    assert result["string_present"] == [1.0, 1.0, 0.0, 0.0]
+    # the jobs of a finished run are removed
+    assert queue.outcomes("run") == {}
+
+
+def test_unknown_metric_fails_job(queue, dataset):
+    metrics = [ExactMatch()]
+    run_worker(queue, [StringPresence()], idle_timeout=0, max_jobs=1)  # nothing queued
+
+    def worker():
+        run_worker(
+            SQLiteWorkQueue(queue.path),
+            [StringPresence()],
+            poll_interval=0.01,
+            idle_timeout=0.5,
+        )
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    with pytest.raises(RagasException, match="Unknown metric"):
+        evaluate_distributed(
+            dataset,
+            metrics,
+            queue,
+            poll_interval=0.01,
+            raise_exceptions=True,
+            show_progress=False,
+        )
+    thread.join()
+
+
+def test_coordinator_deadline_reports_coverage(queue, dataset):
+    result = evaluate_distributed(
+        dataset,
+        [ExactMatch()],
+        queue,
+        run_id="nightly",
+        poll_interval=0.01,
+        deadline=0.05,
+        show_progress=False,
+    )
+    assert all(math.isnan(v) for v in result["exact_match"])
+    assert result.coverage is not None
+    assert result.coverage["computed"] == 0
+    # unfinished jobs stay queued so the run can be resumed
+    assert len(queue.lease("w", lease_seconds=60, max_jobs=10)) == 4
+
+
+def test_evaluate_resumes_a_run_on_the_work_queue(queue, dataset):
+    from ragas import evaluate
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        partial = evaluate(
+            dataset,
+            metrics=[ExactMatch()],
+            work_queue=queue,
+            run_id="nightly",
+            deadline=0.05,
+            show_progress=False,
+        )
+        assert partial.coverage["computed"] == 0
+
+        run_worker(queue, [ExactMatch()], idle_timeout=0.1, poll_interval=0.01)
+        result = evaluate(
+            dataset,
+            metrics=[ExactMatch()],
+            work_queue=queue,
+            run_id="nightly",
+            show_progress=False,
+        )
+
+    assert result["exact_match"] == [1.0, 1.0, 0.0, 0.0]
+
+
+def test_evaluate_rejects_arguments_the_work_queue_ignores(queue, dataset):
+    from ragas import evaluate
+    from ragas.run_config import RunConfig
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        with pytest.raises(ValueError, match="run_config, batch_size"):
+            evaluate(
+                dataset,
+                metrics=[ExactMatch()],
+                work_queue=queue,
+                run_config=RunConfig(),
+                batch_size=2,
+            )
+        with pytest.raises(ValueError, match="run_id"):
+            evaluate(dataset, metrics=[ExactMatch()], run_id="nightly")
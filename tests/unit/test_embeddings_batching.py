@@ -0,0 +1,123 @@
+"""Unit tests for micro-batching of concurrent embedding calls."""
+
+import asyncio
+import typing as t
+
+import pytest
+
+from ragas.cache import InMemoryCacheBackend
+from ragas.embeddings.base import BaseRagasEmbedding
+
+
+class CountingEmbeddings(BaseRagasEmbedding):
+    """Embeds a text as its length, recording the texts of every call."""
+
+    def __init__(self, fail: bool = False, **kwargs: t.Any):
+        super().__init__(**kwargs)
+        self.fail = fail
+        self.calls: t.List[t.List[str]] = []
+
+    def embed_text(self, text: str, **kwargs: t.Any) -> t.List[float]:
+        self.calls.append([text])
+        return [float(len(text))]
+
+    async def aembed_text(self, text: str, **kwargs: t.Any) -> t.List[float]:
+        self.calls.append([text])
+        return [float(len(text))]
+
+    async def aembed_texts(
+        self, texts: t.List[str], **kwargs: t.Any
+    ) -> t.List[t.List[float]]:
+        self.calls.append(list(texts))
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("provider error")
+        return [[float(len(text))] for text in texts]
+
+
+class SingleTextEmbeddings(BaseRagasEmbedding):
+    def embed_text(self, text: str, **kwargs: t.Any) -> t.List[float]:
+        return [0.0]
+
+    async def aembed_text(self, text: str, **kwargs: t.Any) -> t.List[float]:
+        return [0.0]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_embedded_in_one_batch():
+    embedder = CountingEmbeddings(micro_batch_window=0.01)
+    texts = ["x" * i for i in range(1, 101)]
+
+    results = await asyncio.gather(*(embedder.aembed_text(text) for text in texts))
+
+    assert embedder.calls == [texts]
+    assert results == [[float(i)] for i in range(1, 101)]
+
+
+@pytest.mark.asyncio
+async def test_batches_are_sent_when_full():
+    embedder = CountingEmbeddings(micro_batch_window=10, micro_batch_size=4)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(embedder.aembed_text("x" * i) for i in range(1, 9))),
+        timeout=1,
+    )
+
+    assert [len(call) for call in embedder.calls] == [4, 4]
+    assert results == [[float(i)] for i in range(1, 9)]
+
+
+@pytest.mark.asyncio
+async def test_batch_errors_reach_every_caller():
+    embedder = CountingEmbeddings(fail=True, micro_batch_window=0.01)
+
+    results = await asyncio.gather(
+        embedder.aembed_text("a"), embedder.aembed_text("b"), return_exceptions=True
+    )
+
+    assert len(embedder.calls) == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_calls_with_kwargs_are_not_batched():
+    embedder = CountingEmbeddings(micro_batch_window=0.01)
+
+    await asyncio.gather(
+        embedder.aembed_text("a", dimensions=2), embedder.aembed_text("b")
+    )
+
+    assert sorted(embedder.calls) == [["a"], ["b"]]
+
+
+@pytest.mark.asyncio
+async def test_only_cache_misses_are_batched():
+    cache = InMemoryCacheBackend()
+    embedder = CountingEmbeddings(cache=cache, micro_batch_window=0.01)
+    await embedder.aembed_text("cached")
+    embedder.calls.clear()
+
+    results = await asyncio.gather(
+        embedder.aembed_text("cached"),
+        embedder.aembed_text("a"),
+        embedder.aembed_text("bb"),
+        embedder.aembed_text("a"),
+    )
+
+    # the duplicate shares the call in flight
+    assert embedder.calls == [["a", "bb"]]
+    assert results == [[6.0], [1.0], [2.0], [1.0]]
+
+
+def test_micro_batching_is_off_by_default():
+    embedder = CountingEmbeddings()
+    assert embedder.aembed_text.__func__ is CountingEmbeddings.aembed_text
+
+
+def test_micro_batching_requires_a_batch_method():
+    with pytest.warns(UserWarning, match="micro_batch_window is ignored"):
+        embedder = SingleTextEmbeddings(micro_batch_window=0.01)
+    assert embedder.aembed_text.__func__ is SingleTextEmbeddings.aembed_text
+
+    with pytest.raises(ValueError):
+        CountingEmbeddings(micro_batch_window=0.01, micro_batch_size=0)
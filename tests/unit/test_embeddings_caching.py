@@ -1,10 +1,13 @@
 """Unit tests for embeddings caching functionality."""
 
+import json
+import pickle
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
-from ragas.cache import DiskCacheBackend
+from ragas.cache import DiskCacheBackend, EmbeddingCacheBackend
 from ragas.embeddings import embedding_factory
 
 
@@ -137,3 +140,103 @@ def test_cache_persistence_across_sessions(tmp_path):
     # Should hit cache from session 1, not call API
     assert mock_client2.embeddings.create.call_count == 0
     assert result2 == [0.1, 0.2, 0.3]  # From cache, not the new mock value
+
+
+def _batch_client():
+    """Mock client returning one embedding per input text, recording the inputs."""
+    mock_client = MagicMock()
+
+    def create(input, model, **kwargs):
+        texts = [input] if isinstance(input, str) else input
+        return MagicMock(
+            data=[MagicMock(embedding=[float(len(text)), 0.5]) for text in texts]
+        )
+
+    mock_client.embeddings.create.side_effect = create
+    return mock_client
+
+
+def test_batch_embeds_only_missing_texts_in_one_call(tmp_path):
+    cache = DiskCacheBackend(cache_dir=str(tmp_path / "cache"))
+    mock_client = _batch_client()
+    embedder = embedding_factory("openai", client=mock_client, cache=cache)
+
+    embedder.embed_texts(["a", "bb"])
+    result = embedder.embed_texts(["bb", "ccc", "a", "dddd", "ccc"])
+
+    assert mock_client.embeddings.create.call_count == 2
+    # one call for the two new texts, without the duplicate
+    assert mock_client.embeddings.create.call_args.kwargs["input"] == ["ccc", "dddd"]
+    assert [list(e) for e in result] == [
+        [2.0, 0.5],
+        [3.0, 0.5],
+        [1.0, 0.5],
+        [4.0, 0.5],
+        [3.0, 0.5],
+    ]
+    assert cache.stats.hits == 2 and cache.stats.misses == 4
+
+    # the single and batch methods share entries
+    embedder.embed_text("dddd")
+    assert mock_client.embeddings.create.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_batch_embeds_only_missing_texts(tmp_path):
+    cache = EmbeddingCacheBackend(str(tmp_path / "embeddings"))
+    calls = []
+
+    async def create(input, model, **kwargs):
+        calls.append(input)
+        texts = [input] if isinstance(input, str) else input
+        return MagicMock(data=[MagicMock(embedding=[float(len(t))]) for t in texts])
+
+    mock_client = MagicMock()
+    mock_client.embeddings.create = create
+    embedder = embedding_factory("openai", client=mock_client, cache=cache)
+
+    await embedder.aembed_text("a")
+    result = await embedder.aembed_texts(["a", "bb"])
+
+    assert calls == ["a", ["bb"]]
+    assert result == [[1.0], [2.0]]
+    # cached vectors are returned as plain lists, e.g. to be saved as JSON
+    assert json.dumps(await embedder.aembed_text("a")) == "[1.0]"
+    assert json.dumps(embedder.embed_texts(["a", "bb"])) == "[[1.0], [2.0]]"
+
+
+def test_legacy_embeddings_reject_embedding_cache_backend(tmp_path):
+    from ragas.embeddings import LangchainEmbeddingsWrapper
+
+    with pytest.raises(ValueError, match="EmbeddingCacheBackend"):
+        LangchainEmbeddingsWrapper(
+            MagicMock(), cache=EmbeddingCacheBackend(str(tmp_path / "embeddings"))
+        )
+
+
+def test_embedding_cache_backend_stores_float32_vectors(tmp_path):
+    directory = str(tmp_path / "embeddings")
+    cache = EmbeddingCacheBackend(directory)
+    cache.set_many({"a": [0.1, 0.2, 0.3], "b": np.array([1.0, 2.0, 3.0])})
+    cache.set("c", [0.5] * 8)
+    cache.set("a", [0.4, 0.5, 0.6])
+
+    found = cache.get_many(["a", "b", "c", "missing"])
+    assert set(found) == {"a", "b", "c"}
+    assert found["b"].dtype == np.float32 and not found["b"].flags.writeable
+    np.testing.assert_allclose(found["a"], [0.4, 0.5, 0.6], rtol=1e-6)
+    np.testing.assert_array_equal(found["c"], [0.5] * 8)
+    assert cache.has_key("a") and not cache.has_key("missing")
+    assert cache.get("missing") is None
+    assert len(cache) == 3
+
+    with pytest.raises(TypeError):
+        cache.set("text", "not an embedding")
+
+    # another instance, e.g. in another process, reads the same files
+    other = pickle.loads(pickle.dumps(cache))
+    np.testing.assert_array_equal(other.get("b"), [1.0, 2.0, 3.0])
+    other.set("d", [7.0, 8.0, 9.0])
+    np.testing.assert_array_equal(cache.get("d"), [7.0, 8.0, 9.0])
+    cache.close()
+    other.close()
@@ -47,9 +47,6 @@ async def test_executor_in_script(batch_size):
 @pytest.mark.asyncio
 @pytest.mark.parametrize("batch_size", [None, 3, 20])
 async def test_executor_with_running_loop(batch_size):
-    loop = asyncio.new_event_loop()
-    loop.run_until_complete(asyncio.sleep(0.1))
-
     async def echo_order(index: int):
         await asyncio.sleep(1 / index)
         return index
@@ -150,3 +147,68 @@ def test_executor_batch_size_edge_cases():
     for i in range(3):
         executor.submit(echo, i)
     assert executor.results() == [0, 1, 2]
+
+
+def test_executor_submit_jobs_generator_is_lazy():
+    """Jobs from a generator are drawn as the window frees up, in order."""
+    from ragas.run_config import RunConfig
+
+    max_workers = 2
+    in_flight = 0
+    peak_in_flight = 0
+    drawn = 0
+
+    async def echo(x):
+        nonlocal in_flight, peak_in_flight
+        in_flight += 1
+        peak_in_flight = max(peak_in_flight, in_flight)
+        await asyncio.sleep(0.001 * (x % 3))
+        in_flight -= 1
+        return x
+
+    def job_gen():
+        nonlocal drawn
+        for i in range(50):
+            drawn += 1
+            yield echo, (i,), {}
+
+    executor = Executor(
+        run_config=RunConfig(max_workers=max_workers), show_progress=False
+    )
+    executor.submit_jobs(job_gen(), total=50)
+    assert drawn == 0
+
+    results = executor.results()
+    assert results == list(range(50))
+    assert peak_in_flight <= max_workers
+
+
+def test_executor_submit_jobs_keeps_submission_order():
+    """Mixing single jobs and job streams preserves submission order."""
+
+    async def echo(x):
+        await asyncio.sleep(0.001 * (5 - x % 5))
+        return x
+
+    executor = Executor(batch_size=3, show_progress=False)
+    executor.submit(echo, 0)
+    executor.submit_jobs(((echo, (i,), {}, f"echo-{i}") for i in range(1, 6)))
+    executor.submit(echo, 6)
+    assert executor.results() == list(range(7))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_size", [None, 3])
+async def test_executor_astream_yields_in_completion_order(batch_size):
+    async def sleep_and_return(x):
+        await asyncio.sleep(0.01 * x)
+        return x
+
+    executor = Executor(batch_size=batch_size, show_progress=False)
+    for i in [4, 1, 2]:
+        executor.submit(sleep_and_return, i, name=f"sleep-{i}")
+
+    streamed = [item async for item in executor.astream()]
+    assert sorted(streamed) == [(0, 4), (1, 1), (2, 2)]
+    if batch_size is None:
+        assert [value for _, value in streamed] == [1, 2, 4]
@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from ragas.hedging import RequestHedger
+from ragas.run_config import RunConfig, add_async_retry
+
+
+def _warm_up(hedger, key, latency=0.01, n=20):
+    for _ in range(n):
+        hedger.record_latency(key, latency)
+
+
+def test_no_hedging_before_min_samples():
+    hedger = RequestHedger(min_samples=5)
+    _warm_up(hedger, "call", n=4)
+    assert hedger.delay("call") is None
+    hedger.record_latency("call", 0.01)
+    assert hedger.delay("call") == pytest.approx(0.01)
+
+
+def test_slow_request_is_hedged_and_loser_cancelled():
+    hedger = RequestHedger(percentile=90, budget=1.0)
+    _warm_up(hedger, "call")
+    calls = 0
+    cancelled = []
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        attempt = calls
+        try:
+            # the first request is stuck, the duplicate is fast
+            await asyncio.sleep(10 if attempt == 1 else 0.01)
+        except asyncio.CancelledError:
+            cancelled.append(attempt)
+            raise
+        return attempt
+
+    async def main():
+        result = await hedger.call("call", call)
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(main()) == 2
+    assert cancelled == [1]
+    assert hedger.hedged == 1
+
+
+def test_hedge_budget_limits_duplicates():
+    hedger = RequestHedger(percentile=50, budget=0.1, min_delay=0.001)
+    _warm_up(hedger, "call", latency=0.001)
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    async def main():
+        for _ in range(20):
+            await hedger.call("call", call)
+
+    asyncio.run(main())
+    assert hedger.requests == 20
+    assert hedger.hedged == 2
+    assert calls == 22
+
+
+def test_failed_request_waits_for_duplicate():
+    hedger = RequestHedger(percentile=90, budget=1.0)
+    _warm_up(hedger, "call")
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        attempt = calls
+        await asyncio.sleep(0.05 if attempt == 1 else 0.1)
+        if attempt == 1:
+            raise ValueError("failed")
+        return attempt
+
+    assert asyncio.run(hedger.call("call", call)) == 2
+
+
+def test_add_async_retry_hedges_with_run_config():
+    run_config = RunConfig(hedge_requests=True, hedge_budget=1.0, max_wait=0)
+    assert run_config.hedger is not None
+    calls = 0
+
+    async def generate():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(10 if calls == 21 else 0.001)
+        return calls
+
+    async def main():
+        wrapped = add_async_retry(generate, run_config)
+        return [await wrapped() for _ in range(21)]
+
+    results = asyncio.run(main())
+    assert results[-1] == 22
+    assert run_config.hedger.hedged == 1
+    assert RunConfig().hedger is None
+
+
+class Model:
+    def __init__(self, model: str):
+        self.model = model
+
+    def _rate_limit_key(self):
+        return "openai", self.model
+
+    async def agenerate(self):
+        return self.model
+
+
+def test_add_async_retry_tracks_latency_per_model():
+    run_config = RunConfig(hedge_requests=True, max_wait=0)
+
+    async def main():
+        for model in ("gpt-4o", "gpt-4o-mini"):
+            await add_async_retry(Model(model).agenerate, run_config)()
+
+    asyncio.run(main())
+    assert sorted(run_config.hedger._latencies) == [
+        "Model.agenerate[openai/gpt-4o-mini]",
+        "Model.agenerate[openai/gpt-4o]",
+    ]
@@ -0,0 +1,88 @@
+import asyncio
+import warnings
+
+import pytest
+
+from ragas import http_clients
+from ragas.http_clients import (
+    close_http_clients,
+    get_async_http_client,
+    get_http_client,
+    pool_limits,
+)
+from ragas.run_config import RunConfig
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    close_http_clients()
+    yield
+    close_http_clients()
+
+
+def test_pool_limits_follow_max_workers():
+    limits = pool_limits(RunConfig(max_workers=50))
+    assert limits.max_connections == 100
+    assert limits.max_keepalive_connections == 50
+
+    adaptive = pool_limits(
+        RunConfig(max_workers=8, adaptive_concurrency=True, max_adaptive_workers=40)
+    )
+    assert adaptive.max_keepalive_connections == 40
+
+
+def test_sync_clients_are_shared_per_pool_configuration():
+    client = get_http_client()
+    assert get_http_client(RunConfig()) is client
+    assert get_http_client(RunConfig(max_workers=64)) is not client
+    assert client.follow_redirects
+    assert client.timeout.read == RunConfig().timeout
+
+
+def test_close_replaces_clients():
+    client = get_http_client()
+    close_http_clients()
+    assert client.is_closed
+    assert get_http_client() is not client
+
+
+def test_clients_are_not_shared_across_fork(monkeypatch):
+    client = get_http_client()
+    monkeypatch.setattr(http_clients, "_pid", -1)
+    assert get_http_client() is not client
+
+
+def test_async_clients_are_shared_per_event_loop():
+    async def get_twice():
+        return get_async_http_client(), get_async_http_client()
+
+    first, again = asyncio.run(get_twice())
+    assert first is again
+
+    loop = asyncio.new_event_loop()
+    try:
+        other, _ = loop.run_until_complete(get_twice())
+    finally:
+        loop.close()
+    assert other is not first
+
+    with pytest.raises(RuntimeError):
+        get_async_http_client()
+
+
+def test_http2_requires_h2():
+    pytest.importorskip("h2")
+    assert get_http_client(RunConfig(http2=True)) is not get_http_client()
+
+
+def test_default_embeddings_share_the_pool(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    from ragas.testset.transforms.extractors.embeddings import EmbeddingExtractor
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        first = EmbeddingExtractor().embedding_model
+        second = EmbeddingExtractor().embedding_model
+
+    assert first.embeddings.http_client is get_http_client()
+    assert second.embeddings.http_client is get_http_client()
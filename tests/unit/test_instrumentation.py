@@ -0,0 +1,90 @@
+import asyncio
+import json
+
+from ragas.executor import Executor
+from ragas.instrumentation import JobRecord, JobSink, JSONLJobSink
+from ragas.run_config import RunConfig, add_async_retry
+
+
+class ListSink(JobSink):
+    def __init__(self):
+        self.records = []
+
+    def emit(self, record: JobRecord) -> None:
+        self.records.append(record)
+
+
+def test_executor_records_job_timings():
+    async def work(x):
+        await asyncio.sleep(0.01)
+        if x == 3:
+            raise ValueError("bad")
+        return x
+
+    sink = ListSink()
+    executor = Executor(
+        run_config=RunConfig(max_workers=1), show_progress=False, job_sinks=[sink]
+    )
+    for i in range(4):
+        executor.submit(work, i, name=f"work-{i}")
+    executor.submit_jobs([(work, (0,), {})], name="other", group="grouped")
+    executor.results()
+
+    assert len(sink.records) == 5
+    failed = [r for r in sink.records if r.exception_type is not None]
+    assert [(r.index, r.exception_type) for r in failed] == [(3, "ValueError")]
+    for record in sink.records:
+        assert record.submitted_at <= record.started_at <= record.ended_at
+        assert record.run_time >= 0.01
+
+    summary = executor.job_stats.summary()
+    assert summary["jobs"] == 5
+    assert summary["failed"] == 1
+    assert summary["throughput"] > 0
+    assert summary["by_name"]["work"]["count"] == 4
+    assert summary["by_name"]["grouped"]["count"] == 1
+    # with a single worker, later jobs wait for the earlier ones
+    assert summary["by_name"]["work"]["queue_wait"]["p99"] >= 0.01
+    assert summary["by_name"]["work"]["run_time"]["p50"] >= 0.01
+    assert summary["queue_depth"]
+
+
+def test_retries_are_attributed_to_jobs():
+    run_config = RunConfig(max_wait=0)
+    attempts = 0
+
+    async def flaky():
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise RuntimeError("try again")
+        return "ok"
+
+    async def job():
+        return await add_async_retry(flaky, run_config)()
+
+    sink = ListSink()
+    executor = Executor(show_progress=False, job_sinks=[sink])
+    executor.submit(job, name="flaky")
+    assert executor.results() == ["ok"]
+    assert sink.records[0].retries == 2
+    assert executor.job_stats.summary()["retries"] == 2
+
+
+def test_jsonl_job_sink(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+
+    async def work(x):
+        return x
+
+    sink = JSONLJobSink(str(path))
+    executor = Executor(show_progress=False, job_sinks=[sink])
+    executor.submit(work, 1, name="work-0")
+    executor.results()
+    sink.close()
+
+    (line,) = path.read_text().splitlines()
+    record = json.loads(line)
+    assert record["key"] == "work"
+    assert record["exception_type"] is None
+    assert record["run_time"] >= 0
@@ -0,0 +1,96 @@
+import asyncio
+import os
+import pickle
+import typing as t
+from dataclasses import dataclass, field
+
+import pytest
+
+from ragas.dataset_schema import SingleTurnSample
+from ragas.metrics.base import CPUBoundMetric, MetricType
+from ragas.process_pool import ProcessPoolRunner
+from ragas.run_config import RunConfig
+
+
+def square(x):
+    if x < 0:
+        raise ValueError("negative")
+    return x * x
+
+
+def pid_of_worker(_):
+    return os.getpid()
+
+
+@dataclass
+class WordCount(CPUBoundMetric):
+    name: str = "word_count"
+    _required_columns: t.Dict[MetricType, t.Set[str]] = field(
+        default_factory=lambda: {MetricType.SINGLE_TURN: {"response"}}
+    )
+
+    def __post_init__(self):
+        # modules are not picklable, like the ones stored by BleuScore or RougeScore
+        self.os = os
+
+    def _score_sample(self, sample: SingleTurnSample) -> float:
+        assert isinstance(sample.response, str)
+        return float(len(sample.response.split()))
+
+
+@pytest.fixture
+def runner():
+    runner = ProcessPoolRunner(max_workers=2, max_batch_size=4)
+    yield runner
+    runner.shutdown()
+
+
+def test_runner_computes_in_worker_processes(runner):
+    async def main():
+        return await asyncio.gather(*(runner.run(pid_of_worker, i) for i in range(8)))
+
+    pids = asyncio.run(main())
+    assert os.getpid() not in pids
+    assert not runner.is_inline
+
+
+def test_runner_returns_results_and_errors_per_item(runner):
+    async def main():
+        return await asyncio.gather(
+            *(runner.run(square, x) for x in [1, 2, -1, 3]), return_exceptions=True
+        )
+
+    results = asyncio.run(main())
+    assert results[:2] == [1, 4] and results[3] == 9
+    assert isinstance(results[2], ValueError)
+
+
+def test_runner_falls_back_inline_when_not_picklable(runner, caplog):
+    async def main():
+        return await asyncio.gather(*(runner.run(lambda x: x + 1, i) for i in range(3)))
+
+    assert asyncio.run(main()) == [1, 2, 3]
+    assert runner.is_inline
+    assert "running CPU-bound metrics inline" in caplog.text
+
+
+def test_cpu_bound_metric_pickles_without_derived_attributes():
+    metric = pickle.loads(pickle.dumps(WordCount()))
+    assert metric.os is os
+    assert metric.name == "word_count"
+
+
+def test_cpu_bound_metric_uses_run_config_process_pool():
+    sample = SingleTurnSample(response="one two three")
+    metric = WordCount()
+    metric.init(RunConfig())
+    assert asyncio.run(metric.single_turn_ascore(sample)) == 3.0
+
+    run_config = RunConfig(cpu_workers=2)
+    assert run_config.process_pool is not None
+    metric.init(run_config)
+    try:
+        assert asyncio.run(metric.single_turn_ascore(sample)) == 3.0
+        assert not run_config.process_pool.is_inline
+    finally:
+        run_config.process_pool.shutdown()
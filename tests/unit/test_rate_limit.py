@@ -0,0 +1,159 @@
+import asyncio
+import time
+
+import pytest
+from pydantic import BaseModel
+
+from ragas.llms.base import InstructorLLM
+from ragas.rate_limit import (
+    RateLimiter,
+    TokenBucket,
+    clear_rate_limits,
+    estimate_tokens,
+    get_rate_limiter,
+    remove_rate_limit,
+    set_rate_limit,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_registry():
+    clear_rate_limits()
+    yield
+    clear_rate_limits()
+
+
+class Answer(BaseModel):
+    text: str
+
+
+class AsyncCompletions:
+    def __init__(self):
+        self.calls = 0
+
+    async def create(self, *args, **kwargs):
+        self.calls += 1
+        return Answer(text="ok")
+
+
+class AsyncChat:
+    def __init__(self):
+        self.completions = AsyncCompletions()
+
+
+class AsyncInstructor:
+    def __init__(self):
+        self.chat = AsyncChat()
+
+
+def test_token_bucket_reserve_and_refund():
+    bucket = TokenBucket(capacity=10, rate=1)
+    assert bucket.reserve(10) == 0
+    # bucket is empty: waiting for 5 units at 1 unit/s takes ~5s
+    assert bucket.reserve(5) == pytest.approx(5, abs=0.1)
+    bucket.refund(5)
+    assert bucket.available == pytest.approx(0, abs=0.1)
+
+
+def test_token_bucket_oversized_request_waits_for_full_bucket():
+    bucket = TokenBucket(capacity=10, rate=10)
+    assert bucket.reserve(100) == 0
+    assert bucket.reserve(1) == pytest.approx(9.1, abs=0.1)
+
+
+def test_token_bucket_invalid_arguments():
+    with pytest.raises(ValueError):
+        TokenBucket(capacity=0, rate=1)
+
+
+def test_registry_lookup_with_provider_fallback():
+    provider_wide = set_rate_limit("OpenAI", requests_per_minute=100)
+    model_limit = set_rate_limit("openai", "gpt-4o", requests_per_minute=10)
+
+    assert get_rate_limiter("openai", "gpt-4o") is model_limit
+    assert get_rate_limiter("openai", "gpt-4o-mini") is provider_wide
+    assert get_rate_limiter("anthropic", "claude") is None
+
+    remove_rate_limit("openai", "gpt-4o")
+    assert get_rate_limiter("openai", "gpt-4o") is provider_wide
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("") == 0
+    single = estimate_tokens("hello world")
+    assert single > 0
+    assert estimate_tokens(["hello world", "hello world"]) == 2 * single
+
+
+def test_rate_limiter_throttles_requests():
+    # 600 rpm = 10 requests per second with a burst of 600
+    limiter = RateLimiter(requests_per_minute=600)
+
+    async def _run():
+        for _ in range(600):
+            await limiter.acquire()
+        start = time.monotonic()
+        await limiter.acquire()
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(_run())
+    assert elapsed >= 0.05
+
+
+def test_rate_limiter_cancelled_wait_is_refunded():
+    limiter = RateLimiter(tokens_per_minute=60)
+
+    async def _run():
+        await limiter.acquire(tokens=60)
+        task = asyncio.create_task(limiter.acquire(tokens=30))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(_run())
+    assert limiter._tokens is not None
+    assert limiter._tokens.available > -1
+
+
+@pytest.mark.asyncio
+async def test_instructor_llm_waits_for_rate_limit(monkeypatch):
+    client = AsyncInstructor()
+    llm = InstructorLLM(client=client, model="gpt-4o-mini", provider="openai")
+    limiter = set_rate_limit(
+        "openai", "gpt-4o-mini", requests_per_minute=60, tokens_per_minute=100_000
+    )
+
+    requested = []
+    original_acquire = limiter.acquire
+
+    async def recording_acquire(tokens: int = 0):
+        requested.append(tokens)
+        await original_acquire(tokens)
+
+    monkeypatch.setattr(limiter, "acquire", recording_acquire)
+
+    result = await llm.agenerate("What is the capital of France?", Answer)
+
+    assert result.text == "ok"
+    assert client.chat.completions.calls == 1
+    # prompt tokens plus the max_tokens reserved for the completion
+    assert requested == [estimate_tokens("What is the capital of France?") + 1024]
+
+
+def test_local_huggingface_embeddings_use_the_default_provider_key():
+    from ragas.cache import _owner_fingerprint
+    from ragas.embeddings.base import HuggingfaceEmbeddings
+    from ragas.run_config import _provider_key
+
+    class LocalEmbeddings(HuggingfaceEmbeddings):
+        async def aembed_query(self, text):
+            return self.embed_query(text)
+
+        async def aembed_documents(self, texts):
+            return self.embed_documents(texts)
+
+    # a local sentence-transformers model has no provider rate limit
+    embeddings = LocalEmbeddings.__new__(LocalEmbeddings)
+    assert _provider_key(embeddings.embed_query) == ("LocalEmbeddings", None)
+    assert _owner_fingerprint(embeddings) == {"model_name": embeddings.model_name}
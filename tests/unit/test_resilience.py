@@ -0,0 +1,197 @@
+import asyncio
+import copy
+import pickle
+
+import pytest
+
+from ragas.exceptions import CircuitOpenError
+from ragas.resilience import CircuitBreaker, RetryBudget, is_provider_error
+from ragas.run_config import RunConfig, add_async_retry
+
+
+class ServiceUnavailableError(Exception):
+    pass
+
+
+def test_is_provider_error():
+    assert is_provider_error(ServiceUnavailableError())
+    assert is_provider_error(ConnectionError())
+    assert is_provider_error(asyncio.TimeoutError())
+    assert not is_provider_error(ValueError("could not parse output"))
+
+
+def test_retry_budget_limits_retries_to_ratio_of_calls():
+    budget = RetryBudget(ratio=0.5, min_retries=1)
+    assert budget.try_spend()
+    assert not budget.try_spend()
+    budget.record_call()
+    budget.record_call()
+    assert budget.try_spend()
+    assert not budget.try_spend()
+
+
+def test_add_async_retry_shares_retry_budget():
+    run_config = RunConfig(max_wait=0, max_retries=10, max_retry_ratio=0.0)
+    calls = 0
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        raise RuntimeError("down")
+
+    async def main():
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                await add_async_retry(failing, run_config)()
+
+    asyncio.run(main())
+    # 3 calls plus the 10 retries available up front, instead of 3 * 10 attempts
+    assert calls == 13
+
+
+def test_circuit_breaker_opens_and_probes():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+
+    async def main():
+        for _ in range(2):
+            probe = await breaker.acquire()
+            breaker.record_failure(ServiceUnavailableError(), probe)
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError):
+            await breaker.acquire()
+
+        await asyncio.sleep(0.06)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert await breaker.acquire() is True
+        # only one probe at a time
+        with pytest.raises(CircuitOpenError):
+            await breaker.acquire()
+        breaker.record_failure(ServiceUnavailableError(), probe=True)
+        assert breaker.state == CircuitBreaker.OPEN
+
+        await asyncio.sleep(0.06)
+        probe = await breaker.acquire()
+        breaker.record_success(probe)
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    asyncio.run(main())
+
+
+def test_circuit_breaker_ignores_non_provider_errors():
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.record_failure(ValueError("bad output"))
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_add_async_retry_fails_fast_when_circuit_open():
+    run_config = RunConfig(
+        max_wait=0, max_retries=3, circuit_breaker=True, circuit_failure_threshold=3
+    )
+    calls = 0
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        raise ServiceUnavailableError()
+
+    async def main():
+        with pytest.raises(ServiceUnavailableError):
+            await add_async_retry(failing, run_config, ("openai", "gpt-4o"))()
+        with pytest.raises(CircuitOpenError):
+            await add_async_retry(failing, run_config, ("openai", "gpt-4o"))()
+        # other models keep their own breaker
+        with pytest.raises(ServiceUnavailableError):
+            await add_async_retry(failing, run_config, ("openai", "gpt-4o-mini"))()
+
+    asyncio.run(main())
+    assert calls == 6
+    assert run_config.circuit_breakers.states() == {
+        ("openai", "gpt-4o"): "open",
+        ("openai", "gpt-4o-mini"): "open",
+    }
+
+
+def test_add_async_retry_waits_for_circuit_to_close():
+    run_config = RunConfig(
+        max_wait=0,
+        max_retries=1,
+        circuit_breaker=True,
+        circuit_failure_threshold=1,
+        circuit_reset_timeout=0.05,
+        circuit_open_action="wait",
+    )
+    healthy = False
+
+    async def call():
+        if not healthy:
+            raise ServiceUnavailableError()
+        return "ok"
+
+    async def main():
+        nonlocal healthy
+        with pytest.raises(ServiceUnavailableError):
+            await add_async_retry(call, run_config)()
+        healthy = True
+        return await asyncio.gather(
+            *(add_async_retry(call, run_config)() for _ in range(3))
+        )
+
+    assert asyncio.run(main()) == ["ok"] * 3
+
+
+def test_invalid_circuit_open_action():
+    with pytest.raises(ValueError):
+        RunConfig(circuit_breaker=True, circuit_open_action="retry")  # type: ignore
+
+
+class FailingModel:
+    def __init__(self, model: str):
+        self.model = model
+
+    def _rate_limit_key(self):
+        return "openai", self.model
+
+    async def agenerate(self):
+        raise ServiceUnavailableError()
+
+
+def test_circuit_breakers_are_per_model_with_hedging():
+    run_config = RunConfig(
+        max_wait=0,
+        max_retries=1,
+        circuit_breaker=True,
+        circuit_failure_threshold=1,
+        hedge_requests=True,
+    )
+
+    async def main():
+        for model in ("gpt-4o", "gpt-4o-mini"):
+            with pytest.raises(ServiceUnavailableError):
+                await add_async_retry(FailingModel(model).agenerate, run_config)()
+
+    asyncio.run(main())
+    assert run_config.circuit_breakers.states() == {
+        ("openai", "gpt-4o"): "open",
+        ("openai", "gpt-4o-mini"): "open",
+    }
+
+
+def test_run_config_with_resilience_pickles_and_copies():
+    run_config = RunConfig(max_retry_ratio=0.5, circuit_breaker=True)
+    run_config.retry_budget.record_call()
+    breaker = run_config.circuit_breakers.get("openai", "gpt-4o")
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure(TimeoutError("timed out"))
+
+    for restored in (
+        pickle.loads(pickle.dumps(run_config)),
+        copy.deepcopy(run_config),
+    ):
+        assert restored.retry_budget.available == 10
+        assert restored.retry_budget.try_spend()
+        restored_breaker = restored.circuit_breakers.get("openai", "gpt-4o")
+        assert restored_breaker is not breaker
+        assert restored_breaker.state == CircuitBreaker.OPEN
+        restored_breaker.record_success()
+        assert restored_breaker.state == CircuitBreaker.CLOSED
+    assert breaker.state == CircuitBreaker.OPEN
@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from ragas.executor import Executor
+from ragas.run_config import RunConfig
+from ragas.scheduling import FairScheduler, FairScheduling
+
+
+def _jobs(groups, n):
+    # row-major stream: one job per group for each row, like evaluate()
+    return [(g, i) for i in range(n) for g in groups]
+
+
+def test_fair_scheduling_invalid_policy():
+    with pytest.raises(ValueError):
+        FairScheduling(weights={"a": 0})
+    with pytest.raises(ValueError):
+        FairScheduling(max_buffered_jobs=0)
+
+
+def test_scheduler_yields_every_job_once():
+    jobs = _jobs(["a", "b", "c"], 5)
+    scheduler = FairScheduler(jobs, group_of=lambda j: j[0])
+    assert sorted(scheduler) == sorted(jobs)
+
+
+def test_scheduler_shares_time_by_observed_cost():
+    jobs = _jobs(["slow", "fast"], 20)
+    scheduler = FairScheduler(jobs, group_of=lambda j: j[0])
+    scheduler.record_latency("slow", 4.0)
+    scheduler.record_latency("fast", 1.0)
+
+    first = [next(scheduler)[0] for _ in range(10)]
+    # equal time share: ~4 fast jobs for every slow job
+    assert first.count("fast") >= 7
+
+
+def test_scheduler_weights():
+    jobs = _jobs(["a", "b"], 20)
+    scheduler = FairScheduler(
+        jobs, group_of=lambda j: j[0], policy=FairScheduling(weights={"a": 3.0})
+    )
+    first = [next(scheduler)[0] for _ in range(8)]
+    assert first.count("a") == 6
+
+
+def test_scheduler_priorities_first():
+    jobs = _jobs(["low", "high"], 5)
+    scheduler = FairScheduler(
+        jobs, group_of=lambda j: j[0], policy=FairScheduling(priorities={"high": 1})
+    )
+    order = [job[0] for job in scheduler]
+    assert order[:5] == ["high"] * 5
+    assert order[5:] == ["low"] * 5
+
+
+def test_scheduler_bounded_read_ahead():
+    drawn = 0
+
+    def stream():
+        nonlocal drawn
+        for i in range(1000):
+            drawn += 1
+            yield ("a" if i % 2 else "b", i)
+
+    scheduler = FairScheduler(
+        stream(),
+        group_of=lambda j: j[0],
+        policy=FairScheduling(priorities={"a": 1}, max_buffered_jobs=10),
+    )
+    for _ in range(20):
+        next(scheduler)
+    assert drawn <= 40
+    assert sum(scheduler.queued.values()) <= 10
+
+
+def test_executor_fair_scheduling_keeps_result_order():
+    finished = []
+
+    async def job(group, i, delay):
+        await asyncio.sleep(delay)
+        finished.append(group)
+        return (group, i)
+
+    executor = Executor(
+        run_config=RunConfig(max_workers=1),
+        show_progress=False,
+        scheduling=FairScheduling(priorities={"important": 1}),
+    )
+    executor.submit_jobs(
+        (job, (group, i, delay), {}, None, group)
+        for i in range(3)
+        for group, delay in (("slow", 0.01), ("important", 0.0))
+    )
+
+    results = executor.results()
+    assert results == [(g, i) for i in range(3) for g in ("slow", "important")]
+    assert finished[:3] == ["important"] * 3
+    assert executor.group_progress == {"slow": 3, "important": 3}
+
+
+def test_submit_passes_group_keyword_to_the_callable():
+    async def job(group):
+        return group
+
+    executor = Executor(run_config=RunConfig(max_workers=1), show_progress=False)
+    executor.submit(job, group="mine")
+
+    assert executor.results() == ["mine"]
+    assert executor.group_progress == {"default": 1}
@@ -0,0 +1,145 @@
+import math
+import os
+import time
+import typing as t
+import warnings
+from dataclasses import dataclass, field
+
+import pytest
+
+from ragas.callbacks import Callbacks
+from ragas.dataset_schema import EvaluationDataset, SingleTurnSample
+from ragas.metrics import ExactMatch
+from ragas.metrics.base import MetricType, SingleTurnMetric
+from ragas.rate_limit import clear_rate_limits, set_rate_limit
+from ragas.run_config import RunConfig
+from ragas.sharding import (
+    _evaluate_shard,
+    _shard_bounds,
+    _shard_rate_limits,
+    _shard_run_config,
+    _ShardState,
+    evaluate_sharded,
+)
+
+
+@dataclass
+class ProcessId(SingleTurnMetric):
+    name: str = "pid"
+    _required_columns: t.Dict[MetricType, t.Set[str]] = field(
+        default_factory=lambda: {MetricType.SINGLE_TURN: {"response"}}
+    )
+
+    def init(self, run_config: RunConfig):
+        pass
+
+    async def _single_turn_ascore(
+        self, sample: SingleTurnSample, callbacks: Callbacks
+    ) -> float:
+        return float(os.getpid())
+
+
+@pytest.fixture
+def dataset():
+    return EvaluationDataset(
+        samples=[
+            SingleTurnSample(response=f"answer {i}", reference=f"answer {i % 3}")
+            for i in range(10)
+        ]
+    )
+
+
+def test_shard_bounds_cover_all_rows():
+    assert _shard_bounds(10, 4) == [(0, 3), (3, 6), (6, 8), (8, 10)]
+
+
+def test_shards_get_a_share_of_the_limits():
+    run_config = _shard_run_config(RunConfig(max_workers=16, cpu_workers=2), 3)
+    assert run_config.max_workers == 6
+    assert run_config.cpu_workers == 0
+    assert run_config.process_pool is None
+
+    set_rate_limit("openai", "gpt-4o", requests_per_minute=600, tokens_per_minute=None)
+    try:
+        assert _shard_rate_limits(3) == [("openai", "gpt-4o", 200, None)]
+    finally:
+        clear_rate_limits()
+
+
+def test_evaluate_with_num_processes_keeps_row_order(dataset):
+    from ragas import evaluate
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        result = evaluate(
+            dataset,
+            metrics=[ExactMatch(), ProcessId()],
+            show_progress=False,
+            num_processes=2,
+        )
+
+    assert result["exact_match"] == [float(i < 3) for i in range(10)]
+    pids = set(result["pid"])
+    assert os.getpid() not in pids
+    assert len(pids) == 2
+    # traces are merged into one evaluation with rows numbered across shards
+    assert len(result.traces) == 10
+    assert result.traces[7].scores["exact_match"] == 0.0
+
+
+def test_evaluate_sharded_with_single_row(dataset):
+    result = evaluate_sharded(
+        EvaluationDataset(samples=dataset.samples[:1]),
+        num_processes=4,
+        run_config=RunConfig(),
+        show_progress=False,
+        metrics=[ExactMatch()],
+    )
+    assert result["exact_match"] == [1.0]
+
+
+def test_num_processes_rejects_return_executor(dataset):
+    from ragas import evaluate
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        with pytest.raises(ValueError, match="num_processes"):
+            evaluate(
+                dataset,
+                metrics=[ExactMatch()],
+                num_processes=2,
+                return_executor=True,
+            )
+
+
+def test_shards_get_the_time_left_of_the_run_deadline(dataset):
+    state = _ShardState(
+        dataset=dataset,
+        kwargs={"metrics": [ExactMatch()]},
+        run_config=RunConfig(),
+        rate_limits=[],
+        ends_at=time.time() + 60,
+    )
+    result = _evaluate_shard(0, 2, state)
+    assert not result.expired
+    assert result.coverage is not None and result.coverage["computed"] == 2
+
+    state.ends_at = time.time() - 1
+    result = _evaluate_shard(2, 4, state)
+    assert result.expired and result.n_rows == 2
+
+
+def test_shards_starting_after_the_deadline_are_uncovered(dataset):
+    result = evaluate_sharded(
+        dataset,
+        num_processes=2,
+        run_config=RunConfig(),
+        show_progress=False,
+        metrics=[ExactMatch()],
+        deadline=1e-9,
+    )
+    assert len(result["exact_match"]) == 10
+    assert all(math.isnan(score) for score in result["exact_match"])
+    assert result.coverage["computed"] == 0
+    assert result.coverage["skipped"] == 10
+    assert result.coverage["by_metric"] == {"exact_match": 0.0}